@@ -0,0 +1,36 @@
+import { http, HttpResponse } from "msw";
+import { describe, expect, it } from "vitest";
+import ConversationService from "#/api/conversation-service/conversation-service.api";
+import { server } from "#/mocks/node";
+
+describe("ConversationService.getFileTree", () => {
+  it("should reuse the last tree while its ETag is current", async () => {
+    const etags: (string | null)[] = [];
+    server.use(
+      http.get(
+        "/api/conversations/:conversationId/file-tree",
+        ({ request }) => {
+          const etag = request.headers.get("If-None-Match");
+          etags.push(etag);
+          if (etag === '"1"') {
+            return new HttpResponse(null, {
+              status: 304,
+              headers: { ETag: '"1"' },
+            });
+          }
+          return HttpResponse.json(
+            { path: "src", entries: [{ name: "a.ts" }], truncated: false },
+            { headers: { ETag: '"1"' } },
+          );
+        },
+      ),
+    );
+
+    const first = await ConversationService.getFileTree("etag-test", "src", 1);
+    const second = await ConversationService.getFileTree("etag-test", "src", 1);
+
+    expect(etags).toEqual([null, '"1"']);
+    expect(second).toEqual(first);
+    expect(second.entries).toEqual([{ name: "a.ts" }]);
+  });
+});
@@ -1,3 +1,4 @@
+import { act } from "@testing-library/react";
 import { beforeAll, describe, expect, it, vi, afterEach } from "vitest";
 import { useTerminal } from "#/hooks/use-terminal";
 import { Command, useCommandStore } from "#/state/command-store";
@@ -83,4 +84,30 @@ describe("useTerminal", () => {
     expect(mockTerminal.writeln).toHaveBeenNthCalledWith(1, "echo hello");
     expect(mockTerminal.writeln).toHaveBeenNthCalledWith(2, "hello");
   });
+
+  it("should write output as it streams in", () => {
+    renderWithProviders(<TestTerminalComponent />);
+
+    act(() => {
+      useCommandStore.getState().appendInput("npm run build");
+      useCommandStore.getState().appendStreamedOutput("building\n");
+    });
+    act(() => {
+      useCommandStore.getState().appendStreamedOutput("done");
+    });
+
+    expect(mockTerminal.write).toHaveBeenCalledWith("building\r\n");
+    expect(mockTerminal.write).toHaveBeenCalledWith("done");
+
+    // The observation completes the command without writing its output again
+    act(() => {
+      useCommandStore.getState().appendOutput("building\ndone");
+    });
+
+    expect(mockTerminal.writeln).toHaveBeenCalledTimes(1);
+    expect(useCommandStore.getState().commands).toEqual([
+      { content: "npm run build", type: "input" },
+      { content: "building\ndone", type: "output" },
+    ]);
+  });
 });
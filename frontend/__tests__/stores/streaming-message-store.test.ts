@@ -0,0 +1,26 @@
+import { beforeEach, describe, expect, it } from "vitest";
+import { useStreamingMessageStore } from "#/stores/streaming-message-store";
+
+describe("useStreamingMessageStore", () => {
+  beforeEach(() => {
+    useStreamingMessageStore.getState().clearStreamingMessage();
+  });
+
+  it("should collect the streamed response until it is cleared", () => {
+    const store = useStreamingMessageStore.getState();
+    store.appendStreamingMessage("Let me ");
+    store.appendStreamingMessage("check.");
+    store.addStreamedToolCall({ id: "call_1", name: "execute_bash" });
+
+    expect(useStreamingMessageStore.getState()).toMatchObject({
+      streamingMessage: "Let me check.",
+      streamedToolCalls: [{ id: "call_1", name: "execute_bash" }],
+    });
+
+    store.clearStreamingMessage();
+    expect(useStreamingMessageStore.getState()).toMatchObject({
+      streamingMessage: "",
+      streamedToolCalls: [],
+    });
+  });
+});
@@ -11,6 +11,7 @@ import {
   CreateMicroagent,
   FileUploadSuccessResponse,
   GetFilesResponse,
+  GetFileTreeResponse,
 } from "../open-hands.types";
 import { openHands } from "../open-hands-axios";
 import { Provider } from "#/types/settings";
@@ -20,6 +21,12 @@ import { BatchFeedbackData } from "#/hooks/query/use-batch-feedback";
 class ConversationService {
   private static currentConversation: Conversation | null = null;
 
+  // Last file trees fetched, with their ETags, by conversation, path and depth
+  private static fileTrees = new Map<
+    string,
+    { etag: string; tree: GetFileTreeResponse }
+  >();
+
   /**
    * Get a current conversation
    * @return the current conversation
@@ -367,6 +374,37 @@ class ConversationService {
     return data;
   }
 
+  /**
+   * Retrieve the tree of files under a path in the workspace, recursively
+   * @param conversationId ID of the conversation
+   * @param path Path to list. If not provided, lists the workspace
+   * @param depth Number of directory levels to list
+   * @returns The tree of files, from the last response if it has not changed
+   */
+  static async getFileTree(
+    conversationId: string,
+    path?: string,
+    depth?: number,
+  ): Promise<GetFileTreeResponse> {
+    const url = `${this.getConversationUrl(conversationId)}/file-tree`;
+    const key = JSON.stringify([conversationId, path, depth]);
+    const cached = this.fileTrees.get(key);
+
+    const headers = this.getConversationHeaders();
+    if (cached) headers.set("If-None-Match", cached.etag);
+    const response = await openHands.get<GetFileTreeResponse>(url, {
+      params: { path, depth },
+      headers,
+      validateStatus: (status) =>
+        (status >= 200 && status < 300) || (!!cached && status === 304),
+    });
+
+    if (response.status === 304 && cached) return cached.tree;
+    const etag = response.headers.etag as string | undefined;
+    if (etag) this.fileTrees.set(key, { etag, tree: response.data });
+    return response.data;
+  }
+
   /**
    * Upload multiple files to the workspace
    * @param conversationId ID of the conversation
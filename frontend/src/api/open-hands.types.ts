@@ -143,6 +143,20 @@ export interface MicroagentContentResponse {
 
 export type GetFilesResponse = string[];
 
+export interface FileTreeEntry {
+  /** Name of the entry, with a trailing slash for directories */
+  name: string;
+  /** Entries of a listed directory, missing below the depth limit */
+  children?: FileTreeEntry[];
+}
+
+export interface GetFileTreeResponse {
+  path: string;
+  entries: FileTreeEntry[];
+  /** Whether the entry limit was reached before the whole tree was listed */
+  truncated: boolean;
+}
+
 export interface GetFileResponse {
   code: string;
 }
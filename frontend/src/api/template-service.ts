@@ -14,8 +14,10 @@ export class TemplateService {
     return data;
   }
 
-  static getTemplateImageUrl(templateId: string): string {
+  static getTemplateImageUrl(template: Template): string {
     const baseURL = `${window.location.protocol}//${import.meta.env.VITE_BACKEND_BASE_URL || window?.location.host}`;
-    return `${baseURL}/api/templates/${templateId}/image`;
+    // image_url is versioned by the image content, so it can be cached for good
+    const path = template.image_url ?? `/api/templates/${template.id}/image`;
+    return `${baseURL}${path}`;
   }
 }
@@ -13,6 +13,7 @@ import {
 import { EventMessage } from "./event-message";
 import { ChatMessage } from "./chat-message";
 import { useOptimisticUserMessageStore } from "#/stores/optimistic-user-message-store";
+import { useStreamingMessageStore } from "#/stores/streaming-message-store";
 import { LaunchMicroagentModal } from "./microagent/launch-microagent-modal";
 import { useUserConversation } from "#/hooks/query/use-user-conversation";
 import { useConversationId } from "#/hooks/use-conversation-id";
@@ -59,6 +60,7 @@ export const Messages: React.FC<MessagesProps> = React.memo(
     const isV1Conversation = activeConversation?.conversation_version === "V1";
 
     const optimisticUserMessage = getOptimisticUserMessage();
+    const { streamingMessage, streamedToolCalls } = useStreamingMessageStore();
 
     const [selectedEventId, setSelectedEventId] = React.useState<number | null>(
       null,
@@ -264,6 +266,15 @@ export const Messages: React.FC<MessagesProps> = React.memo(
         {optimisticUserMessage && (
           <ChatMessage type="user" message={optimisticUserMessage} />
         )}
+        {(streamingMessage || streamedToolCalls.length > 0) && (
+          <ChatMessage type="agent" message={streamingMessage}>
+            {streamedToolCalls.map((toolCall) => (
+              <code key={toolCall.id} className="text-xs text-neutral-400">
+                {toolCall.name}
+              </code>
+            ))}
+          </ChatMessage>
+        )}
         {conversation?.selected_repository &&
           !isV1Conversation &&
           showLaunchMicroagentModal &&
@@ -32,7 +32,7 @@ export function TemplateCard({ template, onClick }: TemplateCardProps) {
       <div className="relative h-32 w-full overflow-hidden">
         {hasImage ? (
           <img
-            src={TemplateService.getTemplateImageUrl(template.id)}
+            src={TemplateService.getTemplateImageUrl(template)}
             alt={template.name}
             className="h-full w-full object-cover transition-transform duration-300 group-hover:scale-105"
             onError={() => setImageError(true)}
@@ -67,7 +67,7 @@ export function TemplateDetailModal({
         <div className="w-full h-48 rounded-lg overflow-hidden">
           {hasImage ? (
             <img
-              src={TemplateService.getTemplateImageUrl(template.id)}
+              src={TemplateService.getTemplateImageUrl(template)}
               alt={template.name}
               className="w-full h-full object-cover"
               onError={() => setImageError(true)}
@@ -29,6 +29,8 @@ import { useErrorMessageStore } from "#/stores/error-message-store";
 import { useOptimisticUserMessageStore } from "#/stores/optimistic-user-message-store";
 import { useEventStore } from "#/stores/use-event-store";
 import { useConversationStore } from "#/state/conversation-store";
+import { useCommandStore } from "#/state/command-store";
+import { useStreamingMessageStore } from "#/stores/streaming-message-store";
 import { parseAgentModeSwitch } from "#/utils/parse-agent-mode-switch";
 
 /**
@@ -44,6 +46,22 @@ const hasValidMessageProperty = (obj: unknown): obj is { message: string } =>
   "message" in obj &&
   typeof obj.message === "string";
 
+const hasStringContent = (data: unknown): data is { content: string } =>
+  typeof data === "object" &&
+  data !== null &&
+  "content" in data &&
+  typeof data.content === "string";
+
+const isStreamedToolCall = (
+  data: unknown,
+): data is { id: string; name: string } =>
+  typeof data === "object" &&
+  data !== null &&
+  "id" in data &&
+  typeof data.id === "string" &&
+  "name" in data &&
+  typeof data.name === "string";
+
 const isOpenHandsEvent = (event: unknown): event is OpenHandsParsedEvent =>
   typeof event === "object" &&
   event !== null &&
@@ -219,6 +237,11 @@ export function WsClientProvider({
         addEvent(event); // Event is already OpenHandsParsedEvent
       }
 
+      if (isOpenHandsAction(event) && event.source === "agent") {
+        // The streamed response has been turned into this action
+        useStreamingMessageStore.getState().clearStreamingMessage();
+      }
+
       if (isErrorObservation(event)) {
         trackError({
           message: event.message,
@@ -293,6 +316,28 @@ export function WsClientProvider({
     }
   }
 
+  function handleShellOutput(data: unknown) {
+    // Output of the running command; its observation follows as an oh_event
+    if (hasStringContent(data)) {
+      useCommandStore.getState().appendStreamedOutput(data.content);
+    }
+  }
+
+  function handleLlmOutput(data: unknown) {
+    // Text of the LLM response; the resulting action follows as an oh_event
+    if (hasStringContent(data)) {
+      useStreamingMessageStore.getState().appendStreamingMessage(data.content);
+    }
+  }
+
+  function handleLlmToolCall(data: unknown) {
+    if (isStreamedToolCall(data)) {
+      useStreamingMessageStore
+        .getState()
+        .addStreamedToolCall({ id: data.id, name: data.name });
+    }
+  }
+
   function handleDisconnect(data: unknown) {
     setWebSocketStatus("DISCONNECTED");
     const sio = sioRef.current;
@@ -325,6 +370,7 @@ export function WsClientProvider({
     lastEventRef.current = null;
 
     clearEvents();
+    useStreamingMessageStore.getState().clearStreamingMessage();
     setWebSocketStatus("CONNECTING");
     pendingEventsRef.current = [];
   }, [conversationId]);
@@ -408,6 +454,9 @@ export function WsClientProvider({
 
     sio.on("connect", handleConnect);
     sio.on("oh_event", handleMessage);
+    sio.on("oh_shell_output", handleShellOutput);
+    sio.on("oh_llm_output", handleLlmOutput);
+    sio.on("oh_llm_tool_call", handleLlmToolCall);
     sio.on("connect_error", handleError);
     sio.on("connect_failed", handleError);
     sio.on("disconnect", handleDisconnect);
@@ -418,6 +467,9 @@ export function WsClientProvider({
     return () => {
       sio.off("connect", handleConnect);
       sio.off("oh_event", handleMessage);
+      sio.off("oh_shell_output", handleShellOutput);
+      sio.off("oh_llm_output", handleLlmOutput);
+      sio.off("oh_llm_tool_call", handleLlmToolCall);
       sio.off("connect_error", handleError);
       sio.off("connect_failed", handleError);
       sio.off("disconnect", handleDisconnect);
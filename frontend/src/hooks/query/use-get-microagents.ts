@@ -8,9 +8,8 @@ export const useGetMicroagents = (microagentDirectory: string) => {
   return useQuery({
     queryKey: ["files", "microagents", conversationId, microagentDirectory],
     queryFn: () =>
-      ConversationService.getFiles(conversationId!, microagentDirectory),
+      ConversationService.getFileTree(conversationId!, microagentDirectory, 1),
     enabled: !!conversationId,
-    select: (data) =>
-      data.map((fileName) => fileName.replace(microagentDirectory, "")),
+    select: (data) => data.entries.map((entry) => entry.name),
   });
 };
@@ -32,6 +32,46 @@ const renderCommand = (
 // Create a persistent reference that survives component unmounts
 // This ensures terminal history is preserved when navigating away and back
 const persistentLastCommandIndex = { current: 0 };
+// How much of the command at persistentLastCommandIndex was written while it streamed
+const persistentStreamedLength = { current: 0 };
+
+/**
+ * Writes commands[from:] to the terminal, returning the index of the first
+ * command that still needs rendering. A command that is still streaming is
+ * written as its output arrives and rendered again until it completes.
+ */
+const renderCommands = (
+  commands: Command[],
+  terminal: Terminal,
+  from: number,
+  streamedLength: { current: number },
+) => {
+  for (let i = from; i < commands.length; i += 1) {
+    const command = commands[i];
+    const streamed = streamedLength.current;
+    streamedLength.current = 0;
+
+    if (command.streaming || streamed > 0) {
+      if (command.streaming) {
+        terminal.write(
+          command.content.slice(streamed).replace(/\r?\n/g, "\r\n"),
+        );
+        if (i === commands.length - 1) {
+          streamedLength.current = command.content.length;
+          return i;
+        }
+      }
+      // The output was already written as it streamed in
+      terminal.write("\r\n");
+    } else {
+      if (command.type === "input") {
+        terminal.write("$ ");
+      }
+      renderCommand(command, terminal, false);
+    }
+  }
+  return commands.length;
+};
 
 export const useTerminal = () => {
   const commands = useCommandStore((state) => state.commands);
@@ -75,41 +115,31 @@ export const useTerminal = () => {
       initializeTerminal();
       // Render all commands in array
       // This happens when we just switch to Terminal from other tabs
-      if (commands.length > 0) {
-        for (let i = 0; i < commands.length; i += 1) {
-          if (commands[i].type === "input") {
-            terminal.current.write("$ ");
-          }
-          // Don't pass isUserInput=true here because we're initializing the terminal
-          // and need to show all previous commands
-          renderCommand(commands[i], terminal.current, false);
-        }
-        lastCommandIndex.current = commands.length;
-      }
+      persistentStreamedLength.current = 0;
+      lastCommandIndex.current = renderCommands(
+        commands,
+        terminal.current,
+        0,
+        persistentStreamedLength,
+      );
       // Don't show prompt in read-only terminal
     }
 
     return () => {
       terminal.current?.dispose();
       lastCommandIndex.current = 0;
+      persistentStreamedLength.current = 0;
     };
   }, []);
 
   React.useEffect(() => {
-    if (
-      terminal.current &&
-      commands.length > 0 &&
-      lastCommandIndex.current < commands.length
-    ) {
-      for (let i = lastCommandIndex.current; i < commands.length; i += 1) {
-        if (commands[i].type === "input") {
-          terminal.current.write("$ ");
-        }
-        // Pass true for isUserInput to skip rendering user input commands
-        // that have already been displayed as the user typed
-        renderCommand(commands[i], terminal.current, false);
-      }
-      lastCommandIndex.current = commands.length;
+    if (terminal.current && lastCommandIndex.current < commands.length) {
+      lastCommandIndex.current = renderCommands(
+        commands,
+        terminal.current,
+        lastCommandIndex.current,
+        persistentStreamedLength,
+      );
     }
   }, [commands]);
 
@@ -22,6 +22,32 @@ export const FILE_SERVICE_HANDLERS = [
     },
   ),
 
+  http.get(
+    "/api/conversations/:conversationId/file-tree",
+    async ({ params, request }) => {
+      await delay();
+
+      const cid = params.conversationId?.toString();
+      if (!cid) return HttpResponse.json(null, { status: 400 });
+
+      const files =
+        cid === "test-conversation-id-2" ? FILE_VARIANTS_2 : FILE_VARIANTS_1;
+      const etag = `"${cid}"`;
+      if (request.headers.get("If-None-Match") === etag) {
+        return new HttpResponse(null, { status: 304, headers: { ETag: etag } });
+      }
+      const url = new URL(request.url);
+      return HttpResponse.json(
+        {
+          path: url.searchParams.get("path") ?? "",
+          entries: files.map((name) => ({ name })),
+          truncated: false,
+        },
+        { headers: { ETag: etag } },
+      );
+    },
+  ),
+
   http.get(
     "/api/conversations/:conversationId/select-file",
     async ({ request }) => {
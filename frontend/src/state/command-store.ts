@@ -3,24 +3,53 @@ import { create } from "zustand";
 export type Command = {
   content: string;
   type: "input" | "output";
+  /** Output of a command that is still running, streamed as it arrives */
+  streaming?: boolean;
 };
 
 interface CommandState {
   commands: Command[];
   appendInput: (content: string) => void;
   appendOutput: (content: string) => void;
+  appendStreamedOutput: (content: string) => void;
   clearTerminal: () => void;
 }
 
+/** The commands before the one still streaming, and that command if any */
+const splitStreaming = (commands: Command[]) => {
+  const last = commands[commands.length - 1];
+  return last?.streaming
+    ? { done: commands.slice(0, -1), streaming: last }
+    : { done: commands, streaming: null };
+};
+
 export const useCommandStore = create<CommandState>((set) => ({
   commands: [],
   appendInput: (content: string) =>
-    set((state) => ({
-      commands: [...state.commands, { content, type: "input" }],
-    })),
+    set((state) => {
+      const { done, streaming } = splitStreaming(state.commands);
+      // A command that never finished keeps the output streamed so far
+      const commands = streaming
+        ? [...done, { ...streaming, streaming: false }]
+        : done;
+      return { commands: [...commands, { content, type: "input" }] };
+    }),
   appendOutput: (content: string) =>
-    set((state) => ({
-      commands: [...state.commands, { content, type: "output" }],
-    })),
+    set((state) => {
+      // The final output replaces what was streamed while the command ran
+      const { done } = splitStreaming(state.commands);
+      return { commands: [...done, { content, type: "output" }] };
+    }),
+  appendStreamedOutput: (content: string) =>
+    set((state) => {
+      const { done, streaming } = splitStreaming(state.commands);
+      const output = streaming ? streaming.content + content : content;
+      return {
+        commands: [
+          ...done,
+          { content: output, type: "output", streaming: true },
+        ],
+      };
+    }),
   clearTerminal: () => set({ commands: [] }),
 }));
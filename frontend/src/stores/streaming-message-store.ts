@@ -0,0 +1,44 @@
+import { create } from "zustand";
+
+export interface StreamedToolCall {
+  id: string;
+  name: string;
+}
+
+interface StreamingMessageState {
+  // Text of the LLM response being generated, before its action arrives
+  streamingMessage: string;
+  // Tool calls the LLM has finished generating in that response
+  streamedToolCalls: StreamedToolCall[];
+}
+
+interface StreamingMessageActions {
+  appendStreamingMessage: (content: string) => void;
+  addStreamedToolCall: (toolCall: StreamedToolCall) => void;
+  clearStreamingMessage: () => void;
+}
+
+type StreamingMessageStore = StreamingMessageState & StreamingMessageActions;
+
+const initialState: StreamingMessageState = {
+  streamingMessage: "",
+  streamedToolCalls: [],
+};
+
+export const useStreamingMessageStore = create<StreamingMessageStore>(
+  (set) => ({
+    ...initialState,
+
+    appendStreamingMessage: (content: string) =>
+      set((state) => ({
+        streamingMessage: state.streamingMessage + content,
+      })),
+
+    addStreamedToolCall: (toolCall: StreamedToolCall) =>
+      set((state) => ({
+        streamedToolCalls: [...state.streamedToolCalls, toolCall],
+      })),
+
+    clearStreamingMessage: () => set(() => initialState),
+  }),
+);
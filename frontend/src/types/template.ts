@@ -10,6 +10,7 @@ export interface Template {
   features: string[];
   default: boolean;
   image_url: string | null;
+  content_hash: string | null;
 }
 
 export interface TemplatesResponse {
@@ -31,7 +31,7 @@ from openhands.controller.agent import Agent
 from openhands.controller.state.state import State
 from openhands.core.config import AgentConfig
 from openhands.core.logger import openhands_logger as logger
-from openhands.core.message import Message
+from openhands.core.message import Message, TextContent
 from openhands.events.action import AgentFinishAction, MessageAction
 from openhands.events.event import Event
 from openhands.llm.llm_utils import check_tools
@@ -207,13 +207,6 @@ class CodeActAgent(Agent):
 
         initial_user_message = self._get_initial_user_message(state.history)
 
-        # Extract and update lumio settings from the latest user message
-        latest_lumio_settings = self.conversation_memory.extract_latest_lumio_settings(
-            condensed_history
-        )
-        if latest_lumio_settings:
-            state.lumio_settings = latest_lumio_settings
-
         messages = self._get_messages(condensed_history, initial_user_message, state)
         params: dict = {
             'messages': messages,
@@ -224,6 +217,8 @@ class CodeActAgent(Agent):
                 model_name=self.llm.config.model, agent_name=self.name
             )
         }
+        if self.config.enable_streaming and self.stream_listener is not None:
+            params['stream_listener'] = self.stream_listener
         response = self.llm.completion(**params)
         logger.debug(f'Response from LLM: {response}')
         actions = self.response_to_actions(response)
@@ -303,13 +298,23 @@ class CodeActAgent(Agent):
         )
 
         # Add Lumio settings reminder to ensure agent always sees current mode/skip_tests
-        if state and hasattr(state, 'lumio_settings') and state.lumio_settings:
-            self.prompt_manager.add_lumio_settings_reminder(
-                messages, state.lumio_settings
-            )
+        lumio_settings = getattr(state, 'lumio_settings', None) if state else None
 
         if self.llm.is_caching_prompt_active():
-            self.conversation_memory.apply_prompt_caching(messages)
+            # The reminder goes after the last cache breakpoint, so it does
+            # not invalidate the cached prefix on the next step
+            volatile_content = []
+            if lumio_settings:
+                volatile_content.append(
+                    TextContent(
+                        text=self.prompt_manager.build_lumio_settings_reminder(
+                            lumio_settings
+                        )
+                    )
+                )
+            self.conversation_memory.apply_prompt_caching(messages, volatile_content)
+        elif lumio_settings:
+            self.prompt_manager.add_lumio_settings_reminder(messages, lumio_settings)
 
         return messages
 
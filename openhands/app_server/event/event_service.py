@@ -48,6 +48,12 @@ class EventService(ABC):
     async def save_event(self, conversation_id: UUID, event: Event):
         """Save an event. Internal method intended not be part of the REST api."""
 
+    async def save_events(self, conversation_id: UUID, events: list[Event]):
+        """Save a batch of events. Internal method intended not be part of the REST api."""
+        await asyncio.gather(
+            *[self.save_event(conversation_id, event) for event in events]
+        )
+
     async def batch_get_events(self, event_ids: list[str]) -> list[Event | None]:
         """Given a list of ids, get events (Or none for any which were not found)."""
         return await asyncio.gather(
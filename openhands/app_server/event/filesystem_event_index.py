@@ -0,0 +1,175 @@
+"""Sorted per-conversation manifest of event files for FilesystemEventService.
+
+Event files are named ``{YYYYMMDDHHMMSS}_{kind}_{id.hex}`` so their names sort
+by timestamp. Each conversation directory keeps an append-only ``.index``
+manifest with one event filename per line. The manifest is loaded once per
+process into sorted lists (overall and per kind), kept in sync by appending on
+save, and used to seek to a page with a binary search instead of globbing and
+scanning every file.
+
+To build manifests for existing event directories, run:
+
+    python -m openhands.app_server.event.filesystem_event_index <events_dir>
+"""
+
+import bisect
+import os
+import sys
+import tempfile
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+
+INDEX_FILENAME = '.index'
+
+
+@dataclass
+class ConversationEventIndex:
+    """Sorted event filenames for a single conversation."""
+
+    names: list[str] = field(default_factory=list)
+    names_by_kind: dict[str, list[str]] = field(default_factory=dict)
+    manifest_size: int = 0
+
+    def __contains__(self, name: str) -> bool:
+        i = bisect.bisect_left(self.names, name)
+        return i < len(self.names) and self.names[i] == name
+
+    def add(self, name: str) -> bool:
+        """Add a filename, returning False if it was already indexed."""
+        if name in self:
+            return False
+        i = bisect.bisect_left(self.names, name)
+        self.names.insert(i, name)
+        kind = parse_kind(name)
+        if kind is not None:
+            bisect.insort(self.names_by_kind.setdefault(kind, []), name)
+        return True
+
+    def select(
+        self,
+        kind: str | None = None,
+        timestamp_gte: str | None = None,
+        timestamp_lt: str | None = None,
+    ) -> tuple[list[str], int, int]:
+        """Return the sorted list to use and the [start, end) range matching the filters."""
+        names = self.names if kind is None else self.names_by_kind.get(kind, [])
+        start = bisect.bisect_left(names, timestamp_gte) if timestamp_gte else 0
+        end = bisect.bisect_left(names, timestamp_lt) if timestamp_lt else len(names)
+        return names, start, max(start, end)
+
+
+def parse_kind(name: str) -> str | None:
+    parts = name.split('_')
+    if len(parts) < 3:
+        return None
+    return '_'.join(parts[1:-1])
+
+
+_indexes: dict[Path, ConversationEventIndex] = {}
+_lock = threading.Lock()
+
+
+def _scan_event_names(conversation_dir: Path) -> list[str]:
+    with os.scandir(conversation_dir) as entries:
+        return [
+            entry.name
+            for entry in entries
+            if not entry.name.startswith('.') and entry.is_file()
+        ]
+
+
+def rebuild_index(conversation_dir: Path) -> ConversationEventIndex:
+    """Rebuild the manifest of a conversation directory from its event files."""
+    with _lock:
+        return _rebuild_index(conversation_dir)
+
+
+def _rebuild_index(conversation_dir: Path) -> ConversationEventIndex:
+    # Called with _lock held, so events saved meanwhile are appended after it
+    names = sorted(_scan_event_names(conversation_dir))
+    manifest = conversation_dir / INDEX_FILENAME
+    fd, tmp_manifest = tempfile.mkstemp(
+        dir=conversation_dir, prefix=f'{INDEX_FILENAME}.', suffix='.tmp'
+    )
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(''.join(f'{name}\n' for name in names))
+        os.replace(tmp_manifest, manifest)
+    except BaseException:
+        Path(tmp_manifest).unlink(missing_ok=True)
+        raise
+    index = ConversationEventIndex()
+    for name in names:
+        index.add(name)
+    index.manifest_size = manifest.stat().st_size
+    _indexes[conversation_dir] = index
+    return index
+
+
+def get_index(conversation_dir: Path) -> ConversationEventIndex | None:
+    """Get the index for a conversation directory, or None if it has no events."""
+    if not conversation_dir.is_dir():
+        return None
+    manifest = conversation_dir / INDEX_FILENAME
+    try:
+        manifest_size = manifest.stat().st_size
+    except FileNotFoundError:
+        return rebuild_index(conversation_dir)
+
+    with _lock:
+        index = _indexes.get(conversation_dir)
+        if index is not None and index.manifest_size == manifest_size:
+            return index
+        if index is None or manifest_size < index.manifest_size:
+            index = ConversationEventIndex()
+        # Read only what was appended since we last looked (possibly by another process)
+        with open(manifest, 'rb') as f:
+            f.seek(index.manifest_size)
+            data = f.read(manifest_size - index.manifest_size)
+        # Ignore a trailing partial line; it is picked up on the next call
+        complete = data[: data.rfind(b'\n') + 1]
+        for line in complete.decode('utf-8').splitlines():
+            if line:
+                index.add(line)
+        index.manifest_size += len(complete)
+        _indexes[conversation_dir] = index
+        return index
+
+
+def add_to_index(conversation_dir: Path, name: str) -> None:
+    """Record a newly written event file in the manifest of its conversation."""
+    manifest = conversation_dir / INDEX_FILENAME
+    with _lock:
+        if not manifest.exists():
+            # The new file is already on disk, so the rebuild includes it
+            _rebuild_index(conversation_dir)
+            return
+        index = _indexes.get(conversation_dir)
+        if index is not None and name in index:
+            return
+        with open(manifest, 'ab') as f:
+            line = f'{name}\n'.encode('utf-8')
+            f.write(line)
+            end = f.tell()
+        if index is not None and end == index.manifest_size + len(line):
+            index.add(name)
+            index.manifest_size = end
+
+
+def rebuild_all_indexes(events_dir: Path) -> int:
+    """Rebuild the manifests of all conversations under events_dir."""
+    count = 0
+    for conversation_dir in sorted(events_dir.iterdir()):
+        if conversation_dir.is_dir():
+            rebuild_index(conversation_dir)
+            count += 1
+    return count
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 2:
+        print(f'Usage: python -m {__spec__.name} <events_dir>')
+        sys.exit(1)
+    rebuilt = rebuild_all_indexes(Path(sys.argv[1]))
+    print(f'Rebuilt {rebuilt} event indexes')
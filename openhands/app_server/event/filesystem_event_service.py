@@ -1,11 +1,12 @@
 """Filesystem-based EventService implementation."""
 
 import asyncio
+import bisect
 import glob
 import json
 import logging
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import AsyncGenerator
 from uuid import UUID
@@ -18,6 +19,7 @@ from openhands.app_server.app_conversation.app_conversation_info_service import
 )
 from openhands.app_server.errors import OpenHandsError
 from openhands.app_server.event.event_service import EventService, EventServiceInjector
+from openhands.app_server.event.filesystem_event_index import add_to_index, get_index
 from openhands.app_server.event_callback.event_callback_models import EventKind
 from openhands.app_server.services.injector import InjectorState
 from openhands.sdk import Event
@@ -32,6 +34,10 @@ class FilesystemEventService(EventService):
     Events are stored in files with the naming format:
     {conversation_id}/{YYYYMMDDHHMMSS}_{kind}_{id.hex}
 
+    Each conversation directory also keeps a sorted index of its event files
+    (see filesystem_event_index), so searches and counts scoped to a single
+    conversation seek by binary search rather than listing every file.
+
     Uses an AppConversationInfoService to lookup conversations
     """
 
@@ -76,6 +82,12 @@ class FilesystemEventService(EventService):
             # Use model_dump with mode='json' to handle UUID serialization
             data = event.model_dump(mode='json')
             f.write(json.dumps(data, indent=2))
+        add_to_index(events_path, filename)
+
+    def _save_events_to_files(self, conversation_id: UUID, events: list[Event]) -> None:
+        """Save a batch of events to files."""
+        for event in events:
+            self._save_event_to_file(conversation_id, event)
 
     def _load_events_from_files(self, file_paths: list[Path]) -> list[Event]:
         events = []
@@ -193,6 +205,93 @@ class FilesystemEventService(EventService):
 
         return filtered_files
 
+    def _timestamp_bound(self, timestamp: datetime | None) -> str | None:
+        """Convert a timestamp bound to the filename prefix it corresponds to.
+
+        Filenames have second precision, so a bound with a fractional second
+        is rounded up to the next whole second.
+        """
+        if timestamp is None:
+            return None
+        if timestamp.microsecond:
+            timestamp = timestamp.replace(microsecond=0) + timedelta(seconds=1)
+        return self._timestamp_to_str(timestamp)
+
+    async def _select_conversation_events(
+        self,
+        conversation_id: UUID,
+        kind__eq: EventKind | None = None,
+        timestamp__gte: datetime | None = None,
+        timestamp__lt: datetime | None = None,
+    ) -> tuple[list[str], int, int] | None:
+        """Select the indexed events of a conversation matching the filters.
+
+        Returns the sorted filenames and the [start, end) range which matches,
+        or None if the conversation does not exist or is not accessible.
+        """
+        conversation = (
+            await self.app_conversation_info_service.get_app_conversation_info(
+                conversation_id
+            )
+        )
+        if not conversation:
+            return None
+        loop = asyncio.get_running_loop()
+        index = await loop.run_in_executor(
+            None, get_index, self.events_dir / str(conversation_id)
+        )
+        if index is None:
+            return None
+        return index.select(
+            kind__eq,
+            self._timestamp_bound(timestamp__gte),
+            self._timestamp_bound(timestamp__lt),
+        )
+
+    async def _search_conversation_events(
+        self,
+        conversation_id: UUID,
+        kind__eq: EventKind | None,
+        timestamp__gte: datetime | None,
+        timestamp__lt: datetime | None,
+        sort_order: EventSortOrder,
+        page_id: str | None,
+        limit: int,
+    ) -> EventPage:
+        selection = await self._select_conversation_events(
+            conversation_id, kind__eq, timestamp__gte, timestamp__lt
+        )
+        if selection is None:
+            return EventPage(items=[], next_page_id=None)
+        names, start, end = selection
+
+        # Seek to the item after page_id, or the first item if it is not found
+        position = None
+        if page_id:
+            i = bisect.bisect_left(names, page_id, start, end)
+            if i < end and names[i] == page_id:
+                position = i
+
+        if sort_order == EventSortOrder.TIMESTAMP_DESC:
+            top = end if position is None else position
+            page_names = names[max(start, top - limit) : top][::-1]
+            has_more = top - limit > start
+        else:
+            first = start if position is None else position + 1
+            page_names = names[first : first + limit]
+            has_more = first + limit < end
+        next_page_id = page_names[-1] if has_more and page_names else None
+
+        # Load all events from files in a background thread.
+        conversation_dir = self.events_dir / str(conversation_id)
+        loop = asyncio.get_running_loop()
+        page_events = await loop.run_in_executor(
+            None,
+            self._load_events_from_files,
+            [conversation_dir / name for name in page_names],
+        )
+        return EventPage(items=page_events, next_page_id=next_page_id)
+
     async def get_event(self, event_id: str) -> Event | None:
         """Get the event with the given id, or None if not found."""
         # Convert event_id to hex format (remove dashes) for filename matching
@@ -235,6 +334,17 @@ class FilesystemEventService(EventService):
         limit: int = 100,
     ) -> EventPage:
         """Search for events matching the given filters."""
+        if conversation_id__eq:
+            return await self._search_conversation_events(
+                conversation_id__eq,
+                kind__eq,
+                timestamp__gte,
+                timestamp__lt,
+                sort_order,
+                page_id,
+                limit,
+            )
+
         # Build the search pattern
         pattern = '*'
         files = self._get_event_files_by_pattern(pattern, conversation_id__eq)
@@ -262,7 +372,8 @@ class FilesystemEventService(EventService):
         page_files = files[start_index : start_index + limit]
         next_page_id = None
         if start_index + limit < len(files):
-            next_page_id = files[start_index + limit].name
+            # The next page starts after the last item of this one
+            next_page_id = page_files[-1].name
 
         # Load all events from files in a background thread.
         loop = asyncio.get_running_loop()
@@ -281,6 +392,15 @@ class FilesystemEventService(EventService):
         sort_order: EventSortOrder = EventSortOrder.TIMESTAMP,
     ) -> int:
         """Count events matching the given filters."""
+        if conversation_id__eq:
+            selection = await self._select_conversation_events(
+                conversation_id__eq, kind__eq, timestamp__gte, timestamp__lt
+            )
+            if selection is None:
+                return 0
+            _, start, end = selection
+            return end - start
+
         # Build the search pattern
         pattern = '*'
         files = self._get_event_files_by_pattern(pattern, conversation_id__eq)
@@ -293,8 +413,7 @@ class FilesystemEventService(EventService):
 
         return len(files)
 
-    async def save_event(self, conversation_id: UUID, event: Event):
-        """Save an event. Internal method intended not be part of the REST api."""
+    async def _validate_conversation(self, conversation_id: UUID) -> None:
         conversation = (
             await self.app_conversation_info_service.get_app_conversation_info(
                 conversation_id
@@ -302,9 +421,24 @@ class FilesystemEventService(EventService):
         )
         if not conversation:
             # This is either an illegal state or somebody is trying to hack
-            raise OpenHandsError('No such conversation: {conversaiont_id}')
+            raise OpenHandsError(f'No such conversation: {conversation_id}')
+
+    async def save_event(self, conversation_id: UUID, event: Event):
+        """Save an event. Internal method intended not be part of the REST api."""
+        await self._validate_conversation(conversation_id)
         self._save_event_to_file(conversation_id, event)
 
+    async def save_events(self, conversation_id: UUID, events: list[Event]):
+        """Save a batch of events, validating the conversation only once."""
+        if not events:
+            return
+        await self._validate_conversation(conversation_id)
+        # Write all files in a single background thread hop.
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None, self._save_events_to_files, conversation_id, events
+        )
+
 
 class FilesystemEventServiceInjector(EventServiceInjector):
     async def inject(
@@ -183,12 +183,25 @@ class SQLEventCallbackService(EventCallbackService):
         return event_callback
 
     async def execute_callbacks(self, conversation_id: UUID, event: Event) -> None:
+        await self.execute_callbacks_batch(conversation_id, [event])
+
+    async def execute_callbacks_batch(
+        self, conversation_id: UUID, events: list[Event]
+    ) -> None:
+        """Execute callbacks for a batch of events.
+
+        Matching callbacks are loaded with a single query and routed to events
+        in memory. Results and callback changes are committed in one transaction.
+        """
+        if not events:
+            return
+        event_kinds = {event.kind for event in events}
         query = (
             select(StoredEventCallback)
             .where(StoredEventCallback.status == EventCallbackStatus.ACTIVE)
             .where(
                 or_(
-                    StoredEventCallback.event_kind == event.kind,
+                    StoredEventCallback.event_kind.in_(event_kinds),
                     StoredEventCallback.event_kind.is_(None),
                 )
             )
@@ -201,19 +214,31 @@ class SQLEventCallbackService(EventCallbackService):
         )
         result = await self.db_session.execute(query)
         stored_callbacks = result.scalars().all()
-        if stored_callbacks:
-            callbacks = [EventCallback(**row2dict(cb)) for cb in stored_callbacks]
+        if not stored_callbacks:
+            return
+
+        callbacks = [EventCallback(**row2dict(cb)) for cb in stored_callbacks]
+        # Callbacks must see events in sequence; callbacks for one event run
+        # concurrently. A callback may disable itself while handling an event,
+        # so its status is checked again before routing each later event to it.
+        for event in events:
+            matching_callbacks = [
+                callback
+                for callback in callbacks
+                if callback.status == EventCallbackStatus.ACTIVE
+                and (callback.event_kind is None or callback.event_kind == event.kind)
+            ]
             await asyncio.gather(
                 *[
                     self.execute_callback(conversation_id, callback, event)
-                    for callback in callbacks
+                    for callback in matching_callbacks
                 ]
             )
 
-            # Persist any new changes callbacks may have made to itself
-            for callback in callbacks:
-                await self.save_event_callback(callback)
-            await self.db_session.commit()
+        # Persist any new changes callbacks may have made to itself
+        for callback in callbacks:
+            await self.save_event_callback(callback)
+        await self.db_session.commit()
 
     async def execute_callback(
         self, conversation_id: UUID, callback: EventCallback, event: Event
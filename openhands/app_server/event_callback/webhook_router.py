@@ -140,9 +140,7 @@ async def on_event(
 
     try:
         # Save events...
-        await asyncio.gather(
-            *[event_service.save_event(conversation_id, event) for event in events]
-        )
+        await event_service.save_events(conversation_id, events)
 
         asyncio.create_task(
             _run_callbacks_in_bg_and_close(
@@ -202,9 +200,8 @@ async def _run_callbacks_in_bg_and_close(
     setattr(state, USER_CONTEXT_ATTR, SpecifyUserContext(user_id=user_id))
 
     async with get_event_callback_service(state) as event_callback_service:
-        # We don't use asynio.gather here because callbacks must be run in sequence.
-        for event in events:
-            await event_callback_service.execute_callbacks(conversation_id, event)
+        # Callbacks are run in sequence, but loaded and committed once per batch.
+        await event_callback_service.execute_callbacks_batch(conversation_id, events)
 
 
 def _import_all_tools():
@@ -9,6 +9,7 @@ if TYPE_CHECKING:
     from openhands.controller.state.state import State
     from openhands.events.action import Action
     from openhands.events.action.message import SystemMessageAction
+    from openhands.llm.completion_stream import CompletionStreamListener
     from openhands.utils.prompt import PromptManager
 from litellm import ChatCompletionToolParam
 
@@ -49,6 +50,8 @@ class Agent(ABC):
         self._prompt_manager: 'PromptManager' | None = None
         self.mcp_tools: dict[str, ChatCompletionToolParam] = {}
         self.tools: list = []
+        # Receives streamed completions when config.enable_streaming is set
+        self.stream_listener: CompletionStreamListener | None = None
 
     @property
     def prompt_manager(self) -> 'PromptManager':
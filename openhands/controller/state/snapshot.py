@@ -0,0 +1,255 @@
+"""Compact, versioned snapshots of the agent state.
+
+A snapshot is a small header followed by the state encoded with msgpack and,
+when zstandard is installed (the snapshot_compression extra), compressed.
+Metrics are stored as the columns of their record histories, and the per-call
+records of the state's metrics are written to append-only segment files with
+the same framing, so a save only rewrites the records added since the last
+full segment.
+
+Values msgpack cannot represent natively (enums, control flags, arbitrary
+objects in extra_data) are embedded as pickles, so any state that could be
+pickled before can be snapshotted.
+"""
+
+import pickle
+from enum import IntEnum
+from typing import Any
+
+import msgpack
+from pydantic import BaseModel
+
+from openhands.llm.metrics import (
+    Cost,
+    MetricRecords,
+    Metrics,
+    ResponseLatency,
+    TokenUsage,
+)
+from openhands.storage.files import FileStore
+from openhands.storage.locations import get_conversation_agent_state_segment_filename
+
+try:
+    import zstandard
+
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+# Not a valid base64 character, so a snapshot is never mistaken for the
+# base64 encoded pickles written by earlier versions
+SNAPSHOT_MAGIC = b'\x93OHS'
+SNAPSHOT_VERSION = 1
+_FLAG_ZSTD = 1
+_HEADER_SIZE = len(SNAPSHOT_MAGIC) + 2
+
+# Number of per-call metric records in a segment file
+METRICS_SEGMENT_SIZE = 256
+
+# Record histories of a Metrics object and the model of their records
+_METRIC_RECORDS: dict[str, type[BaseModel]] = {
+    'costs': Cost,
+    'response_latencies': ResponseLatency,
+    'token_usages': TokenUsage,
+}
+
+
+class _Ext(IntEnum):
+    PICKLE = 1
+    TUPLE = 2
+    METRICS = 3
+    SEGMENTED_METRICS = 4
+
+
+def is_snapshot(data: bytes) -> bool:
+    return data.startswith(SNAPSHOT_MAGIC)
+
+
+class MetricSegments:
+    """Append-only segment files holding the per-call records of state metrics.
+
+    Records are grouped in segments of `METRICS_SEGMENT_SIZE`, named after
+    the position of their first record. A segment is written once, when it
+    is full, and the snapshot only stores where the segments start and end
+    plus the records after them.
+    """
+
+    def __init__(self, file_store: FileStore, sid: str, user_id: str | None) -> None:
+        self.file_store = file_store
+        self.sid = sid
+        self.user_id = user_id
+        # name -> (history the segments were written from, start, end)
+        self._sealed: dict[str, tuple[MetricRecords, int, int]] = {}
+
+    def seal(self, name: str, records: MetricRecords) -> tuple[int, int]:
+        """Write the full segments not written yet, returning where they start and end."""
+        sealed, start, end = self._sealed.get(name, (None, 0, 0))
+        # Records are only appended to a history, but a replaced history or
+        # one that dropped records not yet in a segment starts over
+        if sealed is not records or end < records.dropped:
+            start = end = records.dropped
+        while records.total - end >= METRICS_SEGMENT_SIZE:
+            self.file_store.write(
+                self._filename(name, end),
+                _frame(msgpack.packb(records.columns(end, end + METRICS_SEGMENT_SIZE))),
+            )
+            end += METRICS_SEGMENT_SIZE
+        self._sealed[name] = (records, start, end)
+        return start, end
+
+    def load(
+        self,
+        name: str,
+        model: type[BaseModel],
+        packed: dict[str, Any],
+        max_records: int | None,
+    ) -> MetricRecords:
+        """Read back a history written by `seal` and encoded by `_pack_metrics`."""
+        start, end, dropped = packed['start'], packed['end'], packed['dropped']
+        # Skip the segments whose records were all dropped since
+        if dropped > start:
+            start += (dropped - start) // METRICS_SEGMENT_SIZE * METRICS_SEGMENT_SIZE
+        columns: dict[str, list[Any]] = {field: [] for field in model.model_fields}
+        for position in range(start, end, METRICS_SEGMENT_SIZE):
+            segment = msgpack.unpackb(
+                _unframe(self.file_store.read_bytes(self._filename(name, position)))
+            )
+            for field, values in segment.items():
+                columns[field].extend(values)
+        for field, values in packed['records'].items():
+            columns[field].extend(values)
+        skip = max(dropped - start, 0)
+        records = MetricRecords.from_columns(
+            model,
+            {field: values[skip:] for field, values in columns.items()},
+            dropped=max(dropped, start),
+            max_records=max_records,
+        )
+        self._sealed[name] = (records, start, end)
+        return records
+
+    def _filename(self, name: str, position: int) -> str:
+        return get_conversation_agent_state_segment_filename(
+            self.sid, name, position, self.user_id
+        )
+
+
+def encode_snapshot(state: dict[str, Any], segments: MetricSegments) -> bytes:
+    """Encode the pickled state dict of a State, writing new metric segments."""
+    fields = {}
+    for key, value in state.items():
+        if isinstance(value, Metrics):
+            # Only the metrics of the state itself have a stable name to segment by
+            value = msgpack.ExtType(
+                _Ext.SEGMENTED_METRICS, _pack_metrics(value, segments, key)
+            )
+        fields[key] = value
+    return _frame(msgpack.packb(fields, default=_default, strict_types=True))
+
+
+def decode_snapshot(data: bytes, segments: MetricSegments) -> dict[str, Any]:
+    """Decode a snapshot into the state dict to restore a State from."""
+    body = _unframe(data)
+
+    def ext_hook(code: int, payload: bytes) -> Any:
+        if code == _Ext.PICKLE:
+            return pickle.loads(payload)
+        if code == _Ext.TUPLE:
+            return tuple(_unpack(payload, ext_hook))
+        if code == _Ext.METRICS:
+            return _unpack_metrics(payload, None)
+        if code == _Ext.SEGMENTED_METRICS:
+            return _unpack_metrics(payload, segments)
+        return msgpack.ExtType(code, payload)
+
+    return _unpack(body, ext_hook)
+
+
+def _frame(body: bytes) -> bytes:
+    flags = 0
+    if HAS_ZSTD:
+        body = zstandard.ZstdCompressor().compress(body)
+        flags |= _FLAG_ZSTD
+    return SNAPSHOT_MAGIC + bytes([SNAPSHOT_VERSION, flags]) + body
+
+
+def _unframe(data: bytes) -> bytes:
+    if not is_snapshot(data):
+        raise ValueError('Not a state snapshot')
+    version, flags = data[len(SNAPSHOT_MAGIC)], data[len(SNAPSHOT_MAGIC) + 1]
+    if version > SNAPSHOT_VERSION:
+        raise ValueError(f'Unsupported state snapshot version: {version}')
+    body = data[_HEADER_SIZE:]
+    if flags & _FLAG_ZSTD:
+        if not HAS_ZSTD:
+            raise ValueError('The state snapshot requires zstandard to be installed')
+        body = zstandard.ZstdDecompressor().decompress(body)
+    return body
+
+
+def _unpack(data: bytes, ext_hook: Any) -> Any:
+    return msgpack.unpackb(data, ext_hook=ext_hook, strict_map_key=False)
+
+
+def _default(value: Any) -> msgpack.ExtType:
+    if isinstance(value, tuple):
+        return msgpack.ExtType(
+            _Ext.TUPLE, msgpack.packb(list(value), default=_default, strict_types=True)
+        )
+    if isinstance(value, Metrics):
+        return msgpack.ExtType(_Ext.METRICS, _pack_metrics(value, None, None))
+    return msgpack.ExtType(_Ext.PICKLE, pickle.dumps(value))
+
+
+def _pack_metrics(
+    metrics: Metrics, segments: MetricSegments | None, name: str | None
+) -> bytes:
+    packed: dict[str, Any] = {
+        'name': name,
+        'model_name': metrics.model_name,
+        'accumulated_cost': metrics.accumulated_cost,
+        'max_budget_per_task': metrics.max_budget_per_task,
+        'accumulated_token_usage': metrics.accumulated_token_usage.model_dump(),
+        'max_records': metrics.costs.max_records,
+        'histories': {},
+    }
+    for attr in _METRIC_RECORDS:
+        records: MetricRecords = getattr(metrics, attr)
+        start = end = records.dropped
+        if segments is not None and name is not None:
+            start, end = segments.seal(f'{name}.{attr}', records)
+        packed['histories'][attr] = {
+            'dropped': records.dropped,
+            'start': start,
+            'end': end,
+            'records': records.columns(start=end),
+        }
+    return msgpack.packb(packed)
+
+
+def _unpack_metrics(payload: bytes, segments: MetricSegments | None) -> Metrics:
+    packed = msgpack.unpackb(payload)
+    max_records = packed['max_records']
+    metrics = Metrics(packed['model_name'], max_records=max_records)
+    metrics._accumulated_cost = packed['accumulated_cost']
+    metrics._max_budget_per_task = packed['max_budget_per_task']
+    metrics._accumulated_token_usage = TokenUsage.model_construct(
+        **packed['accumulated_token_usage']
+    )
+    for attr, model in _METRIC_RECORDS.items():
+        history = packed['histories'][attr]
+        if history['end'] > history['start']:
+            if segments is None or packed['name'] is None:
+                raise ValueError('Missing metric segments in state snapshot')
+            records = segments.load(
+                f'{packed["name"]}.{attr}', model, history, max_records
+            )
+        else:
+            records = MetricRecords.from_columns(
+                model,
+                history['records'],
+                dropped=history['dropped'],
+                max_records=max_records,
+            )
+        setattr(metrics, f'_{attr}', records)
+    return metrics
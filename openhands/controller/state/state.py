@@ -3,6 +3,7 @@ from __future__ import annotations
 import base64
 import os
 import pickle
+import re
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
@@ -12,6 +13,12 @@ from openhands.controller.state.control_flags import (
     BudgetControlFlag,
     IterationControlFlag,
 )
+from openhands.controller.state.snapshot import (
+    MetricSegments,
+    decode_snapshot,
+    encode_snapshot,
+    is_snapshot,
+)
 from openhands.core.logger import openhands_logger as logger
 from openhands.core.schema import AgentState
 from openhands.events.action import (
@@ -25,6 +32,10 @@ from openhands.server.services.conversation_stats import ConversationStats
 from openhands.storage.files import FileStore
 from openhands.storage.locations import get_conversation_agent_state_filename
 
+LUMIO_SETTINGS_PATTERN = re.compile(
+    r'<lumio-settings\s+mode="([^"]+)"\s+skip-tests="([^"]+)"\s*/>'
+)
+
 RESUMABLE_STATES = [
     AgentState.RUNNING,
     AgentState.PAUSED,
@@ -33,6 +44,26 @@ RESUMABLE_STATES = [
 ]
 
 
+def parse_lumio_settings(content: str) -> dict[str, Any] | None:
+    """Parse <lumio-settings> tag from message content.
+
+    Args:
+        content: The message content to parse
+
+    Returns:
+        Dict with 'mode' and 'skip_tests' keys if found, None otherwise
+    """
+    if '<lumio-settings' not in content:
+        return None
+    match = LUMIO_SETTINGS_PATTERN.search(content)
+    if match:
+        return {
+            'mode': match.group(1),
+            'skip_tests': match.group(2).lower() == 'true',
+        }
+    return None
+
+
 # NOTE: this is deprecated
 class TrafficControlState(str, Enum):
     # default state, no rate limiting
@@ -64,7 +95,7 @@ class State:
 
     - Data for saving and restoring the agent:
       - save to and restore from a session
-      - serialize with pickle and base64
+      - serialize as a compact snapshot, see `snapshot.py`
 
     - Save / restore data about message history
       - start and end IDs for events in agent's history
@@ -130,12 +161,14 @@ class State:
         conversation_stats = self.conversation_stats
         self.conversation_stats = None  # Don't save conversation stats, handles itself
 
-        pickled = pickle.dumps(self)
         logger.debug(f'Saving state to session {sid}:{self.agent_state}')
-        encoded = base64.b64encode(pickled).decode('utf-8')
         try:
+            snapshot = encode_snapshot(
+                self.__getstate__(),
+                self._metric_segments(sid, file_store, user_id),
+            )
             file_store.write(
-                get_conversation_agent_state_filename(sid, user_id), encoded
+                get_conversation_agent_state_filename(sid, user_id), snapshot
             )
 
             # see if state is in the old directory on saas/remote use cases and delete it.
@@ -148,8 +181,8 @@ class State:
         except Exception as e:
             logger.error(f'Failed to save state to session: {e}')
             raise e
-
-        self.conversation_stats = conversation_stats  # restore reference
+        finally:
+            self.conversation_stats = conversation_stats  # restore reference
 
     @staticmethod
     def restore_from_session(
@@ -158,19 +191,12 @@ class State:
         """Restores the state from the previously saved session."""
         state: State
         try:
-            encoded = file_store.read(
-                get_conversation_agent_state_filename(sid, user_id)
-            )
-            pickled = base64.b64decode(encoded)
-            state = pickle.loads(pickled)
+            state = State._load_from_session(sid, file_store, user_id)
         except FileNotFoundError:
             # if user_id is provided, we are in a saas/remote use case
             # and we need to check if the state is in the old directory.
             if user_id:
-                filename = get_conversation_agent_state_filename(sid)
-                encoded = file_store.read(filename)
-                pickled = base64.b64decode(encoded)
-                state = pickle.loads(pickled)
+                state = State._load_from_session(sid, file_store, None)
             else:
                 raise FileNotFoundError(
                     f'Could not restore state from session file for sid: {sid}'
@@ -193,6 +219,37 @@ class State:
 
         return state
 
+    @staticmethod
+    def _load_from_session(
+        sid: str, file_store: FileStore, user_id: str | None
+    ) -> 'State':
+        data = file_store.read_bytes(
+            get_conversation_agent_state_filename(sid, user_id)
+        )
+        if not is_snapshot(data):
+            # saved by an earlier version as a base64 encoded pickle
+            return pickle.loads(base64.b64decode(data))
+        segments = MetricSegments(file_store, sid, user_id)
+        state = State.__new__(State)
+        state.__setstate__(decode_snapshot(data, segments))
+        # the segments read back don't need to be written again
+        state._snapshot_segments = segments
+        return state
+
+    def _metric_segments(
+        self, sid: str, file_store: FileStore, user_id: str | None
+    ) -> MetricSegments:
+        segments: MetricSegments | None = getattr(self, '_snapshot_segments', None)
+        if (
+            segments is None
+            or segments.file_store is not file_store
+            or segments.sid != sid
+            or segments.user_id != user_id
+        ):
+            segments = MetricSegments(file_store, sid, user_id)
+            self._snapshot_segments = segments
+        return segments
+
     def __getstate__(self) -> dict:
         # don't pickle history, it will be restored from the event stream
         state = self.__dict__.copy()
@@ -202,6 +259,7 @@ class State:
         # history after that gets reloaded.
         state.pop('_history_checksum', None)
         state.pop('_view', None)
+        state.pop('_snapshot_segments', None)
 
         # Remove deprecated fields before pickling
         state.pop('iteration', None)
@@ -278,6 +336,17 @@ class State:
                 return event
         return None
 
+    def update_lumio_settings(self, event: Event) -> None:
+        """Updates lumio_settings if the event is a user message with a <lumio-settings> tag.
+
+        Called for each event added to the history, so the current settings are
+        always available without scanning the history.
+        """
+        if isinstance(event, MessageAction) and event.source == EventSource.USER:
+            settings = parse_lumio_settings(event.content)
+            if settings:
+                self.lumio_settings = settings
+
     def to_llm_metadata(self, model_name: str, agent_name: str) -> dict:
         metadata = {
             'session_id': self.session_id,
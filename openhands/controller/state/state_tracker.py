@@ -191,6 +191,10 @@ class StateTracker:
         else:
             self.state.history = events
 
+        # pick up settings from restored messages once, later ones come through add_history
+        for event in self.state.history:
+            self.state.update_lumio_settings(event)
+
         # make sure history is in sync
         self.state.start_id = start_id
 
@@ -221,6 +225,7 @@ class StateTracker:
         # if the event is not filtered out, add it to the history
         if self.agent_history_filter.include(event):
             self.state.history.append(event)
+            self.state.update_lumio_settings(event)
 
     def get_trajectory(self, include_screenshots: bool = False) -> list[dict]:
         return [
@@ -236,12 +241,12 @@ class StateTracker:
             self.state.budget_flag.increase_limit(headless_mode)
 
     def get_metrics_snapshot(self):
-        """Deep copy of metrics
+        """Snapshot of the metrics totals, without copying the per-call records
         This serves as a snapshot for the parent's metrics at the time a delegate is created
         It will be stored and used to compute local metrics for the delegate
         (since delegates now accumulate metrics from where its parent left off)
         """
-        return self.state.metrics.copy()
+        return self.state.metrics.snapshot()
 
     def save_state(self):
         """Save's current state to persistent store"""
@@ -53,6 +53,8 @@ class AgentConfig(BaseModel):
     """Whether to enable plan mode, which uses the long horizon system message and add the new tool - task_tracker - for planning, tracking and executing complex tasks."""
     enable_stuck_detection: bool = Field(default=True)
     """Whether to enable stuck/loop detection. When disabled, the agent will not automatically detect and recover from loops."""
+    enable_streaming: bool = Field(default=False)
+    """Whether to stream LLM completions, forwarding text deltas and completed tool calls to the agent's stream listener while the response is generated."""
     condenser: CondenserConfig = Field(
         # The default condenser is set to the conversation window condenser -- if
         # we use NoOp and the conversation hits the LLM context length limit,
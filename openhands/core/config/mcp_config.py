@@ -226,11 +226,14 @@ class MCPConfig(BaseModel):
         sse_servers: List of MCP SSE server configs
         stdio_servers: List of MCP stdio server configs. These servers will be added to the MCP Router running inside runtime container.
         shttp_servers: List of MCP HTTP server configs.
+        connect_timeout: Seconds allowed for connecting to a server and listing its tools.
+            Defaults to MCP_SERVER_CONNECT_TIMEOUT; SHTTP servers with a larger timeout use theirs.
     """
 
     sse_servers: list[MCPSSEServerConfig] = Field(default_factory=list)
     stdio_servers: list[MCPStdioServerConfig] = Field(default_factory=list)
     shttp_servers: list[MCPSHTTPServerConfig] = Field(default_factory=list)
+    connect_timeout: int | None = Field(default=None, ge=1)
     model_config = ConfigDict(extra='forbid')
 
     @staticmethod
@@ -319,6 +322,7 @@ class MCPConfig(BaseModel):
                 sse_servers=mcp_config.sse_servers,
                 stdio_servers=mcp_config.stdio_servers,
                 shttp_servers=mcp_config.shttp_servers,
+                connect_timeout=mcp_config.connect_timeout,
             )
         except ValidationError as e:
             raise ValueError(f'Invalid MCP configuration: {e}')
@@ -329,6 +333,7 @@ class MCPConfig(BaseModel):
             sse_servers=self.sse_servers + other.sse_servers,
             stdio_servers=self.stdio_servers + other.stdio_servers,
             shttp_servers=self.shttp_servers + other.shttp_servers,
+            connect_timeout=other.connect_timeout or self.connect_timeout,
         )
 
 
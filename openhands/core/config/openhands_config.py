@@ -60,6 +60,9 @@ class OpenHandsConfig(BaseModel):
         workspace_mount_path_in_sandbox (deprecated): Path to mount the workspace in sandbox. Defaults to `/workspace`.
         workspace_mount_rewrite (deprecated): Path to rewrite the workspace mount path.
         cache_dir: Path to cache directory. Defaults to `/tmp/cache`.
+        llm_response_cache: Whether to cache the responses of auxiliary LLM calls (e.g. conversation titles) in `cache_dir`.
+        llm_response_cache_max_entries: Maximum number of cached LLM responses, least recently used ones are evicted.
+        llm_response_cache_ttl_seconds: How long a cached LLM response is reused.
         run_as_openhands: Whether to run as openhands.
         max_iterations: Maximum number of iterations allowed.
         max_budget_per_task: Maximum budget per task, agent stops if exceeded.
@@ -108,6 +111,9 @@ class OpenHandsConfig(BaseModel):
     # End of deprecated parameters
 
     cache_dir: str = Field(default='/tmp/cache')
+    llm_response_cache: bool = Field(default=False)
+    llm_response_cache_max_entries: int = Field(default=1000)
+    llm_response_cache_ttl_seconds: int = Field(default=86400)  # 1 day in seconds
     run_as_openhands: bool = Field(default=True)
     max_iterations: int = Field(default=OH_MAX_ITERATIONS)
     max_budget_per_task: float | None = Field(default=None)
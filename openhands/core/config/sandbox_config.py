@@ -52,6 +52,16 @@ class SandboxConfig(BaseModel):
             Use <PORT> as placeholder for VSCode port. Examples:
             - http://localhost:<PORT> (default, direct access)
             - https://example.com/vscode/<PORT> (for path-based routing via nginx)
+        move_cache_volume: Docker volume (or absolute host path) mounted at
+            /openhands/cache/move in Docker runtimes, so Move git dependencies and
+            the `lu build` cache are shared by all runtimes on the host. Any
+            conversation can write to it, so only set it when all of them are
+            trusted. Unset by default, which keeps them in each container.
+        pnpm_store_volume: Docker volume (or absolute host path) mounted at
+            /openhands/cache/pnpm-store, the pnpm store shared by all runtimes
+            on the host, and read-only in deployment containers. Any
+            conversation can write to it, so only set it when all of them are
+            trusted. Unset by default, which keeps the store in each container.
     """
 
     remote_runtime_api_url: str | None = Field(default='http://localhost:8000')
@@ -104,6 +114,14 @@ class SandboxConfig(BaseModel):
         default='http://localhost:<PORT>',
         description='URL mask for building VSCODE_BASE_URL. Use <PORT> as placeholder for VSCode port.',
     )
+    move_cache_volume: str | None = Field(
+        default=None,
+        description='Docker volume or host path mounted at /openhands/cache/move, shared by all runtimes. Writable by every conversation, so unset by default.',
+    )
+    pnpm_store_volume: str | None = Field(
+        default=None,
+        description='Docker volume or host path mounted at /openhands/cache/pnpm-store, shared by all runtimes and deployments. Writable by every conversation, so unset by default.',
+    )
     volumes: str | None = Field(
         default=None,
         description="Volume mounts in the format 'host_path:container_path[:mode]', e.g. '/my/host/dir:/workspace:rw'. Multiple mounts can be specified using commas, e.g. '/path1:/workspace/path1,/path2:/workspace/path2:ro'",
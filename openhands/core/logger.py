@@ -1,11 +1,14 @@
+import atexit
 import copy
 import logging
 import os
+import queue
 import re
 import sys
+import threading
 import traceback
 from datetime import datetime
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 from types import TracebackType
 from typing import Any, Literal, Mapping, MutableMapping, TextIO
 
@@ -21,6 +24,11 @@ DEBUG_LLM = os.getenv('DEBUG_LLM', 'False').lower() in ['true', '1', 'yes']
 LOG_JSON = os.getenv('LOG_JSON', 'False').lower() in ['true', '1', 'yes']
 LOG_JSON_LEVEL_KEY = os.getenv('LOG_JSON_LEVEL_KEY', 'level')
 
+# Ship records to handlers on a background thread, disabled by default
+LOG_ASYNC = os.getenv('LOG_ASYNC', 'False').lower() in ['true', '1', 'yes']
+LOG_QUEUE_SIZE = int(os.getenv('LOG_QUEUE_SIZE', '10000'))
+LOG_BATCH_SIZE = int(os.getenv('LOG_BATCH_SIZE', '256'))
+
 
 # Configure litellm logging based on DEBUG_LLM
 if DEBUG_LLM:
@@ -338,6 +346,130 @@ def json_log_handler(
     return handler
 
 
+class DroppingQueueHandler(QueueHandler):
+    """Enqueues records for a background listener without doing any I/O.
+
+    The queue is bounded: when it is full, records at DEBUG level or below are
+    dropped (and counted) instead of blocking the caller. Records above DEBUG
+    wait for a free slot so warnings and errors are never lost.
+    """
+
+    def __init__(self, log_queue: queue.Queue) -> None:
+        super().__init__(log_queue)
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The listener runs in this process, so exc_info and extra attributes
+        # can travel as-is. Only the message is resolved eagerly, because args
+        # may be mutated by the caller before the listener gets to them.
+        new_record = copy.copy(record)
+        new_record.msg = record.getMessage()
+        new_record.args = None
+        return new_record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            if record.levelno <= logging.DEBUG:
+                with self._dropped_lock:
+                    self.dropped += 1
+                return
+            self.queue.put(record)
+
+
+class BatchingQueueListener(QueueListener):
+    """Queue listener which drains records in batches on a dedicated thread.
+
+    Handlers are flushed once per batch rather than once per record.
+    """
+
+    def __init__(
+        self,
+        log_queue: queue.Queue,
+        *handlers: logging.Handler,
+        batch_size: int = LOG_BATCH_SIZE,
+    ) -> None:
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self.batch_size = batch_size
+
+    def enqueue_sentinel(self) -> None:
+        # The queue is bounded, so wait for room instead of raising queue.Full
+        self.queue.put(self._sentinel)
+
+    def _monitor(self) -> None:
+        q = self.queue
+        while True:
+            batch = [q.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(q.get_nowait())
+                except queue.Empty:
+                    break
+            stop = False
+            for record in batch:
+                if record is self._sentinel:
+                    stop = True
+                else:
+                    self.handle(record)
+                q.task_done()
+            for handler in self.handlers:
+                handler.flush()
+            if stop:
+                break
+
+
+_queue_listeners: list[BatchingQueueListener] = []
+
+
+def enable_async_logging(
+    logger: logging.Logger,
+    queue_size: int = LOG_QUEUE_SIZE,
+    batch_size: int = LOG_BATCH_SIZE,
+) -> DroppingQueueHandler:
+    """Moves the handlers of a logger behind a queue serviced by a background thread.
+
+    Args:
+        logger: The logger whose handlers should be moved off the calling thread.
+        queue_size: Maximum number of pending records.
+        batch_size: Maximum number of records written per batch.
+
+    Returns:
+        The queue handler now attached to the logger.
+    """
+    for handler in logger.handlers:
+        if isinstance(handler, DroppingQueueHandler):
+            return handler
+    handlers = list(logger.handlers)
+    log_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+    queue_handler = DroppingQueueHandler(log_queue)
+    listener = BatchingQueueListener(log_queue, *handlers, batch_size=batch_size)
+    for handler in handlers:
+        logger.removeHandler(handler)
+    logger.addHandler(queue_handler)
+    listener.start()
+    _queue_listeners.append(listener)
+    return queue_handler
+
+
+def stop_async_logging() -> None:
+    """Flushes pending records and stops all background log listeners."""
+    while _queue_listeners:
+        _queue_listeners.pop().stop()
+
+
+def get_dropped_log_records(logger: logging.Logger) -> int:
+    """Returns how many DEBUG records a logger dropped under back-pressure."""
+    return sum(
+        handler.dropped
+        for handler in logger.handlers
+        if isinstance(handler, DroppingQueueHandler)
+    )
+
+
+atexit.register(stop_async_logging)
+
 # Set up logging
 logging.basicConfig(level=logging.ERROR)
 
@@ -494,6 +626,11 @@ def _setup_llm_logger(name: str, log_level: int) -> logging.Logger:
 llm_prompt_logger = _setup_llm_logger('prompt', current_log_level)
 llm_response_logger = _setup_llm_logger('response', current_log_level)
 
+if LOG_ASYNC:
+    for _logger in (openhands_logger, llm_prompt_logger, llm_response_logger):
+        if _logger.handlers:
+            enable_async_logging(_logger)
+
 
 class OpenHandsLoggerAdapter(logging.LoggerAdapter):
     extra: dict
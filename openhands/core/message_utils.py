@@ -13,19 +13,13 @@ def get_token_usage_for_event(event: Event, metrics: Metrics) -> TokenUsage | No
     if event.tool_call_metadata and event.tool_call_metadata.model_response:
         tool_response_id = event.tool_call_metadata.model_response.get('id')
         if tool_response_id:
-            usage_rec = next(
-                (u for u in metrics.token_usages if u.response_id == tool_response_id),
-                None,
-            )
+            usage_rec = metrics.token_usages.find('response_id', tool_response_id)
             if usage_rec is not None:
                 return usage_rec
 
     # 2) Fallback to the top-level event.response_id if present
     if event.response_id:
-        return next(
-            (u for u in metrics.token_usages if u.response_id == event.response_id),
-            None,
-        )
+        return metrics.token_usages.find('response_id', event.response_id)
 
     return None
 
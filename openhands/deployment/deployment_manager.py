@@ -21,6 +21,7 @@ from openhands.storage.data_models.deployment_metadata import (
 from openhands.storage.locations import get_conversation_workspace_dir
 
 DEPLOY_PORT_RANGE = (50000, 54999)
+PNPM_STORE_DIR = '/openhands/cache/pnpm-store'
 
 
 class DeploymentManager:
@@ -230,11 +231,21 @@ set -e;
 ls -l /workspace/;
 cd /workspace/frontend;
 if [ ! -d "node_modules" ]; then
-    pnpm install --store-dir /tmp/pnpm-store --shamefully-hoist
+    /openhands/bin/lu install /workspace || \
+        pnpm install --store-dir /tmp/pnpm-store --shamefully-hoist
 fi;
 pnpm vite --host --port ${APP_PORT_1} --strictPort;
 """
 
+            volumes: dict[Any, dict[str, str]] = {
+                workspace_dir: {'bind': '/workspace', 'mode': 'rw'},
+            }
+            # The runtimes' pnpm store, read-only: lu installs from it or
+            # falls back to a local store
+            pnpm_store = self.config.sandbox.pnpm_store_volume
+            if pnpm_store:
+                volumes[pnpm_store] = {'bind': PNPM_STORE_DIR, 'mode': 'ro'}
+
             run_kwargs: dict[str, Any] = {
                 'command': ['bash', '-c', startup_script],
                 'name': container_name,
@@ -244,9 +255,7 @@ pnpm vite --host --port ${APP_PORT_1} --strictPort;
                     'APP_BASE_URL_1': f'http://localhost:{app_port}',
                 },
                 'ports': {f'{app_port}/tcp': app_port},
-                'volumes': {
-                    workspace_dir: {'bind': '/workspace', 'mode': 'rw'},
-                },
+                'volumes': volumes,
                 # 'restart_policy': {
                 #     'Name': restart_policy_name,
                 #     'MaximumRetryCount': self.deployment_config.max_restart_attempts,
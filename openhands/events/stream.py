@@ -13,10 +13,10 @@ from openhands.events.event_store import EventStore
 from openhands.events.serialization.event import event_from_dict, event_to_dict
 from openhands.io import json
 from openhands.storage import FileStore
+from openhands.storage.adapters import get_async_file_store
 from openhands.storage.locations import (
     get_conversation_dir,
 )
-from openhands.utils.async_utils import call_sync_from_async
 from openhands.utils.shutdown_listener import should_continue
 
 
@@ -34,7 +34,7 @@ async def session_exists(
     sid: str, file_store: FileStore, user_id: str | None = None
 ) -> bool:
     try:
-        await call_sync_from_async(file_store.list, get_conversation_dir(sid, user_id))
+        await get_async_file_store(file_store).list(get_conversation_dir(sid, user_id))
         return True
     except FileNotFoundError:
         return False
@@ -161,6 +161,32 @@ class EventStream(EventStore):
         self._clean_up_subscriber(subscriber_id, callback_id)
 
     def add_event(self, event: Event, source: EventSource) -> None:
+        event, data, current_write_page = self._assign_id(event, source)
+        if event.id is not None:
+            # Write the event to the store - this can take some time
+            self.file_store.write(*self._get_event_file(event.id, data))
+
+            # Store the cache page last - if it is not present during reads then it will simply be bypassed.
+            cache_file = self._get_cache_page_file(current_write_page)
+            if cache_file:
+                self.file_store.write(*cache_file)
+        self._queue.put(event)
+
+    async def add_event_async(self, event: Event, source: EventSource) -> None:
+        """Add an event like `add_event`, without blocking the event loop on the writes."""
+        event, data, current_write_page = self._assign_id(event, source)
+        if event.id is not None:
+            file_store = get_async_file_store(self.file_store)
+            await file_store.write(*self._get_event_file(event.id, data))
+            cache_file = self._get_cache_page_file(current_write_page)
+            if cache_file:
+                await file_store.write(*cache_file)
+        self._queue.put(event)
+
+    def _assign_id(
+        self, event: Event, source: EventSource
+    ) -> tuple[Event, dict, list[dict]]:
+        """Give the event the next ID, returning it with its data and its write page."""
         if event.id != Event.INVALID_ID:
             raise ValueError(
                 f'Event already has an ID:{event.id}. It was probably added back to the EventStream from inside a handler, triggering a loop.'
@@ -182,35 +208,32 @@ class EventStream(EventStore):
             # If the page is full, create a new page for future events / other threads to use
             if len(current_write_page) == self.cache_size:
                 self._write_page_cache = []
+        return event, data, current_write_page
+
+    def _get_event_file(self, event_id: int, data: dict) -> tuple[str, str]:
+        event_json = json.dumps(data)
+        filename = self._get_filename_for_id(event_id, self.user_id)
+        if len(event_json) > 1_000_000:  # Roughly 1MB in bytes, ignoring encoding
+            logger.warning(
+                f'Saving event JSON over 1MB: {len(event_json):,} bytes, filename: {filename}',
+                extra={
+                    'user_id': self.user_id,
+                    'session_id': self.sid,
+                    'size': len(event_json),
+                },
+            )
+        return filename, event_json
 
-        if event.id is not None:
-            # Write the event to the store - this can take some time
-            event_json = json.dumps(data)
-            filename = self._get_filename_for_id(event.id, self.user_id)
-            if len(event_json) > 1_000_000:  # Roughly 1MB in bytes, ignoring encoding
-                logger.warning(
-                    f'Saving event JSON over 1MB: {len(event_json):,} bytes, filename: {filename}',
-                    extra={
-                        'user_id': self.user_id,
-                        'session_id': self.sid,
-                        'size': len(event_json),
-                    },
-                )
-            self.file_store.write(filename, event_json)
-
-            # Store the cache page last - if it is not present during reads then it will simply be bypassed.
-            self._store_cache_page(current_write_page)
-        self._queue.put(event)
-
-    def _store_cache_page(self, current_write_page: list[dict]):
-        """Store a page in the cache. Reading individual events is slow when there are a lot of them, so we use pages."""
+    def _get_cache_page_file(
+        self, current_write_page: list[dict]
+    ) -> tuple[str, str] | None:
+        """The cache page to store, once it is full. Reading individual events is slow when there are a lot of them, so we use pages."""
         if len(current_write_page) < self.cache_size:
-            return
+            return None
         start = current_write_page[0]['id']
         end = start + self.cache_size
         contents = json.dumps(current_write_page)
-        cache_filename = self._get_filename_for_cache(start, end)
-        self.file_store.write(cache_filename, contents)
+        return self._get_filename_for_cache(start, end), contents
 
     def set_secrets(self, secrets: dict[str, str]) -> None:
         self.secrets = secrets.copy()
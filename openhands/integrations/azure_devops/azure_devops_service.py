@@ -25,6 +25,7 @@ from openhands.integrations.service_types import (
     ProviderType,
     RequestMethod,
 )
+from openhands.utils.http_session import get_async_client
 from openhands.utils.import_utils import get_impl
 
 
@@ -186,10 +187,22 @@ class AzureDevOpsServiceImpl(
         method: RequestMethod = RequestMethod.GET,
     ) -> tuple[Any, dict]:
         try:
-            async with httpx.AsyncClient() as client:
-                azure_devops_headers = await self._get_azure_devops_headers()
+            client = get_async_client()
+            azure_devops_headers = await self._get_azure_devops_headers()
+
+            # Make initial request
+            response = await self.execute_request(
+                client=client,
+                url=url,
+                headers=azure_devops_headers,
+                params=params,
+                method=method,
+            )
 
-                # Make initial request
+            # Handle token refresh if needed
+            if self.refresh and self._has_token_expired(response.status_code):
+                await self.get_latest_token()
+                azure_devops_headers = await self._get_azure_devops_headers()
                 response = await self.execute_request(
                     client=client,
                     url=url,
@@ -198,24 +211,12 @@ class AzureDevOpsServiceImpl(
                     method=method,
                 )
 
-                # Handle token refresh if needed
-                if self.refresh and self._has_token_expired(response.status_code):
-                    await self.get_latest_token()
-                    azure_devops_headers = await self._get_azure_devops_headers()
-                    response = await self.execute_request(
-                        client=client,
-                        url=url,
-                        headers=azure_devops_headers,
-                        params=params,
-                        method=method,
-                    )
-
-                response.raise_for_status()
-                headers = {}
-                if 'Link' in response.headers:
-                    headers['Link'] = response.headers['Link']
-
-                return response.json(), headers
+            response.raise_for_status()
+            headers = {}
+            if 'Link' in response.headers:
+                headers['Link'] = response.headers['Link']
+
+            return response.json(), headers
 
         except httpx.HTTPStatusError as e:
             raise self.handle_http_status_error(e)
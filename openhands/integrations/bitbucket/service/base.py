@@ -14,7 +14,7 @@ from openhands.integrations.service_types import (
     ResourceNotFoundError,
     User,
 )
-from openhands.utils.http_session import httpx_verify_option
+from openhands.utils.http_session import get_async_client
 
 
 class BitBucketMixinBase(BaseGitService, HTTPClient):
@@ -84,23 +84,23 @@ class BitBucketMixinBase(BaseGitService, HTTPClient):
 
         """
         try:
-            async with httpx.AsyncClient(verify=httpx_verify_option()) as client:
+            client = get_async_client()
+            bitbucket_headers = await self._get_headers()
+            response = await self.execute_request(
+                client, url, bitbucket_headers, params, method
+            )
+            if self.refresh and self._has_token_expired(response.status_code):
+                await self.get_latest_token()
                 bitbucket_headers = await self._get_headers()
                 response = await self.execute_request(
-                    client, url, bitbucket_headers, params, method
+                    client=client,
+                    url=url,
+                    headers=bitbucket_headers,
+                    params=params,
+                    method=method,
                 )
-                if self.refresh and self._has_token_expired(response.status_code):
-                    await self.get_latest_token()
-                    bitbucket_headers = await self._get_headers()
-                    response = await self.execute_request(
-                        client=client,
-                        url=url,
-                        headers=bitbucket_headers,
-                        params=params,
-                        method=method,
-                    )
-                response.raise_for_status()
-                return response.json(), dict(response.headers)
+            response.raise_for_status()
+            return response.json(), dict(response.headers)
         except httpx.HTTPStatusError as e:
             raise self.handle_http_status_error(e)
         except httpx.HTTPError as e:
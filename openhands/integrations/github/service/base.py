@@ -1,17 +1,30 @@
+import asyncio
 import json
+import re
 from typing import Any, cast
 
 import httpx
 from pydantic import SecretStr
 
-from openhands.integrations.protocols.http_client import HTTPClient
+from openhands.integrations.protocols.http_client import CachedResponse, HTTPClient
 from openhands.integrations.service_types import (
     BaseGitService,
     RequestMethod,
     UnknownException,
     User,
 )
-from openhands.utils.http_session import httpx_verify_option
+from openhands.utils.http_session import get_async_client
+
+# Pages of a list fetched at the same time once the number of pages is known
+MAX_CONCURRENT_PAGES = 8
+
+_LAST_PAGE_PATTERN = re.compile(r'<[^>]*[?&]page=(\d+)[^>]*>;\s*rel="last"')
+
+
+def get_last_page(link_header: str) -> int | None:
+    """The number of the last page in a `Link` header, if it has one."""
+    match = _LAST_PAGE_PATTERN.search(link_header)
+    return int(match.group(1)) if match else None
 
 
 class GitHubMixinBase(BaseGitService, HTTPClient):
@@ -44,63 +57,86 @@ class GitHubMixinBase(BaseGitService, HTTPClient):
         method: RequestMethod = RequestMethod.GET,
     ) -> tuple[Any, dict]:  # type: ignore[override]
         try:
-            async with httpx.AsyncClient(verify=httpx_verify_option()) as client:
-                github_headers = await self._get_headers()
+            client = get_async_client()
+            github_headers = await self._get_headers()
 
-                # Make initial request
-                response = await self.execute_request(
-                    client=client,
-                    url=url,
-                    headers=github_headers,
-                    params=params,
-                    method=method,
+            # Make initial request
+            response, cached = await self._execute(
+                client, url, github_headers, params, method
+            )
+
+            # Handle token refresh if needed
+            if self.refresh and self._has_token_expired(response.status_code):
+                await self.get_latest_token()
+                github_headers = await self._get_headers()
+                response, cached = await self._execute(
+                    client, url, github_headers, params, method
                 )
 
-                # Handle token refresh if needed
-                if self.refresh and self._has_token_expired(response.status_code):
-                    await self.get_latest_token()
-                    github_headers = await self._get_headers()
-                    response = await self.execute_request(
-                        client=client,
-                        url=url,
-                        headers=github_headers,
-                        params=params,
-                        method=method,
-                    )
-
-                response.raise_for_status()
-                headers: dict = {}
-                if 'Link' in response.headers:
-                    headers['Link'] = response.headers['Link']
-
-                return response.json(), headers
+            if cached is not None:
+                # Unchanged since it was cached
+                return cached.json(), dict(cached.headers)
+
+            response.raise_for_status()
+            headers: dict = {}
+            if 'Link' in response.headers:
+                headers['Link'] = response.headers['Link']
+
+            return response.json(), headers
 
         except httpx.HTTPStatusError as e:
             raise self.handle_http_status_error(e)
         except httpx.HTTPError as e:
             raise self.handle_http_error(e)
 
+    async def _execute(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        headers: dict,
+        params: dict | None,
+        method: RequestMethod,
+    ) -> tuple[httpx.Response, CachedResponse | None]:
+        if method == RequestMethod.GET:
+            return await self.execute_conditional_request(client, url, headers, params)
+        response = await self.execute_request(
+            client=client, url=url, headers=headers, params=params, method=method
+        )
+        return response, None
+
+    async def _fetch_pages(
+        self, url: str, params: dict, pages: range
+    ) -> list[tuple[Any, dict]]:
+        """Fetch several pages of a list at once, returned in order."""
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
+
+        async def fetch(page: int) -> tuple[Any, dict]:
+            async with semaphore:
+                return await self._make_request(url, {**params, 'page': str(page)})
+
+        return await asyncio.gather(*(fetch(page) for page in pages))
+
     async def execute_graphql_query(
         self, query: str, variables: dict[str, Any]
     ) -> dict[str, Any]:
         try:
-            async with httpx.AsyncClient(verify=httpx_verify_option()) as client:
-                github_headers = await self._get_headers()
-
-                response = await client.post(
-                    self.GRAPHQL_URL,
-                    headers=github_headers,
-                    json={'query': query, 'variables': variables},
+            client = get_async_client()
+            github_headers = await self._get_headers()
+
+            response = await client.post(
+                self.GRAPHQL_URL,
+                headers=github_headers,
+                json={'query': query, 'variables': variables},
+            )
+            response.raise_for_status()
+
+            result = response.json()
+            if 'errors' in result:
+                raise UnknownException(
+                    f'GraphQL query error: {json.dumps(result["errors"])}'
                 )
-                response.raise_for_status()
-
-                result = response.json()
-                if 'errors' in result:
-                    raise UnknownException(
-                        f'GraphQL query error: {json.dumps(result["errors"])}'
-                    )
 
-                return dict(result)
+            return dict(result)
 
         except httpx.HTTPStatusError as e:
             raise self.handle_http_status_error(e)
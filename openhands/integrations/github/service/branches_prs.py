@@ -1,8 +1,13 @@
+import math
+
 from openhands.core.logger import openhands_logger as logger
 from openhands.integrations.github.queries import (
     search_branches_graphql_query,
 )
-from openhands.integrations.github.service.base import GitHubMixinBase
+from openhands.integrations.github.service.base import (
+    GitHubMixinBase,
+    get_last_page,
+)
 from openhands.integrations.service_types import Branch, PaginatedBranchesResponse
 
 
@@ -20,34 +25,19 @@ class GitHubBranchesMixin(GitHubMixinBase):
         PER_PAGE = 100
 
         all_branches: list[Branch] = []
+        params = {'per_page': str(PER_PAGE)}
         page = 1
 
-        # Fetch up to 10 pages of branches
+        # Fetch up to 50 pages of branches
         while len(all_branches) < MAX_BRANCHES:
-            params = {'per_page': str(PER_PAGE), 'page': str(page)}
-            response, headers = await self._make_request(url, params)
+            response, headers = await self._make_request(
+                url, {**params, 'page': str(page)}
+            )
 
             if not response:  # No more branches
                 break
 
-            for branch_data in response:
-                # Extract the last commit date if available
-                last_push_date = None
-                if branch_data.get('commit') and branch_data['commit'].get('commit'):
-                    commit_info = branch_data['commit']['commit']
-                    if commit_info.get('committer') and commit_info['committer'].get(
-                        'date'
-                    ):
-                        last_push_date = commit_info['committer']['date']
-
-                branch = Branch(
-                    name=branch_data.get('name'),
-                    commit_sha=branch_data.get('commit', {}).get('sha', ''),
-                    protected=branch_data.get('protected', False),
-                    last_push_date=last_push_date,
-                )
-                all_branches.append(branch)
-
+            all_branches.extend(self._parse_branch(data) for data in response)
             page += 1
 
             # Check if we've reached the last page
@@ -55,8 +45,34 @@ class GitHubBranchesMixin(GitHubMixinBase):
             if 'rel="next"' not in link_header:
                 break
 
+            # Once the number of pages is known, fetch the rest at once
+            last_page = get_last_page(link_header)
+            if last_page is not None:
+                pages_needed = math.ceil((MAX_BRANCHES - len(all_branches)) / PER_PAGE)
+                pages = range(page, min(last_page, page + pages_needed - 1) + 1)
+                for response, _ in await self._fetch_pages(url, params, pages):
+                    if not response:
+                        break
+                    all_branches.extend(self._parse_branch(data) for data in response)
+                break
+
         return all_branches
 
+    def _parse_branch(self, branch_data: dict) -> Branch:
+        # Extract the last commit date if available
+        last_push_date = None
+        if branch_data.get('commit') and branch_data['commit'].get('commit'):
+            commit_info = branch_data['commit']['commit']
+            if commit_info.get('committer') and commit_info['committer'].get('date'):
+                last_push_date = commit_info['committer']['date']
+
+        return Branch(
+            name=branch_data.get('name'),
+            commit_sha=branch_data.get('commit', {}).get('sha', ''),
+            protected=branch_data.get('protected', False),
+            last_push_date=last_push_date,
+        )
+
     async def get_paginated_branches(
         self, repository: str, page: int = 1, per_page: int = 30
     ) -> PaginatedBranchesResponse:
@@ -66,24 +82,7 @@ class GitHubBranchesMixin(GitHubMixinBase):
         params = {'per_page': str(per_page), 'page': str(page)}
         response, headers = await self._make_request(url, params)
 
-        branches: list[Branch] = []
-        for branch_data in response:
-            # Extract the last commit date if available
-            last_push_date = None
-            if branch_data.get('commit') and branch_data['commit'].get('commit'):
-                commit_info = branch_data['commit']['commit']
-                if commit_info.get('committer') and commit_info['committer'].get(
-                    'date'
-                ):
-                    last_push_date = commit_info['committer']['date']
-
-            branch = Branch(
-                name=branch_data.get('name'),
-                commit_sha=branch_data.get('commit', {}).get('sha', ''),
-                protected=branch_data.get('protected', False),
-                last_push_date=last_push_date,
-            )
-            branches.append(branch)
+        branches = [self._parse_branch(data) for data in response]
 
         # Parse Link header to determine if there's a next page
         has_next_page = False
@@ -1,7 +1,11 @@
+import math
 from datetime import datetime
 
 from openhands.core.logger import openhands_logger as logger
-from openhands.integrations.github.service.base import GitHubMixinBase
+from openhands.integrations.github.service.base import (
+    GitHubMixinBase,
+    get_last_page,
+)
 from openhands.integrations.service_types import OwnerType, ProviderType, Repository
 from openhands.server.types import AppMode
 
@@ -52,6 +56,20 @@ class GitHubReposMixin(GitHubMixinBase):
             if 'rel="next"' not in link_header:
                 break
 
+            # Once the number of pages is known, fetch the rest at once
+            last_page = get_last_page(link_header)
+            if last_page is not None:
+                pages_needed = math.ceil((max_repos - len(repos)) / len(page_repos))
+                pages = range(page, min(last_page, page + pages_needed - 1) + 1)
+                for response, _ in await self._fetch_pages(url, params, pages):
+                    page_repos = (
+                        response.get(extract_key, []) if extract_key else response
+                    )
+                    if not page_repos:
+                        break
+                    repos.extend(page_repos)
+                break
+
         return repos[:max_repos]  # Trim to max_repos if needed
 
     def parse_pushed_at_date(self, repo):
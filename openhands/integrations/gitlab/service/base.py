@@ -10,7 +10,7 @@ from openhands.integrations.service_types import (
     UnknownException,
     User,
 )
-from openhands.utils.http_session import httpx_verify_option
+from openhands.utils.http_session import get_async_client
 
 
 class GitLabMixinBase(BaseGitService, HTTPClient):
@@ -42,10 +42,22 @@ class GitLabMixinBase(BaseGitService, HTTPClient):
         method: RequestMethod = RequestMethod.GET,
     ) -> tuple[Any, dict]:  # type: ignore[override]
         try:
-            async with httpx.AsyncClient(verify=httpx_verify_option()) as client:
+            client = get_async_client()
+            gitlab_headers = await self._get_headers()
+
+            # Make initial request
+            response = await self.execute_request(
+                client=client,
+                url=url,
+                headers=gitlab_headers,
+                params=params,
+                method=method,
+            )
+
+            # Handle token refresh if needed
+            if self.refresh and self._has_token_expired(response.status_code):
+                await self.get_latest_token()
                 gitlab_headers = await self._get_headers()
-
-                # Make initial request
                 response = await self.execute_request(
                     client=client,
                     url=url,
@@ -54,31 +66,19 @@ class GitLabMixinBase(BaseGitService, HTTPClient):
                     method=method,
                 )
 
-                # Handle token refresh if needed
-                if self.refresh and self._has_token_expired(response.status_code):
-                    await self.get_latest_token()
-                    gitlab_headers = await self._get_headers()
-                    response = await self.execute_request(
-                        client=client,
-                        url=url,
-                        headers=gitlab_headers,
-                        params=params,
-                        method=method,
-                    )
-
-                response.raise_for_status()
-                headers = {}
-                if 'Link' in response.headers:
-                    headers['Link'] = response.headers['Link']
-
-                if 'X-Total' in response.headers:
-                    headers['X-Total'] = response.headers['X-Total']
-
-                content_type = response.headers.get('Content-Type', '')
-                if 'application/json' in content_type:
-                    return response.json(), headers
-                else:
-                    return response.text, headers
+            response.raise_for_status()
+            headers = {}
+            if 'Link' in response.headers:
+                headers['Link'] = response.headers['Link']
+
+            if 'X-Total' in response.headers:
+                headers['X-Total'] = response.headers['X-Total']
+
+            content_type = response.headers.get('Content-Type', '')
+            if 'application/json' in content_type:
+                return response.json(), headers
+            else:
+                return response.text, headers
 
         except httpx.HTTPStatusError as e:
             raise self.handle_http_status_error(e)
@@ -100,39 +100,39 @@ class GitLabMixinBase(BaseGitService, HTTPClient):
         if variables is None:
             variables = {}
         try:
-            async with httpx.AsyncClient(verify=httpx_verify_option()) as client:
+            client = get_async_client()
+            gitlab_headers = await self._get_headers()
+            # Add content type header for GraphQL
+            gitlab_headers['Content-Type'] = 'application/json'
+
+            payload = {
+                'query': query,
+                'variables': variables if variables is not None else {},
+            }
+
+            response = await client.post(
+                self.GRAPHQL_URL, headers=gitlab_headers, json=payload
+            )
+
+            if self.refresh and self._has_token_expired(response.status_code):
+                await self.get_latest_token()
                 gitlab_headers = await self._get_headers()
-                # Add content type header for GraphQL
                 gitlab_headers['Content-Type'] = 'application/json'
-
-                payload = {
-                    'query': query,
-                    'variables': variables if variables is not None else {},
-                }
-
                 response = await client.post(
                     self.GRAPHQL_URL, headers=gitlab_headers, json=payload
                 )
 
-                if self.refresh and self._has_token_expired(response.status_code):
-                    await self.get_latest_token()
-                    gitlab_headers = await self._get_headers()
-                    gitlab_headers['Content-Type'] = 'application/json'
-                    response = await client.post(
-                        self.GRAPHQL_URL, headers=gitlab_headers, json=payload
-                    )
-
-                response.raise_for_status()
-                result = response.json()
-
-                # Check for GraphQL errors
-                if 'errors' in result:
-                    error_message = result['errors'][0].get(
-                        'message', 'Unknown GraphQL error'
-                    )
-                    raise UnknownException(f'GraphQL error: {error_message}')
-
-                return result.get('data')
+            response.raise_for_status()
+            result = response.json()
+
+            # Check for GraphQL errors
+            if 'errors' in result:
+                error_message = result['errors'][0].get(
+                    'message', 'Unknown GraphQL error'
+                )
+                raise UnknownException(f'GraphQL error: {error_message}')
+
+            return result.get('data')
         except httpx.HTTPStatusError as e:
             raise self.handle_http_status_error(e)
         except httpx.HTTPError as e:
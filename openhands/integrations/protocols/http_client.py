@@ -1,9 +1,14 @@
 """HTTP Client Protocol for Git Service Integrations."""
 
+import hashlib
+import json
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
 from typing import Any
 
-from httpx import AsyncClient, HTTPError, HTTPStatusError
+from httpx import AsyncClient, HTTPError, HTTPStatusError, Response
 from pydantic import SecretStr
 
 from openhands.core.logger import openhands_logger as logger
@@ -15,6 +20,81 @@ from openhands.integrations.service_types import (
     UnknownException,
 )
 
+# Bounds of the cache of responses to conditional requests, shared by all users
+MAX_CACHED_RESPONSES = 2048
+MAX_CACHED_RESPONSE_BYTES = 64 * 1024 * 1024
+# Response headers kept with a cached response, for pagination
+CACHED_HEADERS = ('Link', 'X-Total')
+
+
+@dataclass
+class CachedResponse:
+    """The body and kept headers of a response, for revalidating with its ETag."""
+
+    etag: str
+    content: bytes
+    headers: dict[str, str]
+
+    def json(self) -> Any:
+        # Parsed on each hit, so callers can't modify each other's results
+        return json.loads(self.content)
+
+
+class ConditionalRequestCache:
+    """Responses to GET requests that came with an ETag, by token and URL.
+
+    Sending the ETag back in `If-None-Match` lets the service answer with a
+    304 and no body when nothing changed, which GitHub doesn't count against
+    the rate limit. Tokens are only kept hashed. Least recently used
+    responses are evicted beyond the entry or byte bounds.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = MAX_CACHED_RESPONSES,
+        max_bytes: int = MAX_CACHED_RESPONSE_BYTES,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._responses: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._size = 0
+        self._lock = Lock()
+
+    @staticmethod
+    def key(authorization: str, url: str, params: dict | None) -> str:
+        request = json.dumps([authorization, url, params or {}], sort_keys=True)
+        return hashlib.sha256(request.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            response = self._responses.get(key)
+            if response is not None:
+                self._responses.move_to_end(key)
+            return response
+
+    def put(self, key: str, response: CachedResponse) -> None:
+        if len(response.content) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._responses.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous.content)
+            self._responses[key] = response
+            self._size += len(response.content)
+            while (
+                len(self._responses) > self.max_entries or self._size > self.max_bytes
+            ):
+                _, evicted = self._responses.popitem(last=False)
+                self._size -= len(evicted.content)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._responses.clear()
+            self._size = 0
+
+
+response_cache = ConditionalRequestCache()
+
 
 class HTTPClient(ABC):
     """Abstract base class defining the HTTP client interface for Git service integrations.
@@ -74,6 +154,35 @@ class HTTPClient(ABC):
             return await client.post(url, headers=headers, json=params)
         return await client.get(url, headers=headers, params=params)
 
+    async def execute_conditional_request(
+        self,
+        client: AsyncClient,
+        url: str,
+        headers: dict,
+        params: dict | None,
+    ) -> tuple[Response, CachedResponse | None]:
+        """Execute a GET request, revalidating the cached response if there is one.
+
+        Returns the response and, if it was a 304, the cached response it
+        confirmed. Responses with an ETag are cached for the next request.
+        """
+        key = response_cache.key(headers.get('Authorization', ''), url, params)
+        cached = response_cache.get(key)
+        if cached is not None:
+            headers = {**headers, 'If-None-Match': cached.etag}
+        response = await self.execute_request(client, url, headers, params)
+        if response.status_code == 304 and cached is not None:
+            return response, cached
+        etag = response.headers.get('ETag')
+        if response.status_code == 200 and etag:
+            kept = {
+                name: response.headers[name]
+                for name in CACHED_HEADERS
+                if name in response.headers
+            }
+            response_cache.put(key, CachedResponse(etag, response.content, kept))
+        return response, None
+
     def handle_http_status_error(
         self, e: HTTPStatusError
     ) -> (
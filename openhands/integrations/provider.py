@@ -1,12 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import os
 from collections.abc import Mapping
 from types import MappingProxyType
 from typing import Any, Coroutine, Literal, cast, overload
 from urllib.parse import quote
 
-import httpx
 from pydantic import (
     BaseModel,
     ConfigDict,
@@ -40,7 +40,7 @@ from openhands.integrations.service_types import (
 )
 from openhands.microagent.types import MicroagentContentResponse, MicroagentResponse
 from openhands.server.types import AppMode
-from openhands.utils.http_session import httpx_verify_option
+from openhands.utils.http_session import get_async_client
 
 
 class ProviderToken(BaseModel):
@@ -173,14 +173,14 @@ class ProviderHandler:
     ) -> SecretStr | None:
         """Get latest token from service"""
         try:
-            async with httpx.AsyncClient(verify=httpx_verify_option()) as client:
-                resp = await client.get(
-                    self.REFRESH_TOKEN_URL,
-                    headers={
-                        'X-Session-API-Key': self.session_api_key,
-                    },
-                    params={'provider': provider.value, 'sid': self.sid},
-                )
+            client = get_async_client()
+            resp = await client.get(
+                self.REFRESH_TOKEN_URL,
+                headers={
+                    'X-Session-API-Key': self.session_api_key,
+                },
+                params={'provider': provider.value, 'sid': self.sid},
+            )
 
             resp.raise_for_status()
             data = TokenResponse.model_validate_json(resp.text)
@@ -246,27 +246,43 @@ class ProviderHandler:
                 page, per_page, sort, installation_id
             )
 
+        async def get_all_repositories(provider: ProviderType) -> list[Repository]:
+            service = self.get_service(provider)
+            return await service.get_all_repositories(sort, app_mode)
+
+        # Ask all providers at once, keeping their order in the results
+        providers = list(self.provider_tokens)
+        results = await asyncio.gather(
+            *(get_all_repositories(provider) for provider in providers),
+            return_exceptions=True,
+        )
         all_repos: list[Repository] = []
-        for provider in self.provider_tokens:
-            try:
-                service = self.get_service(provider)
-                service_repos = await service.get_all_repositories(sort, app_mode)
-                all_repos.extend(service_repos)
-            except Exception as e:
-                logger.warning(f'Error fetching repos from {provider}: {e}')
+        for provider, result in zip(providers, results):
+            if isinstance(result, BaseException):
+                logger.warning(f'Error fetching repos from {provider}: {result}')
+            else:
+                all_repos.extend(result)
 
         return all_repos
 
     async def get_suggested_tasks(self) -> list[SuggestedTask]:
         """Get suggested tasks from providers"""
+
+        async def get_suggested_tasks(provider: ProviderType) -> list[SuggestedTask]:
+            service = self.get_service(provider)
+            return await service.get_suggested_tasks()
+
+        providers = list(self.provider_tokens)
+        results = await asyncio.gather(
+            *(get_suggested_tasks(provider) for provider in providers),
+            return_exceptions=True,
+        )
         tasks: list[SuggestedTask] = []
-        for provider in self.provider_tokens:
-            try:
-                service = self.get_service(provider)
-                service_repos = await service.get_suggested_tasks()
-                tasks.extend(service_repos)
-            except Exception as e:
-                logger.warning(f'Error fetching repos from {provider}: {e}')
+        for provider, result in zip(providers, results):
+            if isinstance(result, BaseException):
+                logger.warning(f'Error fetching repos from {provider}: {result}')
+            else:
+                tasks.extend(result)
 
         return tasks
 
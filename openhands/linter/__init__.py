@@ -8,4 +8,6 @@ code](https://github.com/paul-gauthier/aider/blob/main/aider/linter.py)).
 
 from openhands_aci.linter import DefaultLinter, LintResult
 
-__all__ = ['DefaultLinter', 'LintResult']
+from openhands.linter.service import LintService, get_lint_service
+
+__all__ = ['DefaultLinter', 'LintResult', 'LintService', 'get_lint_service']
@@ -0,0 +1,312 @@
+"""A warm linter for files that are edited over and over.
+
+DefaultLinter lints files on disk, and for Python starts a flake8 process on
+each call, so linting an edit (the original and the updated content) costs
+two process startups. LintService lints content in process instead:
+
+- Python is parsed with `ast` and checked with the pyflakes checks
+  DefaultLinter selects from flake8 (undefined names, undefined exports and
+  duplicate arguments), reported with flake8's codes, positions and messages.
+- Other languages are parsed with tree-sitter, keeping a parser per language.
+  The tree of the previous version of a file is reused to parse only what
+  changed, and only subtrees that contain errors are walked.
+
+Results and trees are cached by content hash. An edit's original content is
+usually the previous edit's updated content, so it is rarely linted again,
+and errors that were already there are matched by diffing only the lines
+between the unchanged head and tail of the file.
+"""
+
+import ast
+import hashlib
+import io
+import os
+from collections import OrderedDict, defaultdict
+from difflib import SequenceMatcher
+from threading import Lock
+from typing import Any
+
+from grep_ast import filename_to_lang
+from grep_ast.parsers import PARSERS
+from openhands_aci.linter import LintResult
+from tree_sitter_language_pack import get_parser
+
+try:
+    from pyflakes import checker as pyflakes_checker
+except ImportError:
+    # Without flake8 (and pyflakes), DefaultLinter only checks syntax as well
+    pyflakes_checker = None
+
+MAX_CACHED_CONTENTS = 32
+
+# The pyflakes messages DefaultLinter selects from flake8, by flake8 code
+PYFLAKES_CODES = {
+    'UndefinedName': 'F821',
+    'UndefinedExport': 'F822',
+    'DuplicateArgument': 'F831',
+}
+
+
+class LintService:
+    """Lints the contents of files, keeping parsers and recent results warm."""
+
+    def __init__(self, max_cached_contents: int = MAX_CACHED_CONTENTS) -> None:
+        self.max_cached_contents = max_cached_contents
+        # (language, content hash) -> (lint results, tree-sitter tree and source)
+        self._cache: OrderedDict[
+            tuple[str, str], tuple[list[LintResult], tuple[Any, bytes] | None]
+        ] = OrderedDict()
+        self._parsers: dict[str, Any] = {}
+        self._lock = Lock()
+
+    def supports(self, file_path: str) -> bool:
+        return _language(file_path) is not None
+
+    def lint(
+        self, file_path: str, content: str, previous_content: str | None = None
+    ) -> list[LintResult]:
+        """Lint content as the file at file_path.
+
+        If given, the tree of the previous content of the file (if it was
+        linted recently) is taken over to parse only what changed.
+        """
+        language = _language(file_path)
+        if language is None:
+            return []
+        key = (language, _content_hash(content))
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+            base = None
+            if cached is None and previous_content is not None:
+                previous_key = (language, _content_hash(previous_content))
+                previous = self._cache.get(previous_key)
+                if previous is not None and previous[1] is not None:
+                    # The tree is edited in place, so it no longer fits the
+                    # previous content (whose results are still kept)
+                    base = previous[1]
+                    self._cache[previous_key] = (previous[0], None)
+
+        if cached is not None:
+            results = cached[0]
+        else:
+            tree = None
+            if language == 'python':
+                results = _lint_python(content)
+            else:
+                tree = self._parse(language, content.encode('utf-8'), base)
+                results = _syntax_errors(tree[0].root_node)
+            with self._lock:
+                self._cache[key] = (results, tree)
+                while len(self._cache) > self.max_cached_contents:
+                    self._cache.popitem(last=False)
+        return [result.model_copy(update={'file': file_path}) for result in results]
+
+    def lint_diff(
+        self, file_path: str, old_content: str, new_content: str
+    ) -> list[LintResult]:
+        """The lint errors introduced by changing old_content to new_content.
+
+        Errors on unchanged lines are left out if the same error (message and
+        column) was already on that line before the change.
+        """
+        new_errors = self.lint(file_path, new_content, previous_content=old_content)
+        if not new_errors:
+            return []
+        old_errors = self.lint(file_path, old_content)
+        if old_errors:
+            old_lines = io.StringIO(old_content).readlines()
+            new_lines = io.StringIO(new_content).readlines()
+            line_map = _unchanged_line_map(
+                old_lines, new_lines, {error.line for error in old_errors}
+            )
+            # The errors already on each line of the updated content
+            existing: dict[int, set[tuple[str, int]]] = defaultdict(set)
+            for error in old_errors:
+                if error.line in line_map:
+                    existing[line_map[error.line]].add((error.message, error.column))
+            new_errors = [
+                error
+                for error in new_errors
+                if (error.message, error.column) not in existing.get(error.line, ())
+            ]
+        return sorted(new_errors, key=lambda error: (error.line, error.column))
+
+    def _parse(
+        self, language: str, source: bytes, base: tuple[Any, bytes] | None
+    ) -> tuple[Any, bytes]:
+        with self._lock:
+            parser = self._parsers.get(language)
+            if parser is None:
+                parser = self._parsers[language] = get_parser(language)  # type: ignore[arg-type]
+            if base is None:
+                return parser.parse(source), source
+            tree, old_source = base
+            _apply_edit(tree, old_source, source)
+            return parser.parse(source, tree), source
+
+
+_service: LintService | None = None
+_service_lock = Lock()
+
+
+def get_lint_service() -> LintService:
+    """The LintService shared by everything linting in this process."""
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = LintService()
+    return _service
+
+
+def _language(file_path: str) -> str | None:
+    extension = os.path.splitext(file_path)[1]
+    if extension == '.py':
+        return 'python'
+    if extension not in PARSERS:
+        return None
+    return filename_to_lang(file_path)
+
+
+def _content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode('utf-8', 'surrogatepass')).hexdigest()
+
+
+def _lint_python(content: str) -> list[LintResult]:
+    # Python's own parser has the final say on syntax, so unlike DefaultLinter,
+    # tree-sitter is not consulted when it passes
+    try:
+        tree = ast.parse(content)
+    except SyntaxError as e:
+        # As flake8 reports it, as E999 one column after the offset
+        return [
+            LintResult(
+                file='',
+                line=e.lineno or 1,
+                column=(e.offset or 0) + 1,
+                message=f'E999 {type(e).__name__}: {e.msg}',
+            )
+        ]
+    except ValueError as e:
+        # e.g. null bytes in the source, on older Pythons
+        return [LintResult(file='', line=1, column=1, message=f'E999 ValueError: {e}')]
+    if pyflakes_checker is None:
+        return []
+    results = []
+    for message in pyflakes_checker.Checker(tree).messages:
+        code = PYFLAKES_CODES.get(type(message).__name__)
+        if code is None:
+            continue
+        results.append(
+            LintResult(
+                file='',
+                line=message.lineno,
+                column=message.col + 1,
+                message=f'{code} {message.message % message.message_args}',
+            )
+        )
+    results.sort(key=lambda result: (result.line, result.column))
+    return results
+
+
+def _syntax_errors(root: Any) -> list[LintResult]:
+    """The ERROR and missing nodes of a tree, in document order."""
+    results = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if node.type == 'ERROR' or node.is_missing:
+            results.append(
+                LintResult(
+                    file='',
+                    line=node.start_point[0] + 1,
+                    column=node.start_point[1] + 1,
+                    message='Missing node' if node.is_missing else 'Syntax error',
+                )
+            )
+        # Subtrees without errors have nothing to report
+        stack.extend(
+            child
+            for child in reversed(node.children)
+            if child.has_error or child.is_missing
+        )
+    return results
+
+
+def _apply_edit(tree: Any, old: bytes, new: bytes) -> None:
+    """Tell a tree of old about the one range that differs in new."""
+    old_lines = old.splitlines(keepends=True)
+    new_lines = new.splitlines(keepends=True)
+    prefix = _common_prefix(old_lines, new_lines)
+    suffix = _common_suffix(old_lines[prefix:], new_lines[prefix:])
+    start = sum(len(line) for line in old_lines[:prefix])
+    old_end = len(old) - sum(len(line) for line in old_lines[len(old_lines) - suffix :])
+    new_end = len(new) - sum(len(line) for line in new_lines[len(new_lines) - suffix :])
+    tree.edit(
+        start_byte=start,
+        old_end_byte=old_end,
+        new_end_byte=new_end,
+        start_point=_point(old, start),
+        old_end_point=_point(old, old_end),
+        new_end_point=_point(new, new_end),
+    )
+
+
+def _point(source: bytes, offset: int) -> tuple[int, int]:
+    row = source.count(b'\n', 0, offset)
+    return row, offset - (source.rfind(b'\n', 0, offset) + 1)
+
+
+def _common_prefix(a: list, b: list) -> int:
+    n = min(len(a), len(b))
+    i = 0
+    while i < n and a[i] == b[i]:
+        i += 1
+    return i
+
+
+def _common_suffix(a: list, b: list) -> int:
+    n = min(len(a), len(b))
+    i = 0
+    while i < n and a[-1 - i] == b[-1 - i]:
+        i += 1
+    return i
+
+
+def _unchanged_line_map(
+    old_lines: list[str], new_lines: list[str], wanted: set[int]
+) -> dict[int, int]:
+    """Map the wanted (1-indexed) lines of old that are unchanged in new.
+
+    Edits touch a small part of a file, so only the lines between the common
+    head and tail are diffed.
+    """
+    prefix = _common_prefix(old_lines, new_lines)
+    suffix = _common_suffix(old_lines[prefix:], new_lines[prefix:])
+    old_middle_end = len(old_lines) - suffix
+    shift = len(new_lines) - len(old_lines)
+
+    line_map = {}
+    for line in wanted:
+        if line <= prefix:
+            line_map[line] = line
+        elif line > old_middle_end:
+            line_map[line] = line + shift
+
+    if any(prefix < line <= old_middle_end for line in wanted):
+        matcher = SequenceMatcher(
+            None,
+            old_lines[prefix:old_middle_end],
+            new_lines[prefix : len(new_lines) - suffix],
+            autojunk=False,
+        )
+        for tag, old_start, old_end, new_start, _ in matcher.get_opcodes():
+            if tag != 'equal':
+                continue
+            for i in range(old_end - old_start):
+                line = prefix + old_start + i + 1
+                if line in wanted:
+                    line_map[line] = prefix + new_start + i + 1
+    return line_map
@@ -0,0 +1,173 @@
+from typing import Any, Callable
+
+from litellm import stream_chunk_builder
+from litellm.types.utils import (
+    ChatCompletionMessageToolCall,
+    Function,
+    ModelResponse,
+)
+
+from openhands.core.exceptions import LLMNoResponseError
+from openhands.core.logger import openhands_logger as logger
+
+
+class CompletionStreamListener:
+    """Callbacks for a completion that is streamed while it is generated.
+
+    Args:
+        on_content: Called with each text delta of the assistant message.
+        on_tool_call: Called once per tool call, as soon as its arguments are
+            complete, which can be well before the whole response is.
+    """
+
+    def __init__(
+        self,
+        on_content: Callable[[str], None] | None = None,
+        on_tool_call: Callable[[ChatCompletionMessageToolCall], None] | None = None,
+    ) -> None:
+        self.on_content = on_content
+        self.on_tool_call = on_tool_call
+
+
+class _PendingToolCall:
+    """A tool call being streamed, with a running scan of its JSON arguments."""
+
+    def __init__(self, tool_call_id: str, name: str) -> None:
+        self.id = tool_call_id
+        self.name = name
+        self.arguments: list[str] = []
+        self.closed = False
+        self._depth = 0
+        self._started = False
+        self._in_string = False
+        self._escaped = False
+
+    def add_arguments(self, text: str) -> bool:
+        """Add a fragment of the arguments, returning True once they are complete.
+
+        Only the new fragment is scanned, so long arguments such as file
+        contents are not re-parsed on every delta.
+        """
+        self.arguments.append(text)
+        for char in text:
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == '\\':
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in '{[':
+                self._depth += 1
+                self._started = True
+            elif char in '}]':
+                self._depth -= 1
+        return self._started and self._depth == 0
+
+    def to_tool_call(self) -> ChatCompletionMessageToolCall:
+        return ChatCompletionMessageToolCall(
+            id=self.id,
+            type='function',
+            function=Function(name=self.name, arguments=''.join(self.arguments)),
+        )
+
+
+class ToolCallStreamParser:
+    """Parses tool calls incrementally from streamed completion chunks.
+
+    A tool call is complete when its JSON arguments close, or failing that,
+    when the next tool call starts or the stream ends.
+    """
+
+    def __init__(self) -> None:
+        self._tool_calls: dict[int, _PendingToolCall] = {}
+        self._current_index = -1
+
+    def feed(self, chunk: Any) -> list[ChatCompletionMessageToolCall]:
+        """Process a chunk, returning the tool calls it completed."""
+        completed: list[ChatCompletionMessageToolCall] = []
+        if not chunk.choices:
+            return completed
+        for delta in getattr(chunk.choices[0].delta, 'tool_calls', None) or []:
+            index = delta.index
+            if index is None:
+                index = self._current_index + 1 if delta.id else self._current_index
+            function = delta.function
+            pending = self._tool_calls.get(index)
+            if pending is None:
+                # The previous tool call can no longer receive arguments
+                completed.extend(self._close_before(index))
+                pending = _PendingToolCall(delta.id or '', '')
+                self._tool_calls[index] = pending
+                self._current_index = index
+            if delta.id and not pending.id:
+                pending.id = delta.id
+            if function is not None and function.name:
+                pending.name += function.name
+            if (
+                function is not None
+                and function.arguments
+                and not pending.closed
+                and pending.add_arguments(function.arguments)
+            ):
+                pending.closed = True
+                completed.append(pending.to_tool_call())
+        return completed
+
+    def finish(self) -> list[ChatCompletionMessageToolCall]:
+        """Close all remaining tool calls at the end of the stream."""
+        return self._close_before(None)
+
+    def _close_before(self, index: int | None) -> list[ChatCompletionMessageToolCall]:
+        completed = []
+        for pending_index in sorted(self._tool_calls):
+            pending = self._tool_calls[pending_index]
+            if (index is None or pending_index < index) and not pending.closed:
+                pending.closed = True
+                completed.append(pending.to_tool_call())
+        return completed
+
+
+class CompletionStream:
+    """Collects the chunks of a streamed completion, notifying a listener.
+
+    Once the stream is consumed, `build` assembles the chunks into the same
+    ModelResponse a non-streamed call returns, including token usage, so
+    metrics are recorded once per completion rather than per chunk.
+    """
+
+    def __init__(self, listener: CompletionStreamListener | None = None) -> None:
+        self.listener = listener
+        self.chunks: list[Any] = []
+        self._parser = ToolCallStreamParser()
+
+    def add(self, chunk: Any) -> None:
+        self.chunks.append(chunk)
+        if self.listener is None:
+            return
+        if chunk.choices and self.listener.on_content is not None:
+            content = getattr(chunk.choices[0].delta, 'content', None)
+            if content:
+                self._notify(self.listener.on_content, content)
+        if self.listener.on_tool_call is not None:
+            for tool_call in self._parser.feed(chunk):
+                self._notify(self.listener.on_tool_call, tool_call)
+
+    def build(self, messages: list[dict[str, Any]] | None = None) -> ModelResponse:
+        if self.listener is not None and self.listener.on_tool_call is not None:
+            for tool_call in self._parser.finish():
+                self._notify(self.listener.on_tool_call, tool_call)
+        response = stream_chunk_builder(self.chunks, messages=messages)
+        if response is None:
+            raise LLMNoResponseError('The completion stream returned no chunks')
+        return response
+
+    @staticmethod
+    def _notify(callback: Callable[[Any], None], value: Any) -> None:
+        # A failing listener must not fail the completion itself
+        try:
+            callback(value)
+        except Exception as e:
+            logger.warning(f'Error in completion stream listener: {e}')
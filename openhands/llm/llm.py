@@ -30,6 +30,7 @@ from litellm.utils import create_pretrained_tokenizer
 from openhands.core.exceptions import LLMNoResponseError
 from openhands.core.logger import openhands_logger as logger
 from openhands.core.message import Message
+from openhands.llm.completion_stream import CompletionStream, CompletionStreamListener
 from openhands.llm.debug_mixin import DebugMixin
 from openhands.llm.fn_call_converter import (
     STOP_WORDS,
@@ -236,6 +237,10 @@ class LLM(RetryMixin, DebugMixin):
                 dict[str, Any] | Message | list[dict[str, Any]] | list[Message]
             ) = []
             mock_function_calling = not self.is_function_calling_active()
+            # with a listener, the completion is streamed and assembled here
+            stream_listener: CompletionStreamListener | None = kwargs.pop(
+                'stream_listener', None
+            )
 
             # some callers might send the model and messages directly
             # litellm allows positional args, like completion(model, messages, **kwargs)
@@ -321,9 +326,13 @@ class LLM(RetryMixin, DebugMixin):
             if 'litellm_proxy' not in self.config.model:
                 kwargs.pop('extra_body', None)
 
+            if stream_listener is not None:
+                kwargs['stream'] = True
+                kwargs['stream_options'] = {'include_usage': True}
+
             # Record start time for latency measurement
             start_time = time.time()
-            # we don't support streaming here, thus we get a ModelResponse
+            # a streamed completion is assembled back into a ModelResponse
 
             # Suppress httpx deprecation warnings during LiteLLM calls
             # This prevents the "Use 'content=<...>' to upload raw bytes/text content" warning
@@ -337,7 +346,14 @@ class LLM(RetryMixin, DebugMixin):
                     message=r'.*content=.*upload.*',
                     category=DeprecationWarning,
                 )
-                resp: ModelResponse = self._completion_unwrapped(*args, **kwargs)
+                resp: ModelResponse
+                if stream_listener is not None:
+                    stream = CompletionStream(stream_listener)
+                    for chunk in self._completion_unwrapped(*args, **kwargs):
+                        stream.add(chunk)
+                    resp = stream.build(messages)
+                else:
+                    resp = self._completion_unwrapped(*args, **kwargs)
 
             # Calculate and record latency
             latency = time.time() - start_time
@@ -674,6 +690,12 @@ class LLM(RetryMixin, DebugMixin):
                 context_window=context_window,
                 response_id=response_id,
             )
+            token_usage = self.metrics.token_usages[-1]
+            if cache_hit_tokens or cache_write_tokens:
+                stats += 'Prompt cache: %.1f%% read | %.1f%% written\n' % (
+                    token_usage.cache_read_ratio * 100,
+                    token_usage.cache_write_ratio * 100,
+                )
 
         # log the stats
         if stats:
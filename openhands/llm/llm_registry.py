@@ -1,4 +1,5 @@
 import copy
+import os
 from typing import Any, Callable
 from uuid import uuid4
 
@@ -9,6 +10,7 @@ from openhands.core.config.llm_config import LLMConfig
 from openhands.core.config.openhands_config import OpenHandsConfig
 from openhands.core.logger import openhands_logger as logger
 from openhands.llm.llm import LLM
+from openhands.llm.response_cache import LLMResponseCache
 
 
 class RegistryEvent(BaseModel):
@@ -33,6 +35,13 @@ class LLMRegistry:
         self.agent_to_llm_config = self.config.get_agent_to_llm_config_map()
         self.service_to_llm: dict[str, LLM] = {}
         self.subscriber: Callable[[Any], None] | None = None
+        self.response_cache: LLMResponseCache | None = None
+        if self.config.llm_response_cache:
+            self.response_cache = LLMResponseCache(
+                os.path.join(self.config.cache_dir, 'llm_responses.db'),
+                max_entries=self.config.llm_response_cache_max_entries,
+                ttl_seconds=self.config.llm_response_cache_ttl_seconds,
+            )
 
         selected_agent_cls = self.config.default_agent
         if agent_cls:
@@ -65,8 +74,22 @@ class LLMRegistry:
             )
 
         llm = self.service_to_llm[service_id]
+        cache_key = (
+            self.response_cache.make_key(llm.config, messages)
+            if self.response_cache
+            else None
+        )
+        if self.response_cache and cache_key:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f'extraneous completion cache hit: {service_id}')
+                return cached
+
         response = llm.completion(messages=messages)
-        return response.choices[0].message.content.strip()
+        content = response.choices[0].message.content.strip()
+        if self.response_cache and cache_key:
+            self.response_cache.put(cache_key, content)
+        return content
 
     def get_llm_from_agent_config(self, service_id: str, agent_config: AgentConfig):
         llm_config = self.config.get_llm_config_from_agent_config(agent_config)
@@ -1,8 +1,13 @@
 import copy
 import time
+from array import array
+from typing import Any, Generic, Iterable, Iterator, TypeVar, overload
 
 from pydantic import BaseModel, Field
 
+# Per-call records kept by each Metrics object, the totals cover all calls
+DEFAULT_MAX_RECORDS = 10_000
+
 
 class Cost(BaseModel):
     model: str
@@ -30,6 +35,20 @@ class TokenUsage(BaseModel):
     per_turn_token: int = Field(default=0)
     response_id: str = Field(default='')
 
+    @property
+    def cache_read_ratio(self) -> float:
+        """Share of the prompt tokens that were read from the prompt cache."""
+        return (
+            self.cache_read_tokens / self.prompt_tokens if self.prompt_tokens else 0.0
+        )
+
+    @property
+    def cache_write_ratio(self) -> float:
+        """Share of the prompt tokens that were written to the prompt cache."""
+        return (
+            self.cache_write_tokens / self.prompt_tokens if self.prompt_tokens else 0.0
+        )
+
     def __add__(self, other: 'TokenUsage') -> 'TokenUsage':
         """Add two TokenUsage instances together."""
         return TokenUsage(
@@ -44,6 +63,181 @@ class TokenUsage(BaseModel):
         )
 
 
+R = TypeVar('R', bound=BaseModel)
+
+_ARRAY_TYPECODES = {float: 'd', int: 'q'}
+
+
+class MetricRecords(Generic[R]):
+    """Columnar, bounded history of one kind of per-call metric record.
+
+    Records are stored field by field, numbers in typed arrays, instead of as
+    one pydantic object per call, and are only built into `R` objects when
+    read. Beyond `max_records` the oldest records are overwritten in place
+    (a ring buffer); `dropped` counts them, so positions (`total`) keep
+    growing with every call and stay comparable between snapshots.
+    """
+
+    def __init__(
+        self,
+        model: type[R],
+        records: Iterable[R] = (),
+        max_records: int | None = DEFAULT_MAX_RECORDS,
+    ) -> None:
+        if max_records is not None and max_records < 1:
+            raise ValueError('max_records must be positive')
+        self.model = model
+        self.max_records = max_records
+        self.dropped = 0
+        # index of the oldest record once the ring buffer is full
+        self._start = 0
+        self._columns: dict[str, Any] = {
+            name: array(_ARRAY_TYPECODES[field.annotation])
+            if field.annotation in _ARRAY_TYPECODES
+            else []
+            for name, field in model.model_fields.items()
+        }
+        for record in records:
+            self.append(record)
+
+    @classmethod
+    def from_columns(
+        cls,
+        model: type[R],
+        columns: dict[str, list[Any]],
+        dropped: int = 0,
+        max_records: int | None = DEFAULT_MAX_RECORDS,
+    ) -> 'MetricRecords[R]':
+        """Build a history from column values, as returned by `columns`."""
+        records = cls(model, max_records=max_records)
+        records._extend_columns(columns)
+        records.dropped += dropped
+        return records
+
+    @property
+    def total(self) -> int:
+        """Number of records ever added, including the dropped ones."""
+        return self.dropped + len(self)
+
+    def __len__(self) -> int:
+        return len(next(iter(self._columns.values())))
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    @overload
+    def __getitem__(self, index: int) -> R: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[R]: ...
+
+    def __getitem__(self, index: int | slice) -> R | list[R]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError('metric record index out of range')
+        physical = (self._start + index) % size
+        return self.model.model_construct(
+            **{name: column[physical] for name, column in self._columns.items()}
+        )
+
+    def __iter__(self) -> Iterator[R]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __repr__(self) -> str:
+        return f'MetricRecords({list(self)})'
+
+    def append(self, record: R) -> None:
+        self.append_values(**{name: getattr(record, name) for name in self._columns})
+
+    def append_values(self, **values: Any) -> None:
+        """Add a record from its field values, without building a model object."""
+        if self.max_records is not None and len(self) >= self.max_records:
+            for name, column in self._columns.items():
+                column[self._start] = values[name]
+            self._start = (self._start + 1) % len(self)
+            self.dropped += 1
+            return
+        for name, column in self._columns.items():
+            column.append(values[name])
+
+    def extend(self, records: 'Iterable[R] | MetricRecords[R]') -> None:
+        if isinstance(records, MetricRecords):
+            self._extend_columns(records.columns())
+        else:
+            for record in records:
+                self.append(record)
+
+    def __iadd__(self, records: 'Iterable[R] | MetricRecords[R]') -> 'MetricRecords[R]':
+        self.extend(records)
+        return self
+
+    def columns(
+        self, start: int | None = None, end: int | None = None
+    ) -> dict[str, list[Any]]:
+        """Field values of the records between two positions, oldest first.
+
+        Positions count all records ever added (see `total`) and default to
+        the oldest and newest record kept.
+        """
+        first = 0 if start is None else max(start - self.dropped, 0)
+        last = len(self) if end is None else max(end - self.dropped, first)
+        columns = {}
+        for name, column in self._columns.items():
+            values = column.tolist() if isinstance(column, array) else column
+            if self._start:
+                values = values[self._start :] + values[: self._start]
+            columns[name] = values[first:last]
+        return columns
+
+    def since(self, position: int) -> 'MetricRecords[R]':
+        """A new history with the records added at or after a position."""
+        return MetricRecords.from_columns(
+            self.model, self.columns(start=position), max_records=self.max_records
+        )
+
+    def find(self, name: str, value: Any) -> R | None:
+        """The oldest record whose field `name` equals `value`, if any."""
+        column = self._columns[name]
+        size = len(self)
+        # search in logical order, the part after the ring buffer start comes first
+        for lo, hi in ((self._start, size), (0, self._start)):
+            try:
+                physical = column.index(value, lo, hi)
+            except ValueError:
+                continue
+            return self[(physical - self._start) % size]
+        return None
+
+    def dump(self) -> list[dict[str, Any]]:
+        """The records as dictionaries, like `model_dump` of each of them."""
+        columns = self.columns()
+        names = list(columns)
+        return [dict(zip(names, values)) for values in zip(*columns.values())]
+
+    def _extend_columns(self, columns: dict[str, list[Any]]) -> None:
+        if not columns:
+            return
+        if self._start:
+            # unroll the ring buffer, so new records can be appended in order
+            current = self.columns()
+            self._start = 0
+            for name, column in self._columns.items():
+                del column[:]
+                column.extend(current[name])
+        for name, column in self._columns.items():
+            column.extend(columns[name])
+        if self.max_records is not None and len(self) > self.max_records:
+            overflow = len(self) - self.max_records
+            for column in self._columns.values():
+                del column[:overflow]
+            self.dropped += overflow
+
+
 class Metrics:
     """Metrics class can record various metrics during running and evaluation.
     We track:
@@ -51,15 +245,27 @@ class Metrics:
       - max_budget_per_task (budget limit)
       - A list of ResponseLatency
       - A list of TokenUsage (one per call).
+
+    Totals are kept up to date as calls are recorded, so reading them is O(1).
+    The per-call records are kept in bounded columnar histories, see
+    `MetricRecords`.
     """
 
-    def __init__(self, model_name: str = 'default') -> None:
+    def __init__(
+        self,
+        model_name: str = 'default',
+        max_records: int | None = DEFAULT_MAX_RECORDS,
+    ) -> None:
         self._accumulated_cost: float = 0.0
         self._max_budget_per_task: float | None = None
-        self._costs: list[Cost] = []
-        self._response_latencies: list[ResponseLatency] = []
+        self._costs: MetricRecords[Cost] = MetricRecords(Cost, max_records=max_records)
+        self._response_latencies: MetricRecords[ResponseLatency] = MetricRecords(
+            ResponseLatency, max_records=max_records
+        )
         self.model_name = model_name
-        self._token_usages: list[TokenUsage] = []
+        self._token_usages: MetricRecords[TokenUsage] = MetricRecords(
+            TokenUsage, max_records=max_records
+        )
         self._accumulated_token_usage: TokenUsage = TokenUsage(
             model=model_name,
             prompt_tokens=0,
@@ -89,27 +295,35 @@ class Metrics:
         self._max_budget_per_task = value
 
     @property
-    def costs(self) -> list[Cost]:
+    def costs(self) -> MetricRecords[Cost]:
         return self._costs
 
     @property
-    def response_latencies(self) -> list[ResponseLatency]:
+    def response_latencies(self) -> MetricRecords[ResponseLatency]:
         if not hasattr(self, '_response_latencies'):
-            self._response_latencies = []
+            self._response_latencies = MetricRecords(ResponseLatency)
         return self._response_latencies
 
     @response_latencies.setter
-    def response_latencies(self, value: list[ResponseLatency]) -> None:
+    def response_latencies(self, value: Iterable[ResponseLatency]) -> None:
+        if not isinstance(value, MetricRecords):
+            value = MetricRecords(
+                ResponseLatency, value, max_records=self._costs.max_records
+            )
         self._response_latencies = value
 
     @property
-    def token_usages(self) -> list[TokenUsage]:
+    def token_usages(self) -> MetricRecords[TokenUsage]:
         if not hasattr(self, '_token_usages'):
-            self._token_usages = []
+            self._token_usages = MetricRecords(TokenUsage)
         return self._token_usages
 
     @token_usages.setter
-    def token_usages(self, value: list[TokenUsage]) -> None:
+    def token_usages(self, value: Iterable[TokenUsage]) -> None:
+        if not isinstance(value, MetricRecords):
+            value = MetricRecords(
+                TokenUsage, value, max_records=self._costs.max_records
+            )
         self._token_usages = value
 
     @property
@@ -131,13 +345,13 @@ class Metrics:
         if value < 0:
             raise ValueError('Added cost cannot be negative.')
         self._accumulated_cost += value
-        self._costs.append(Cost(cost=value, model=self.model_name))
+        self._costs.append_values(
+            model=self.model_name, cost=value, timestamp=time.time()
+        )
 
     def add_response_latency(self, value: float, response_id: str) -> None:
-        self._response_latencies.append(
-            ResponseLatency(
-                latency=max(0.0, value), model=self.model_name, response_id=response_id
-            )
+        self.response_latencies.append_values(
+            model=self.model_name, latency=max(0.0, value), response_id=response_id
         )
 
     def add_token_usage(
@@ -153,7 +367,7 @@ class Metrics:
         # Token each turn for calculating context usage.
         per_turn_token = prompt_tokens + completion_tokens
 
-        usage = TokenUsage(
+        self.token_usages.append_values(
             model=self.model_name,
             prompt_tokens=prompt_tokens,
             completion_tokens=completion_tokens,
@@ -163,18 +377,19 @@ class Metrics:
             per_turn_token=per_turn_token,
             response_id=response_id,
         )
-        self._token_usages.append(usage)
 
-        # Update accumulated token usage using the __add__ operator
-        self._accumulated_token_usage = self.accumulated_token_usage + TokenUsage(
-            model=self.model_name,
-            prompt_tokens=prompt_tokens,
-            completion_tokens=completion_tokens,
-            cache_read_tokens=cache_read_tokens,
-            cache_write_tokens=cache_write_tokens,
-            context_window=context_window,
+        # Update the running totals, like TokenUsage.__add__ without the
+        # intermediate objects
+        accumulated = self.accumulated_token_usage
+        self._accumulated_token_usage = TokenUsage.model_construct(
+            model=accumulated.model,
+            prompt_tokens=accumulated.prompt_tokens + prompt_tokens,
+            completion_tokens=accumulated.completion_tokens + completion_tokens,
+            cache_read_tokens=accumulated.cache_read_tokens + cache_read_tokens,
+            cache_write_tokens=accumulated.cache_write_tokens + cache_write_tokens,
+            context_window=max(accumulated.context_window, context_window),
             per_turn_token=per_turn_token,
-            response_id='',
+            response_id=accumulated.response_id,
         )
 
     def merge(self, other: 'Metrics') -> None:
@@ -201,11 +416,9 @@ class Metrics:
             'accumulated_cost': self._accumulated_cost,
             'max_budget_per_task': self._max_budget_per_task,
             'accumulated_token_usage': self.accumulated_token_usage.model_dump(),
-            'costs': [cost.model_dump() for cost in self._costs],
-            'response_latencies': [
-                latency.model_dump() for latency in self._response_latencies
-            ],
-            'token_usages': [usage.model_dump() for usage in self._token_usages],
+            'costs': self._costs.dump(),
+            'response_latencies': self.response_latencies.dump(),
+            'token_usages': self.token_usages.dump(),
         }
 
     def log(self) -> str:
@@ -220,38 +433,44 @@ class Metrics:
         """Create a deep copy of the Metrics object."""
         return copy.deepcopy(self)
 
+    def snapshot(self) -> 'Metrics':
+        """Capture the totals and record positions of these metrics, without the records.
+
+        A snapshot costs the same however many calls were recorded, and is
+        all `diff` needs as a baseline.
+        """
+        result = Metrics(self.model_name, max_records=self._costs.max_records)
+        result._accumulated_cost = self._accumulated_cost
+        result._max_budget_per_task = self._max_budget_per_task
+        result._accumulated_token_usage = self.accumulated_token_usage.model_copy()
+        result._costs.dropped = self._costs.total
+        result._response_latencies.dropped = self.response_latencies.total
+        result._token_usages.dropped = self.token_usages.total
+        return result
+
     def diff(self, baseline: 'Metrics') -> 'Metrics':
         """Calculate the difference between current metrics and a baseline.
 
         This is useful for tracking metrics for specific operations like delegates.
 
         Args:
-            baseline: A metrics object representing the baseline state
+            baseline: A metrics object representing the baseline state, either a
+                copy or a snapshot of these metrics
 
         Returns:
             A new Metrics object containing only the differences since the baseline
         """
-        result = Metrics(self.model_name)
+        result = Metrics(self.model_name, max_records=self._costs.max_records)
 
         # Calculate cost difference
         result._accumulated_cost = self._accumulated_cost - baseline._accumulated_cost
 
-        # Include only costs that were added after the baseline
-        if baseline._costs:
-            last_baseline_timestamp = baseline._costs[-1].timestamp
-            result._costs = [
-                cost for cost in self._costs if cost.timestamp > last_baseline_timestamp
-            ]
-        else:
-            result._costs = self._costs.copy()
-
-        # Include only response latencies that were added after the baseline
-        result._response_latencies = self._response_latencies[
-            len(baseline._response_latencies) :
-        ]
-
-        # Include only token usages that were added after the baseline
-        result._token_usages = self._token_usages[len(baseline._token_usages) :]
+        # Include only the records that were added after the baseline
+        result._costs = self._costs.since(baseline._costs.total)
+        result._response_latencies = self.response_latencies.since(
+            baseline.response_latencies.total
+        )
+        result._token_usages = self.token_usages.since(baseline.token_usages.total)
 
         # Calculate accumulated token usage difference
         base_usage = baseline.accumulated_token_usage
@@ -273,5 +492,16 @@ class Metrics:
 
         return result
 
+    def __setstate__(self, state: dict) -> None:
+        # Metrics pickled by earlier versions hold lists of records
+        for attr, model in (
+            ('_costs', Cost),
+            ('_response_latencies', ResponseLatency),
+            ('_token_usages', TokenUsage),
+        ):
+            if isinstance(state.get(attr), list):
+                state[attr] = MetricRecords(model, state[attr])
+        self.__dict__.update(state)
+
     def __repr__(self) -> str:
         return f'Metrics({self.get()}'
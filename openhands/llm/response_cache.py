@@ -0,0 +1,139 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+from openhands.core.config.llm_config import LLMConfig
+from openhands.core.logger import openhands_logger as logger
+
+DEFAULT_MAX_ENTRIES = 1000
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+
+# Config fields that change what a model returns for the same messages
+_CACHE_KEY_FIELDS = (
+    'model',
+    'base_url',
+    'api_version',
+    'custom_llm_provider',
+    'temperature',
+    'top_p',
+    'top_k',
+    'max_output_tokens',
+    'seed',
+    'reasoning_effort',
+    'completion_kwargs',
+)
+
+
+class LLMResponseCache:
+    """Disk-backed, content-addressed cache for auxiliary LLM completions.
+
+    Entries are keyed by a hash of the model, sampling parameters and
+    messages, so an identical request (e.g. generating the title of the
+    same message again) is answered without calling the model. Requests
+    with a non-zero temperature are not deterministic and bypass the cache.
+
+    Entries expire after `ttl_seconds`, and beyond `max_entries` the least
+    recently used ones are evicted. The cache is a SQLite database, shared
+    by all processes using the same path. Errors reading or writing it are
+    logged and treated as cache misses.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+    ) -> None:
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._initialized = False
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(llm_config: LLMConfig, messages: list[dict[str, Any]]) -> str | None:
+        """Returns the cache key for a request, or None if it must not be cached."""
+        if llm_config.temperature != 0:
+            return None
+        request = {field: getattr(llm_config, field) for field in _CACHE_KEY_FIELDS}
+        request['messages'] = messages
+        payload = json.dumps(request, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    'SELECT content FROM responses WHERE key = ? AND created_at > ?',
+                    (key, now - self.ttl_seconds),
+                ).fetchone()
+                if row is None:
+                    return None
+                conn.execute(
+                    'UPDATE responses SET accessed_at = ? WHERE key = ?', (now, key)
+                )
+                return row[0]
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f'LLM response cache read failed: {e}')
+            return None
+
+    def put(self, key: str, content: str) -> None:
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    'INSERT OR REPLACE INTO responses (key, content, created_at, accessed_at) '
+                    'VALUES (?, ?, ?, ?)',
+                    (key, content, now, now),
+                )
+                conn.execute(
+                    'DELETE FROM responses WHERE created_at <= ?',
+                    (now - self.ttl_seconds,),
+                )
+                conn.execute(
+                    'DELETE FROM responses WHERE key IN ('
+                    'SELECT key FROM responses ORDER BY accessed_at DESC '
+                    'LIMIT -1 OFFSET ?)',
+                    (self.max_entries,),
+                )
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f'LLM response cache write failed: {e}')
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Opens a connection for one transaction, creating the database if needed."""
+        if not self._initialized:
+            with self._lock:
+                if not self._initialized:
+                    self._create_schema()
+                    self._initialized = True
+        conn = sqlite3.connect(self.path, timeout=5)
+        try:
+            # commits on success, rolls back on error
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _create_schema(self) -> None:
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=5)
+        try:
+            with conn:
+                conn.execute(
+                    'CREATE TABLE IF NOT EXISTS responses ('
+                    'key TEXT PRIMARY KEY, content TEXT NOT NULL, '
+                    'created_at REAL NOT NULL, accessed_at REAL NOT NULL)'
+                )
+                conn.execute(
+                    'CREATE INDEX IF NOT EXISTS responses_accessed_at '
+                    'ON responses (accessed_at)'
+                )
+        finally:
+            conn.close()
@@ -5,6 +5,7 @@ from typing import Any, Callable
 from openhands.core.exceptions import UserCancelledError
 from openhands.core.logger import openhands_logger as logger
 from openhands.llm.async_llm import LLM_RETRY_EXCEPTIONS, AsyncLLM
+from openhands.llm.completion_stream import CompletionStream
 from openhands.llm.model_features import get_features
 
 
@@ -76,6 +77,7 @@ class StreamingLLM(AsyncLLM):
             try:
                 # Directly call and await litellm_acompletion
                 resp = await async_streaming_completion_unwrapped(*args, **kwargs)
+                stream = CompletionStream()
 
                 # For streaming we iterate over the chunks
                 async for chunk in resp:
@@ -92,10 +94,18 @@ class StreamingLLM(AsyncLLM):
                     message_back = chunk['choices'][0]['delta'].get('content', '')
                     if message_back:
                         self.log_response(message_back)
-                    self._post_completion(chunk)
+                    stream.add(chunk)
 
                     yield chunk
 
+                # Record cost and usage once, for the assembled response
+                try:
+                    response = stream.build(messages)
+                except Exception as e:
+                    logger.debug(f'Could not assemble streamed response: {e}')
+                else:
+                    self._post_completion(response)
+
             except UserCancelledError:
                 logger.debug('LLM request cancelled by user.')
                 raise
@@ -1,5 +1,6 @@
 from openhands.mcp.client import MCPClient
 from openhands.mcp.error_collector import mcp_error_collector
+from openhands.mcp.session_pool import MCPSessionPool
 from openhands.mcp.tool import MCPClientTool
 from openhands.mcp.utils import (
     add_mcp_tools_to_agent,
@@ -7,14 +8,17 @@ from openhands.mcp.utils import (
     convert_mcp_clients_to_tools,
     create_mcp_clients,
     fetch_mcp_tools_from_config,
+    fetch_mcp_tools_from_config_cached,
 )
 
 __all__ = [
     'MCPClient',
+    'MCPSessionPool',
     'convert_mcp_clients_to_tools',
     'create_mcp_clients',
     'MCPClientTool',
     'fetch_mcp_tools_from_config',
+    'fetch_mcp_tools_from_config_cached',
     'call_tool_mcp',
     'add_mcp_tools_to_agent',
     'mcp_error_collector',
@@ -0,0 +1,273 @@
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, field
+
+from openhands.core.config.mcp_config import (
+    MCPSHTTPServerConfig,
+    MCPSSEServerConfig,
+    MCPStdioServerConfig,
+)
+from openhands.core.logger import openhands_logger as logger
+from openhands.events.action.mcp import MCPAction
+from openhands.events.observation.observation import Observation
+from openhands.mcp.client import MCPClient
+
+# Sessions unused for longer than this are closed on the next pool access
+DEFAULT_MCP_SESSION_IDLE_TTL = 300.0
+
+
+@dataclass
+class MCPToolLatency:
+    """Latency statistics for calls to a single MCP tool."""
+
+    calls: int = 0
+    errors: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    @property
+    def average_seconds(self) -> float:
+        return self.total_seconds / self.calls if self.calls else 0.0
+
+    def record(self, seconds: float, error: bool) -> None:
+        self.calls += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        if error:
+            self.errors += 1
+
+
+@dataclass
+class _PooledSession:
+    client: MCPClient
+    held: bool = False
+    last_used: float = field(default_factory=time.monotonic)
+
+
+class MCPSessionPool:
+    """Keeps MCP client sessions open across tool calls for one conversation.
+
+    Clients are connected once and their sessions are held open, so
+    subsequent tool calls reuse the negotiated session instead of
+    reconnecting. Concurrent calls are multiplexed over the same session.
+    A call that fails with a connection error reconnects the server and is
+    retried once. Sessions idle for longer than ``idle_ttl`` are closed.
+    """
+
+    def __init__(
+        self,
+        conversation_id: str | None = None,
+        idle_ttl: float = DEFAULT_MCP_SESSION_IDLE_TTL,
+    ) -> None:
+        self.conversation_id = conversation_id
+        self.idle_ttl = idle_ttl
+        self.tool_latencies: dict[str, MCPToolLatency] = {}
+        self._sessions: dict[str, _PooledSession] = {}
+        self._lock = asyncio.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @staticmethod
+    def _server_key(
+        server: MCPSSEServerConfig | MCPSHTTPServerConfig | MCPStdioServerConfig,
+    ) -> str:
+        return f'{type(server).__name__}:{server.model_dump_json()}'
+
+    async def get_clients(
+        self,
+        sse_servers: list[MCPSSEServerConfig],
+        shttp_servers: list[MCPSHTTPServerConfig],
+        stdio_servers: list[MCPStdioServerConfig] | None = None,
+    ) -> list[MCPClient]:
+        """Returns connected clients for the given servers, reusing open sessions."""
+        from openhands.mcp.utils import create_mcp_clients
+
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Sessions are bound to the loop that opened them, so they are
+            # closed there and reopened on this one
+            old_loop, dropped = self._loop, list(self._sessions.values())
+            self._sessions.clear()
+            self._lock = asyncio.Lock()
+            self._loop = loop
+            if old_loop is not None and dropped:
+                await asyncio.to_thread(self._close_on_loop, old_loop, dropped)
+
+        servers: list[
+            MCPSSEServerConfig | MCPSHTTPServerConfig | MCPStdioServerConfig
+        ] = [*sse_servers, *shttp_servers, *(stdio_servers or [])]
+
+        async with self._lock:
+            await self._close_idle_sessions()
+
+            missing = [
+                server
+                for server in servers
+                if self._server_key(server) not in self._sessions
+            ]
+            for server in missing:
+                clients = await create_mcp_clients(
+                    [server] if isinstance(server, MCPSSEServerConfig) else [],
+                    [server] if isinstance(server, MCPSHTTPServerConfig) else [],
+                    self.conversation_id,
+                    [server] if isinstance(server, MCPStdioServerConfig) else [],
+                )
+                if not clients:
+                    continue
+                self._sessions[self._server_key(server)] = _PooledSession(
+                    client=clients[0], held=await self._open_session(clients[0])
+                )
+
+            now = time.monotonic()
+            result = []
+            for server in servers:
+                session = self._sessions.get(self._server_key(server))
+                if session is not None:
+                    session.last_used = now
+                    result.append(session.client)
+            return result
+
+    async def call_tool(
+        self,
+        action: MCPAction,
+        sse_servers: list[MCPSSEServerConfig],
+        shttp_servers: list[MCPSHTTPServerConfig],
+        stdio_servers: list[MCPStdioServerConfig] | None = None,
+    ) -> Observation:
+        """Calls an MCP tool over a pooled session, reconnecting once on failure."""
+        from openhands.mcp.utils import call_tool_mcp
+
+        mcp_clients = await self.get_clients(sse_servers, shttp_servers, stdio_servers)
+        start = time.monotonic()
+        error = False
+        try:
+            try:
+                observation = await call_tool_mcp(mcp_clients, action)
+            except ValueError:
+                # No server provides this tool, reconnecting will not help
+                error = True
+                raise
+            except Exception as e:
+                logger.warning(
+                    f'MCP session for tool {action.name} failed, reconnecting: {e}'
+                )
+                await self._discard_client_for_tool(action.name, mcp_clients)
+                mcp_clients = await self.get_clients(
+                    sse_servers, shttp_servers, stdio_servers
+                )
+                try:
+                    observation = await call_tool_mcp(mcp_clients, action)
+                except Exception:
+                    error = True
+                    raise
+            error = error or '"isError": true' in getattr(observation, 'content', '')
+            return observation
+        finally:
+            elapsed = time.monotonic() - start
+            self.tool_latencies.setdefault(action.name, MCPToolLatency()).record(
+                elapsed, error
+            )
+            logger.debug(f'MCP tool {action.name} took {elapsed:.3f}s')
+
+    async def close(self) -> None:
+        """Closes all pooled sessions."""
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        await self._close_sessions(sessions)
+
+    def close_sync(self, timeout: float = 5.0) -> None:
+        """Closes all pooled sessions from synchronous code."""
+        loop = self._loop
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        if not sessions or loop is None:
+            return
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is loop:
+            loop.create_task(self._close_sessions(sessions))
+        else:
+            self._close_on_loop(loop, sessions, timeout)
+
+    @classmethod
+    def _close_on_loop(
+        cls,
+        loop: asyncio.AbstractEventLoop,
+        sessions: list[_PooledSession],
+        timeout: float = 5.0,
+    ) -> None:
+        """Close sessions on the loop that opened them, from another thread."""
+        if loop.is_closed():
+            # Their transports went with the loop
+            logger.debug('MCP sessions dropped with their closed event loop')
+            return
+        try:
+            if loop.is_running():
+                future = asyncio.run_coroutine_threadsafe(
+                    cls._close_sessions(sessions), loop
+                )
+                future.result(timeout=timeout)
+                return
+            # The loop is idle, so run it until the sessions are closed. In a
+            # thread of its own, as this one may be running another loop.
+            closer = threading.Thread(
+                target=loop.run_until_complete,
+                args=(cls._close_sessions(sessions),),
+                name='mcp-session-close',
+                daemon=True,
+            )
+            closer.start()
+            closer.join(timeout)
+        except Exception as e:
+            logger.warning(f'Error closing MCP sessions: {e}')
+
+    @classmethod
+    async def _close_sessions(cls, sessions: list[_PooledSession]) -> None:
+        for session in sessions:
+            await cls._close_session(session)
+
+    async def _close_idle_sessions(self) -> None:
+        now = time.monotonic()
+        for key, session in list(self._sessions.items()):
+            if now - session.last_used > self.idle_ttl:
+                logger.debug('Closing idle MCP session')
+                del self._sessions[key]
+                await self._close_session(session)
+
+    async def _discard_client_for_tool(
+        self, tool_name: str, mcp_clients: list[MCPClient]
+    ) -> None:
+        async with self._lock:
+            for key, session in list(self._sessions.items()):
+                if (
+                    session.client in mcp_clients
+                    and tool_name in session.client.tool_map
+                ):
+                    del self._sessions[key]
+                    await self._close_session(session)
+
+    @staticmethod
+    async def _open_session(client: MCPClient) -> bool:
+        if client.client is None:
+            return False
+        try:
+            # Holding an outer context keeps the session open, nested
+            # `async with` blocks in MCPClient.call_tool then reuse it.
+            await client.client.__aenter__()
+            return True
+        except Exception as e:
+            # The client still works, it just reconnects per call
+            logger.warning(f'Could not keep MCP session open: {e}')
+            return False
+
+    @staticmethod
+    async def _close_session(session: _PooledSession) -> None:
+        if not session.held or session.client.client is None:
+            return
+        session.held = False
+        try:
+            await session.client.client.__aexit__(None, None, None)
+        except Exception as e:
+            logger.debug(f'Error closing MCP session: {e}')
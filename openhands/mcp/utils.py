@@ -1,4 +1,5 @@
 import asyncio
+import hashlib
 import json
 import shutil
 from typing import TYPE_CHECKING
@@ -25,6 +26,15 @@ from openhands.mcp.error_collector import mcp_error_collector
 from openhands.runtime.base import Runtime
 from openhands.runtime.impl.cli.cli_runtime import CLIRuntime
 
+# Default upper bound for connecting to a single server and listing its tools,
+# overridden by MCPConfig.connect_timeout
+MCP_SERVER_CONNECT_TIMEOUT = 60.0
+
+# Tool schemas of each server keyed by a hash of its configuration, shared across
+# conversations
+_mcp_tools_cache: dict[str, list[dict]] = {}
+_mcp_tools_refresh_tasks: dict[str, asyncio.Task] = {}
+
 
 def convert_mcp_clients_to_tools(mcp_clients: list[MCPClient] | None) -> list[dict]:
     """Converts a list of MCPClient instances to ChatCompletionToolParam format
@@ -66,6 +76,7 @@ async def create_mcp_clients(
     shttp_servers: list[MCPSHTTPServerConfig],
     conversation_id: str | None = None,
     stdio_servers: list[MCPStdioServerConfig] | None = None,
+    connect_timeout: float | None = None,
 ) -> list[MCPClient]:
     import sys
 
@@ -88,70 +99,195 @@ async def create_mcp_clients(
     if not servers:
         return []
 
-    mcp_clients = []
+    if connect_timeout is None:
+        connect_timeout = MCP_SERVER_CONNECT_TIMEOUT
 
-    for server in servers:
-        if isinstance(server, MCPStdioServerConfig):
-            # Validate that the command exists before connecting
-            if not shutil.which(server.command):
-                logger.error(
-                    f'Skipping MCP stdio server "{server.name}": command "{server.command}" not found. '
-                    f'Please install {server.command} or remove this server from your configuration.'
-                )
-                continue
-
-            logger.info(f'Initializing MCP agent for {server} with stdio connection...')
-            client = MCPClient()
-            try:
-                await client.connect_stdio(server)
-
-                # Log which tools this specific server provides
-                tool_names = [tool.name for tool in client.tools]
-                server_name = getattr(
-                    server, 'name', f'{server.command} {" ".join(server.args or [])}'
-                )
-                logger.debug(
-                    f'Successfully connected to MCP stdio server {server_name} - '
-                    f'provides {len(tool_names)} tools: {tool_names}'
-                )
-
-                mcp_clients.append(client)
-            except Exception as e:
-                # Error is already logged and collected in client.connect_stdio()
-                logger.error(f'Failed to connect to {server}: {str(e)}', exc_info=True)
-            continue
+    # Connect to all servers concurrently; each one gets its own timeout so a
+    # single slow server cannot hold up the others.
+    results = await asyncio.gather(
+        *(
+            _connect_mcp_server(server, conversation_id, connect_timeout)
+            for server in servers
+        )
+    )
+    mcp_clients = [client for client in results if client is not None]
 
-        is_shttp = isinstance(server, MCPSHTTPServerConfig)
+    return mcp_clients
 
-        connection_type = 'SHTTP' if is_shttp else 'SSE'
-        logger.info(
-            f'Initializing MCP agent for {server} with {connection_type} connection...'
-        )
-        client = MCPClient()
 
-        # Set server timeout for SHTTP servers
-        if isinstance(server, MCPSHTTPServerConfig) and server.timeout is not None:
-            client.server_timeout = float(server.timeout)
-            logger.debug(f'Set SHTTP server timeout to {server.timeout}s')
+async def _connect_mcp_server(
+    server: MCPSSEServerConfig | MCPSHTTPServerConfig | MCPStdioServerConfig,
+    conversation_id: str | None = None,
+    timeout: float = MCP_SERVER_CONNECT_TIMEOUT,
+) -> MCPClient | None:
+    """Connect to a single MCP server and list its tools.
+
+    Returns:
+        The connected client, or None if the server could not be reached in time.
+    """
+    if isinstance(server, MCPStdioServerConfig):
+        # Validate that the command exists before connecting
+        if not shutil.which(server.command):
+            logger.error(
+                f'Skipping MCP stdio server "{server.name}": command "{server.command}" not found. '
+                f'Please install {server.command} or remove this server from your configuration.'
+            )
+            return None
 
+        logger.info(f'Initializing MCP agent for {server} with stdio connection...')
+        client = MCPClient()
         try:
-            await client.connect_http(server, conversation_id=conversation_id)
+            await asyncio.wait_for(client.connect_stdio(server), timeout=timeout)
 
             # Log which tools this specific server provides
             tool_names = [tool.name for tool in client.tools]
+            server_name = getattr(
+                server, 'name', f'{server.command} {" ".join(server.args or [])}'
+            )
             logger.debug(
-                f'Successfully connected to MCP STTP server {server.url} - '
+                f'Successfully connected to MCP stdio server {server_name} - '
                 f'provides {len(tool_names)} tools: {tool_names}'
             )
-
-            # Only add the client to the list after a successful connection
-            mcp_clients.append(client)
-
+            return client
         except Exception as e:
-            # Error is already logged and collected in client.connect_http()
+            # Error is already logged and collected in client.connect_stdio()
             logger.error(f'Failed to connect to {server}: {str(e)}', exc_info=True)
+            return None
+
+    is_shttp = isinstance(server, MCPSHTTPServerConfig)
+
+    connection_type = 'SHTTP' if is_shttp else 'SSE'
+    logger.info(
+        f'Initializing MCP agent for {server} with {connection_type} connection...'
+    )
+    client = MCPClient()
+
+    # Set server timeout for SHTTP servers; connecting may take as long
+    if isinstance(server, MCPSHTTPServerConfig) and server.timeout is not None:
+        client.server_timeout = float(server.timeout)
+        timeout = max(timeout, client.server_timeout)
+        logger.debug(f'Set SHTTP server timeout to {server.timeout}s')
+
+    try:
+        await asyncio.wait_for(
+            client.connect_http(server, conversation_id=conversation_id),
+            timeout=timeout,
+        )
+
+        # Log which tools this specific server provides
+        tool_names = [tool.name for tool in client.tools]
+        logger.debug(
+            f'Successfully connected to MCP STTP server {server.url} - '
+            f'provides {len(tool_names)} tools: {tool_names}'
+        )
+        return client
+    except Exception as e:
+        # Error is already logged and collected in client.connect_http()
+        logger.error(f'Failed to connect to {server}: {str(e)}', exc_info=True)
+        return None
+
+
+def _mcp_server_cache_key(
+    server: MCPSSEServerConfig | MCPSHTTPServerConfig | MCPStdioServerConfig,
+) -> str:
+    """Hash the parts of a server configuration that determine its tools."""
+    payload = {
+        'type': type(server).__name__,
+        'server': server.model_dump(mode='json', exclude={'api_key'}),
+    }
+    return hashlib.sha256(
+        json.dumps(payload, sort_keys=True).encode('utf-8')
+    ).hexdigest()
+
+
+async def _refresh_mcp_server_tools(
+    cache_key: str,
+    server: MCPSSEServerConfig | MCPSHTTPServerConfig | MCPStdioServerConfig,
+    conversation_id: str | None,
+    timeout: float,
+) -> list[dict] | None:
+    """Fetch the tools of one server, keeping the cached ones if it can't be reached."""
+    client = await _connect_mcp_server(server, conversation_id, timeout)
+    if client is None:
+        return _mcp_tools_cache.get(cache_key)
+    mcp_tools = convert_mcp_clients_to_tools([client])
+    _mcp_tools_cache[cache_key] = mcp_tools
+    return mcp_tools
 
-    return mcp_clients
+
+async def fetch_mcp_tools_from_config_cached(
+    mcp_config: MCPConfig,
+    conversation_id: str | None = None,
+    use_stdio: bool = False,
+    cache_keys: dict[str, str] | None = None,
+) -> list[dict]:
+    """Retrieves MCP tools, serving cached schemas for known servers.
+
+    Tools are cached per server, so a server that changes or can't be reached
+    does not affect the tools of the others. Servers with cached tools return
+    them immediately and are refreshed in the background, so a later
+    conversation picks up any changes; the others are fetched concurrently.
+
+    Args:
+        mcp_config: The MCP configuration
+        conversation_id: Optional conversation ID to associate with the MCP clients
+        use_stdio: Whether to use stdio servers for MCP clients
+        cache_keys: Cache keys by server URL, for servers whose configuration
+            changes per conversation but whose tools don't
+
+    Returns:
+        A list of tool dictionaries.
+    """
+    import sys
+
+    # Skip MCP tools on Windows
+    if sys.platform == 'win32':
+        logger.info('MCP functionality is disabled on Windows, skipping tool fetching')
+        return []
+
+    servers: list[MCPSSEServerConfig | MCPSHTTPServerConfig | MCPStdioServerConfig] = [
+        *mcp_config.sse_servers,
+        *mcp_config.shttp_servers,
+        *(mcp_config.stdio_servers if use_stdio else []),
+    ]
+    timeout = float(mcp_config.connect_timeout or MCP_SERVER_CONNECT_TIMEOUT)
+    cache_keys = cache_keys or {}
+    keys = [
+        cache_keys.get(getattr(server, 'url', None) or '')
+        or _mcp_server_cache_key(server)
+        for server in servers
+    ]
+
+    # Fetch the servers without cached tools, refresh the others in the background
+    missing = {
+        key: server for key, server in zip(keys, servers) if key not in _mcp_tools_cache
+    }
+    await asyncio.gather(
+        *(
+            _refresh_mcp_server_tools(key, server, conversation_id, timeout)
+            for key, server in missing.items()
+        )
+    )
+    for key, server in zip(keys, servers):
+        if key in missing:
+            continue
+        refresh_task = _mcp_tools_refresh_tasks.get(key)
+        if refresh_task is None or refresh_task.done():
+            refresh_task = asyncio.create_task(
+                _refresh_mcp_server_tools(key, server, conversation_id, timeout)
+            )
+            _mcp_tools_refresh_tasks[key] = refresh_task
+            refresh_task.add_done_callback(
+                lambda task, key=key: _mcp_tools_refresh_tasks.pop(key, None)
+                if _mcp_tools_refresh_tasks.get(key) is task
+                else None
+            )
+
+    mcp_tools = []
+    for key in dict.fromkeys(keys):
+        mcp_tools.extend(_mcp_tools_cache.get(key, []))
+    logger.debug(f'Using {len(mcp_tools)} MCP tools from {len(servers)} servers')
+    return mcp_tools
 
 
 async def fetch_mcp_tools_from_config(
@@ -185,6 +321,7 @@ async def fetch_mcp_tools_from_config(
             mcp_config.shttp_servers,
             conversation_id,
             mcp_config.stdio_servers if use_stdio else [],
+            mcp_config.connect_timeout,
         )
 
         if not mcp_clients:
@@ -324,10 +461,24 @@ async def add_mcp_tools_to_agent(
     # Add the runtime as another MCP server
     updated_mcp_config = runtime.get_mcp_config(extra_stdio_servers)
 
+    # The runtime's proxy has a new URL and key in every conversation, but its
+    # tools only depend on the stdio servers behind it
+    cache_keys = {}
+    if runtime.mcp_proxy_url:
+        proxied_servers = [*updated_mcp_config.stdio_servers, *extra_stdio_servers]
+        cache_keys[runtime.mcp_proxy_url] = hashlib.sha256(
+            json.dumps(
+                [server.model_dump(mode='json') for server in proxied_servers],
+                sort_keys=True,
+            ).encode('utf-8')
+        ).hexdigest()
+
     # Fetch the MCP tools
     # Only use stdio if run from a CLI runtime
-    mcp_tools = await fetch_mcp_tools_from_config(
-        updated_mcp_config, use_stdio=isinstance(runtime, CLIRuntime)
+    mcp_tools = await fetch_mcp_tools_from_config_cached(
+        updated_mcp_config,
+        use_stdio=isinstance(runtime, CLIRuntime),
+        cache_keys=cache_keys,
     )
 
     tool_names = [tool['function']['name'] for tool in mcp_tools]
@@ -1,8 +1,8 @@
-import re
 from typing import Any, Generator
 
 from litellm import ModelResponse
 
+from openhands.controller.state.state import parse_lumio_settings
 from openhands.core.config.agent_config import AgentConfig
 from openhands.core.logger import openhands_logger as logger
 from openhands.core.message import ImageContent, Message, TextContent
@@ -46,6 +46,7 @@ from openhands.events.observation.error import ErrorObservation
 from openhands.events.observation.mcp import MCPObservation
 from openhands.events.observation.observation import Observation
 from openhands.events.serialization.event import truncate_content
+from openhands.memory.prompt_cache import PromptCachePlanner
 from openhands.utils.prompt import (
     ConversationInstructions,
     PromptManager,
@@ -60,6 +61,7 @@ class ConversationMemory:
     def __init__(self, config: AgentConfig, prompt_manager: PromptManager):
         self.agent_config = config
         self.prompt_manager = prompt_manager
+        self.prompt_cache_planner = PromptCachePlanner()
 
     @staticmethod
     def _is_valid_image_url(url: str | None) -> bool:
@@ -83,22 +85,15 @@ class ConversationMemory:
         Returns:
             Dict with 'mode' and 'skip_tests' keys if found, None otherwise
         """
-        match = re.search(
-            r'<lumio-settings\s+mode="([^"]+)"\s+skip-tests="([^"]+)"\s*/>', content
-        )
-        if match:
-            return {
-                'mode': match.group(1),
-                'skip_tests': match.group(2).lower() == 'true',
-            }
-        return None
+        return parse_lumio_settings(content)
 
     @staticmethod
     def extract_latest_lumio_settings(events: list) -> dict[str, Any] | None:
         """Extract the latest lumio settings from a list of events.
 
         Iterates through events in reverse to find the most recent user message
-        containing lumio-settings tag.
+        containing lumio-settings tag. Agents should prefer State.lumio_settings,
+        which is kept up to date as events are added to the history.
 
         Args:
             events: List of events to search through
@@ -108,7 +103,7 @@ class ConversationMemory:
         """
         for event in reversed(events):
             if isinstance(event, MessageAction) and event.source == 'user':
-                settings = ConversationMemory.parse_lumio_settings(event.content)
+                settings = parse_lumio_settings(event.content)
                 if settings:
                     return settings
         return None
@@ -725,20 +720,18 @@ class ConversationMemory:
 
         return [message]
 
-    def apply_prompt_caching(self, messages: list[Message]) -> None:
+    def apply_prompt_caching(
+        self,
+        messages: list[Message],
+        volatile_content: list[TextContent] | None = None,
+    ) -> None:
         """Applies caching breakpoints to the messages.
 
-        For new Anthropic API, we only need to mark the last user or tool message as cacheable.
+        Breakpoints are chosen by the PromptCachePlanner, and volatile content
+        (e.g. per-step reminders) is added after the last of them so that it
+        does not invalidate the cached prefix.
         """
-        if len(messages) > 0 and messages[0].role == 'system':
-            messages[0].content[-1].cache_prompt = True
-        # NOTE: this is only needed for anthropic
-        for message in reversed(messages):
-            if message.role in ('user', 'tool'):
-                message.content[
-                    -1
-                ].cache_prompt = True  # Last item inside the message content
-                break
+        self.prompt_cache_planner.apply(messages, volatile_content)
 
     def _filter_agents_in_microagent_obs(
         self, obs: RecallObservation, current_index: int, events: list[Event]
@@ -0,0 +1,90 @@
+from openhands.core.message import Message, TextContent
+
+# Anthropic accepts at most this many cache_control breakpoints per request
+MAX_CACHE_BREAKPOINTS = 4
+
+
+class PromptCachePlanner:
+    """Chooses prompt caching breakpoints that keep the cached prefix stable.
+
+    A cached prefix is only read back when the next request starts with
+    exactly the same content up to a breakpoint. The planner marks, in order
+    of priority:
+
+    - the last user or tool message, to write the whole prompt for the next step
+    - the last user or tool message before the latest assistant turn, which is
+      where the previous step's request ended, so it is read back even when
+      that step added more content than the provider looks back over
+    - the system message, which holds the system prompt and survives
+      condensation
+    - the end of the initial user turn (task and workspace context), which
+      condensers keep as well
+
+    Content that changes from step to step, such as the settings reminder,
+    is placed after the last breakpoint, so it never invalidates the prefix.
+    """
+
+    def __init__(self, max_breakpoints: int = MAX_CACHE_BREAKPOINTS) -> None:
+        self.max_breakpoints = max_breakpoints
+
+    def plan(self, messages: list[Message]) -> list[int]:
+        """Returns the indices of the messages to mark, in order of priority."""
+        candidates: list[int | None] = []
+        last = self._last_prompt_index(messages, len(messages))
+        candidates.append(last)
+        if last is not None:
+            latest_assistant = next(
+                (i for i in range(last - 1, -1, -1) if messages[i].role == 'assistant'),
+                None,
+            )
+            if latest_assistant is not None:
+                candidates.append(self._last_prompt_index(messages, latest_assistant))
+        if messages and messages[0].role == 'system':
+            candidates.append(0)
+        candidates.append(self._initial_turn_end(messages))
+
+        planned: list[int] = []
+        for index in candidates:
+            if (
+                index is not None
+                and index not in planned
+                and messages[index].content
+                and len(planned) < self.max_breakpoints
+            ):
+                planned.append(index)
+        return planned
+
+    def apply(
+        self,
+        messages: list[Message],
+        volatile_content: list[TextContent] | None = None,
+    ) -> None:
+        """Marks the planned breakpoints and appends the volatile content after them."""
+        for index in self.plan(messages):
+            messages[index].content[-1].cache_prompt = True
+
+        if not volatile_content:
+            return
+        if messages and messages[-1].role == 'user':
+            messages[-1].content.extend(volatile_content)
+        else:
+            # Content added to a tool result would be cached with it, the
+            # provider caches tool results as a whole
+            messages.append(Message(role='user', content=list(volatile_content)))
+
+    @staticmethod
+    def _last_prompt_index(messages: list[Message], end: int) -> int | None:
+        for i in range(end - 1, -1, -1):
+            if messages[i].role in ('user', 'tool'):
+                return i
+        return None
+
+    @staticmethod
+    def _initial_turn_end(messages: list[Message]) -> int | None:
+        start = 1 if messages and messages[0].role == 'system' else 0
+        end = None
+        for i in range(start, len(messages)):
+            if messages[i].role != 'user':
+                break
+            end = i
+        return end
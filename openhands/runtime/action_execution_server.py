@@ -16,13 +16,14 @@ import tempfile
 import time
 from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import Callable
 from zipfile import ZipFile
 
 import puremagic
 from binaryornot.check import is_binary
 from fastapi import Depends, FastAPI, HTTPException, Request, UploadFile
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, Response, StreamingResponse
 from fastapi.security import APIKeyHeader
 from openhands_aci.editor.editor import OHEditor
 from openhands_aci.editor.exceptions import ToolError
@@ -68,13 +69,21 @@ from openhands.runtime.mcp.proxy import MCPProxyManager
 from openhands.runtime.plugins import ALL_PLUGINS, JupyterPlugin, Plugin, VSCodePlugin
 from openhands.runtime.utils import find_available_tcp_port
 from openhands.runtime.utils.bash import BashSession
+from openhands.runtime.utils.file_tree import (
+    DEFAULT_TREE_DEPTH,
+    DEFAULT_TREE_LIMIT,
+    FileTreeBuilder,
+)
 from openhands.runtime.utils.files import insert_lines, read_lines
+from openhands.runtime.utils.git_changes_tracker import GitChangesTracker
 from openhands.runtime.utils.memory_monitor import MemoryMonitor
+from openhands.runtime.utils.output_buffer import OutputChunkBuffer
 from openhands.runtime.utils.runtime_init import init_user_and_working_directory
 from openhands.runtime.utils.system_stats import (
     get_system_stats,
     update_last_execution_time,
 )
+from openhands.runtime.utils.workspace_watcher import WorkspaceWatcher
 from openhands.utils.async_utils import call_sync_from_async, wait_all
 
 if sys.platform == 'win32':
@@ -85,8 +94,17 @@ class ActionRequest(BaseModel):
     action: dict
 
 
+class MoveBuildRequest(BaseModel):
+    project_dir: str | None = None
+    test: bool = False
+    move_args: str | None = None
+
+
 ROOT_GID = 0
 
+# Minimum delay between output lines sent by /execute_action_stream
+SHELL_STREAM_INTERVAL = 0.1
+
 SESSION_API_KEY = os.environ.get('SESSION_API_KEY')
 api_key_header = APIKeyHeader(name='X-Session-API-Key', auto_error=False)
 
@@ -433,21 +451,32 @@ class ActionExecutor:
         except Exception as e:
             logger.warning(f'LumioVibe: Error starting frontend: {e}')
 
-    async def run_action(self, action) -> Observation:
+    async def run_action(
+        self, action, output_callback: Callable[[str], None] | None = None
+    ) -> Observation:
         async with self.lock:
+            if isinstance(action, CmdRunAction) and output_callback is not None:
+                return await self.run(action, output_callback)
             action_type = action.action
             observation = await getattr(self, action_type)(action)
             return observation
 
     async def run(
-        self, action: CmdRunAction
+        self,
+        action: CmdRunAction,
+        output_callback: Callable[[str], None] | None = None,
     ) -> CmdOutputObservation | ErrorObservation:
         try:
             bash_session = self.bash_session
             if action.is_static:
                 bash_session = self._create_bash_session(action.cwd)
             assert bash_session is not None
-            obs = await call_sync_from_async(bash_session.execute, action)
+            if output_callback is not None and isinstance(bash_session, BashSession):
+                obs = await call_sync_from_async(
+                    bash_session.execute, action, output_callback
+                )
+            else:
+                obs = await call_sync_from_async(bash_session.execute, action)
             return obs
         except Exception as e:
             logger.exception(f'Error running command: {e}')
@@ -750,10 +779,13 @@ if __name__ == '__main__':
 
     client: ActionExecutor | None = None
     mcp_proxy_manager: MCPProxyManager | None = None
+    file_trees = FileTreeBuilder()
+    workspace_watcher: WorkspaceWatcher | None = None
+    git_changes_trackers: dict[str, GitChangesTracker] = {}
 
     @asynccontextmanager
     async def lifespan(app: FastAPI):
-        global client, mcp_proxy_manager
+        global client, mcp_proxy_manager, workspace_watcher
         logger.info('Initializing ActionExecutor...')
         client = ActionExecutor(
             plugins_to_load,
@@ -766,6 +798,14 @@ if __name__ == '__main__':
         await client.ainit()
         logger.info('ActionExecutor initialized.')
 
+        # Watch the workspace, so git changes are listed only for changed paths
+        workspace_watcher = WorkspaceWatcher(client.initial_cwd)
+        try:
+            workspace_watcher.start()
+        except OSError as e:
+            logger.info(f'Not watching the workspace for changes: {e}')
+            workspace_watcher = None
+
         # Check if we're on Windows
         is_windows = sys.platform == 'win32'
 
@@ -800,6 +840,9 @@ if __name__ == '__main__':
         else:
             logger.info('MCP Proxy Manager instance not found for shutdown.')
 
+        if workspace_watcher:
+            workspace_watcher.stop()
+
         logger.info('Closing ActionExecutor...')
         if client:
             try:
@@ -887,6 +930,63 @@ if __name__ == '__main__':
         finally:
             update_last_execution_time()
 
+    @app.post('/execute_action_stream')
+    async def execute_action_stream(action_request: ActionRequest):
+        """Run a command, streaming its output before the final observation.
+
+        The response is newline-delimited JSON: any number of
+        `{"output": str}` lines followed by one `{"observation": dict}` line.
+        Output is coalesced and sent at most every SHELL_STREAM_INTERVAL
+        seconds; if the client reads slowly it keeps accumulating in a
+        bounded buffer instead of piling up unsent lines.
+        """
+        assert client is not None
+        action = event_from_dict(action_request.action)
+        if not isinstance(action, CmdRunAction):
+            raise HTTPException(
+                status_code=400, detail='Only run actions can be streamed'
+            )
+        client.last_execution_time = time.time()
+
+        loop = asyncio.get_running_loop()
+        pending_output = OutputChunkBuffer()
+        output_ready = asyncio.Event()
+
+        def on_output(chunk: str) -> None:
+            # Called from the thread executing the command
+            if pending_output.append(chunk):
+                loop.call_soon_threadsafe(output_ready.set)
+
+        async def stream_events():
+            task = asyncio.create_task(client.run_action(action, on_output))
+            try:
+                while not task.done():
+                    output_wait = asyncio.create_task(output_ready.wait())
+                    await asyncio.wait(
+                        [task, output_wait], return_when=asyncio.FIRST_COMPLETED
+                    )
+                    output_wait.cancel()
+                    if task.done():
+                        break
+                    output_ready.clear()
+                    # Give more output a chance to arrive and be sent together
+                    await asyncio.sleep(SHELL_STREAM_INTERVAL)
+                    content = pending_output.drain()
+                    if content:
+                        yield json.dumps({'output': content}) + '\n'
+                observation = await task
+            except Exception as e:
+                logger.exception(f'Error while running /execute_action_stream: {e}')
+                observation = ErrorObservation(f'Internal server error: {e}')
+            finally:
+                update_last_execution_time()
+            content = pending_output.drain()
+            if content:
+                yield json.dumps({'output': content}) + '\n'
+            yield json.dumps({'observation': event_to_dict(observation)}) + '\n'
+
+        return StreamingResponse(stream_events(), media_type='application/x-ndjson')
+
     @app.post('/update_mcp_server')
     async def update_mcp_server(request: Request):
         # Check if we're on Windows
@@ -1127,6 +1227,127 @@ if __name__ == '__main__':
             logger.exception(f'Error listing files: {e}')
             return JSONResponse(content=[])
 
+    @app.get('/file_tree')
+    def file_tree(
+        request: Request,
+        path: str | None = None,
+        depth: int = DEFAULT_TREE_DEPTH,
+        limit: int = DEFAULT_TREE_LIMIT,
+    ):
+        """List the tree of files under a path, recursively, in one response.
+
+        Entries ignored by .gitignore files or by the UI are left out. The
+        response has an ETag, and a request whose If-None-Match matches the
+        current tree gets a 304 without a body.
+
+        To list files:
+        ```sh
+        curl 'http://localhost:3000/file_tree?path=/workspace&depth=3&limit=5000'
+        ```
+
+        Args:
+            request (Request): The incoming request object.
+            path (str, optional): The directory to list. Defaults to the working directory.
+            depth (int): The number of directory levels to list.
+            limit (int): The maximum number of entries to list.
+
+        Returns:
+            dict: The tree, see `openhands.runtime.utils.file_tree.FileTree`.
+
+        Raises:
+            HTTPException: If the depth or limit is not positive.
+        """
+        assert client is not None
+
+        if path is None:
+            full_path = client.initial_cwd
+        elif os.path.isabs(path):
+            full_path = path
+        else:
+            full_path = os.path.join(client.initial_cwd, path)
+
+        try:
+            tree = file_trees.get_tree(full_path, depth, limit)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        headers = {'ETag': tree.etag}
+        if request.headers.get('if-none-match') == tree.etag:
+            return Response(status_code=304, headers=headers)
+        return JSONResponse(content=tree.tree, headers=headers)
+
+    @app.get('/git_changes')
+    def git_changes(cwd: str):
+        """The git changes in a directory of the workspace.
+
+        Only the paths changed since the previous request are checked with git.
+
+        Raises:
+            HTTPException: 503 if the workspace is not being watched, or 400 if
+                the directory is not in it.
+        """
+        if workspace_watcher is None or not workspace_watcher.running:
+            raise HTTPException(status_code=503, detail='Workspace is not watched')
+        tracker = git_changes_trackers.get(cwd)
+        if tracker is None:
+            try:
+                tracker = GitChangesTracker(cwd, workspace_watcher)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            tracker = git_changes_trackers.setdefault(cwd, tracker)
+        try:
+            return tracker.get_changes()
+        except RuntimeError as e:
+            raise HTTPException(status_code=500, detail=str(e))
+
+    @app.post('/move_build')
+    async def move_build(request: MoveBuildRequest):
+        """Compile (or test) a Move package with `lu build`, reusing cached builds.
+
+        Builds are cached by the contents of the package, so this returns at
+        once when nothing changed since the last successful build.
+
+        ```sh
+        curl -X POST -d '{"project_dir": "/workspace/app", "test": false}' http://localhost:3000/move_build
+        ```
+
+        Returns:
+            dict: The `lu build --json` result: `success`, `cached`, `output`,
+                `seconds` and the cache `stats` (hits, misses and hit rate).
+
+        Raises:
+            HTTPException: 404 if there is no Move package in the project, or
+                500 if the build could not be run.
+        """
+        assert client is not None
+
+        cmd = ['lu', 'build', '--json']
+        if request.test:
+            cmd.append('--test')
+        if request.move_args:
+            cmd.extend(['--move-args', request.move_args])
+        if request.project_dir:
+            cmd.append(request.project_dir)
+        # Build as the agent does, so build directories stay theirs
+        user = client.username if os.geteuid() == 0 and client.user_id != 0 else None
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                cwd=client.initial_cwd,
+                user=user,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+            )
+        except OSError as e:
+            raise HTTPException(status_code=500, detail=f'Could not run lu: {e}')
+        stdout, _ = await process.communicate()
+        output = stdout.decode('utf-8', errors='replace').strip()
+        try:
+            return json.loads(output.splitlines()[-1])
+        except (IndexError, ValueError):
+            # lu reports a missing project as text
+            raise HTTPException(status_code=404, detail=output)
+
     logger.debug(f'Starting action execution API on port {args.port}')
     # When LOG_JSON=1, provide a JSON log config to Uvicorn so error/access logs are structured
     log_config = None
@@ -67,6 +67,11 @@ from openhands.runtime.plugins import (
 )
 from openhands.runtime.runtime_status import RuntimeStatus
 from openhands.runtime.utils.edit import FileEditRuntimeMixin
+from openhands.runtime.utils.file_tree import (
+    DEFAULT_TREE_DEPTH,
+    DEFAULT_TREE_LIMIT,
+    FileTree,
+)
 from openhands.runtime.utils.git_handler import CommandResult, GitHandler
 from openhands.security import SecurityAnalyzer, options
 from openhands.storage.locations import get_conversation_dir
@@ -1088,6 +1093,11 @@ fi
     ) -> MCPConfig:
         pass
 
+    @property
+    def mcp_proxy_url(self) -> str | None:
+        """URL of the SSE server proxying the runtime's stdio MCP servers, if any."""
+        return None
+
     # ====================================================================
     # Action execution
     # ====================================================================
@@ -1140,6 +1150,20 @@ fi
         """
         raise NotImplementedError('This method is not implemented in the base class.')
 
+    def get_file_tree(
+        self,
+        path: str | None = None,
+        depth: int = DEFAULT_TREE_DEPTH,
+        limit: int = DEFAULT_TREE_LIMIT,
+        etag: str | None = None,
+    ) -> FileTree | None:
+        """List the tree of files under a path in the sandbox, recursively.
+
+        If path is None, list the sandbox's initial working directory. Returns
+        None if the tree still has the given ETag.
+        """
+        raise NotImplementedError('This runtime does not support listing file trees.')
+
     @abstractmethod
     def copy_from(self, path: str) -> Path:
         """Zip all files in the sandbox and return a path in the local filesystem."""
@@ -5,18 +5,20 @@ import numpy as np
 from PIL import Image
 
 
-def image_to_png_base64_url(
-    image: np.ndarray | Image.Image, add_data_prefix: bool = False
-) -> str:
-    """Convert a numpy array to a base64 encoded png image url."""
+def image_to_png_bytes(image: np.ndarray | Image.Image) -> bytes:
+    """Convert a numpy array to png image bytes."""
     if isinstance(image, np.ndarray):
         image = Image.fromarray(image)
     if image.mode in ('RGBA', 'LA'):
         image = image.convert('RGB')
     buffered = io.BytesIO()
     image.save(buffered, format='PNG')
+    return buffered.getvalue()
+
 
-    image_base64 = base64.b64encode(buffered.getvalue()).decode()
+def png_bytes_to_base64_url(png: bytes, add_data_prefix: bool = False) -> str:
+    """Convert png image bytes to a base64 encoded png image url."""
+    image_base64 = base64.b64encode(png).decode()
     return (
         f'data:image/png;base64,{image_base64}'
         if add_data_prefix
@@ -24,6 +26,13 @@ def image_to_png_base64_url(
     )
 
 
+def image_to_png_base64_url(
+    image: np.ndarray | Image.Image, add_data_prefix: bool = False
+) -> str:
+    """Convert a numpy array to a base64 encoded png image url."""
+    return png_bytes_to_base64_url(image_to_png_bytes(image), add_data_prefix)
+
+
 def png_base64_url_to_image(png_base64_url: str) -> Image.Image:
     """Convert a base64 encoded png image url to a PIL Image."""
     splited = png_base64_url.split(',')
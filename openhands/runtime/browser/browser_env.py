@@ -8,16 +8,18 @@ import browsergym.core  # noqa F401 (we register the openended task as a gym env
 import gymnasium as gym
 import html2text
 import tenacity
-from browsergym.utils.obs import flatten_dom_to_str, overlay_som
+from browsergym.utils.obs import flatten_dom_to_str
 
 from openhands.core.exceptions import BrowserInitException
 from openhands.core.logger import openhands_logger as logger
-from openhands.runtime.browser.base64 import image_to_png_base64_url
+from openhands.runtime.browser.shared_image_ring import SharedImageRing
 from openhands.utils.shutdown_listener import should_continue, should_exit
 from openhands.utils.tenacity_stop import stop_if_should_exit
 
 BROWSER_EVAL_GET_GOAL_ACTION = 'GET_EVAL_GOAL'
 BROWSER_EVAL_GET_REWARDS_ACTION = 'GET_EVAL_REWARDS'
+# Pipe waits block for at most this long before checking for shutdown
+PIPE_WAIT_INTERVAL = 1.0
 
 
 class BrowserEnv:
@@ -33,6 +35,8 @@ class BrowserEnv:
         # Initialize browser environment process
         multiprocessing.set_start_method('spawn', force=True)
         self.browser_side, self.agent_side = multiprocessing.Pipe()
+        # Screenshots bypass the pipe, see `step`
+        self.image_ring = SharedImageRing()
 
         self.init_browser()
         atexit.register(self.close)
@@ -55,6 +59,9 @@ class BrowserEnv:
     )
     def init_browser(self) -> None:
         logger.debug('Starting browser env...')
+        if self.image_ring.closed:
+            # Closed by a previous failed attempt
+            self.image_ring = SharedImageRing()
         try:
             self.process = multiprocessing.Process(target=self.browser_process)
             self.process.start()
@@ -122,7 +129,7 @@ class BrowserEnv:
 
         while should_continue():
             try:
-                if self.browser_side.poll(timeout=0.01):
+                if self.browser_side.poll(timeout=PIPE_WAIT_INTERVAL):
                     unique_request_id, action_data = self.browser_side.recv()
 
                     # shutdown the browser environment
@@ -165,16 +172,9 @@ class BrowserEnv:
                     # add text content of the page
                     html_str = flatten_dom_to_str(obs['dom_object'])
                     obs['text_content'] = self.html_text_converter.handle(html_str)
-                    # make observation serializable
-                    obs['set_of_marks'] = image_to_png_base64_url(
-                        overlay_som(
-                            obs['screenshot'], obs.get('extra_element_properties', {})
-                        ),
-                        add_data_prefix=True,
-                    )
-                    obs['screenshot'] = image_to_png_base64_url(
-                        obs['screenshot'], add_data_prefix=True
-                    )
+                    # make observation serializable, the raw screenshot is
+                    # passed through shared memory rather than the pipe
+                    obs['screenshot'] = self.image_ring.put(obs['screenshot'])
                     obs['active_page_index'] = obs['active_page_index'].item()
                     obs['elapsed_time'] = obs['elapsed_time'].item()
                     self.browser_side.send((unique_request_id, obs))
@@ -187,17 +187,26 @@ class BrowserEnv:
                 return
 
     def step(self, action_str: str, timeout: float = 120) -> dict:
-        """Execute an action in the browser environment and return the observation."""
+        """Execute an action in the browser environment and return the observation.
+
+        The `screenshot` of the observation is the raw RGB(A) image as a numpy
+        array. Encoding it (and rendering the set-of-marks overlay) is left to
+        the consumer, see `openhands.runtime.browser.utils.browse`.
+        """
         unique_request_id = str(uuid.uuid4())
         self.agent_side.send((unique_request_id, {'action': action_str}))
         start_time = time.time()
         while True:
-            if should_exit() or time.time() - start_time > timeout:
+            remaining = timeout - (time.time() - start_time)
+            if should_exit() or remaining <= 0:
                 raise TimeoutError('Browser environment took too long to respond.')
-            if self.agent_side.poll(timeout=0.01):
+            if self.agent_side.poll(timeout=min(remaining, PIPE_WAIT_INTERVAL)):
                 response_id, obs = self.agent_side.recv()
                 if response_id == unique_request_id:
-                    return dict(obs)
+                    obs = dict(obs)
+                    if 'screenshot' in obs:
+                        obs['screenshot'] = self.image_ring.get(obs['screenshot'])
+                    return obs
 
     def check_alive(self, timeout: float = 60) -> bool:
         self.agent_side.send(('IS_ALIVE', None))
@@ -210,6 +219,7 @@ class BrowserEnv:
 
     def close(self) -> None:
         if not self.process.is_alive():
+            self.image_ring.close()
             return
         try:
             self.agent_side.send(('SHUTDOWN', None))
@@ -225,5 +235,6 @@ class BrowserEnv:
                     self.process.join(5)  # Wait for the process to terminate
             self.agent_side.close()
             self.browser_side.close()
+            self.image_ring.close()
         except Exception as e:
             logger.error(f'Encountered an error when closing browser env: {e}')
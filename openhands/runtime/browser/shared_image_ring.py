@@ -0,0 +1,108 @@
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# Large enough for a 1920x1080 RGBA screenshot
+DEFAULT_SLOT_SIZE = 8 * 1024 * 1024
+DEFAULT_SLOTS = 2
+
+
+@dataclass(frozen=True)
+class SharedImageRef:
+    """Location of an image written to a SharedImageRing slot."""
+
+    slot: int
+    shape: tuple[int, ...]
+    dtype: str
+
+
+class SharedImageRing:
+    """Ring of shared-memory slots for passing raw images between processes.
+
+    The writer copies an image into the next slot and sends only the small
+    SharedImageRef through its pipe; the reader copies the pixels back out.
+    Images never get pickled, PNG encoded or base64 encoded on the way.
+    With more than one slot, a response the reader gave up waiting for
+    cannot overwrite the image of the next response before it is read.
+
+    The ring is created by the parent process and re-attached by name when
+    pickled into a child process. Only the creator unlinks the memory.
+    """
+
+    def __init__(
+        self,
+        slots: int = DEFAULT_SLOTS,
+        slot_size: int = DEFAULT_SLOT_SIZE,
+        name: str | None = None,
+    ) -> None:
+        self.slots = slots
+        self.slot_size = slot_size
+        self._owner = name is None
+        self._shm: shared_memory.SharedMemory | None = shared_memory.SharedMemory(
+            name=name, create=self._owner, size=slots * slot_size if self._owner else 0
+        )
+        self._next_slot = 0
+
+    @property
+    def closed(self) -> bool:
+        return self._shm is None
+
+    @property
+    def name(self) -> str:
+        assert self._shm is not None
+        return self._shm.name
+
+    def __getstate__(self) -> dict:
+        return {'slots': self.slots, 'slot_size': self.slot_size, 'name': self.name}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state['slots'], state['slot_size'], state['name'])  # type: ignore[misc]
+
+    def put(self, image: np.ndarray) -> SharedImageRef | np.ndarray:
+        """Write an image to the next slot.
+
+        Returns a reference to the slot, or the image itself if it does not
+        fit in a slot (it then has to be sent by value).
+        """
+        assert self._shm is not None
+        image = np.ascontiguousarray(image)
+        if image.nbytes > self.slot_size:
+            return image
+        slot = self._next_slot
+        self._next_slot = (slot + 1) % self.slots
+        target = np.ndarray(
+            image.shape,
+            dtype=image.dtype,
+            buffer=self._shm.buf,
+            offset=slot * self.slot_size,
+        )
+        target[...] = image
+        del target
+        return SharedImageRef(slot=slot, shape=image.shape, dtype=image.dtype.str)
+
+    def get(self, ref: SharedImageRef | np.ndarray) -> np.ndarray:
+        """Copy an image out of its slot, passing images sent by value through."""
+        if not isinstance(ref, SharedImageRef):
+            return ref
+        assert self._shm is not None
+        source = np.ndarray(
+            ref.shape,
+            dtype=np.dtype(ref.dtype),
+            buffer=self._shm.buf,
+            offset=ref.slot * self.slot_size,
+        )
+        image = source.copy()
+        del source
+        return image
+
+    def close(self) -> None:
+        if self._shm is None:
+            return
+        self._shm.close()
+        if self._owner:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+        self._shm = None
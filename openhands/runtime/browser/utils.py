@@ -4,14 +4,18 @@ import os
 from pathlib import Path
 from typing import Any
 
-from browsergym.utils.obs import flatten_axtree_to_str
-from PIL import Image
+import numpy as np
+from browsergym.utils.obs import flatten_axtree_to_str, overlay_som
 
 from openhands.core.exceptions import BrowserUnavailableException
 from openhands.core.schema import ActionType
 from openhands.events.action import BrowseInteractiveAction, BrowseURLAction
 from openhands.events.observation import BrowserOutputObservation
-from openhands.runtime.browser.base64 import png_base64_url_to_image
+from openhands.runtime.browser.base64 import (
+    image_to_png_base64_url,
+    image_to_png_bytes,
+    png_bytes_to_base64_url,
+)
 from openhands.runtime.browser.browser_env import BrowserEnv
 from openhands.utils.async_utils import call_sync_from_async
 
@@ -97,6 +101,37 @@ def get_agent_obs_text(obs: BrowserOutputObservation) -> str:
         raise ValueError(f'Invalid trigger_by_action: {obs.trigger_by_action}')
 
 
+def encode_browser_images(
+    obs: dict[str, Any],
+) -> tuple[bytes | None, str | None, str | None]:
+    """Encode the screenshot of an observation returned by BrowserEnv.step.
+
+    The browser process hands over the raw screenshot, so PNG and base64
+    encoding (and the set-of-marks overlay) happen only here, once.
+
+    Returns:
+        The screenshot as PNG bytes, and the screenshot and its set-of-marks
+        overlay as base64 PNG data URLs.
+    """
+    screenshot = obs.get('screenshot')
+    if isinstance(screenshot, np.ndarray):
+        png = image_to_png_bytes(screenshot)
+        set_of_marks = image_to_png_base64_url(
+            overlay_som(screenshot, obs.get('extra_element_properties', {})),
+            add_data_prefix=True,
+        )
+        return png, png_bytes_to_base64_url(png, add_data_prefix=True), set_of_marks
+
+    # Already encoded, or no screenshot at all (e.g. evaluation requests)
+    png = None
+    if screenshot:
+        try:
+            png = base64.b64decode(screenshot.split(',')[-1])
+        except ValueError:
+            pass
+    return png, screenshot, obs.get('set_of_marks')
+
+
 async def browse(
     action: BrowseURLAction | BrowseInteractiveAction,
     browser: BrowserEnv | None,
@@ -123,9 +158,13 @@ async def browse(
         # obs provided by BrowserGym: see https://github.com/ServiceNow/BrowserGym/blob/main/core/src/browsergym/core/env.py#L396
         obs = await call_sync_from_async(browser.step, action_str)
 
+        screenshot_png, screenshot, set_of_marks = await call_sync_from_async(
+            encode_browser_images, obs
+        )
+
         # Save screenshot if workspace_dir is provided
         screenshot_path = None
-        if workspace_dir is not None and obs.get('screenshot'):
+        if workspace_dir is not None and screenshot_png:
             # Create screenshots directory if it doesn't exist
             screenshots_dir = Path(workspace_dir) / '.browser_screenshots'
             screenshots_dir.mkdir(exist_ok=True)
@@ -135,41 +174,17 @@ async def browse(
             screenshot_filename = f'screenshot_{timestamp}.png'
             screenshot_path = str(screenshots_dir / screenshot_filename)
 
-            # Direct image saving from base64 data without using PIL's Image.open
-            # This approach bypasses potential encoding issues that might occur when
-            # converting between different image representations, ensuring the raw PNG
-            # data from the browser is saved directly to disk.
-
-            # Extract the base64 data
-            base64_data = obs.get('screenshot', '')
-            if ',' in base64_data:
-                base64_data = base64_data.split(',')[1]
-
-            try:
-                # Decode base64 directly to binary
-                image_data = base64.b64decode(base64_data)
-
-                # Write binary data directly to file
-                with open(screenshot_path, 'wb') as f:
-                    f.write(image_data)
-
-                # Verify the image was saved correctly by opening it
-                # This is just a verification step and can be removed in production
-                Image.open(screenshot_path).verify()
-            except Exception:
-                # If direct saving fails, fall back to the original method
-                image = png_base64_url_to_image(obs.get('screenshot'))
-                image.save(screenshot_path, format='PNG', optimize=True)
+            # Save the PNG data as encoded above, without decoding it again
+            with open(screenshot_path, 'wb') as f:
+                f.write(screenshot_png)
 
         # Create the observation with all data
         observation = BrowserOutputObservation(
             content=obs['text_content'],  # text content of the page
             url=obs.get('url', ''),  # URL of the page
-            screenshot=obs.get('screenshot', None),  # base64-encoded screenshot, png
+            screenshot=screenshot,  # base64-encoded screenshot, png
             screenshot_path=screenshot_path,  # path to saved screenshot file
-            set_of_marks=obs.get(
-                'set_of_marks', None
-            ),  # base64-encoded Set-of-Marks annotated screenshot, png,
+            set_of_marks=set_of_marks,  # base64-encoded Set-of-Marks annotated screenshot, png,
             goal_image_urls=obs.get('image_content', []),
             open_pages_urls=obs.get('open_pages_urls', []),  # list of open pages
             active_page_index=obs.get(
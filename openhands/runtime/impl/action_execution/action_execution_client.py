@@ -1,8 +1,9 @@
+import json
 import os
 import tempfile
 import threading
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Callable
 from zipfile import ZipFile
 
 import httpcore
@@ -16,6 +17,7 @@ from openhands.core.config.mcp_config import (
     MCPStdioServerConfig,
 )
 from openhands.core.exceptions import (
+    AgentRuntimeDisconnectedError,
     AgentRuntimeTimeoutError,
 )
 from openhands.events import EventStream
@@ -46,11 +48,19 @@ from openhands.integrations.provider import PROVIDER_TOKEN_TYPE
 from openhands.llm.llm_registry import LLMRegistry
 from openhands.runtime.base import Runtime
 from openhands.runtime.plugins import PluginRequirement
-from openhands.runtime.utils.request import send_request
+from openhands.runtime.utils.file_tree import (
+    DEFAULT_TREE_DEPTH,
+    DEFAULT_TREE_LIMIT,
+    FileTree,
+)
+from openhands.runtime.utils.request import RequestHTTPError, send_request
 from openhands.runtime.utils.system_stats import update_last_execution_time
 from openhands.utils.http_session import HttpSession
 from openhands.utils.tenacity_stop import stop_if_should_exit
 
+if TYPE_CHECKING:
+    from openhands.mcp.session_pool import MCPSessionPool
+
 
 def _is_retryable_error(exception):
     return isinstance(
@@ -84,6 +94,12 @@ class ActionExecutionClient(Runtime):
         self._runtime_closed: bool = False
         self._vscode_token: str | None = None  # initial dummy value
         self._last_updated_mcp_stdio_servers: list[MCPStdioServerConfig] = []
+        self._mcp_session_pool: 'MCPSessionPool | None' = None
+        self._shell_stream_callback: Callable[[str], None] | None = None
+        # Cleared if the action execution server predates the streaming endpoint
+        self._shell_stream_supported = True
+        # Cleared if the action execution server can't watch the workspace
+        self._watched_git_changes = True
         super().__init__(
             config,
             event_stream,
@@ -163,6 +179,62 @@ class ActionExecutionClient(Runtime):
         except httpx.TimeoutException:
             raise TimeoutError('List files operation timed out')
 
+    def get_file_tree(
+        self,
+        path: str | None = None,
+        depth: int = DEFAULT_TREE_DEPTH,
+        limit: int = DEFAULT_TREE_LIMIT,
+        etag: str | None = None,
+    ) -> FileTree | None:
+        """List the tree of files under a path in the sandbox, in one request.
+
+        If path is None, list the sandbox's initial working directory. Returns
+        None if the tree still has the given ETag.
+        """
+        params: dict[str, Any] = {'depth': depth, 'limit': limit}
+        if path is not None:
+            params['path'] = path
+        headers = {'If-None-Match': etag} if etag else {}
+        try:
+            response = self._send_action_server_request(
+                'GET',
+                f'{self.action_execution_server_url}/file_tree',
+                params=params,
+                headers=headers,
+                timeout=30,
+            )
+        except RequestHTTPError as e:
+            if e.response.status_code == 304:
+                return None
+            raise
+        except httpx.TimeoutException:
+            raise TimeoutError('File tree operation timed out')
+        assert response.is_closed
+        return FileTree(response.json(), response.headers.get('ETag', ''))
+
+    def get_git_changes(self, cwd: str) -> list[dict[str, str]] | None:
+        """Get the git changes, checking only the paths changed since last time.
+
+        Falls back to listing all of them if the workspace is not watched.
+        """
+        if self._watched_git_changes:
+            try:
+                response = self._send_action_server_request(
+                    'GET',
+                    f'{self.action_execution_server_url}/git_changes',
+                    params={'cwd': cwd},
+                    timeout=60,
+                )
+                return response.json()
+            except RequestHTTPError as e:
+                if e.response.status_code in (404, 503):
+                    self._watched_git_changes = False
+                else:
+                    self.log('warning', f'Failed to get watched git changes: {e}')
+            except httpx.TimeoutException:
+                self.log('warning', 'Getting watched git changes timed out')
+        return super().get_git_changes(cwd)
+
     def copy_from(self, path: str) -> Path:
         """Zip all files in the sandbox and return as a stream of bytes."""
         try:
@@ -320,15 +392,26 @@ class ActionExecutionClient(Runtime):
                 execution_action_body: dict[str, Any] = {
                     'action': event_to_dict(action),
                 }
-                response = self._send_action_server_request(
-                    'POST',
-                    f'{self.action_execution_server_url}/execute_action',
-                    json=execution_action_body,
-                    # wait a few more seconds to get the timeout error from client side
-                    timeout=action.timeout + 5,
-                )
-                assert response.is_closed
-                output = response.json()
+                output: dict | None = None
+                if (
+                    isinstance(action, CmdRunAction)
+                    and not action.hidden
+                    and self._shell_stream_callback is not None
+                    and self._shell_stream_supported
+                ):
+                    output = self._execute_action_streaming(
+                        execution_action_body, timeout=action.timeout + 5
+                    )
+                if output is None:
+                    response = self._send_action_server_request(
+                        'POST',
+                        f'{self.action_execution_server_url}/execute_action',
+                        json=execution_action_body,
+                        # wait a few more seconds to get the timeout error from client side
+                        timeout=action.timeout + 5,
+                    )
+                    assert response.is_closed
+                    output = response.json()
                 if getattr(action, 'hidden', False):
                     output.get('extras')['hidden'] = True
                 obs = observation_from_dict(output)
@@ -341,6 +424,65 @@ class ActionExecutionClient(Runtime):
                 update_last_execution_time()
             return obs
 
+    def _execute_action_streaming(
+        self, execution_action_body: dict[str, Any], timeout: float
+    ) -> dict | None:
+        """Run a command via /execute_action_stream, forwarding output as it arrives.
+
+        Returns the serialized observation, or None if the action execution
+        server does not support streaming.
+        """
+        try:
+            response = self._send_action_server_request(
+                'POST',
+                f'{self.action_execution_server_url}/execute_action_stream',
+                json=execution_action_body,
+                timeout=timeout,
+                stream=True,
+            )
+        except (httpx.HTTPStatusError, AgentRuntimeDisconnectedError) as e:
+            # Subclasses may wrap the HTTP error in their own
+            cause = e if isinstance(e, httpx.HTTPStatusError) else e.__cause__
+            if not (
+                isinstance(cause, httpx.HTTPStatusError)
+                and cause.response.status_code == 404
+            ):
+                raise
+            # A runtime that is gone fails again on /execute_action
+            self.log('debug', 'Action execution server cannot stream output')
+            self._shell_stream_supported = False
+            return None
+        try:
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                message = json.loads(line)
+                if 'observation' in message:
+                    return message['observation']
+                callback = self._shell_stream_callback
+                if callback is not None and message.get('output'):
+                    try:
+                        callback(message['output'])
+                    except Exception as e:
+                        self.log('warning', f'Shell stream callback failed: {e}')
+        finally:
+            response.close()
+        raise AgentRuntimeDisconnectedError(
+            'Action execution server closed the stream before returning an observation'
+        )
+
+    def subscribe_to_shell_stream(
+        self, callback: Callable[[str], None] | None = None
+    ) -> bool:
+        """Subscribe to the output of commands while they run.
+
+        Args:
+            callback: Called from the runtime thread with chunks of raw terminal
+                output. If None, any existing subscription will be removed.
+        """
+        self._shell_stream_callback = callback
+        return True
+
     def run(self, action: CmdRunAction) -> Observation:
         return self.send_action_for_execution(action)
 
@@ -362,6 +504,10 @@ class ActionExecutionClient(Runtime):
     def browse_interactive(self, action: BrowseInteractiveAction) -> Observation:
         return self.send_action_for_execution(action)
 
+    @property
+    def mcp_proxy_url(self) -> str:
+        return self.action_execution_server_url.rstrip('/') + '/mcp/sse'
+
     def get_mcp_config(
         self, extra_stdio_servers: list[MCPStdioServerConfig] | None = None
     ) -> MCPConfig:
@@ -446,7 +592,7 @@ class ActionExecutionClient(Runtime):
             # We should always include the runtime as an MCP server whenever there's > 0 stdio servers
             updated_mcp_config.sse_servers.append(
                 MCPSSEServerConfig(
-                    url=self.action_execution_server_url.rstrip('/') + '/mcp/sse',
+                    url=self.mcp_proxy_url,
                     api_key=self.session_api_key,
                 )
             )
@@ -464,30 +610,28 @@ class ActionExecutionClient(Runtime):
             return ErrorObservation('MCP functionality is not available on Windows')
 
         # Import here to avoid circular imports
-        from openhands.mcp.utils import call_tool_mcp as call_tool_mcp_handler
-        from openhands.mcp.utils import create_mcp_clients
+        from openhands.mcp.session_pool import MCPSessionPool
 
         # Get the updated MCP config
         updated_mcp_config = self.get_mcp_config()
         self.log(
             'debug',
-            f'Creating MCP clients with servers: {updated_mcp_config.sse_servers}',
+            f'Calling MCP tool with servers: {updated_mcp_config.sse_servers}',
         )
 
-        # Create clients for this specific operation
-        mcp_clients = await create_mcp_clients(
-            updated_mcp_config.sse_servers, updated_mcp_config.shttp_servers, self.sid
+        # Reuse open sessions across tool calls within this conversation
+        if self._mcp_session_pool is None:
+            self._mcp_session_pool = MCPSessionPool(conversation_id=self.sid)
+        return await self._mcp_session_pool.call_tool(
+            action, updated_mcp_config.sse_servers, updated_mcp_config.shttp_servers
         )
 
-        # Call the tool and return the result
-        # No need for try/finally since disconnect() is now just resetting state
-        result = await call_tool_mcp_handler(mcp_clients, action)
-        return result
-
     def close(self) -> None:
         # Make sure we don't close the session multiple times
         # Can happen in evaluation
         if self._runtime_closed:
             return
         self._runtime_closed = True
+        if self._mcp_session_pool is not None:
+            self._mcp_session_pool.close_sync()
         self.session.close()
@@ -50,8 +50,15 @@ from openhands.llm.llm_registry import LLMRegistry
 from openhands.runtime.base import Runtime
 from openhands.runtime.plugins import PluginRequirement
 from openhands.runtime.runtime_status import RuntimeStatus
+from openhands.runtime.utils.file_tree import (
+    DEFAULT_TREE_DEPTH,
+    DEFAULT_TREE_LIMIT,
+    FileTree,
+    FileTreeBuilder,
+)
 
 if TYPE_CHECKING:
+    from openhands.mcp.session_pool import MCPSessionPool
     from openhands.runtime.utils.windows_bash import WindowsPowershellSession
 
 # Import Windows PowerShell support if on Windows
@@ -153,7 +160,9 @@ class CLIRuntime(Runtime):
         # Initialize runtime state
         self._runtime_initialized = False
         self.file_editor = OHEditor(workspace_root=self._workspace_path)
+        self._file_trees = FileTreeBuilder()
         self._shell_stream_callback: Callable[[str], None] | None = None
+        self._mcp_session_pool: 'MCPSessionPool | None' = None
 
         # Initialize PowerShell session on Windows
         self._is_windows = sys.platform == 'win32'
@@ -699,8 +708,7 @@ class CLIRuntime(Runtime):
             return ErrorObservation('MCP functionality is not available on Windows')
 
         # Import here to avoid circular imports
-        from openhands.mcp.utils import call_tool_mcp as call_tool_mcp_handler
-        from openhands.mcp.utils import create_mcp_clients
+        from openhands.mcp.session_pool import MCPSessionPool
 
         try:
             # Get the MCP config for this runtime
@@ -714,18 +722,12 @@ class CLIRuntime(Runtime):
                 self.log('warning', 'No MCP servers configured')
                 return ErrorObservation('No MCP servers configured')
 
-            self.log(
-                'debug',
-                f'Creating MCP clients for action {action.name} with servers: '
-                f'SSE={len(mcp_config.sse_servers)}, SHTTP={len(mcp_config.shttp_servers)}, '
-                f'stdio={len(mcp_config.stdio_servers)}',
-            )
-
-            # Create clients for this specific operation
-            mcp_clients = await create_mcp_clients(
+            # Reuse open sessions (and stdio server processes) across tool calls
+            if self._mcp_session_pool is None:
+                self._mcp_session_pool = MCPSessionPool(conversation_id=self.sid)
+            mcp_clients = await self._mcp_session_pool.get_clients(
                 mcp_config.sse_servers,
                 mcp_config.shttp_servers,
-                self.sid,
                 mcp_config.stdio_servers,
             )
 
@@ -740,7 +742,12 @@ class CLIRuntime(Runtime):
                 'debug',
                 f'Executing MCP tool: {action.name} with arguments: {action.arguments}',
             )
-            result = await call_tool_mcp_handler(mcp_clients, action)
+            result = await self._mcp_session_pool.call_tool(
+                action,
+                mcp_config.sse_servers,
+                mcp_config.shttp_servers,
+                mcp_config.stdio_servers,
+            )
             self.log('debug', f'MCP tool {action.name} executed successfully')
             return result
 
@@ -851,6 +858,27 @@ class CLIRuntime(Runtime):
             logger.error(f'Error listing files: {str(e)}')
             return []
 
+    def get_file_tree(
+        self,
+        path: str | None = None,
+        depth: int = DEFAULT_TREE_DEPTH,
+        limit: int = DEFAULT_TREE_LIMIT,
+        etag: str | None = None,
+    ) -> FileTree | None:
+        """List the tree of files under a path in the sandbox, recursively."""
+        if not self._runtime_initialized:
+            raise RuntimeError('Runtime not initialized')
+
+        if path is None:
+            dir_path = self._workspace_path
+        else:
+            dir_path = self._sanitize_filename(path)
+
+        tree = self._file_trees.get_tree(dir_path, depth, limit)
+        if etag is not None and tree.etag == etag:
+            return None
+        return tree
+
     def copy_from(self, path: str) -> Path:
         """Zip all files in the sandbox and return a path in the local filesystem."""
         if not self._runtime_initialized:
@@ -894,6 +922,9 @@ class CLIRuntime(Runtime):
             finally:
                 self._powershell_session = None
 
+        if self._mcp_session_pool is not None:
+            self._mcp_session_pool.close_sync()
+
         self._runtime_initialized = False
         super().close()
 
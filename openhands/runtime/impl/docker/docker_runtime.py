@@ -42,6 +42,9 @@ from openhands.utils.shutdown_listener import add_shutdown_listener
 from openhands.utils.tenacity_stop import stop_if_should_exit
 
 CONTAINER_NAME_PREFIX = 'openhands-runtime-'
+# Where the runtime image keeps Move dependencies and the lu build cache
+MOVE_CACHE_DIR = '/openhands/cache/move'
+PNPM_STORE_DIR = '/openhands/cache/pnpm-store'
 
 EXECUTION_SERVER_PORT_RANGE = (30000, 39999)
 VSCODE_PORT_RANGE = (40000, 49999)
@@ -531,6 +534,20 @@ class DockerRuntime(ActionExecutionClient):
                 'Mount dir is not set, will not mount the workspace directory to the container'
             )
             volumes = {}  # Empty dict instead of None to satisfy mypy
+
+        # Move dependencies and build cache, shared by all runtimes if configured
+        move_cache = self.config.sandbox.move_cache_volume
+        if move_cache:
+            if os.path.isabs(move_cache):
+                move_cache = os.path.abspath(move_cache)
+            volumes.setdefault(move_cache, {'bind': MOVE_CACHE_DIR, 'mode': 'rw'})
+        # pnpm store, so runtimes install each package version once per host,
+        # if configured (only for trusted conversations, all can write to it)
+        pnpm_store = self.config.sandbox.pnpm_store_volume
+        if pnpm_store:
+            if os.path.isabs(pnpm_store):
+                pnpm_store = os.path.abspath(pnpm_store)
+            volumes.setdefault(pnpm_store, {'bind': PNPM_STORE_DIR, 'mode': 'rw'})
         self.log(
             'debug',
             f'Sandbox workspace: {self.config.workspace_mount_path_in_sandbox}',
@@ -19,7 +19,7 @@ Note:
 
 import os
 
-from openhands.linter import DefaultLinter, LintResult
+from openhands.linter import LintResult, get_lint_service
 
 CURRENT_FILE: str | None = None
 CURRENT_LINE = 1
@@ -99,8 +99,9 @@ def _lint_file(file_path: str) -> tuple[str | None, int | None]:
         - The lint error message if found, None otherwise
         - The line number of the first error, None if no errors
     """
-    linter = DefaultLinter()
-    lint_error: list[LintResult] = linter.lint(file_path)
+    with open(file_path, encoding='utf-8') as file:
+        content = file.read()
+    lint_error: list[LintResult] = get_lint_service().lint(file_path, content)
     if not lint_error:
         # Linting successful. No issues found.
         return None, None
@@ -1,9 +1,11 @@
 import os
 import re
+import shlex
+import tempfile
 import time
 import uuid
 from enum import Enum
-from typing import Any
+from typing import Any, Callable
 
 import bashlex
 import libtmux
@@ -12,6 +14,7 @@ from openhands.core.logger import openhands_logger as logger
 from openhands.events.action import CmdRunAction
 from openhands.events.observation import ErrorObservation
 from openhands.events.observation.commands import (
+    CMD_OUTPUT_PS1_BEGIN,
     CMD_OUTPUT_PS1_END,
     CmdOutputMetadata,
     CmdOutputObservation,
@@ -183,6 +186,8 @@ def _remove_command_prefix(command_output: str, command: str) -> str:
 
 class BashSession:
     POLL_INTERVAL = 0.5
+    # How often the pane output stream is checked for new bytes
+    STREAM_POLL_INTERVAL = 0.02
     HISTORY_LIMIT = 10_000
     PS1 = CmdOutputMetadata.to_ps1_prompt()
 
@@ -197,7 +202,10 @@ class BashSession:
         self.work_dir = work_dir
         self.username = username
         self._initialized = False
+        self._closed = False
         self.max_memory_mb = max_memory_mb
+        self._output_stream_path: str | None = None
+        self._output_stream_offset = 0
 
     def initialize(self) -> None:
         self.server = libtmux.Server()
@@ -245,10 +253,13 @@ class BashSession:
         _initial_window.kill()
 
         # Configure bash to use simple PS1 and disable PS2
+        self._start_output_stream()
         self.pane.send_keys(
             f'export PROMPT_COMMAND=\'export PS1="{self.PS1}"\'; export PS2=""'
         )
         time.sleep(0.1)  # Wait for command to take effect
+        # Make sure the new prompt is in place before the first command runs
+        self._wait_for_prompt(timeout=5)
         self._clear_screen()
 
         # Store the last command for interactive input handling
@@ -276,11 +287,107 @@ class BashSession:
         )
         return content
 
+    def _start_output_stream(self) -> None:
+        """Stream everything written to the pane into a file via `tmux pipe-pane`.
+
+        The stream lets `execute` wait for new output and spot the PS1 end
+        marker by reading only the bytes appended since the last check,
+        instead of capturing the whole scrollback on every poll. If piping
+        is unavailable, `execute` falls back to polling the pane.
+        """
+        fd, path = tempfile.mkstemp(prefix='openhands-pane-', suffix='.log')
+        os.close(fd)
+        try:
+            self.pane.cmd('pipe-pane', '-o', f'cat >> {shlex.quote(path)}')
+        except Exception as e:
+            logger.debug(f'Failed to pipe pane output, falling back to polling: {e}')
+            os.unlink(path)
+            return
+        self._output_stream_path = path
+        self._output_stream_offset = 0
+
+    def _reset_output_stream(self) -> None:
+        """Discard streamed output which has already been handled."""
+        if self._output_stream_path is None:
+            return
+        try:
+            # `cat >>` appends, so its next write lands at the new end of file
+            os.truncate(self._output_stream_path, 0)
+        except OSError:
+            pass
+        self._output_stream_offset = 0
+
+    def _get_output_stream_size(self) -> int:
+        assert self._output_stream_path is not None
+        try:
+            return os.stat(self._output_stream_path).st_size
+        except OSError:
+            return 0
+
+    def _wait_for_prompt(self, timeout: float) -> None:
+        """Wait up to `timeout` seconds for a PS1 prompt to be written to the pane."""
+        if self._output_stream_path is None:
+            return
+        deadline = time.time() + timeout
+        start = self._output_stream_offset
+        marker_tail = ''
+        while (remaining := deadline - time.time()) > 0:
+            _, marker_seen, marker_tail = self._wait_for_output_stream(
+                remaining, marker_tail
+            )
+            if not marker_seen:
+                continue
+            # The echo of the PS1 export contains the marker too, so only a
+            # rendered prompt (with valid metadata) counts
+            with open(self._output_stream_path, 'rb') as f:
+                f.seek(start)
+                text = f.read(self._output_stream_offset - start).decode(
+                    'utf-8', errors='replace'
+                )
+            if CmdOutputMetadata.matches_ps1_metadata(text.replace('\r', '')):
+                return
+
+    def _wait_for_output_stream(
+        self, timeout: float, marker_tail: str
+    ) -> tuple[str, bool, str]:
+        """Wait up to `timeout` seconds for new pane output.
+
+        Returns:
+            The new output ('' if none), whether it contains the PS1 end marker,
+            and the trailing characters to carry into the next marker search
+            (the marker may be split across reads).
+        """
+        assert self._output_stream_path is not None
+        marker = CMD_OUTPUT_PS1_END.strip()
+        deadline = time.time() + timeout
+        while True:
+            size = self._get_output_stream_size()
+            if size < self._output_stream_offset:
+                self._output_stream_offset = 0
+            if size > self._output_stream_offset:
+                with open(self._output_stream_path, 'rb') as f:
+                    f.seek(self._output_stream_offset)
+                    data = f.read(size - self._output_stream_offset)
+                self._output_stream_offset += len(data)
+                new_output = data.decode('utf-8', errors='replace')
+                text = marker_tail + new_output
+                return new_output, marker in text, text[-(len(marker) - 1) :]
+            if time.time() >= deadline:
+                return '', False, marker_tail
+            time.sleep(self.STREAM_POLL_INTERVAL)
+
     def close(self) -> None:
         """Clean up the session."""
         if self._closed:
             return
-        self.session.kill()
+        if self._initialized:
+            self.session.kill()
+        if self._output_stream_path is not None:
+            try:
+                os.unlink(self._output_stream_path)
+            except OSError:
+                pass
+            self._output_stream_path = None
         self._closed = True
 
     @property
@@ -295,9 +402,17 @@ class BashSession:
 
     def _clear_screen(self) -> None:
         """Clear the tmux pane screen and history."""
-        self.pane.send_keys('C-l', enter=False)
-        time.sleep(0.1)
+        if self._output_stream_path is not None:
+            self._output_stream_offset = self._get_output_stream_size()
+            self.pane.send_keys('C-l', enter=False)
+            # Wait for the prompt to be redrawn so it is not mistaken for the
+            # prompt which follows the next command
+            self._wait_for_prompt(timeout=0.5)
+        else:
+            self.pane.send_keys('C-l', enter=False)
+            time.sleep(0.1)
         self.pane.cmd('clear-history')
+        self._reset_output_stream()
 
     def _get_command_output(
         self,
@@ -491,8 +606,19 @@ class BashSession:
         logger.debug(f'COMBINED OUTPUT: {combined_output}')
         return combined_output
 
-    def execute(self, action: CmdRunAction) -> CmdOutputObservation | ErrorObservation:
-        """Execute a command in the bash session."""
+    def execute(
+        self,
+        action: CmdRunAction,
+        output_callback: Callable[[str], None] | None = None,
+    ) -> CmdOutputObservation | ErrorObservation:
+        """Execute a command in the bash session.
+
+        Args:
+            action: The command to run, or input to send to the running process.
+            output_callback: Called with raw terminal output as it is produced,
+                before the command completes. Only supported when the pane
+                output can be streamed.
+        """
         if not self._initialized:
             raise RuntimeError('Bash session is not initialized')
 
@@ -591,6 +717,12 @@ class BashSession:
                 hidden=getattr(action, 'hidden', False),
             )
 
+        # Only output produced from here on is relevant to this command
+        if self._output_stream_path is not None:
+            self._output_stream_offset = self._get_output_stream_size()
+        marker_tail = ''
+        prompt_streamed = False
+
         # Send actual command/inputs to the pane
         if command != '':
             is_special_key = self._is_special_key(command)
@@ -611,6 +743,32 @@ class BashSession:
 
         # Loop until the command completes or times out
         while should_continue():
+            if self._output_stream_path is not None:
+                # Wait on the output stream and only capture the pane once the
+                # command may have completed or a timeout is due.
+                new_output, marker_seen, marker_tail = self._wait_for_output_stream(
+                    self.POLL_INTERVAL, marker_tail
+                )
+                if new_output:
+                    last_change_time = time.time()
+                    if output_callback is not None and not prompt_streamed:
+                        # Stop at the prompt, it is parsed into metadata instead
+                        prompt_index = new_output.find(CMD_OUTPUT_PS1_BEGIN.strip())
+                        if prompt_index != -1:
+                            new_output = new_output[:prompt_index]
+                            prompt_streamed = True
+                        if new_output:
+                            output_callback(new_output)
+                no_change_timeout_due = (
+                    not action.blocking
+                    and time.time() - last_change_time >= self.NO_CHANGE_TIMEOUT_SECONDS
+                )
+                hard_timeout_due = bool(
+                    action.timeout and time.time() - start_time >= action.timeout
+                )
+                if not (marker_seen or no_change_timeout_due or hard_timeout_due):
+                    continue
+
             _start_time = time.time()
             logger.debug(f'GETTING PANE CONTENT at {_start_time}')
             cur_pane_output = self._get_pane_content()
@@ -628,8 +786,11 @@ class BashSession:
 
             if cur_pane_output != last_pane_output:
                 last_pane_output = cur_pane_output
-                last_change_time = time.time()
-                logger.debug(f'CONTENT UPDATED DETECTED at {last_change_time}')
+                # When streaming, changes are tracked from the stream instead,
+                # as the pane is not captured on every poll
+                if self._output_stream_path is None:
+                    last_change_time = time.time()
+                    logger.debug(f'CONTENT UPDATED DETECTED at {last_change_time}')
 
             # 1) Execution completed:
             # Condition 1: A new prompt has appeared since the command started.
@@ -679,6 +840,7 @@ class BashSession:
                     timeout=action.timeout,
                 )
 
-            logger.debug(f'SLEEPING for {self.POLL_INTERVAL} seconds for next poll')
-            time.sleep(self.POLL_INTERVAL)
+            if self._output_stream_path is None:
+                logger.debug(f'SLEEPING for {self.POLL_INTERVAL} seconds for next poll')
+                time.sleep(self.POLL_INTERVAL)
         raise RuntimeError('Bash session was likely interrupted...')
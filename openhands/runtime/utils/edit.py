@@ -21,7 +21,7 @@ from openhands.events.observation import (
     FileWriteObservation,
     Observation,
 )
-from openhands.linter import DefaultLinter
+from openhands.linter import get_lint_service
 from openhands.llm.llm import LLM
 from openhands.llm.llm_registry import LLMRegistry
 from openhands.utils.chunk_localizer import Chunk, get_top_k_chunk_matches
@@ -188,54 +188,45 @@ class FileEditRuntimeMixin(FileEditRuntimeInterface):
         filepath: str,
         diff: str,
     ) -> ErrorObservation | None:
-        linter = DefaultLinter()
-        # Copy the original file to a temporary file (with the same ext) and lint it
-        with (
-            tempfile.NamedTemporaryFile(
-                suffix=suffix, mode='w+', encoding='utf-8'
-            ) as original_file_copy,
-            tempfile.NamedTemporaryFile(
-                suffix=suffix, mode='w+', encoding='utf-8'
-            ) as updated_file_copy,
-        ):
-            # Lint the original file
-            original_file_copy.write(old_content)
-            original_file_copy.flush()
+        updated_lint_error = get_lint_service().lint_diff(
+            filepath, old_content, new_content
+        )
+        if not updated_lint_error:
+            return None
 
-            # Lint the updated file
+        _obs = FileEditObservation(
+            content=diff,
+            path=filepath,
+            prev_exist=True,
+            old_content=old_content,
+            new_content=new_content,
+        )
+        error_message = (
+            (
+                f'\n[Linting failed for edited file {filepath}. {len(updated_lint_error)} lint errors found.]\n'
+                '[begin attempted changes]\n'
+                f'{_obs.visualize_diff(change_applied=False)}\n'
+                '[end attempted changes]\n'
+            )
+            + '-' * 40
+            + '\n'
+        )
+        error_message += '-' * 20 + 'First 5 lint errors' + '-' * 20 + '\n'
+        # Errors are visualized from a file, so write the updated content to one
+        with tempfile.NamedTemporaryFile(
+            suffix=suffix, mode='w+', encoding='utf-8'
+        ) as updated_file_copy:
             updated_file_copy.write(new_content)
             updated_file_copy.flush()
-
-            updated_lint_error = linter.lint_file_diff(
-                original_file_copy.name, updated_file_copy.name
-            )
-
-            if len(updated_lint_error) > 0:
-                _obs = FileEditObservation(
-                    content=diff,
-                    path=filepath,
-                    prev_exist=True,
-                    old_content=old_content,
-                    new_content=new_content,
+            for i, lint_error in enumerate(updated_lint_error[:5]):
+                lint_error = lint_error.model_copy(
+                    update={'file': updated_file_copy.name}
                 )
-                error_message = (
-                    (
-                        f'\n[Linting failed for edited file {filepath}. {len(updated_lint_error)} lint errors found.]\n'
-                        '[begin attempted changes]\n'
-                        f'{_obs.visualize_diff(change_applied=False)}\n'
-                        '[end attempted changes]\n'
-                    )
-                    + '-' * 40
-                    + '\n'
-                )
-                error_message += '-' * 20 + 'First 5 lint errors' + '-' * 20 + '\n'
-                for i, lint_error in enumerate(updated_lint_error[:5]):
-                    error_message += f'[begin lint error {i}]\n'
-                    error_message += lint_error.visualize().strip() + '\n'
-                    error_message += f'[end lint error {i}]\n'
-                    error_message += '-' * 40 + '\n'
-                return ErrorObservation(error_message)
-        return None
+                error_message += f'[begin lint error {i}]\n'
+                error_message += lint_error.visualize().strip() + '\n'
+                error_message += f'[end lint error {i}]\n'
+                error_message += '-' * 40 + '\n'
+        return ErrorObservation(error_message)
 
     def llm_based_edit(self, action: FileEditAction, retry_num: int = 0) -> Observation:
         obs = self.read(FileReadAction(path=action.path))
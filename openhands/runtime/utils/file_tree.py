@@ -0,0 +1,194 @@
+"""Recursive listings of the workspace for the file explorer.
+
+A tree is listed breadth first with `os.scandir`, so when the entry limit is
+reached it is the deepest levels that are cut off. Entries matched by a
+.gitignore in their directory or any directory above it (up to the listed
+root) are left out, and compiled gitignore specs are cached until the file
+changes.
+
+Listed trees are cached as well, together with the modification times of the
+directories they were listed from. Adding, removing or renaming an entry
+changes the mtime of its directory, so checking those is enough to know
+whether a cached tree, and its ETag, still holds.
+"""
+
+import hashlib
+import json
+import os
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any
+
+from pathspec import PathSpec
+from pathspec.patterns import GitWildMatchPattern
+
+DEFAULT_TREE_DEPTH = 3
+DEFAULT_TREE_LIMIT = 5000
+MAX_CACHED_TREES = 16
+_MISSING = -1
+
+# Never listed, matching the files the UI ignores
+IGNORED_NAMES = frozenset(
+    {'.git', '.DS_Store', 'node_modules', '__pycache__', 'lost+found', '.vscode'}
+)
+
+
+@dataclass
+class FileTree:
+    """A listed tree and the ETag of its contents.
+
+    The tree is `{'path': ..., 'entries': [...], 'truncated': bool}`. Each
+    entry has a `name`, with a trailing slash for directories, and listed
+    directories have their `children`. Directories below the depth limit have
+    no `children`, and `truncated` is set when the entry limit was reached.
+    """
+
+    tree: dict[str, Any]
+    etag: str
+    # (path, mtime_ns) of the directories and .gitignore files listed, with
+    # _MISSING for directories that could not be listed
+    validators: list[tuple[str, int]] = field(default_factory=list, repr=False)
+
+    def is_current(self) -> bool:
+        for path, mtime in self.validators:
+            try:
+                current = os.stat(path).st_mtime_ns
+            except OSError:
+                current = _MISSING
+            if current != mtime:
+                return False
+        return True
+
+
+class GitignoreCache:
+    """Compiled .gitignore specs, compiled again only when the file changes."""
+
+    def __init__(self) -> None:
+        self._specs: dict[str, tuple[int, int, PathSpec]] = {}
+        self._lock = Lock()
+
+    def get(self, path: str) -> tuple[PathSpec, int] | None:
+        """The spec of a .gitignore and its mtime, or None if there is none."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            with self._lock:
+                self._specs.pop(path, None)
+            return None
+        with self._lock:
+            cached = self._specs.get(path)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2], stat.st_mtime_ns
+        try:
+            with open(path, encoding='utf-8', errors='replace') as f:
+                spec = PathSpec.from_lines(GitWildMatchPattern, f.read().splitlines())
+        except OSError:
+            return None
+        with self._lock:
+            self._specs[path] = (stat.st_mtime_ns, stat.st_size, spec)
+        return spec, stat.st_mtime_ns
+
+
+class FileTreeBuilder:
+    """Lists directory trees, reusing the last trees listed while they are current."""
+
+    def __init__(self, max_cached_trees: int = MAX_CACHED_TREES) -> None:
+        self.gitignores = GitignoreCache()
+        self.max_cached_trees = max_cached_trees
+        self._trees: OrderedDict[tuple[str, int, int], FileTree] = OrderedDict()
+        self._lock = Lock()
+
+    def get_tree(
+        self,
+        root: str,
+        depth: int = DEFAULT_TREE_DEPTH,
+        limit: int = DEFAULT_TREE_LIMIT,
+    ) -> FileTree:
+        if depth < 1:
+            raise ValueError(f'depth must be at least 1, got {depth}')
+        if limit < 1:
+            raise ValueError(f'limit must be at least 1, got {limit}')
+        key = (root, depth, limit)
+        with self._lock:
+            cached = self._trees.get(key)
+        if cached is not None and cached.is_current():
+            return cached
+
+        tree = self._list(root, depth, limit)
+        with self._lock:
+            self._trees[key] = tree
+            self._trees.move_to_end(key)
+            while len(self._trees) > self.max_cached_trees:
+                self._trees.popitem(last=False)
+        return tree
+
+    def _list(self, root: str, depth: int, limit: int) -> FileTree:
+        result: dict[str, Any] = {'path': root, 'entries': [], 'truncated': False}
+        validators: list[tuple[str, int]] = []
+        count = 0
+        # (directory, path relative to root, node, level, gitignore specs by base)
+        pending: deque[tuple[str, str, dict[str, Any], int, list]] = deque(
+            [(root, '', {'children': result['entries']}, 1, [])]
+        )
+        while pending:
+            dir_path, rel_dir, node, level, specs = pending.popleft()
+            if count >= limit:
+                # Not listed, so don't report it as empty
+                node.pop('children', None)
+                result['truncated'] = True
+                continue
+            try:
+                # Stat before listing, so a change while listing invalidates the tree
+                mtime = os.stat(dir_path).st_mtime_ns
+            except OSError:
+                mtime = _MISSING
+            validators.append((dir_path, mtime))
+            try:
+                with os.scandir(dir_path) as it:
+                    items = list(it)
+            except OSError:
+                node.pop('children', None)
+                continue
+
+            gitignore_path = os.path.join(dir_path, '.gitignore')
+            gitignore = self.gitignores.get(gitignore_path)
+            if gitignore is not None:
+                spec, spec_mtime = gitignore
+                specs = specs + [(rel_dir, spec)]
+                validators.append((gitignore_path, spec_mtime))
+
+            directories, files = [], []
+            for item in items:
+                if item.name in IGNORED_NAMES:
+                    continue
+                try:
+                    is_dir = item.is_dir()
+                except OSError:
+                    continue
+                rel_path = rel_dir + item.name + ('/' if is_dir else '')
+                if any(spec.match_file(rel_path[len(base) :]) for base, spec in specs):
+                    continue
+                (directories if is_dir else files).append((item, rel_path))
+            directories.sort(key=lambda entry: entry[0].name.lower())
+            files.sort(key=lambda entry: entry[0].name.lower())
+
+            children = node['children']
+            for item, rel_path in directories + files:
+                if count >= limit:
+                    result['truncated'] = True
+                    break
+                count += 1
+                if not rel_path.endswith('/'):
+                    children.append({'name': item.name})
+                    continue
+                child: dict[str, Any] = {'name': item.name + '/'}
+                children.append(child)
+                # Don't follow symlinks into directories listed elsewhere (or loops)
+                if level < depth and not item.is_symlink():
+                    child['children'] = []
+                    pending.append((item.path, rel_path, child, level + 1, specs))
+
+        contents = json.dumps(result, sort_keys=True).encode('utf-8')
+        etag = f'"{hashlib.sha256(contents).hexdigest()[:32]}"'
+        return FileTree(result, etag, validators)
@@ -6,6 +6,7 @@ NOTE: Since this is run as a script, there should be no imports from project fil
 import glob
 import json
 import os
+import shlex
 import subprocess
 from pathlib import Path
 
@@ -62,16 +63,23 @@ def get_valid_ref(repo_dir: str) -> str | None:
     return None
 
 
-def get_changes_in_repo(repo_dir: str) -> list[dict[str, str]]:
+def get_changes_in_repo(
+    repo_dir: str, ref: str | None = None, paths: list[str] | None = None
+) -> list[dict[str, str]]:
     # Gets the status relative to the origin default branch - not the same as `git status`
+    # With paths, only changes to these files or directories are listed
 
-    ref = get_valid_ref(repo_dir)
+    if ref is None:
+        ref = get_valid_ref(repo_dir)
     if not ref:
         return []
+    pathspec = ''
+    if paths is not None:
+        pathspec = ' -- ' + ' '.join(shlex.quote(path) for path in paths)
 
     # Get changed files
     changed_files = run(
-        f'git --no-pager diff --name-status {ref}', repo_dir
+        f'git --no-pager diff --name-status {ref}{pathspec}', repo_dir
     ).splitlines()
     changes = []
     for line in changed_files:
@@ -144,7 +152,7 @@ def get_changes_in_repo(repo_dir: str) -> list[dict[str, str]]:
 
     # Get untracked files
     untracked_files = run(
-        'git --no-pager ls-files --others --exclude-standard', repo_dir
+        f'git --no-pager ls-files --others --exclude-standard{pathspec}', repo_dir
     ).splitlines()
     for path in untracked_files:
         if path:
@@ -0,0 +1,169 @@
+"""Git changes of the workspace, kept current from the paths a watcher reports.
+
+Lists the same changes as `git_changes.get_git_changes`, but after the first
+listing only asks git about the paths that changed since the last one, and
+reuses the ref each repository is compared to until its git metadata changes.
+When nothing changed, getting the changes runs no git command at all.
+
+Directories the watcher skips (build output, dependencies) are invisible to it,
+so those of them that hold files git knows about are listed on every request.
+"""
+
+import glob
+import os
+import shlex
+import threading
+from dataclasses import dataclass, field
+
+from openhands.runtime.utils import git_changes
+from openhands.runtime.utils.workspace_watcher import WorkspaceWatcher
+
+# Above this many changed paths in a repository, it is listed again as a whole
+MAX_INCREMENTAL_PATHS = 500
+
+
+@dataclass
+class _Repo:
+    ref: str | None
+    # path relative to the repository -> status
+    changes: dict[str, str] = field(default_factory=dict)
+    # Unwatched directories with tracked or changed files, listed every time
+    unwatched: list[str] = field(default_factory=list)
+
+
+class GitChangesTracker:
+    """The git changes of a directory watched by a WorkspaceWatcher."""
+
+    def __init__(self, cwd: str, watcher: WorkspaceWatcher) -> None:
+        self.cwd = os.path.abspath(cwd)
+        self.watcher = watcher
+        rel = os.path.relpath(self.cwd, watcher.root)
+        if rel == '..' or rel.startswith('../'):
+            raise ValueError(f'{cwd} is not in the watched directory {watcher.root}')
+        self._prefix = '' if rel == '.' else rel + '/'
+        self._version: int | None = None
+        # '' for the directory itself, else the name of a repository directly in it
+        self._repos: dict[str, _Repo] = {}
+        self._lock = threading.Lock()
+
+    def get_changes(self) -> list[dict[str, str]]:
+        with self._lock:
+            changes = self.watcher.changes_since(self._version)
+            try:
+                if changes.reset:
+                    self._refresh_all()
+                else:
+                    self._update(self._relative(changes.paths))
+            except Exception:
+                # Start over next time rather than keep partial results
+                self._version = None
+                raise
+            self._version = changes.version
+            return self._collect()
+
+    def _relative(self, paths: list[str]) -> list[str]:
+        return [
+            path[len(self._prefix) :]
+            for path in paths
+            if path.startswith(self._prefix) and path != self._prefix
+        ]
+
+    def _update(self, paths: list[str]) -> None:
+        by_repo: dict[str, list[str]] = {}
+        refresh: set[str] = set()
+        for path in paths:
+            parts = path.split('/')
+            if parts[-1] == '.git' and len(parts) <= 2:
+                repo = parts[0] if len(parts) == 2 else ''
+                if repo not in self._repos:
+                    # A new repository
+                    return self._refresh_all()
+                # Commits, checkouts and fetches change what is compared
+                refresh.add(repo)
+                continue
+            if len(parts) == 1 and parts[0] in self._repos:
+                # A repository directory itself was moved or removed
+                return self._refresh_all()
+            repo = parts[0] if len(parts) > 1 and parts[0] in self._repos else ''
+            by_repo.setdefault(repo, []).append(path[len(repo) + 1 :] if repo else path)
+
+        for repo, repo_paths in by_repo.items():
+            if len(repo_paths) > MAX_INCREMENTAL_PATHS:
+                refresh.add(repo)
+        for repo in refresh:
+            self._refresh_repo(repo)
+        for repo, state in self._repos.items():
+            repo_paths = by_repo.get(repo, []) + state.unwatched
+            if repo not in refresh and repo_paths:
+                self._refresh_paths(repo, repo_paths)
+
+    def _refresh_all(self) -> None:
+        nested = {
+            os.path.dirname(f)[2:]
+            for f in glob.glob('./*/.git', root_dir=self.cwd, recursive=True)
+        }
+        self._repos = {}
+        for repo in [''] + sorted(nested):
+            self._repos[repo] = _Repo(ref=None)
+            self._refresh_repo(repo)
+
+    def _refresh_repo(self, repo: str) -> None:
+        repo_dir = os.path.join(self.cwd, repo)
+        ref = git_changes.get_valid_ref(repo_dir)
+        changes = self._list(repo_dir, ref, None)
+        unwatched = self._unwatched_dirs(repo_dir, changes) if ref else []
+        self._repos[repo] = _Repo(ref, changes, unwatched)
+
+    def _refresh_paths(self, repo: str, paths: list[str]) -> None:
+        state = self._repos[repo]
+        if not state.ref:
+            return
+        for path in list(state.changes):
+            if any(path == p or path.startswith(p + '/') for p in paths):
+                del state.changes[path]
+        state.changes.update(self._list(os.path.join(self.cwd, repo), state.ref, paths))
+
+    def _list(
+        self, repo_dir: str, ref: str | None, paths: list[str] | None
+    ) -> dict[str, str]:
+        if not ref:
+            return {}
+        return {
+            change['path']: change['status']
+            for change in git_changes.get_changes_in_repo(repo_dir, ref, paths)
+        }
+
+    def _unwatched_dirs(self, repo_dir: str, changes: dict[str, str]) -> list[str]:
+        """The excluded directories of the watcher that git knows files in."""
+        names = self.watcher.excluded_dirs
+        if not names:
+            return []
+        # Only the index is matched, so this doesn't walk the excluded directories
+        pathspec = ' '.join(
+            shlex.quote(f':(glob)**/{name}/**') for name in sorted(names)
+        )
+        tracked = git_changes.run(f'git --no-pager ls-files -- {pathspec}', repo_dir)
+        dirs = set()
+        for path in [*tracked.splitlines(), *changes]:
+            parts = path.split('/')
+            for i, part in enumerate(parts[:-1]):
+                if part in names:
+                    dirs.add('/'.join(parts[: i + 1]))
+                    break
+        return sorted(dirs)
+
+    def _collect(self) -> list[dict[str, str]]:
+        nested = [repo for repo in self._repos if repo]
+        changes = [
+            {'status': status, 'path': path}
+            for path, status in self._repos.get('', _Repo(None)).changes.items()
+            # As in get_git_changes, nested repositories list their own changes
+            if not any(path.startswith(repo) for repo in nested)
+        ]
+        for repo in nested:
+            changes.extend(
+                {'status': status, 'path': f'{repo}/{path}'}
+                for path, status in self._repos[repo].changes.items()
+            )
+        changes.sort(key=lambda change: change['path'])
+        return changes
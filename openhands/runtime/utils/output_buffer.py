@@ -0,0 +1,51 @@
+import threading
+
+# Pending output beyond this size is dropped from the front
+DEFAULT_MAX_PENDING_CHARS = 64 * 1024
+TRUNCATED_OUTPUT_NOTICE = '[... output truncated while streaming ...]\n'
+
+
+class OutputChunkBuffer:
+    """Thread-safe buffer that coalesces streamed output chunks.
+
+    Producers append chunks as they arrive; a consumer drains everything
+    pending at its own pace. When the consumer falls behind, pending output
+    is bounded to the most recent `max_pending_chars` characters so a chatty
+    command cannot grow memory without limit.
+    """
+
+    def __init__(self, max_pending_chars: int = DEFAULT_MAX_PENDING_CHARS) -> None:
+        self.max_pending_chars = max_pending_chars
+        self._chunks: list[str] = []
+        self._size = 0
+        self._truncated = False
+        self._lock = threading.Lock()
+
+    def append(self, chunk: str) -> bool:
+        """Add a chunk, returning True if the buffer was empty before."""
+        if not chunk:
+            return False
+        with self._lock:
+            was_empty = self._size == 0
+            self._chunks.append(chunk)
+            self._size += len(chunk)
+            if self._size > self.max_pending_chars:
+                pending = ''.join(self._chunks)[-self.max_pending_chars :]
+                self._chunks = [pending]
+                self._size = len(pending)
+                self._truncated = True
+            return was_empty
+
+    def drain(self) -> str:
+        """Return and clear all pending output."""
+        with self._lock:
+            content = ''.join(self._chunks)
+            if self._truncated:
+                content = TRUNCATED_OUTPUT_NOTICE + content
+            self._chunks = []
+            self._size = 0
+            self._truncated = False
+            return content
+
+    def __len__(self) -> int:
+        return self._size
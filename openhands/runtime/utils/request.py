@@ -39,15 +39,20 @@ def send_request(
     method: str,
     url: str,
     timeout: int = 60,
+    stream: bool = False,
     **kwargs: Any,
 ) -> httpx.Response:
+    if stream:
+        kwargs['stream'] = True
     response = session.request(method, url, timeout=timeout, **kwargs)
     try:
         response.raise_for_status()
     except httpx.HTTPError as e:
         try:
+            if stream:
+                response.read()
             _json = response.json()
-        except json.decoder.JSONDecodeError:
+        except (json.decoder.JSONDecodeError, httpx.HTTPError):
             _json = None
         finally:
             response.close()
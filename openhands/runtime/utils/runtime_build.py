@@ -1,5 +1,6 @@
 import argparse
 import hashlib
+import json
 import os
 import shutil
 import string
@@ -24,15 +25,63 @@ class BuildFromImageType(Enum):
     LOCK = 'lock'  # Fastest: Reuse the most recent image with the exact SAME dependencies (lock files)
 
 
+# The package.json fields that decide what ends up in node_modules. Must match
+# DEPS_KEY_FIELDS in openhands/bin/lu, which looks prebuilt node_modules up by it
+NODE_DEPS_KEY_FIELDS = (
+    'dependencies',
+    'devDependencies',
+    'optionalDependencies',
+    'peerDependencies',
+    'overrides',
+    'resolutions',
+    'pnpm',
+)
+
+
 def get_runtime_image_repo() -> str:
     return os.getenv('OH_RUNTIME_RUNTIME_IMAGE_REPO', 'ghcr.io/openhands/runtime')
 
 
+def get_node_deps_key(package_json: Path) -> str:
+    """Hash the dependencies a package.json declares, ignoring its other fields."""
+    with open(package_json, 'rb') as f:
+        manifest = json.load(f)
+    deps = {
+        field: manifest[field] for field in NODE_DEPS_KEY_FIELDS if field in manifest
+    }
+    return hashlib.sha256(
+        json.dumps(deps, sort_keys=True, separators=(',', ':')).encode()
+    ).hexdigest()[:16]
+
+
+def get_node_modules_layers(templates_dir: Path) -> list[dict]:
+    """The prebuilt node_modules to bake into the image, one per distinct set of
+    template frontend dependencies.
+
+    Each has the key the dependencies hash to, the template frontend whose
+    package.json (and pnpm-lock.yaml, if any) is installed, and whether it has
+    a lockfile.
+    """
+    layers: dict[str, dict] = {}
+    for package_json in sorted(templates_dir.glob('*/frontend/package.json')):
+        key = get_node_deps_key(package_json)
+        if key in layers:
+            continue
+        frontend = package_json.parent
+        layers[key] = {
+            'key': key,
+            'frontend': frontend.relative_to(templates_dir).as_posix(),
+            'lockfile': (frontend / 'pnpm-lock.yaml').exists(),
+        }
+    return list(layers.values())
+
+
 def _generate_dockerfile(
     base_image: str,
     build_from: BuildFromImageType = BuildFromImageType.SCRATCH,
     extra_deps: str | None = None,
     enable_browser: bool = True,
+    node_modules_layers: list[dict] | None = None,
 ) -> str:
     """Generate the Dockerfile content for the runtime image based on the base image.
 
@@ -41,6 +90,7 @@ def _generate_dockerfile(
     - build_from (BuildFromImageType): The build method for the runtime image.
     - extra_deps (str):
     - enable_browser (bool): Whether to enable browser support (install Playwright)
+    - node_modules_layers (list): Template node_modules to prebuild, from get_node_modules_layers
 
     Returns:
     - str: The resulting Dockerfile content
@@ -58,6 +108,7 @@ def _generate_dockerfile(
         build_from_versioned=build_from == BuildFromImageType.VERSIONED,
         extra_deps=extra_deps if extra_deps is not None else '',
         enable_browser=enable_browser,
+        node_modules_layers=node_modules_layers or [],
     )
     return dockerfile_content
 
@@ -305,11 +356,13 @@ def prep_build_folder(
 
     # Copy the 'templates' directory (LumioVibe project templates)
     templates_src = Path(project_root, 'templates')
+    node_modules_layers = []
     if templates_src.exists():
         shutil.copytree(
             templates_src,
             Path(build_folder, 'code', 'templates'),
         )
+        node_modules_layers = get_node_modules_layers(templates_src)
 
     # Copy pyproject.toml and poetry.lock files
     for file in ['pyproject.toml', 'poetry.lock']:
@@ -324,6 +377,7 @@ def prep_build_folder(
         build_from=build_from,
         extra_deps=extra_deps,
         enable_browser=enable_browser,
+        node_modules_layers=node_modules_layers,
     )
     dockerfile_path = Path(build_folder, 'Dockerfile')
     with open(str(dockerfile_path), 'w') as f:
@@ -0,0 +1,324 @@
+"""Watch the workspace for changes with inotify.
+
+The watcher keeps an inotify watch on every directory of the workspace except
+dependency and build output directories, and records which paths changed.
+Events are coalesced: everything that happens within `coalesce_delay` becomes
+one new version, and callers ask which paths changed since the version they
+last saw (or wait for the next one), so the cost of knowing what changed is
+proportional to what changed rather than to the size of the workspace.
+
+Of git metadata only the top of each `.git` directory and its refs are
+watched, which is where commits, checkouts, fetches and pushes touch HEAD, the
+index, FETCH_HEAD and branches. Changes there are reported as a change to the
+`.git` path itself.
+
+inotify is only available on Linux; elsewhere `start` raises OSError.
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import threading
+import time
+from dataclasses import dataclass, field
+
+from openhands.core.logger import openhands_logger as logger
+
+# Directories never watched, wherever they are in the workspace
+EXCLUDED_DIRS = frozenset({'node_modules', 'build', '__pycache__'})
+# Beyond this many changed paths, callers are told to start over instead
+MAX_TRACKED_PATHS = 100_000
+DEFAULT_COALESCE_DELAY = 0.05
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_DONT_FOLLOW = 0x02000000
+IN_EXCL_UNLINK = 0x04000000
+IN_ISDIR = 0x40000000
+
+_WATCH_MASK = (
+    IN_MODIFY
+    | IN_ATTRIB
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+    | IN_MOVE_SELF
+    | IN_ONLYDIR
+    | IN_DONT_FOLLOW
+    | IN_EXCL_UNLINK
+)
+_EVENT_HEADER = struct.Struct('iIII')
+
+
+@dataclass
+class WorkspaceChanges:
+    """The paths, relative to the watched root, that changed after a version.
+
+    If `reset` is set, changes were lost (or were too many to track) and the
+    caller has to treat the whole workspace as changed.
+    """
+
+    version: int
+    paths: list[str] = field(default_factory=list)
+    reset: bool = False
+
+
+class _Inotify:
+    """A minimal binding of the inotify system calls."""
+
+    def __init__(self) -> None:
+        libc_name = ctypes.util.find_library('c') or 'libc.so.6'
+        try:
+            self._libc = ctypes.CDLL(libc_name, use_errno=True)
+            init = self._libc.inotify_init1
+        except (OSError, AttributeError) as e:
+            raise OSError(errno.ENOSYS, 'inotify is not available') from e
+        self.fd = init(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise _os_error()
+
+    def add_watch(self, path: str, mask: int) -> int:
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            raise _os_error(path)
+        return wd
+
+    def rm_watch(self, wd: int) -> None:
+        # The watch may already be gone with its directory
+        self._libc.inotify_rm_watch(self.fd, wd)
+
+    def read(self) -> list[tuple[int, int, int, str]]:
+        """Read the pending events as (wd, mask, cookie, name)."""
+        events = []
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return events
+            offset = 0
+            while offset < len(data):
+                wd, mask, cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = os.fsdecode(data[offset : offset + length].rstrip(b'\0'))
+                offset += length
+                events.append((wd, mask, cookie, name))
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+def _os_error(path: str | None = None) -> OSError:
+    code = ctypes.get_errno()
+    return OSError(code, os.strerror(code), path)
+
+
+class WorkspaceWatcher:
+    """Records the paths that change under a directory, using inotify."""
+
+    def __init__(
+        self,
+        root: str,
+        excluded_dirs: frozenset[str] = EXCLUDED_DIRS,
+        coalesce_delay: float = DEFAULT_COALESCE_DELAY,
+        max_tracked_paths: int = MAX_TRACKED_PATHS,
+    ) -> None:
+        self.root = os.path.abspath(root)
+        self.excluded_dirs = excluded_dirs
+        self.coalesce_delay = coalesce_delay
+        self.max_tracked_paths = max_tracked_paths
+        self._inotify: _Inotify | None = None
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._condition = threading.Condition()
+        # Versions start from the clock, so one seen before a restart asks for a reset
+        self._version = time.time_ns() // 1_000_000
+        self._reset_version = self._version
+        # path -> the version it last changed in
+        self._changed: dict[str, int] = {}
+        # watch descriptor -> directory, relative to root ('' for the root)
+        self._dirs: dict[int, str] = {}
+
+    @property
+    def version(self) -> int:
+        with self._condition:
+            return self._version
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Watch the workspace. Raises OSError if it can't be watched."""
+        self._inotify = _Inotify()
+        try:
+            self._watch_tree('')
+        except OSError:
+            self._inotify.close()
+            self._inotify = None
+            raise
+        self._thread = threading.Thread(
+            target=self._run, name='workspace-watcher', daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+
+    def changes_since(self, version: int | None) -> WorkspaceChanges:
+        """The paths changed after `version`. None means nothing was seen yet."""
+        with self._condition:
+            if version is None or not self._reset_version <= version <= self._version:
+                return WorkspaceChanges(self._version, reset=True)
+            paths = sorted(
+                path for path, changed in self._changed.items() if changed > version
+            )
+            return WorkspaceChanges(self._version, paths)
+
+    def wait_for_changes(
+        self, version: int | None, timeout: float | None = None
+    ) -> WorkspaceChanges:
+        """Like `changes_since`, but waits up to `timeout` for a change first."""
+        with self._condition:
+            if version == self._version:
+                self._condition.wait_for(
+                    lambda: self._version > version or not self.running, timeout
+                )
+        return self.changes_since(version)
+
+    def _run(self) -> None:
+        assert self._inotify is not None
+        poller = select.poll()
+        poller.register(self._inotify.fd, select.POLLIN)
+        while not self._stop.is_set():
+            if not poller.poll(100):
+                continue
+            # Let a burst of events (a checkout, an npm install) settle into one version
+            self._stop.wait(self.coalesce_delay)
+            try:
+                self._process(self._inotify.read())
+            except Exception:
+                logger.exception('Error processing workspace events')
+                with self._condition:
+                    self._version += 1
+                    self._reset()
+                    self._condition.notify_all()
+        with self._condition:
+            self._condition.notify_all()
+
+    def _process(self, events: list[tuple[int, int, int, str]]) -> None:
+        changed: set[str] = set()
+        reset = False
+        for wd, mask, _cookie, name in events:
+            if mask & IN_Q_OVERFLOW:
+                reset = True
+                continue
+            directory = self._dirs.get(wd)
+            if directory is None:
+                continue
+            if mask & IN_IGNORED:
+                self._dirs.pop(wd, None)
+                continue
+            git_dir = _git_dir(directory)
+            if git_dir is not None:
+                # Report git metadata changes as a change to the .git directory
+                changed.add(git_dir)
+                if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                    try:
+                        self._watch_tree(_join(directory, name))
+                    except OSError as e:
+                        logger.warning(f'Could not watch {directory}/{name}: {e}')
+                        reset = True
+                continue
+            if not name:
+                # Events on the watched directory itself are reported by its parent
+                continue
+            path = _join(directory, name)
+            if mask & IN_ISDIR and name in self.excluded_dirs:
+                continue
+            changed.add(path)
+            if mask & IN_ISDIR:
+                if mask & IN_MOVED_FROM:
+                    self._unwatch_tree(path)
+                elif mask & (IN_CREATE | IN_MOVED_TO):
+                    # Files may have been created in it before the watch was added
+                    try:
+                        changed.update(self._watch_tree(path))
+                    except OSError as e:
+                        logger.warning(f'Could not watch {path}: {e}')
+                        reset = True
+
+        with self._condition:
+            self._version += 1
+            for path in changed:
+                self._changed[path] = self._version
+            if reset or len(self._changed) > self.max_tracked_paths:
+                self._reset()
+            self._condition.notify_all()
+
+    def _reset(self) -> None:
+        self._changed.clear()
+        self._reset_version = self._version
+
+    def _watch_tree(self, top: str) -> list[str]:
+        """Watch a directory and the directories below it, returning the paths in it."""
+        assert self._inotify is not None
+        found = []
+        for dir_path, dir_names, file_names in os.walk(os.path.join(self.root, top)):
+            rel_dir = os.path.relpath(dir_path, self.root)
+            rel_dir = '' if rel_dir == '.' else rel_dir
+            try:
+                wd = self._inotify.add_watch(dir_path, _WATCH_MASK)
+            except FileNotFoundError:
+                continue
+            self._dirs[wd] = rel_dir
+            if _git_dir(rel_dir) is not None:
+                # Of the git metadata, only the top and the refs are watched
+                if os.path.basename(rel_dir) == '.git':
+                    dir_names[:] = [name for name in dir_names if name == 'refs']
+                continue
+            dir_names[:] = [
+                name for name in dir_names if name not in self.excluded_dirs
+            ]
+            found.extend(_join(rel_dir, name) for name in dir_names + file_names)
+        return found
+
+    def _unwatch_tree(self, top: str) -> None:
+        assert self._inotify is not None
+        for wd, rel_dir in list(self._dirs.items()):
+            if rel_dir == top or rel_dir.startswith(top + '/'):
+                self._inotify.rm_watch(wd)
+                del self._dirs[wd]
+
+
+def _join(directory: str, name: str) -> str:
+    return f'{directory}/{name}' if directory else name
+
+
+def _git_dir(directory: str) -> str | None:
+    """The .git directory a directory is in (or is), if any."""
+    parts = directory.split('/')
+    if '.git' not in parts:
+        return None
+    return '/'.join(parts[: parts.index('.git') + 1])
@@ -1,16 +1,15 @@
 import asyncio
 import os
-from collections import defaultdict
-from datetime import datetime, timedelta
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from urllib.parse import urlparse
 
-from fastapi import Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request as StarletteRequest
-from starlette.responses import Response
-from starlette.types import ASGIApp
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 
 class LocalhostCORSMiddleware(CORSMiddleware):
@@ -48,54 +47,126 @@ class LocalhostCORSMiddleware(CORSMiddleware):
         return result
 
 
-class CacheControlMiddleware(BaseHTTPMiddleware):
-    """Middleware to disable caching for all routes by adding appropriate headers"""
+class CacheControlMiddleware:
+    """Middleware to disable caching for all routes by adding appropriate headers,
+    unless a route sets its own Cache-Control"""
 
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
-        response = await call_next(request)
-        if request.url.path.startswith('/assets'):
-            # The content of the assets directory has fingerprinted file names so we cache aggressively
-            response.headers['Cache-Control'] = 'public, max-age=2592000, immutable'
-        else:
-            response.headers['Cache-Control'] = (
-                'no-cache, no-store, must-revalidate, max-age=0'
-            )
-            response.headers['Pragma'] = 'no-cache'
-            response.headers['Expires'] = '0'
-        return response
+    # The content of the assets directory has fingerprinted file names so we cache aggressively
+    ASSET_HEADERS = {'Cache-Control': 'public, max-age=2592000, immutable'}
+    NO_CACHE_HEADERS = {
+        'Cache-Control': 'no-cache, no-store, must-revalidate, max-age=0',
+        'Pragma': 'no-cache',
+        'Expires': '0',
+    }
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        cache_headers = (
+            self.ASSET_HEADERS
+            if scope['path'].startswith('/assets')
+            else self.NO_CACHE_HEADERS
+        )
+
+        async def send_with_cache_headers(message: Message) -> None:
+            if message['type'] == 'http.response.start':
+                headers = MutableHeaders(scope=message)
+                # Routes that say how to cache their responses are left to it
+                if 'cache-control' not in headers:
+                    for key, value in cache_headers.items():
+                        headers[key] = value
+            await send(message)
+
+        await self.app(scope, receive, send_with_cache_headers)
+
+
+@dataclass
+class _TokenBucket:
+    tokens: float
+    updated_at: float
 
 
 class InMemoryRateLimiter:
-    history: dict[str, list[datetime]]
+    """Per-client token bucket rate limiter.
+
+    Each client may make `requests` requests per `seconds`, with bursts of up
+    to `requests`. Once the bucket is empty, the next `requests` requests are
+    delayed by `sleep_seconds` (or rejected if it is 0), and anything beyond
+    that is rejected. Buckets are kept in an LRU bounded to `max_clients`,
+    and buckets idle long enough to have refilled are evicted periodically,
+    since a new bucket would be identical.
+    """
+
     requests: int
     seconds: int
     sleep_seconds: int
-
-    def __init__(self, requests: int = 2, seconds: int = 1, sleep_seconds: int = 1):
+    max_clients: int
+    buckets: OrderedDict[str, _TokenBucket]
+
+    # How often idle buckets are evicted, in seconds
+    EVICTION_INTERVAL = 60.0
+
+    def __init__(
+        self,
+        requests: int = 2,
+        seconds: int = 1,
+        sleep_seconds: int = 1,
+        max_clients: int = 10_000,
+    ):
         self.requests = requests
         self.seconds = seconds
         self.sleep_seconds = sleep_seconds
-        self.history = defaultdict(list)
-        self.sleep_seconds = sleep_seconds
-
-    def _clean_old_requests(self, key: str) -> None:
-        now = datetime.now()
-        cutoff = now - timedelta(seconds=self.seconds)
-        self.history[key] = [ts for ts in self.history[key] if ts > cutoff]
-
-    async def __call__(self, request: Request) -> bool:
-        key = request.client.host
-        now = datetime.now()
-
-        self._clean_old_requests(key)
-
-        self.history[key].append(now)
-
-        if len(self.history[key]) > self.requests * 2:
+        self.max_clients = max_clients
+        self.buckets = OrderedDict()
+        self._refill_rate = requests / seconds
+        self._next_eviction = time.monotonic() + self.EVICTION_INTERVAL
+
+    def _take_token(self, key: str) -> float:
+        """Take a token from the bucket of a client, returning what is left."""
+        now = time.monotonic()
+        if now >= self._next_eviction:
+            self._evict_idle_buckets(now)
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = _TokenBucket(tokens=self.requests, updated_at=now)
+            self.buckets[key] = bucket
+            if len(self.buckets) > self.max_clients:
+                self.buckets.popitem(last=False)
+        else:
+            self.buckets.move_to_end(key)
+            bucket.tokens = min(
+                self.requests,
+                bucket.tokens + (now - bucket.updated_at) * self._refill_rate,
+            )
+            bucket.updated_at = now
+        # Rejected requests count too, down to the point where they would be
+        # delayed again after `seconds`
+        bucket.tokens = max(bucket.tokens - 1, -self.requests - 1)
+        return bucket.tokens
+
+    def _evict_idle_buckets(self, now: float) -> None:
+        self._next_eviction = now + self.EVICTION_INTERVAL
+        # The time an empty bucket takes to refill completely
+        full_after = (2 * self.requests + 1) / self._refill_rate
+        # Buckets are in least recently used order
+        while self.buckets:
+            key, bucket = next(iter(self.buckets.items()))
+            if now - bucket.updated_at < full_after:
+                break
+            del self.buckets[key]
+
+    async def __call__(self, request: HTTPConnection) -> bool:
+        key = request.client.host if request.client else ''
+        tokens = self._take_token(key)
+
+        if tokens < -self.requests:
             return False
-        elif len(self.history[key]) > self.requests:
+        elif tokens < 0:
             if self.sleep_seconds > 0:
                 await asyncio.sleep(self.sleep_seconds)
                 return True
@@ -105,59 +176,66 @@ class InMemoryRateLimiter:
         return True
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
+class RateLimitMiddleware:
     def __init__(self, app: ASGIApp, rate_limiter: InMemoryRateLimiter):
-        super().__init__(app)
+        self.app = app
         self.rate_limiter = rate_limiter
 
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        request = HTTPConnection(scope)
         if not self.is_rate_limited_request(request):
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
         ok = await self.rate_limiter(request)
         if not ok:
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=429,
                 content={'message': 'Too many requests'},
                 headers={'Retry-After': '1'},
             )
-        return await call_next(request)
+            await response(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
 
-    def is_rate_limited_request(self, request: StarletteRequest) -> bool:
-        if request.url.path.startswith('/assets'):
+    def is_rate_limited_request(self, request: HTTPConnection) -> bool:
+        if request.scope['path'].startswith('/assets'):
             return False
         # Put Other non rate limited checks here
         return True
 
 
-class TokenRateLimitMiddleware(BaseHTTPMiddleware):
+class TokenRateLimitMiddleware:
     """Stricter rate limiting for token-related endpoints to prevent brute force attacks."""
 
     def __init__(self, app: ASGIApp):
-        super().__init__(app)
+        self.app = app
         # 20 requests per 60 seconds for token endpoints
         self.rate_limiter = InMemoryRateLimiter(
             requests=20, seconds=60, sleep_seconds=0
         )
 
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         # Skip rate limiting for token status checks
         if (
-            not request.url.path.startswith('/api/token')
-            or request.url.path == '/api/token/status'
+            scope['type'] != 'http'
+            or not scope['path'].startswith('/api/token')
+            or scope['path'] == '/api/token/status'
         ):
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
-        ok = await self.rate_limiter(request)
+        ok = await self.rate_limiter(HTTPConnection(scope))
         if not ok:
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=429,
                 content={
                     'message': 'Too many authentication attempts. Please try again later.'
                 },
                 headers={'Retry-After': '60'},
             )
-        return await call_next(request)
+            await response(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
@@ -1,7 +1,7 @@
 import os
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, status
+from fastapi import APIRouter, Depends, HTTPException, Request, UploadFile, status
 from fastapi.responses import FileResponse, JSONResponse, Response
 from pathspec import PathSpec
 from pathspec.patterns import GitWildMatchPattern
@@ -18,6 +18,7 @@ from openhands.events.observation import (
     FileReadObservation,
 )
 from openhands.runtime.base import Runtime
+from openhands.runtime.utils.file_tree import DEFAULT_TREE_DEPTH, DEFAULT_TREE_LIMIT
 from openhands.server.dependencies import get_dependencies
 from openhands.server.file_config import FILES_TO_IGNORE
 from openhands.server.files import POSTUploadFilesModel
@@ -115,6 +116,65 @@ async def list_files(
     return file_list
 
 
+@app.get(
+    '/file-tree',
+    response_model=None,
+    responses={
+        200: {'description': 'The tree of files', 'model': dict[str, Any]},
+        304: {'description': 'The tree has not changed since the given ETag'},
+        404: {'description': 'Runtime not initialized', 'model': dict},
+        500: {'description': 'Error listing files', 'model': dict},
+        501: {'description': 'Runtime does not list file trees', 'model': dict},
+    },
+)
+async def get_file_tree(
+    request: Request,
+    conversation: ServerConversation = Depends(get_conversation),
+    path: str | None = None,
+    depth: int = DEFAULT_TREE_DEPTH,
+    limit: int = DEFAULT_TREE_LIMIT,
+) -> Response:
+    """List the tree of files under a path, recursively, in one request.
+
+    Unlike list-files, this lists `depth` levels of directories at once (at
+    most `limit` entries), leaving out files ignored by .gitignore. The
+    response has an ETag; send it back in If-None-Match to get a 304 while
+    the tree is unchanged.
+
+    To list the tree:
+    ```sh
+    curl http://localhost:3000/api/conversations/{conversation_id}/file-tree?depth=3
+    ```
+    """
+    if not conversation.runtime:
+        return JSONResponse(
+            status_code=status.HTTP_404_NOT_FOUND,
+            content={'error': 'Runtime not yet initialized'},
+        )
+
+    etag = request.headers.get('If-None-Match')
+    try:
+        tree = await call_sync_from_async(
+            conversation.runtime.get_file_tree, path, depth, limit, etag
+        )
+    except NotImplementedError as e:
+        return JSONResponse(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            content={'error': str(e)},
+        )
+    except Exception as e:
+        logger.error(f'Error listing file tree: {e}')
+        return JSONResponse(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            content={'error': f'Error listing file tree: {e}'},
+        )
+    if tree is None:
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag or ''}
+        )
+    return JSONResponse(content=tree.tree, headers={'ETag': tree.etag})
+
+
 # NOTE: We use response_model=None for endpoints that can return multiple response types
 # (like FileResponse | JSONResponse). This is because FastAPI's response_model expects a
 # Pydantic model, but Starlette response classes like FileResponse are not Pydantic models.
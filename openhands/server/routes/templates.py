@@ -1,18 +1,13 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
 from fastapi.responses import FileResponse
 
-from openhands.server.services.template_manager import TemplateManager
+from openhands.server.services.template_manager import get_template_manager
 
 router = APIRouter(prefix='/api/templates', tags=['templates'])
 
-_template_manager: TemplateManager | None = None
-
-
-def get_template_manager() -> TemplateManager:
-    global _template_manager
-    if _template_manager is None:
-        _template_manager = TemplateManager()
-    return _template_manager
+# Image URLs carry the hash of the image (`?v=`), so those responses never change
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+REVALIDATE_CACHE_CONTROL = 'no-cache'
 
 
 @router.get('')
@@ -45,11 +40,31 @@ async def get_template(template_id: str):
     return manager.to_dict(template)
 
 
-@router.get('/{template_id}/image')
-async def get_template_image(template_id: str):
-    """Get template preview image."""
+@router.get('/{template_id}/image', response_model=None)
+async def get_template_image(
+    template_id: str, request: Request, v: str | None = None
+) -> Response:
+    """Get template preview image.
+
+    The response has an ETag from the image content. Requested with the
+    `image_url` of the template, which has that content in its `v` parameter,
+    it can be cached for good; otherwise it is revalidated with the ETag.
+    """
     manager = get_template_manager()
-    image_path = manager.get_template_image_path(template_id)
-    if image_path is None:
+    image = manager.get_template_image(template_id)
+    if image is None:
         raise HTTPException(status_code=404, detail='Template image not found')
-    return FileResponse(image_path, media_type='image/png')
+    image_path, image_hash = image
+
+    etag = f'"{image_hash}"'
+    immutable = v == image_hash[:16]
+    headers = {
+        'ETag': etag,
+        'Cache-Control': (
+            IMMUTABLE_CACHE_CONTROL if immutable else REVALIDATE_CACHE_CONTROL
+        ),
+    }
+    if_none_match = request.headers.get('If-None-Match', '')
+    if etag in {tag.strip().removeprefix('W/') for tag in if_none_match.split(',')}:
+        return Response(status_code=304, headers=headers)
+    return FileResponse(image_path, media_type='image/png', headers=headers)
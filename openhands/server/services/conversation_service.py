@@ -55,9 +55,11 @@ async def initialize_conversation(
 
         # If template_id is provided, use template name as title
         if template_id:
-            from openhands.server.services.template_manager import TemplateManager
+            from openhands.server.services.template_manager import (
+                get_template_manager,
+            )
 
-            template_manager = TemplateManager()
+            template_manager = get_template_manager()
             template = template_manager.get_template(template_id)
             if template:
                 conversation_title = template.name
@@ -193,9 +195,11 @@ async def create_new_conversation(
     template_id: str | None = None,
 ) -> AgentLoopInfo:
     if template_id is None:
-        from openhands.server.services.template_manager import TemplateManager
+        from openhands.server.services.template_manager import (
+            get_template_manager,
+        )
 
-        template_manager = TemplateManager()
+        template_manager = get_template_manager()
         default_template = template_manager.get_default_template()
         if default_template:
             template_id = default_template.id
@@ -1,10 +1,34 @@
+"""Project templates, kept current as the templates directory changes.
+
+Each template is hashed by its content, so what is built from a template
+(runtime images, installed dependencies, initialized projects) can be cached
+by the hash and reused for as long as it still matches. The directory is
+watched with inotify, or polled where inotify is not available, and only the
+templates whose files changed are loaded and hashed again.
+"""
+
+import hashlib
 import json
 import os
+import threading
+import time
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from pydantic import BaseModel
 
+from openhands.core.logger import openhands_logger as logger
+from openhands.runtime.utils.workspace_watcher import (
+    EXCLUDED_DIRS as WATCHER_EXCLUDED_DIRS,
+)
+from openhands.runtime.utils.workspace_watcher import WorkspaceWatcher
+
+# Directories that are not part of a template's content
+EXCLUDED_DIRS = WATCHER_EXCLUDED_DIRS | {'.git'}
+# How often the templates are checked for changes when they can't be watched
+POLL_INTERVAL = 2.0
+
 
 class TemplateMetadata(BaseModel):
     """Metadata for a project template."""
@@ -17,12 +41,20 @@ class TemplateMetadata(BaseModel):
     features: list[str] = []
     default: bool = False
     image_url: str | None = None
+    content_hash: str | None = None
+
+
+@dataclass
+class _Template:
+    metadata: TemplateMetadata
+    path: Path
+    image_hash: str | None
 
 
 class TemplateManager:
     """Manages project templates for LumioVibe."""
 
-    def __init__(self, templates_dir: str | None = None):
+    def __init__(self, templates_dir: str | None = None, watch: bool = True):
         if templates_dir:
             self._templates_dir = Path(templates_dir)
         else:
@@ -34,52 +66,126 @@ class TemplateManager:
                 project_root = Path(__file__).parent.parent.parent.parent
                 self._templates_dir = project_root / 'templates'
 
-        self._templates_cache: dict[str, TemplateMetadata] | None = None
+        self._watch = watch
+        self._watcher: WorkspaceWatcher | None = None
+        self._version: int | None = None
+        self._templates: dict[str, _Template] | None = None
+        # Template -> the stats of its files, to tell changes when polling
+        self._fingerprints: dict[str, list[tuple[str, int, int]]] = {}
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
 
-    def _load_templates(self) -> dict[str, TemplateMetadata]:
-        """Load all template metadata from templates directory."""
-        templates: dict[str, TemplateMetadata] = {}
+    def _current(self) -> dict[str, _Template]:
+        """The templates, after loading again those that changed."""
+        with self._lock:
+            if self._templates is None:
+                self._start_watching()
+                self._templates = {}
+                self._load_templates(self._template_names())
+            else:
+                changed = self._changed_templates()
+                if changed:
+                    self._load_templates(changed)
+            return self._templates
 
-        if not self._templates_dir.exists():
-            return templates
+    def _start_watching(self) -> None:
+        if not self._watch:
+            return
+        watcher = WorkspaceWatcher(str(self._templates_dir))
+        try:
+            watcher.start()
+        except OSError as e:
+            logger.debug(f'Polling templates for changes, as watching failed: {e}')
+            return
+        self._watcher = watcher
+        self._version = watcher.version
 
-        for item in self._templates_dir.iterdir():
-            if not item.is_dir():
-                continue
+    def stop(self) -> None:
+        """Stop watching the templates directory."""
+        with self._lock:
+            if self._watcher is not None:
+                self._watcher.stop()
+                self._watcher = None
 
+    def _template_names(self) -> set[str]:
+        if not self._templates_dir.is_dir():
+            return set()
+        return {item.name for item in self._templates_dir.iterdir() if item.is_dir()}
+
+    def _changed_templates(self) -> set[str]:
+        assert self._templates is not None
+        if self._watcher is not None and self._watcher.running:
+            changes = self._watcher.changes_since(self._version)
+            self._version = changes.version
+            if changes.reset:
+                return self._template_names() | set(self._templates)
+            return {path.split('/', 1)[0] for path in changes.paths}
+        if not self._watch or time.monotonic() - self._checked_at < POLL_INTERVAL:
+            return set()
+        self._checked_at = time.monotonic()
+        names = self._template_names() | set(self._fingerprints)
+        return {
+            name
+            for name in names
+            if self._fingerprints.get(name) != _fingerprint(self._templates_dir / name)
+        }
+
+    def _load_templates(self, names: set[str]) -> None:
+        """Load (or drop) the metadata and content hashes of templates.
+
+        The templates are loaded into a new dict that replaces the current one,
+        as callers iterate it without holding the lock.
+        """
+        assert self._templates is not None
+        templates = dict(self._templates)
+        for name in names:
+            templates.pop(name, None)
+            self._fingerprints.pop(name, None)
+            item = self._templates_dir / name
             meta_file = item / 'meta.json'
-            if not meta_file.exists():
+            if not meta_file.is_file():
                 continue
+            if self._watch and self._watcher is None:
+                self._fingerprints[name] = _fingerprint(item)
 
             try:
                 with open(meta_file) as f:
                     meta_data = json.load(f)
 
-                # Check if image exists
+                # Check if image exists, and version its URL by content
+                image_hash = None
                 image_path = item / 'image.png'
                 if image_path.exists():
-                    meta_data['image_url'] = f'/api/templates/{item.name}/image'
+                    image_hash = _file_hash(image_path)
+                    meta_data['image_url'] = (
+                        f'/api/templates/{item.name}/image?v={image_hash[:16]}'
+                    )
 
-                templates[item.name] = TemplateMetadata(**meta_data)
-            except (json.JSONDecodeError, ValueError) as e:
-                print(f'Error loading template {item.name}: {e}')
+                meta_data['content_hash'] = hash_template(item)
+                templates[name] = _Template(
+                    TemplateMetadata(**meta_data), item, image_hash
+                )
+            except (OSError, json.JSONDecodeError, ValueError) as e:
+                logger.warning(f'Error loading template {item.name}: {e}')
                 continue
-
-        return templates
+        self._templates = dict(sorted(templates.items()))
+        self._checked_at = time.monotonic()
 
     def get_templates(self) -> list[TemplateMetadata]:
         """Get all available templates."""
-        if self._templates_cache is None:
-            self._templates_cache = self._load_templates()
-
-        return list(self._templates_cache.values())
+        return [template.metadata for template in self._current().values()]
 
     def get_template(self, template_id: str) -> TemplateMetadata | None:
         """Get a specific template by ID."""
-        if self._templates_cache is None:
-            self._templates_cache = self._load_templates()
+        template = self._current().get(template_id)
+        return template.metadata if template else None
 
-        return self._templates_cache.get(template_id)
+    def get_template_by_hash(self, content_hash: str) -> TemplateMetadata | None:
+        """Get the template whose content currently has the given hash."""
+        for template in self._current().values():
+            if template.metadata.content_hash == content_hash:
+                return template.metadata
+        return None
 
     def get_default_template(self) -> TemplateMetadata | None:
         """Get the default template."""
@@ -92,21 +198,23 @@ class TemplateManager:
 
     def get_template_path(self, template_id: str) -> Path | None:
         """Get the filesystem path to a template."""
-        template = self.get_template(template_id)
+        template = self._current().get(template_id)
         if template is None:
             return None
-
-        path = self._templates_dir / template_id
-        return path if path.exists() else None
+        return template.path if template.path.exists() else None
 
     def get_template_image_path(self, template_id: str) -> Path | None:
         """Get the path to template's image."""
-        template_path = self.get_template_path(template_id)
-        if template_path is None:
-            return None
+        image = self.get_template_image(template_id)
+        return image[0] if image else None
 
-        image_path = template_path / 'image.png'
-        return image_path if image_path.exists() else None
+    def get_template_image(self, template_id: str) -> tuple[Path, str] | None:
+        """Get the path to template's image and the hash of its content."""
+        template = self._current().get(template_id)
+        if template is None or template.image_hash is None:
+            return None
+        image_path = template.path / 'image.png'
+        return (image_path, template.image_hash) if image_path.exists() else None
 
     def to_dict(self, template: TemplateMetadata) -> dict[str, Any]:
         """Convert template metadata to dictionary."""
@@ -119,4 +227,56 @@ class TemplateManager:
             'features': template.features,
             'default': template.default,
             'image_url': template.image_url,
+            'content_hash': template.content_hash,
         }
+
+
+_manager: TemplateManager | None = None
+_manager_lock = threading.Lock()
+
+
+def get_template_manager() -> TemplateManager:
+    """The TemplateManager shared by everything using templates in this process."""
+    global _manager
+    if _manager is None:
+        with _manager_lock:
+            if _manager is None:
+                _manager = TemplateManager()
+    return _manager
+
+
+def hash_template(path: Path) -> str:
+    """Hash the files of a template, by their paths and contents."""
+    digest = hashlib.sha256()
+    for dir_path, dir_names, file_names in os.walk(path):
+        dir_names[:] = sorted(d for d in dir_names if d not in EXCLUDED_DIRS)
+        for name in sorted(file_names):
+            file_path = Path(dir_path, name)
+            digest.update(f'{file_path.relative_to(path).as_posix()}\0'.encode())
+            try:
+                digest.update(bytes.fromhex(_file_hash(file_path)))
+            except OSError:
+                # Removed meanwhile; the change is picked up next time
+                digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def _file_hash(path: Path) -> str:
+    with open(path, 'rb') as f:
+        return hashlib.file_digest(f, 'sha256').hexdigest()
+
+
+def _fingerprint(path: Path) -> list[tuple[str, int, int]]:
+    """Cheaply tell whether the files of a template changed."""
+    fingerprint = []
+    for dir_path, dir_names, file_names in os.walk(path):
+        dir_names[:] = sorted(d for d in dir_names if d not in EXCLUDED_DIRS)
+        for name in sorted(file_names):
+            try:
+                stat = os.stat(os.path.join(dir_path, name))
+            except OSError:
+                continue
+            fingerprint.append(
+                (os.path.join(dir_path, name), stat.st_mtime_ns, stat.st_size)
+            )
+    return fingerprint
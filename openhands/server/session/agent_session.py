@@ -532,9 +532,11 @@ class AgentSession:
             self.logger.warning('Cannot initialize template: runtime not available')
             return
 
-        from openhands.server.services.template_manager import TemplateManager
+        from openhands.server.services.template_manager import (
+            get_template_manager,
+        )
 
-        template_manager = TemplateManager()
+        template_manager = get_template_manager()
         template = template_manager.get_template(template_id)
 
         if not template:
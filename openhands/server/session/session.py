@@ -3,6 +3,7 @@ import time
 from logging import LoggerAdapter
 
 import socketio
+from litellm.types.utils import ChatCompletionMessageToolCall
 
 from openhands.controller.agent import Agent
 from openhands.core.config import OpenHandsConfig
@@ -16,7 +17,7 @@ from openhands.core.config.mcp_config import OpenHandsMCPConfigImpl
 from openhands.core.exceptions import MicroagentValidationError
 from openhands.core.logger import OpenHandsLoggerAdapter
 from openhands.core.schema import AgentState
-from openhands.events.action import MessageAction, NullAction
+from openhands.events.action import Action, MessageAction, NullAction
 from openhands.events.event import Event, EventSource
 from openhands.events.observation import (
     AgentStateChangedObservation,
@@ -27,8 +28,10 @@ from openhands.events.observation.agent import RecallObservation
 from openhands.events.observation.error import ErrorObservation
 from openhands.events.serialization import event_from_dict, event_to_dict
 from openhands.events.stream import EventStreamSubscriber
+from openhands.llm.completion_stream import CompletionStreamListener
 from openhands.llm.llm_registry import LLMRegistry
 from openhands.runtime.runtime_status import RuntimeStatus
+from openhands.runtime.utils.output_buffer import OutputChunkBuffer
 from openhands.server.constants import ROOM_KEY
 from openhands.server.services.conversation_stats import ConversationStats
 from openhands.server.session.agent_session import AgentSession
@@ -36,6 +39,11 @@ from openhands.server.session.conversation_init_data import ConversationInitData
 from openhands.storage.data_models.settings import Settings
 from openhands.storage.files import FileStore
 
+# Streamed shell and LLM output is sent to the client at most this often (seconds)
+SHELL_OUTPUT_INTERVAL = 0.2
+# Streamed output is held back while more events than this await sending
+SHELL_OUTPUT_MAX_QUEUED_EVENTS = 100
+
 
 class WebSession:
     """Web server-bound session wrapper.
@@ -115,6 +123,8 @@ class WebSession:
             self._monitor_publish_queue()
         )
         self._wait_websocket_initial_complete: bool = True
+        self._shell_output = OutputChunkBuffer()
+        self._llm_output = OutputChunkBuffer()
 
     async def close(self) -> None:
         if self.sio:
@@ -248,6 +258,11 @@ class WebSession:
             )
             agent_config.condenser = default_condenser_config
         agent = Agent.get_cls(agent_cls)(agent_config, self.llm_registry)
+        if agent_config.enable_streaming:
+            agent.stream_listener = CompletionStreamListener(
+                on_content=self._on_llm_output,
+                on_tool_call=self._on_llm_tool_call,
+            )
 
         self.llm_registry.retry_listner = self._notify_on_llm_retry
 
@@ -308,6 +323,9 @@ class WebSession:
             )
             return
 
+        if self.agent_session.runtime is not None:
+            self.agent_session.runtime.subscribe_to_shell_stream(self._on_shell_output)
+
     def _notify_on_llm_retry(self, retries: int, max: int) -> None:
         self.queue_status_message(
             'info', RuntimeStatus.LLM_RETRY, f'Retrying LLM request, {retries} / {max}'
@@ -329,6 +347,10 @@ class WebSession:
         if isinstance(event, NullObservation):
             return
         if event.source == EventSource.AGENT:
+            if isinstance(event, Action):
+                # The action carries the complete response, drop what was
+                # not streamed yet so it does not arrive after it
+                self._llm_output.drain()
             await self.send(event_to_dict(event))
         elif event.source == EventSource.USER:
             await self.send(event_to_dict(event))
@@ -337,6 +359,10 @@ class WebSession:
             event,
             (CmdOutputObservation, AgentStateChangedObservation, RecallObservation),
         ):
+            if isinstance(event, CmdOutputObservation):
+                # The observation carries the complete output, drop what was
+                # not streamed yet so it does not arrive after it
+                self._shell_output.drain()
             # feedback from the environment to agent actions is understood as agent events by the UI
             event_dict = event_to_dict(event)
             event_dict['source'] = EventSource.AGENT
@@ -371,7 +397,7 @@ class WebSession:
                         'Model does not support image upload, change to a different model or try without an image.'
                     )
                     return
-        self.agent_session.event_stream.add_event(event, EventSource.USER)
+        await self.agent_session.event_stream.add_event_async(event, EventSource.USER)
 
     async def send(self, data: dict[str, object]) -> None:
         self._publish_queue.put_nowait(data)
@@ -458,6 +484,61 @@ class WebSession:
             }
         )
 
+    def _on_shell_output(self, chunk: str) -> None:
+        """Receives output of a running command, called from the runtime thread."""
+        if self._shell_output.append(chunk):
+            asyncio.run_coroutine_threadsafe(
+                self._flush_output(self._shell_output, 'oh_shell_output'), self.loop
+            )
+
+    def _on_llm_output(self, delta: str) -> None:
+        """Receives streamed LLM text, called from the agent controller thread."""
+        if self._llm_output.append(delta):
+            asyncio.run_coroutine_threadsafe(
+                self._flush_output(self._llm_output, 'oh_llm_output'), self.loop
+            )
+
+    def _on_llm_tool_call(self, tool_call: ChatCompletionMessageToolCall) -> None:
+        """Announces a tool call as soon as the LLM has finished generating it."""
+        asyncio.run_coroutine_threadsafe(
+            self._emit_ephemeral(
+                'oh_llm_tool_call',
+                {
+                    'id': tool_call.id,
+                    'name': tool_call.function.name,
+                    'arguments': tool_call.function.arguments,
+                },
+            ),
+            self.loop,
+        )
+
+    async def _flush_output(self, buffer: OutputChunkBuffer, event_name: str) -> None:
+        """Sends pending streamed output to the client.
+
+        Output is ephemeral: it is emitted as `event_name` rather than added
+        to the event stream, since the final observation or action holds the
+        complete content. Chunks arriving within SHELL_OUTPUT_INTERVAL are
+        sent together, and nothing is sent while the client is behind on
+        events, during which output keeps coalescing in a bounded buffer.
+        """
+        await asyncio.sleep(SHELL_OUTPUT_INTERVAL)
+        while (
+            self.is_alive
+            and self._publish_queue.qsize() > SHELL_OUTPUT_MAX_QUEUED_EVENTS
+        ):
+            await asyncio.sleep(SHELL_OUTPUT_INTERVAL)
+        content = buffer.drain()
+        if content:
+            await self._emit_ephemeral(event_name, {'content': content})
+
+    async def _emit_ephemeral(self, event_name: str, data: dict[str, object]) -> None:
+        if not self.is_alive or not self.sio:
+            return
+        try:
+            await self.sio.emit(event_name, data, to=ROOM_KEY.format(sid=self.sid))
+        except RuntimeError as e:
+            self.logger.debug(f'Error sending {event_name} to websocket: {e}')
+
     def queue_status_message(
         self, msg_type: str, runtime_status: RuntimeStatus, message: str
     ) -> None:
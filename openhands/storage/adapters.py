@@ -0,0 +1,95 @@
+from typing import Any, Callable
+
+from openhands.storage.files import AsyncFileStore, FileStore
+from openhands.utils.async_utils import (
+    GENERAL_TIMEOUT,
+    call_async_from_sync,
+    call_sync_from_async,
+)
+
+
+class AsyncFileStoreAdapter(AsyncFileStore):
+    """Serves a FileStore to async callers.
+
+    Each call, including a whole batch, runs in one hop to the thread pool,
+    so batches keep the concurrency of stores that read and write many files
+    at once (such as S3). Stores that don't block are called directly.
+    """
+
+    def __init__(self, file_store: FileStore) -> None:
+        self.file_store = file_store
+
+    async def write(self, path: str, contents: str | bytes) -> None:
+        await self._call(self.file_store.write, path, contents)
+
+    async def read(self, path: str) -> str:
+        return await self._call(self.file_store.read, path)
+
+    async def read_bytes(self, path: str) -> bytes:
+        return await self._call(self.file_store.read_bytes, path)
+
+    async def read_many(
+        self, paths: list[str], return_exceptions: bool = False
+    ) -> list[str] | list[str | Exception]:
+        return await self._call(self.file_store.read_many, paths, return_exceptions)
+
+    async def write_many(self, files: dict[str, str | bytes]) -> None:
+        await self._call(self.file_store.write_many, files)
+
+    async def list(self, path: str) -> list[str]:
+        return await self._call(self.file_store.list, path)
+
+    async def delete(self, path: str) -> None:
+        await self._call(self.file_store.delete, path)
+
+    async def _call(self, fn: Callable, *args: Any) -> Any:
+        if not self.file_store.blocking:
+            return fn(*args)
+        return await call_sync_from_async(fn, *args)
+
+
+class SyncFileStoreAdapter(FileStore):
+    """Serves an AsyncFileStore to synchronous call sites.
+
+    Each call runs the coroutine to completion on a background event loop,
+    so it must not be used from code already running on the event loop.
+    """
+
+    def __init__(
+        self, file_store: AsyncFileStore, timeout: float = GENERAL_TIMEOUT
+    ) -> None:
+        self.file_store = file_store
+        self.timeout = timeout
+
+    def write(self, path: str, contents: str | bytes) -> None:
+        self._call(self.file_store.write, path, contents)
+
+    def read(self, path: str) -> str:
+        return self._call(self.file_store.read, path)
+
+    def read_bytes(self, path: str) -> bytes:
+        return self._call(self.file_store.read_bytes, path)
+
+    def read_many(
+        self, paths: list[str], return_exceptions: bool = False
+    ) -> list[str] | list[str | Exception]:
+        return self._call(self.file_store.read_many, paths, return_exceptions)
+
+    def write_many(self, files: dict[str, str | bytes]) -> None:
+        self._call(self.file_store.write_many, files)
+
+    def list(self, path: str) -> list[str]:
+        return self._call(self.file_store.list, path)
+
+    def delete(self, path: str) -> None:
+        self._call(self.file_store.delete, path)
+
+    def _call(self, corofn: Callable, *args: Any) -> Any:
+        return call_async_from_sync(corofn, self.timeout, *args)
+
+
+def get_async_file_store(file_store: FileStore) -> AsyncFileStore:
+    """The async interface to a store, unwrapping stores adapted from one."""
+    if isinstance(file_store, SyncFileStoreAdapter):
+        return file_store.file_store
+    return AsyncFileStoreAdapter(file_store)
@@ -9,17 +9,17 @@ from pydantic import TypeAdapter
 from openhands.core.config.openhands_config import OpenHandsConfig
 from openhands.core.logger import openhands_logger as logger
 from openhands.storage import get_file_store
+from openhands.storage.adapters import get_async_file_store
 from openhands.storage.conversation.conversation_store import ConversationStore
 from openhands.storage.data_models.conversation_metadata import ConversationMetadata
 from openhands.storage.data_models.conversation_metadata_result_set import (
     ConversationMetadataResultSet,
 )
-from openhands.storage.files import FileStore
+from openhands.storage.files import AsyncFileStore, FileStore
 from openhands.storage.locations import (
     get_conversation_metadata_filename,
     get_user_dir,
 )
-from openhands.utils.async_utils import call_sync_from_async
 from openhands.utils.search_utils import offset_to_page_id, page_id_to_offset
 
 conversation_metadata_type_adapter = TypeAdapter(ConversationMetadata)
@@ -30,33 +30,28 @@ class FileConversationStore(ConversationStore):
     file_store: FileStore
     user_id: str | None = field(default=None)
 
+    @property
+    def async_file_store(self) -> AsyncFileStore:
+        return get_async_file_store(self.file_store)
+
     async def save_metadata(self, metadata: ConversationMetadata) -> None:
         json_str = conversation_metadata_type_adapter.dump_json(metadata)
         path = self._get_metadata_path(metadata.conversation_id)
-        await call_sync_from_async(self.file_store.write, path, json_str)
+        await self.async_file_store.write(path, json_str)
 
     async def get_metadata(self, conversation_id: str) -> ConversationMetadata:
         path = self._get_metadata_path(conversation_id)
-        json_str = await call_sync_from_async(self.file_store.read, path)
-
-        json_obj = json.loads(json_str)
-        if 'created_at' not in json_obj:
-            raise FileNotFoundError(path)
-
-        if 'github_user_id' in json_obj:
-            json_obj.pop('github_user_id')
-
-        result = conversation_metadata_type_adapter.validate_python(json_obj)
-        return result
+        json_str = await self.async_file_store.read(path)
+        return _parse_metadata(path, json_str)
 
     async def delete_metadata(self, conversation_id: str) -> None:
         path = str(Path(self._get_metadata_path(conversation_id)).parent)
-        await call_sync_from_async(self.file_store.delete, path)
+        await self.async_file_store.delete(path)
 
     async def exists(self, conversation_id: str) -> bool:
         path = self._get_metadata_path(conversation_id)
         try:
-            await call_sync_from_async(self.file_store.read, path)
+            await self.async_file_store.read(path)
             return True
         except FileNotFoundError:
             return False
@@ -77,7 +72,7 @@ class FileConversationStore(ConversationStore):
         try:
             conversation_ids = [
                 Path(path).name
-                for path in self.file_store.list(conversations_dir)
+                for path in await self.async_file_store.list(conversations_dir)
                 if not Path(path).name.startswith('.')
             ]
         except FileNotFoundError:
@@ -85,10 +80,15 @@ class FileConversationStore(ConversationStore):
         num_conversations = len(conversation_ids)
         start = page_id_to_offset(page_id)
         end = min(limit + start, num_conversations)
+        # Read all the metadata files in one batch
+        paths = [self._get_metadata_path(cid) for cid in conversation_ids]
+        contents = await self.async_file_store.read_many(paths, return_exceptions=True)
         conversations = []
-        for conversation_id in conversation_ids:
+        for conversation_id, path, json_str in zip(conversation_ids, paths, contents):
             try:
-                conversations.append(await self.get_metadata(conversation_id))
+                if isinstance(json_str, Exception):
+                    raise json_str
+                conversations.append(_parse_metadata(path, json_str))
             except Exception:
                 logger.warning(
                     f'Could not load conversation metadata: {conversation_id}'
@@ -120,6 +120,17 @@ class FileConversationStore(ConversationStore):
         return FileConversationStore(file_store, user_id)
 
 
+def _parse_metadata(path: str, json_str: str) -> ConversationMetadata:
+    json_obj = json.loads(json_str)
+    if 'created_at' not in json_obj:
+        raise FileNotFoundError(path)
+
+    if 'github_user_id' in json_obj:
+        json_obj.pop('github_user_id')
+
+    return conversation_metadata_type_adapter.validate_python(json_obj)
+
+
 def _sort_key(conversation: ConversationMetadata) -> str:
     created_at = conversation.created_at
     if created_at:
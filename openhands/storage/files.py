@@ -1,7 +1,11 @@
+import asyncio
 from abc import abstractmethod
 
 
 class FileStore:
+    # Whether calls block on I/O, so async callers should run them off the event loop
+    blocking: bool = True
+
     @abstractmethod
     def write(self, path: str, contents: str | bytes) -> None:
         pass
@@ -10,6 +14,27 @@ class FileStore:
     def read(self, path: str) -> str:
         pass
 
+    def read_bytes(self, path: str) -> bytes:
+        """Read a file without decoding it. Stores that keep binary contents override this."""
+        return self.read(path).encode('utf-8')
+
+    def read_many(
+        self, paths: list[str], return_exceptions: bool = False
+    ) -> list[str] | list[str | Exception]:
+        """Read several files, in the order of `paths`. Stores that can read concurrently override this.
+
+        With `return_exceptions`, a file that can't be read yields its exception
+        instead of failing the whole batch, as with `asyncio.gather`.
+        """
+        if not return_exceptions:
+            return [self.read(path) for path in paths]
+        return [self._read_or_exception(path) for path in paths]
+
+    def write_many(self, files: dict[str, str | bytes]) -> None:
+        """Write several files. Stores that can write concurrently override this."""
+        for path, contents in files.items():
+            self.write(path, contents)
+
     @abstractmethod
     def list(self, path: str) -> list[str]:
         pass
@@ -17,3 +42,50 @@ class FileStore:
     @abstractmethod
     def delete(self, path: str) -> None:
         pass
+
+    def _read_or_exception(self, path: str) -> str | Exception:
+        try:
+            return self.read(path)
+        except Exception as e:
+            return e
+
+
+class AsyncFileStore:
+    """The FileStore interface for async callers.
+
+    Batch reads and writes are part of the interface, so a conversation's
+    metadata or a page of events costs one call rather than one per file.
+    """
+
+    @abstractmethod
+    async def write(self, path: str, contents: str | bytes) -> None:
+        pass
+
+    @abstractmethod
+    async def read(self, path: str) -> str:
+        pass
+
+    async def read_bytes(self, path: str) -> bytes:
+        return (await self.read(path)).encode('utf-8')
+
+    async def read_many(
+        self, paths: list[str], return_exceptions: bool = False
+    ) -> list[str] | list[str | Exception]:
+        """Read several files concurrently, in the order of `paths`."""
+        return await asyncio.gather(
+            *(self.read(path) for path in paths), return_exceptions=return_exceptions
+        )
+
+    async def write_many(self, files: dict[str, str | bytes]) -> None:
+        """Write several files concurrently."""
+        await asyncio.gather(
+            *(self.write(path, contents) for path, contents in files.items())
+        )
+
+    @abstractmethod
+    async def list(self, path: str) -> list[str]:
+        pass
+
+    @abstractmethod
+    async def delete(self, path: str) -> None:
+        pass
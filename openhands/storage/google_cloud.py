@@ -35,6 +35,14 @@ class GoogleCloudFileStore(FileStore):
         except NotFound as err:
             raise FileNotFoundError(err)
 
+    def read_bytes(self, path: str) -> bytes:
+        blob: Blob = self.bucket.blob(path)
+        try:
+            with blob.open('rb') as f:
+                return bytes(f.read())
+        except NotFound as err:
+            raise FileNotFoundError(err)
+
     def list(self, path: str) -> list[str]:
         if not path or path == '/':
             path = ''
@@ -50,6 +50,12 @@ def get_conversation_agent_state_filename(sid: str, user_id: str | None = None)
     return f'{get_conversation_dir(sid, user_id)}agent_state.pkl'
 
 
+def get_conversation_agent_state_segment_filename(
+    sid: str, name: str, position: int, user_id: str | None = None
+) -> str:
+    return f'{get_conversation_dir(sid, user_id)}agent_state/{name}-{position}.bin'
+
+
 def get_conversation_llm_registry_filename(sid: str, user_id: str | None = None) -> str:
     return f'{get_conversation_dir(sid, user_id)}llm_registry.json'
 
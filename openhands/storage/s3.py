@@ -1,22 +1,37 @@
 import os
-from typing import Any, TypedDict
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Any, Iterator, NotRequired, Sequence, TypedDict
 
 import boto3
 import botocore
+from botocore.config import Config
 
 from openhands.storage.files import FileStore
 
+# Requests read_many and write_many make at once, and connections kept open
+MAX_CONCURRENCY = 32
+# DeleteObjects accepts at most this many keys per request
+DELETE_BATCH_SIZE = 1000
+
 
 class S3ObjectDict(TypedDict):
     Key: str
 
 
+class S3PrefixDict(TypedDict):
+    Prefix: str
+
+
 class GetObjectOutputDict(TypedDict):
     Body: Any
 
 
 class ListObjectsV2OutputDict(TypedDict):
-    Contents: list[S3ObjectDict] | None
+    Contents: NotRequired[list[S3ObjectDict]]
+    CommonPrefixes: NotRequired[list[S3PrefixDict]]
+    IsTruncated: NotRequired[bool]
+    NextContinuationToken: NotRequired[str]
 
 
 class S3FileStore(FileStore):
@@ -34,7 +49,11 @@ class S3FileStore(FileStore):
             aws_secret_access_key=secret_key,
             endpoint_url=endpoint,
             use_ssl=secure,
+            # boto3 clients are thread safe, one pool serves the concurrent requests
+            config=Config(max_pool_connections=MAX_CONCURRENCY),
         )
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = Lock()
 
     def write(self, path: str, contents: str | bytes) -> None:
         try:
@@ -56,12 +75,15 @@ class S3FileStore(FileStore):
             )
 
     def read(self, path: str) -> str:
+        return self.read_bytes(path).decode('utf-8')
+
+    def read_bytes(self, path: str) -> bytes:
         try:
             response: GetObjectOutputDict = self.client.get_object(
                 Bucket=self.bucket, Key=path
             )
             with response['Body'] as stream:
-                return str(stream.read().decode('utf-8'))
+                return bytes(stream.read())
         except botocore.exceptions.ClientError as e:
             # Catch all S3-related errors
             if e.response['Error']['Code'] == 'NoSuchBucket':
@@ -81,37 +103,36 @@ class S3FileStore(FileStore):
                 f"Error: Failed to read from bucket '{self.bucket}' at path {path}: {e}"
             )
 
+    def read_many(
+        self, paths: list[str], return_exceptions: bool = False
+    ) -> list[str] | list[str | Exception]:
+        if len(paths) <= 1:
+            return super().read_many(paths, return_exceptions)
+        read = self._read_or_exception if return_exceptions else self.read
+        return list(self._get_executor().map(read, paths))
+
+    def write_many(self, files: dict[str, str | bytes]) -> None:
+        if len(files) <= 1:
+            return super().write_many(files)
+        # consume the results, so the first failure is raised
+        list(self._get_executor().map(self.write, files.keys(), files.values()))
+
     def list(self, path: str) -> list[str]:
         if not path or path == '/':
             path = ''
         elif not path.endswith('/'):
             path += '/'
-        # The delimiter logic screens out directories, so we can't use it. :(
-        # For example, given a structure:
-        #   foo/bar/zap.txt
-        #   foo/bar/bang.txt
-        #   ping.txt
-        # prefix=None, delimiter="/"   yields  ["ping.txt"]  # :(
-        # prefix="foo", delimiter="/"  yields  []  # :(
-        results: set[str] = set()
-        prefix_len = len(path)
-        response: ListObjectsV2OutputDict = self.client.list_objects_v2(
-            Bucket=self.bucket, Prefix=path
-        )
-        contents = response.get('Contents')
-        if not contents:
-            return []
-        paths = [obj['Key'] for obj in contents]
-        for sub_path in paths:
-            if sub_path == path:
-                continue
-            try:
-                index = sub_path.index('/', prefix_len + 1)
-                if index != prefix_len:
-                    results.add(sub_path[: index + 1])
-            except ValueError:
-                results.add(sub_path)
-        return list(results)
+        # With a delimiter, S3 returns the files directly under the prefix and
+        # rolls everything deeper up into one common prefix per directory
+        results: list[str] = []
+        for page in self._list_pages(path, delimiter='/'):
+            results.extend(
+                prefix['Prefix'] for prefix in page.get('CommonPrefixes', [])
+            )
+            results.extend(
+                obj['Key'] for obj in page.get('Contents', []) if obj['Key'] != path
+            )
+        return results
 
     def delete(self, path: str) -> None:
         try:
@@ -121,15 +142,14 @@ class S3FileStore(FileStore):
             if path.endswith('/'):
                 path = path[:-1]
 
-            # Try to delete any child resources (Assume the path is a directory)
-            response = self.client.list_objects_v2(
-                Bucket=self.bucket, Prefix=f'{path}/'
-            )
-            for content in response.get('Contents') or []:
-                self.client.delete_object(Bucket=self.bucket, Key=content['Key'])
+            # Delete any child resources (Assume the path is a directory), a
+            # page of keys at a time
+            for page in self._list_pages(f'{path}/' if path else ''):
+                self._delete_keys([obj['Key'] for obj in page.get('Contents', [])])
 
-            # Next try to delete item as a file
-            self.client.delete_object(Bucket=self.bucket, Key=path)
+            # Next delete the item as a file
+            if path:
+                self._delete_keys([path])
 
         except botocore.exceptions.ClientError as e:
             if e.response['Error']['Code'] == 'NoSuchBucket':
@@ -153,6 +173,44 @@ class S3FileStore(FileStore):
                 f"Error: Failed to delete key '{path}' from bucket '{self.bucket}: {e}"
             )
 
+    def _list_pages(
+        self, prefix: str, delimiter: str | None = None
+    ) -> Iterator[ListObjectsV2OutputDict]:
+        """List the objects under a prefix, following continuation tokens."""
+        kwargs: dict[str, Any] = {'Bucket': self.bucket, 'Prefix': prefix}
+        if delimiter:
+            kwargs['Delimiter'] = delimiter
+        while True:
+            response: ListObjectsV2OutputDict = self.client.list_objects_v2(**kwargs)
+            yield response
+            if not response.get('IsTruncated'):
+                return
+            kwargs['ContinuationToken'] = response['NextContinuationToken']
+
+    def _delete_keys(self, keys: Sequence[str]) -> None:
+        for start in range(0, len(keys), DELETE_BATCH_SIZE):
+            batch = keys[start : start + DELETE_BATCH_SIZE]
+            response = self.client.delete_objects(
+                Bucket=self.bucket,
+                Delete={'Objects': [{'Key': key} for key in batch], 'Quiet': True},
+            )
+            # Deleting a key that doesn't exist succeeds, errors are failures
+            errors = response.get('Errors')
+            if errors:
+                raise FileNotFoundError(
+                    f"Error: Failed to delete key '{errors[0]['Key']}' from bucket "
+                    f"'{self.bucket}': {errors[0].get('Message')}"
+                )
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=MAX_CONCURRENCY, thread_name_prefix='s3-file-store'
+                    )
+        return self._executor
+
     def _ensure_url_scheme(self, secure: bool, url: str | None) -> str | None:
         if not url:
             return None
@@ -5,11 +5,11 @@ from dataclasses import dataclass
 
 from openhands.core.config.openhands_config import OpenHandsConfig
 from openhands.storage import get_file_store
+from openhands.storage.adapters import get_async_file_store
 from openhands.storage.data_models.settings import Settings
 from openhands.storage.files import FileStore
 from openhands.storage.locations import get_user_settings_filename
 from openhands.storage.settings.settings_store import SettingsStore
-from openhands.utils.async_utils import call_sync_from_async
 
 
 @dataclass
@@ -19,7 +19,7 @@ class FileSettingsStore(SettingsStore):
 
     async def load(self) -> Settings | None:
         try:
-            json_str = await call_sync_from_async(self.file_store.read, self.path)
+            json_str = await get_async_file_store(self.file_store).read(self.path)
             kwargs = json.loads(json_str)
             settings = Settings(**kwargs)
             return settings
@@ -28,7 +28,7 @@ class FileSettingsStore(SettingsStore):
 
     async def store(self, settings: Settings) -> None:
         json_str = settings.model_dump_json(context={'expose_secrets': True})
-        await call_sync_from_async(self.file_store.write, self.path, json_str)
+        await get_async_file_store(self.file_store).write(self.path, json_str)
 
     @classmethod
     async def get_instance(
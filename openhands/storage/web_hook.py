@@ -59,6 +59,42 @@ class WebHookFileStore(FileStore):
         """
         return self.file_store.read(path)
 
+    def read_bytes(self, path: str) -> bytes:
+        """Read contents from a file without decoding them.
+
+        Args:
+            path: The path to read from
+
+        Returns:
+            The raw contents of the file
+        """
+        return self.file_store.read_bytes(path)
+
+    def read_many(
+        self, paths: list[str], return_exceptions: bool = False
+    ) -> list[str] | list[str | Exception]:
+        """Read several files from the underlying store.
+
+        Args:
+            paths: The paths to read from
+            return_exceptions: Return the error reading a file in its place
+                instead of raising it
+
+        Returns:
+            The contents of the files, in the order of paths
+        """
+        return self.file_store.read_many(paths, return_exceptions)
+
+    def write_many(self, files: dict[str, str | bytes]) -> None:
+        """Write several files and trigger a webhook for each of them.
+
+        Args:
+            files: The contents to write, by path
+        """
+        self.file_store.write_many(files)
+        for path, contents in files.items():
+            EXECUTOR.submit(self._on_write, path, contents)
+
     def list(self, path: str) -> list[str]:
         """List files in a directory.
 
@@ -2,14 +2,36 @@
 
 This is primarily used to localize the most relevant chunks in a file
 for a given query (e.g. edit draft produced by the agent).
+
+Chunks are ranked by the normalized LCS of their text with the query. In
+large files, that is only computed for the chunks that best match the query
+line by line: each line is reduced to a hash of its stripped text, and the
+LCS of these line signatures is computed for all chunks at once, which is
+orders of magnitude cheaper than comparing characters. The chunks and
+signatures of recently searched files are cached by content hash, since an
+edit is often retried on the same file.
 """
 
+import hashlib
+import heapq
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+
+import numpy as np
 from pydantic import BaseModel
+from rapidfuzz import process
 from rapidfuzz.distance import LCSseq
 from tree_sitter_language_pack import get_parser
 
 from openhands.core.logger import openhands_logger as logger
 
+# Chunks kept for the exact comparison, per chunk returned
+CANDIDATES_PER_MATCH = 4
+# Files with at most this many chunks are compared exactly throughout
+MIN_PREFILTER_CANDIDATES = 32
+MAX_CACHED_FILES = 8
+
 
 class Chunk(BaseModel):
     text: str
@@ -71,12 +93,91 @@ def normalized_lcs(chunk: str, query: str) -> float:
     return _score / len(chunk)
 
 
+def _line_signature(text: str) -> list[int]:
+    """The hashes of the non-blank lines of a text, ignoring indentation."""
+    return [hash(line) for line in (line.strip() for line in text.split('\n')) if line]
+
+
+@dataclass
+class _IndexedFile:
+    # The raw string chunks of the file, as (text, line_range)
+    chunks: list[tuple[str, tuple[int, int]]]
+    signatures: list[list[int]]
+
+
+def _index_file(text: str, size: int) -> _IndexedFile:
+    lines = text.split('\n')
+    stripped = [line.strip() for line in lines]
+    hashes = [hash(line) if line else None for line in stripped]
+    chunks = []
+    signatures = []
+    for i in range(0, len(lines), size):
+        chunk_lines = lines[i : i + size]
+        chunks.append(('\n'.join(chunk_lines), (i + 1, i + len(chunk_lines))))
+        signatures.append([h for h in hashes[i : i + size] if h is not None])
+    return _IndexedFile(chunks, signatures)
+
+
+class _ChunkIndexCache:
+    """The chunks of recently searched files and their line signatures."""
+
+    def __init__(self, max_files: int = MAX_CACHED_FILES) -> None:
+        self.max_files = max_files
+        self._files: OrderedDict[tuple[str, int], _IndexedFile] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, text: str, max_chunk_size: int) -> _IndexedFile:
+        key = (hashlib.sha256(text.encode('utf-8')).hexdigest(), max_chunk_size)
+        with self._lock:
+            indexed = self._files.get(key)
+            if indexed is not None:
+                self._files.move_to_end(key)
+                return indexed
+        indexed = _index_file(text, max_chunk_size)
+        with self._lock:
+            self._files[key] = indexed
+            while len(self._files) > self.max_files:
+                self._files.popitem(last=False)
+        return indexed
+
+
+_chunk_index_cache = _ChunkIndexCache()
+
+
+def _prefilter(indexed: _IndexedFile, query: str, limit: int) -> list[int] | None:
+    """The indices of the chunks that best match the query line by line.
+
+    Returns None if no line of the query is in the file, so there is nothing
+    to rank the chunks by.
+    """
+    query_signature = _line_signature(query)
+    if not query_signature:
+        return None
+    matched_lines = process.cdist(
+        [query_signature],
+        indexed.signatures,
+        scorer=LCSseq.similarity,
+        dtype=np.int32,
+        workers=-1,
+    )[0]
+    if not matched_lines.any():
+        return None
+    line_counts = np.array([max(len(s), 1) for s in indexed.signatures])
+    scores = matched_lines / line_counts
+    best = np.argpartition(-scores, limit - 1)[:limit]
+    # Best first, so the exact comparison can cut the others short sooner
+    return best[np.argsort(-scores[best], kind='stable')].tolist()
+
+
 def get_top_k_chunk_matches(
     text: str, query: str, k: int = 3, max_chunk_size: int = 100
 ) -> list[Chunk]:
     """Get the top k chunks in the text that match the query.
 
-    The query could be a string of draft code edits.
+    The query could be a string of draft code edits. Chunks with the same
+    score are returned in the order they appear in the text. In files with
+    many chunks, only those that best match the query line by line are
+    scored.
 
     Args:
         text: The text to search for the query.
@@ -84,18 +185,38 @@ def get_top_k_chunk_matches(
         k: The number of top chunks to return.
         max_chunk_size: The maximum number of lines in a chunk.
     """
-    raw_chunks = create_chunks(text, max_chunk_size)
-    chunks_with_lcs: list[Chunk] = [
+    indexed = _chunk_index_cache.get(text, max_chunk_size)
+    chunks = indexed.chunks
+    if k <= 0 or not chunks:
+        return []
+
+    candidates: list[int] | None = None
+    limit = max(CANDIDATES_PER_MATCH * k, MIN_PREFILTER_CANDIDATES)
+    if len(chunks) > limit:
+        candidates = _prefilter(indexed, query, limit)
+    if candidates is None:
+        candidates = list(range(len(chunks)))
+
+    # The k best (score, -index) so far, the worst first: ties go to earlier chunks
+    top: list[tuple[float, int]] = []
+    for index in candidates:
+        chunk_text = chunks[index][0]
+        score = 0.0
+        if chunk_text:
+            # Once there are k chunks, the LCS is cut short below the worst of them
+            cutoff = int(top[0][0] * len(chunk_text)) if len(top) == k else 0
+            similarity = LCSseq.similarity(chunk_text, query, score_cutoff=cutoff)
+            score = similarity / len(chunk_text)
+        if len(top) < k:
+            heapq.heappush(top, (score, -index))
+        else:
+            heapq.heappushpop(top, (score, -index))
+
+    return [
         Chunk(
-            text=chunk.text,
-            line_range=chunk.line_range,
-            normalized_lcs=normalized_lcs(chunk.text, query),
+            text=chunks[-neg_index][0],
+            line_range=chunks[-neg_index][1],
+            normalized_lcs=score,
         )
-        for chunk in raw_chunks
+        for score, neg_index in sorted(top, reverse=True)
     ]
-    sorted_chunks = sorted(
-        chunks_with_lcs,
-        key=lambda x: x.normalized_lcs,  # type: ignore
-        reverse=True,
-    )
-    return sorted_chunks[:k]
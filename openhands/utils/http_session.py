@@ -1,7 +1,10 @@
+import asyncio
 import ssl
 from dataclasses import dataclass, field
+from http.cookiejar import CookieJar, DefaultCookiePolicy
 from threading import Lock
 from typing import MutableMapping
+from weakref import WeakKeyDictionary
 
 import httpx
 
@@ -10,6 +13,9 @@ from openhands.core.logger import openhands_logger as logger
 _client_lock = Lock()
 _verify_certificates: bool = True
 _client: httpx.Client | None = None
+_async_clients: WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+    WeakKeyDictionary()
+)
 
 
 def httpx_verify_option() -> ssl.SSLContext | bool:
@@ -31,6 +37,25 @@ def _get_client() -> httpx.Client:
     return _client
 
 
+def get_async_client() -> httpx.AsyncClient:
+    """Return the AsyncClient shared by all callers on the running event loop.
+
+    Reusing it keeps connections (and their TLS sessions) alive between
+    requests. Connections belong to the loop they were opened on, so each loop
+    gets its own client. Callers must not close it. Cookies are never stored,
+    as they would be sent on every other caller's requests.
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            verify=httpx_verify_option(),
+            cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+        )
+        _async_clients[loop] = client
+    return client
+
+
 @dataclass
 class HttpSession:
     """request.Session is reusable after it has been closed. This behavior makes it
@@ -41,7 +66,7 @@ class HttpSession:
     _is_closed: bool = False
     headers: MutableMapping[str, str] = field(default_factory=dict)
 
-    def request(self, *args, **kwargs):
+    def request(self, *args, stream: bool = False, **kwargs):
         if self._is_closed:
             logger.error(
                 'Session is being used after close!', stack_info=True, exc_info=True
@@ -51,7 +76,11 @@ class HttpSession:
         headers = {**self.headers, **headers}
         kwargs['headers'] = headers
         logger.debug(f'HttpSession:request called with args {args} and kwargs {kwargs}')
-        return _get_client().request(*args, **kwargs)
+        client = _get_client()
+        if stream:
+            # The caller reads the body as it arrives and must close the response
+            return client.send(client.build_request(*args, **kwargs), stream=True)
+        return client.request(*args, **kwargs)
 
     def stream(self, *args, **kwargs):
         if self._is_closed:
@@ -175,13 +175,22 @@ class PromptManager:
             None,
         )
         if latest_user_message and lumio_settings:
-            mode = lumio_settings.get('mode', 'development')
-            skip_tests = lumio_settings.get('skip_tests', False)
-            reminder_text = f"""
+            latest_user_message.content.append(
+                TextContent(text=self.build_lumio_settings_reminder(lumio_settings))
+            )
+
+    def build_lumio_settings_reminder(self, lumio_settings: dict) -> str:
+        """Renders the reminder of the current Lumio settings.
+
+        Args:
+            lumio_settings: Dict with 'mode' and 'skip_tests' keys
+        """
+        mode = lumio_settings.get('mode', 'development')
+        skip_tests = lumio_settings.get('skip_tests', False)
+        return f"""
 
 <LUMIO_SETTINGS_STATE>
 Current Mode: {mode}
 Skip Tests: {skip_tests}
 ⚠️ These are the ACTIVE settings. Follow the rules for this mode!
 </LUMIO_SETTINGS_STATE>"""
-            latest_user_message.content.append(TextContent(text=reminder_text))
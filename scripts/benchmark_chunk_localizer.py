@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Benchmark localizing edit drafts in large files with get_top_k_chunk_matches.
+
+Generates a Python file of the given number of lines and edit drafts that
+rewrite a window of it (changing some lines, reindenting and adding others),
+the way an LLM edit that is too long gets localized. It times the first
+search in the file and the retries that follow, and reports how often the
+best match is in the window the draft was taken from, and how often it
+scores as high as the best chunk of an exhaustive search.
+
+Usage:
+    python scripts/benchmark_chunk_localizer.py [--lines N] [--draft-lines N]
+        [--drafts N] [--retries N] [--baseline-ref REF]
+
+With --baseline-ref, openhands/utils/chunk_localizer.py as of that git
+revision is benchmarked as well, for a before/after comparison:
+
+    python scripts/benchmark_chunk_localizer.py --baseline-ref HEAD~1
+"""
+
+import argparse
+import random
+import subprocess
+import sys
+import time
+import types
+
+LOCALIZER_PATH = 'openhands/utils/chunk_localizer.py'
+CHUNK_SIZE = 20  # lines, as used by the LLM-based file editor
+TOP_K = 3
+
+
+def load_localizer_module(ref: str | None) -> types.ModuleType:
+    if ref is None:
+        from openhands.utils import chunk_localizer
+
+        return chunk_localizer
+    source = subprocess.run(
+        ['git', 'show', f'{ref}:{LOCALIZER_PATH}'],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    name = f'_chunk_localizer_at_{ref}'
+    module = types.ModuleType(name)
+    module.__file__ = f'{ref}:{LOCALIZER_PATH}'
+    sys.modules[name] = module
+    exec(compile(source, module.__file__, 'exec'), module.__dict__)
+    return module
+
+
+def generate_file(lines: int, rng: random.Random) -> list[str]:
+    """A generated module: many similar classes, like generated code tends to be."""
+    out: list[str] = []
+    i = 0
+    while len(out) < lines:
+        field = rng.choice(['name', 'value', 'items', 'config', 'state'])
+        out += [
+            f'class Model{i}(BaseModel):',
+            f'    """Model {i} of the generated schema."""',
+            '',
+            f'    {field}_{i}: int = {rng.randint(0, 1000)}',
+            f'    label: str = "model-{i}"',
+            '',
+            f'    def validate_{field}(self, value: int) -> int:',
+            f'        if value < {rng.randint(0, 100)}:',
+            f'            raise ValueError("{field} too small")',
+            '        return value',
+            '',
+        ]
+        i += 1
+    return out[:lines]
+
+
+def make_draft(lines: list[str], start: int, length: int, rng: random.Random) -> str:
+    draft = []
+    for line in lines[start : start + length]:
+        roll = rng.random()
+        if roll < 0.1:
+            draft.append(line.replace('int', 'float'))
+        elif roll < 0.15:
+            draft.append('    ' + line)
+        else:
+            draft.append(line)
+        if roll > 0.97:
+            draft.append('        # TODO: check bounds')
+    return '\n'.join(draft)
+
+
+def run_benchmark(
+    module: types.ModuleType, lines: int, draft_lines: int, drafts: int, retries: int
+) -> None:
+    rng = random.Random(0)
+    file_lines = generate_file(lines, rng)
+    text = '\n'.join(file_lines)
+    first = retry = 0.0
+    hits = exact = 0
+    for _ in range(drafts):
+        # Start the draft at a chunk boundary, so its chunk is the right answer
+        start = rng.randrange(0, lines - draft_lines) // CHUNK_SIZE * CHUNK_SIZE
+        draft = make_draft(file_lines, start, draft_lines, rng)
+        # A file that was not searched before
+        text += ' '
+        begin = time.perf_counter()
+        matches = module.get_top_k_chunk_matches(text, draft, TOP_K, CHUNK_SIZE)
+        first += time.perf_counter() - begin
+        for _ in range(retries):
+            begin = time.perf_counter()
+            module.get_top_k_chunk_matches(text, draft, TOP_K, CHUNK_SIZE)
+            retry += time.perf_counter() - begin
+        best_start = matches[0].line_range[0] - 1
+        hits += start <= best_start < start + draft_lines
+        best_score = max(
+            module.normalized_lcs(chunk.text, draft)
+            for chunk in module.create_chunks(text, CHUNK_SIZE)
+        )
+        exact += matches[0].normalized_lcs == best_score
+
+    print(f'    first search           {first / drafts * 1000:10.1f} ms')
+    if retries:
+        print(f'    retry                  {retry / drafts / retries * 1000:10.1f} ms')
+    print(f'    best match in draft    {hits:7d} of {drafts}')
+    print(f'    best score is exact    {exact:7d} of {drafts}')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--lines', type=int, default=10_000)
+    parser.add_argument('--draft-lines', type=int, default=40)
+    parser.add_argument('--drafts', type=int, default=20)
+    parser.add_argument('--retries', type=int, default=2)
+    parser.add_argument(
+        '--baseline-ref',
+        help='Also benchmark the chunk localizer at this git revision',
+    )
+    args = parser.parse_args()
+
+    variants = [('current', None)]
+    if args.baseline_ref:
+        variants.insert(0, (args.baseline_ref, args.baseline_ref))
+
+    for label, ref in variants:
+        print(f'{label}:')
+        run_benchmark(
+            load_localizer_module(ref),
+            args.lines,
+            args.draft_lines,
+            args.drafts,
+            args.retries,
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Benchmark the HTTP middleware stack of the OpenHands server.
+
+Drives requests straight through the ASGI interface (no sockets) of a trivial
+app wrapped in the same middleware as openhands/server/listen.py, spread over a
+number of distinct client addresses, and prints the requests/sec achieved.
+The rate limit is set high enough that no request is throttled, so the numbers
+reflect middleware overhead only.
+
+Usage:
+    python scripts/benchmark_middleware.py [--requests N] [--clients N]
+        [--concurrency N] [--baseline-ref REF]
+
+With --baseline-ref, openhands/server/middleware.py as of that git revision is
+benchmarked as well, for a before/after comparison:
+
+    python scripts/benchmark_middleware.py --baseline-ref HEAD~1
+"""
+
+import argparse
+import asyncio
+import subprocess
+import sys
+import time
+import types
+
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+MIDDLEWARE_PATH = 'openhands/server/middleware.py'
+
+
+def load_middleware_module(ref: str | None) -> types.ModuleType:
+    if ref is None:
+        from openhands.server import middleware
+
+        return middleware
+    source = subprocess.run(
+        ['git', 'show', f'{ref}:{MIDDLEWARE_PATH}'],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    name = f'_middleware_at_{ref}'
+    module = types.ModuleType(name)
+    module.__file__ = f'{ref}:{MIDDLEWARE_PATH}'
+    # Needed for dataclasses defined in the module
+    sys.modules[name] = module
+    exec(compile(source, module.__file__, 'exec'), module.__dict__)
+    return module
+
+
+def build_app(middleware: types.ModuleType) -> Starlette:
+    async def ping(request):
+        return PlainTextResponse('pong')
+
+    app = Starlette(routes=[Route('/api/ping', ping)])
+    app.add_middleware(middleware.LocalhostCORSMiddleware)
+    app.add_middleware(middleware.CacheControlMiddleware)
+    app.add_middleware(middleware.TokenRateLimitMiddleware)
+    app.add_middleware(
+        middleware.RateLimitMiddleware,
+        rate_limiter=middleware.InMemoryRateLimiter(requests=10**9, seconds=1),
+    )
+    return app
+
+
+async def send_request(app: Starlette, client_host: str) -> int:
+    scope = {
+        'type': 'http',
+        'asgi': {'version': '3.0'},
+        'http_version': '1.1',
+        'method': 'GET',
+        'scheme': 'http',
+        'path': '/api/ping',
+        'raw_path': b'/api/ping',
+        'root_path': '',
+        'query_string': b'',
+        'headers': [(b'host', b'localhost:3000')],
+        'client': (client_host, 40000),
+        'server': ('localhost', 3000),
+    }
+    request_sent = False
+    disconnected = asyncio.Event()
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {'type': 'http.request', 'body': b'', 'more_body': False}
+        await disconnected.wait()
+        return {'type': 'http.disconnect'}
+
+    status = 0
+
+    async def send(message):
+        nonlocal status
+        if message['type'] == 'http.response.start':
+            status = message['status']
+
+    await app(scope, receive, send)
+    disconnected.set()
+    return status
+
+
+async def run_benchmark(
+    app: Starlette, total: int, clients: int, concurrency: int
+) -> float:
+    hosts = [f'10.{(i >> 16) & 255}.{(i >> 8) & 255}.{i & 255}' for i in range(clients)]
+    start = time.perf_counter()
+    for batch_start in range(0, total, concurrency):
+        batch = range(batch_start, min(total, batch_start + concurrency))
+        statuses = await asyncio.gather(
+            *(send_request(app, hosts[i % clients]) for i in batch)
+        )
+        if any(status != 200 for status in statuses):
+            raise RuntimeError(f'Unexpected response status in {set(statuses)}')
+    return total / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--requests', type=int, default=20_000)
+    parser.add_argument('--clients', type=int, default=1_000)
+    parser.add_argument('--concurrency', type=int, default=50)
+    parser.add_argument(
+        '--baseline-ref',
+        help='Also benchmark the middleware at this git revision',
+    )
+    args = parser.parse_args()
+
+    variants = [('current', None)]
+    if args.baseline_ref:
+        variants.insert(0, (args.baseline_ref, args.baseline_ref))
+
+    for label, ref in variants:
+        app = build_app(load_middleware_module(ref))
+        # Warm up, then measure on the same app so rate limiter state persists
+        asyncio.run(run_benchmark(app, 1_000, args.clients, args.concurrency))
+        rps = asyncio.run(
+            run_benchmark(app, args.requests, args.clients, args.concurrency)
+        )
+        print(f'{label:>20}: {rps:10.0f} requests/sec')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Benchmark S3FileStore on a conversation with many events.
+
+Runs the store against an in-process stand-in for S3 that adds a fixed latency
+to every request and, like S3, returns at most 1000 keys per listing page and
+deletes at most 1000 keys per DeleteObjects request. It fills a conversation
+with events, then times listing the events directory, reading a window of
+events and deleting the conversation, and prints how many keys each operation
+actually covered.
+
+Usage:
+    python scripts/benchmark_s3_file_store.py [--events N] [--reads N]
+        [--latency-ms MS] [--baseline-ref REF]
+
+With --baseline-ref, openhands/storage/s3.py as of that git revision is
+benchmarked as well, for a before/after comparison:
+
+    python scripts/benchmark_s3_file_store.py --baseline-ref HEAD~1
+"""
+
+import argparse
+import bisect
+import io
+import subprocess
+import sys
+import threading
+import time
+import types
+from typing import Any
+from unittest.mock import patch
+
+S3_PATH = 'openhands/storage/s3.py'
+PAGE_SIZE = 1000
+CONVERSATION_DIR = 'users/user/conversations/conversation'
+
+
+class FakeS3Client:
+    """The subset of the boto3 S3 client used by S3FileStore, kept in memory."""
+
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+        self.requests = 0
+        self._objects: dict[str, bytes] = {}
+        self._keys: list[str] = []
+        self._lock = threading.Lock()
+
+    def _request(self) -> None:
+        with self._lock:
+            self.requests += 1
+        time.sleep(self.latency)
+
+    def put_object(self, Bucket: str, Key: str, Body: bytes) -> None:
+        self._request()
+        with self._lock:
+            if Key not in self._objects:
+                bisect.insort(self._keys, Key)
+            self._objects[Key] = Body
+
+    def get_object(self, Bucket: str, Key: str) -> dict[str, Any]:
+        self._request()
+        return {'Body': io.BytesIO(self._objects[Key])}
+
+    def list_objects_v2(
+        self,
+        Bucket: str,
+        Prefix: str = '',
+        Delimiter: str | None = None,
+        ContinuationToken: str | None = None,
+    ) -> dict[str, Any]:
+        self._request()
+        index = bisect.bisect_left(self._keys, max(Prefix, ContinuationToken or ''))
+        if ContinuationToken is not None and index < len(self._keys):
+            index += self._keys[index] == ContinuationToken
+        contents: list[dict[str, str]] = []
+        prefixes: list[dict[str, str]] = []
+        last = None
+        while index < len(self._keys) and len(contents) + len(prefixes) < PAGE_SIZE:
+            key = self._keys[index]
+            if not key.startswith(Prefix):
+                break
+            cut = key.find(Delimiter, len(Prefix)) if Delimiter else -1
+            if cut == -1:
+                contents.append({'Key': key})
+                last = key
+                index += 1
+            else:
+                # Roll the whole directory up into one common prefix
+                prefix = key[: cut + 1]
+                prefixes.append({'Prefix': prefix})
+                last = prefix + '\U0010ffff'
+                index = bisect.bisect_left(self._keys, last)
+        response: dict[str, Any] = {'Contents': contents, 'CommonPrefixes': prefixes}
+        if index < len(self._keys) and self._keys[index].startswith(Prefix):
+            response['IsTruncated'] = True
+            response['NextContinuationToken'] = last
+        return response
+
+    def delete_object(self, Bucket: str, Key: str) -> None:
+        self._request()
+        self._remove([Key])
+
+    def delete_objects(self, Bucket: str, Delete: dict[str, Any]) -> dict[str, Any]:
+        self._request()
+        if len(Delete['Objects']) > PAGE_SIZE:
+            raise ValueError('DeleteObjects accepts at most 1000 keys')
+        self._remove([obj['Key'] for obj in Delete['Objects']])
+        return {}
+
+    def _remove(self, keys: list[str]) -> None:
+        with self._lock:
+            for key in keys:
+                if self._objects.pop(key, None) is not None:
+                    self._keys.pop(bisect.bisect_left(self._keys, key))
+
+
+def load_s3_module(ref: str | None) -> types.ModuleType:
+    if ref is None:
+        from openhands.storage import s3
+
+        return s3
+    source = subprocess.run(
+        ['git', 'show', f'{ref}:{S3_PATH}'],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    name = f'_s3_at_{ref}'
+    module = types.ModuleType(name)
+    module.__file__ = f'{ref}:{S3_PATH}'
+    sys.modules[name] = module
+    exec(compile(source, module.__file__, 'exec'), module.__dict__)
+    return module
+
+
+def timed(label: str, fn, describe) -> None:
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    print(f'    {label:<24} {elapsed * 1000:10.1f} ms   {describe(result)}')
+
+
+def run_benchmark(module: types.ModuleType, events: int, reads: int, latency: float):
+    client = FakeS3Client(latency=0)
+    with patch('boto3.client', lambda service, **kwargs: client):
+        store = module.S3FileStore('bucket')
+
+    # Fill the conversation without latency, it is not what is measured
+    events_dir = f'{CONVERSATION_DIR}/events'
+    for i in range(events):
+        client.put_object('bucket', f'{events_dir}/{i}.json', b'{"id": %d}' % i)
+    client.put_object('bucket', f'{CONVERSATION_DIR}/metadata.json', b'{}')
+    client.latency = latency
+
+    timed(
+        'list events',
+        lambda: store.list(events_dir),
+        lambda paths: f'{len(paths)} of {events} events listed',
+    )
+    paths = [f'{events_dir}/{i}.json' for i in range(events - reads, events)]
+    # Stores without read_many read one file after another
+    read_many = getattr(
+        store, 'read_many', lambda paths: [store.read(p) for p in paths]
+    )
+    timed(
+        f'read {reads} events',
+        lambda: read_many(paths),
+        lambda contents: f'{len(contents)} events read',
+    )
+    client.requests = 0
+    timed(
+        'delete conversation',
+        lambda: store.delete(CONVERSATION_DIR),
+        lambda _: f'{events + 1 - len(client._keys)} of {events + 1} keys deleted '
+        f'in {client.requests} requests',
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--events', type=int, default=50_000)
+    parser.add_argument('--reads', type=int, default=1_000)
+    parser.add_argument('--latency-ms', type=float, default=5.0)
+    parser.add_argument(
+        '--baseline-ref',
+        help='Also benchmark the S3 file store at this git revision',
+    )
+    args = parser.parse_args()
+
+    variants = [('current', None)]
+    if args.baseline_ref:
+        variants.insert(0, (args.baseline_ref, args.baseline_ref))
+
+    for label, ref in variants:
+        print(f'{label}:')
+        run_benchmark(
+            load_s3_module(ref), args.events, args.reads, args.latency_ms / 1000
+        )
+
+
+if __name__ == '__main__':
+    main()
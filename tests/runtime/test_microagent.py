@@ -406,7 +406,7 @@ async def test_add_mcp_tools_from_microagents():
     mock_runtime.runtime_initialized = True
     mock_runtime.get_mcp_config.return_value = mock_microagent_mcp_config
 
-    # Mock the fetch_mcp_tools_from_config function to return a mock tool
+    # Mock the fetch_mcp_tools_from_config_cached function to return a mock tool
     mock_tool = {
         'type': 'function',
         'function': {
@@ -417,7 +417,7 @@ async def test_add_mcp_tools_from_microagents():
     }
 
     with patch(
-        'openhands.mcp.utils.fetch_mcp_tools_from_config',
+        'openhands.mcp.utils.fetch_mcp_tools_from_config_cached',
         new=AsyncMock(return_value=[mock_tool]),
     ):
         # Call the function with the OpenHandsConfig instead of MCPConfig
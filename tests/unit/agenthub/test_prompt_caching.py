@@ -89,12 +89,14 @@ def test_get_messages(codeact_agent: CodeActAgent):
     assert messages[0].content[0].cache_prompt  # system message should be cached
     assert messages[1].role == 'user'
     assert messages[1].content[0].text.endswith('Initial user message')
-    # we add cache breakpoint to only the last user message
-    assert not messages[1].content[0].cache_prompt
+    # the initial user turn survives condensation, so it is a breakpoint
+    assert messages[1].content[0].cache_prompt
+    assert not messages[2].content[0].cache_prompt
 
     assert messages[3].role == 'user'
     assert messages[3].content[0].text == ('Hello, agent!')
-    assert not messages[3].content[0].cache_prompt
+    # where the previous request ended, to read its cached prefix back
+    assert messages[3].content[0].cache_prompt
     assert messages[4].role == 'assistant'
     assert messages[4].content[0].text == 'Hello, user!'
     assert not messages[4].content[0].cache_prompt
@@ -124,16 +126,13 @@ def test_get_messages_prompt_caching(codeact_agent: CodeActAgent):
     codeact_agent.reset()
     messages = codeact_agent._get_messages(history, initial_user_message)
 
-    # Check that only the last two user messages have cache_prompt=True
-    cached_user_messages = [
-        msg
-        for msg in messages
-        if msg.role in ('user', 'system') and msg.content[0].cache_prompt
-    ]
+    # Check that only the planned breakpoints have cache_prompt=True
+    cached_messages = [msg for msg in messages if msg.content[0].cache_prompt]
     assert (
-        len(cached_user_messages) == 2
-    )  # Including the initial system message + last user message
+        len(cached_messages) == 4
+    )  # System message, initial user message, previous and last user message
 
-    # Verify that these are indeed the last user message (from start)
-    assert cached_user_messages[0].content[0].text.startswith('You are OpenHands agent')
-    assert cached_user_messages[1].content[0].text.startswith('User message 14')
+    assert cached_messages[0].content[0].text.startswith('You are OpenHands agent')
+    assert cached_messages[1].content[0].text.startswith('User message 0')
+    assert cached_messages[2].content[0].text.startswith('User message 13')
+    assert cached_messages[3].content[0].text.startswith('User message 14')
@@ -0,0 +1,164 @@
+"""Tests for FilesystemEventService and its per-conversation event index."""
+
+import threading
+import time
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from openhands.agent_server.models import EventSortOrder
+from openhands.app_server.event import filesystem_event_index
+from openhands.app_server.event.filesystem_event_service import (
+    FilesystemEventService,
+)
+from openhands.sdk.event import ConversationStateUpdateEvent, PauseEvent
+
+
+@pytest.fixture
+def service(tmp_path) -> FilesystemEventService:
+    app_conversation_info_service = MagicMock()
+    app_conversation_info_service.get_app_conversation_info = AsyncMock(
+        return_value=MagicMock()
+    )
+    return FilesystemEventService(
+        app_conversation_info_service=app_conversation_info_service,
+        events_dir=tmp_path,
+    )
+
+
+def _make_events(count: int) -> list:
+    start = datetime(2025, 1, 1, 12, 0, 0)
+    events = []
+    for i in range(count):
+        timestamp = (start + timedelta(seconds=i)).isoformat()
+        if i % 2:
+            events.append(PauseEvent(timestamp=timestamp))
+        else:
+            events.append(
+                ConversationStateUpdateEvent(key='step', value=i, timestamp=timestamp)
+            )
+    return events
+
+
+async def _collect_pages(service, conversation_id, sort_order, limit, **kwargs):
+    ids = []
+    page_id = None
+    while True:
+        page = await service.search_events(
+            conversation_id__eq=conversation_id,
+            sort_order=sort_order,
+            page_id=page_id,
+            limit=limit,
+            **kwargs,
+        )
+        ids.extend(event.id for event in page.items)
+        page_id = page.next_page_id
+        if page_id is None:
+            return ids
+
+
+class TestFilesystemEventService:
+    async def test_pagination_returns_every_event_once(self, service):
+        conversation_id = uuid4()
+        events = _make_events(7)
+        await service.save_events(conversation_id, events)
+
+        ascending = await _collect_pages(
+            service, conversation_id, EventSortOrder.TIMESTAMP, limit=3
+        )
+        descending = await _collect_pages(
+            service, conversation_id, EventSortOrder.TIMESTAMP_DESC, limit=3
+        )
+
+        assert ascending == [event.id for event in events]
+        assert descending == [event.id for event in reversed(events)]
+
+    async def test_count_and_filters_use_index(self, service):
+        conversation_id = uuid4()
+        events = _make_events(6)
+        await service.save_events(conversation_id, events)
+
+        assert await service.count_events(conversation_id__eq=conversation_id) == 6
+        assert (
+            await service.count_events(
+                conversation_id__eq=conversation_id, kind__eq='PauseEvent'
+            )
+            == 3
+        )
+        assert (
+            await service.count_events(
+                conversation_id__eq=conversation_id,
+                timestamp__gte=datetime(2025, 1, 1, 12, 0, 2),
+                timestamp__lt=datetime(2025, 1, 1, 12, 0, 4, 500000),
+            )
+            == 3
+        )
+
+        page = await service.search_events(
+            conversation_id__eq=conversation_id, kind__eq='PauseEvent', limit=10
+        )
+        assert [event.id for event in page.items] == [e.id for e in events[1::2]]
+
+    async def test_index_is_rebuilt_for_existing_directories(self, service):
+        conversation_id = uuid4()
+        await service.save_events(conversation_id, _make_events(4))
+        conversation_dir = service.events_dir / str(conversation_id)
+
+        # Simulate a directory written before indexes existed
+        (conversation_dir / filesystem_event_index.INDEX_FILENAME).unlink()
+        filesystem_event_index._indexes.clear()
+
+        assert await service.count_events(conversation_id__eq=conversation_id) == 4
+        assert (conversation_dir / filesystem_event_index.INDEX_FILENAME).exists()
+
+        assert filesystem_event_index.rebuild_all_indexes(service.events_dir) == 1
+
+    async def test_inaccessible_conversation_returns_nothing(self, service):
+        conversation_id = uuid4()
+        await service.save_events(conversation_id, _make_events(2))
+        service.app_conversation_info_service.get_app_conversation_info.return_value = (
+            None
+        )
+
+        page = await service.search_events(conversation_id__eq=conversation_id)
+        assert page.items == []
+        assert await service.count_events(conversation_id__eq=conversation_id) == 0
+
+
+def test_concurrent_first_saves_are_all_indexed(tmp_path, monkeypatch):
+    scan = filesystem_event_index._scan_event_names
+
+    def slow_scan(conversation_dir):
+        names = scan(conversation_dir)
+        time.sleep(0.01)
+        return names
+
+    # Widen the window between listing the files and publishing the manifest
+    monkeypatch.setattr(filesystem_event_index, '_scan_event_names', slow_scan)
+    conversation_dir = tmp_path / 'conversation'
+    conversation_dir.mkdir()
+    names = [f'20250101120000_PauseEvent_{i:032x}' for i in range(32)]
+    barrier = threading.Barrier(len(names))
+
+    errors = []
+
+    def save(name):
+        barrier.wait()
+        try:
+            (conversation_dir / name).write_text('{}')
+            filesystem_event_index.add_to_index(conversation_dir, name)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=save, args=(name,)) for name in names]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    manifest = conversation_dir / filesystem_event_index.INDEX_FILENAME
+    assert sorted(set(manifest.read_text().split())) == names
+    assert [p.name for p in conversation_dir.iterdir() if p.suffix == '.tmp'] == []
@@ -653,3 +653,40 @@ class TestSQLEventCallbackService:
         retrieved_callback = await service.get_event_callback(sample_callback.id)
         assert retrieved_callback is not None
         assert retrieved_callback.id == sample_callback.id
+
+    async def test_execute_callbacks_batch_routes_events_by_kind(
+        self,
+        service: SQLEventCallbackService,
+        sample_request: CreateEventCallbackRequest,
+    ):
+        """Test that a batch loads callbacks once and routes events by kind."""
+        from unittest.mock import MagicMock
+
+        from sqlalchemy import select
+
+        from openhands.app_server.event_callback.sql_event_callback_service import (
+            StoredEventCallbackResult,
+        )
+
+        kind_callback = await service.create_event_callback(sample_request)
+        any_kind_callback = await service.create_event_callback(
+            CreateEventCallbackRequest(
+                conversation_id=sample_request.conversation_id,
+                processor=LoggingCallbackProcessor(),
+            )
+        )
+
+        events = []
+        for kind in ('ActionEvent', 'MessageEvent', 'ActionEvent'):
+            event = MagicMock()
+            event.kind = kind
+            event.id = str(uuid4())
+            events.append(event)
+
+        await service.execute_callbacks_batch(sample_request.conversation_id, events)
+
+        result = await service.db_session.execute(select(StoredEventCallbackResult))
+        stored_results = result.scalars().all()
+        callback_ids = [r.event_callback_id for r in stored_results]
+        assert callback_ids.count(kind_callback.id) == 2
+        assert callback_ids.count(any_kind_callback.id) == 3
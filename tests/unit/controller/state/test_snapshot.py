@@ -0,0 +1,135 @@
+import base64
+import pickle
+
+from openhands.controller.state.snapshot import (
+    METRICS_SEGMENT_SIZE,
+    is_snapshot,
+)
+from openhands.controller.state.state import State
+from openhands.core.schema import AgentState
+from openhands.llm.metrics import Metrics, TokenUsage
+from openhands.storage.locations import get_conversation_agent_state_filename
+from openhands.storage.memory import InMemoryFileStore
+
+
+class _RecordingFileStore(InMemoryFileStore):
+    def __init__(self) -> None:
+        super().__init__()
+        self.written: list[str] = []
+
+    def write(self, path: str, contents: str | bytes) -> None:
+        self.written.append(path)
+        super().write(path, contents)
+
+
+def _metrics(calls: int) -> Metrics:
+    metrics = Metrics('gpt-4o')
+    for i in range(calls):
+        _add_call(metrics, i)
+    return metrics
+
+
+def _add_call(metrics: Metrics, i: int) -> None:
+    metrics.add_cost(0.01)
+    metrics.add_response_latency(0.5, f'resp-{i}')
+    metrics.add_token_usage(1000 + i, 50, 800, 100, 128000, f'resp-{i}')
+
+
+def _state(calls: int) -> State:
+    return State(
+        session_id='sid',
+        agent_state=AgentState.RUNNING,
+        metrics=_metrics(calls),
+        extra_data={'condenser_meta': [{'step': 1}], 'pair': (1, 'a')},
+    )
+
+
+def test_snapshot_round_trip():
+    state = _state(calls=3)
+    state.parent_metrics_snapshot = state.metrics.copy()
+    store = InMemoryFileStore()
+
+    state.save_to_session('sid', store, None)
+    data = store.read_bytes(get_conversation_agent_state_filename('sid'))
+    assert is_snapshot(data)
+
+    restored = State.restore_from_session('sid', store, None)
+    assert restored.session_id == 'sid'
+    assert restored.agent_state == AgentState.LOADING
+    assert restored.resume_state == AgentState.RUNNING
+    assert restored.extra_data == state.extra_data
+    assert restored.iteration_flag == state.iteration_flag
+    assert restored.metrics.get() == state.metrics.get()
+    assert restored.parent_metrics_snapshot.get() == state.metrics.get()
+
+
+def test_restore_legacy_pickle():
+    state = _state(calls=3)
+    store = InMemoryFileStore()
+    store.write(
+        get_conversation_agent_state_filename('sid', 'user'),
+        base64.b64encode(pickle.dumps(state)).decode('utf-8'),
+    )
+
+    restored = State.restore_from_session('sid', store, 'user')
+    assert restored.metrics.get() == state.metrics.get()
+    assert restored.resume_state == AgentState.RUNNING
+
+    # Saving again converts it to a snapshot
+    restored.save_to_session('sid', store, 'user')
+    assert is_snapshot(
+        store.read_bytes(get_conversation_agent_state_filename('sid', 'user'))
+    )
+
+
+def test_snapshot_is_smaller_than_legacy_pickle():
+    state = _state(calls=METRICS_SEGMENT_SIZE - 1)
+    store = InMemoryFileStore()
+    state.save_to_session('sid', store, None)
+
+    snapshot = store.read_bytes(get_conversation_agent_state_filename('sid'))
+    legacy = base64.b64encode(pickle.dumps(state))
+    assert len(snapshot) * 5 < len(legacy)
+
+
+def test_saves_only_write_new_metric_segments():
+    state = _state(calls=2 * METRICS_SEGMENT_SIZE + 10)
+    store = _RecordingFileStore()
+    state_file = get_conversation_agent_state_filename('sid')
+
+    state.save_to_session('sid', store, None)
+    # two full segments for each of the three record lists
+    assert len(store.written) == 1 + 2 * 3
+
+    store.written.clear()
+    _add_call(state.metrics, 1)
+    state.save_to_session('sid', store, None)
+    assert store.written == [state_file]
+
+    restored = State.restore_from_session('sid', store, None)
+    assert restored.metrics.get() == state.metrics.get()
+
+    # A restored state keeps appending to the same segments
+    store.written.clear()
+    for i in range(METRICS_SEGMENT_SIZE):
+        _add_call(restored.metrics, i)
+    restored.save_to_session('sid', store, None)
+    assert len(store.written) == 1 + 3
+    assert (
+        State.restore_from_session('sid', store, None).metrics.get()
+        == restored.metrics.get()
+    )
+
+
+def test_replaced_metric_records_are_written_again():
+    state = _state(calls=METRICS_SEGMENT_SIZE + 1)
+    store = InMemoryFileStore()
+    state.save_to_session('sid', store, None)
+
+    state.metrics = _metrics(calls=METRICS_SEGMENT_SIZE + 1)
+    state.metrics.token_usages = [TokenUsage(prompt_tokens=7)]
+    state.save_to_session('sid', store, None)
+
+    restored = State.restore_from_session('sid', store, None)
+    assert restored.metrics.get() == state.metrics.get()
+    assert [usage.prompt_tokens for usage in restored.metrics.token_usages] == [7]
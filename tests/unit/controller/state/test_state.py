@@ -1,8 +1,14 @@
 from unittest.mock import patch
 
-from openhands.controller.state.state import State, TrafficControlState
+from openhands.controller.state.state import (
+    State,
+    TrafficControlState,
+    parse_lumio_settings,
+)
+from openhands.controller.state.state_tracker import StateTracker
 from openhands.core.schema import AgentState
-from openhands.events.event import Event
+from openhands.events.action import MessageAction
+from openhands.events.event import Event, EventSource
 from openhands.llm.metrics import Metrics
 from openhands.storage.memory import InMemoryFileStore
 
@@ -123,3 +129,35 @@ def test_save_without_deprecated_fields():
         restored_state.iteration_flag.current_value == 0
     )  # The depreciated attrib was not stored, so it did not override existing values on restore
     assert restored_state.iteration_flag.max_value == 100
+
+
+def _user_message(content: str) -> MessageAction:
+    message = MessageAction(content=content)
+    message._source = EventSource.USER
+    return message
+
+
+def test_parse_lumio_settings():
+    assert parse_lumio_settings(
+        'Do it <lumio-settings mode="production" skip-tests="True" />'
+    ) == {'mode': 'production', 'skip_tests': True}
+    assert parse_lumio_settings('no settings here') is None
+
+
+def test_state_tracker_keeps_lumio_settings_current():
+    tracker = StateTracker(sid='sid', file_store=InMemoryFileStore({}), user_id=None)
+    tracker.state = State()
+    assert tracker.state.lumio_settings == {'mode': 'development', 'skip_tests': False}
+
+    tracker.add_history(
+        _user_message('<lumio-settings mode="production" skip-tests="true"/>')
+    )
+    tracker.add_history(_user_message('Continue'))
+    agent_message = MessageAction(
+        content='<lumio-settings mode="development" skip-tests="false"/>'
+    )
+    agent_message._source = EventSource.AGENT
+    tracker.add_history(agent_message)
+
+    # Only user messages with a tag change the settings
+    assert tracker.state.lumio_settings == {'mode': 'production', 'skip_tests': True}
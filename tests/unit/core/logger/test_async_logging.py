@@ -0,0 +1,84 @@
+import logging
+import queue
+
+from openhands.core.logger import (
+    BatchingQueueListener,
+    DroppingQueueHandler,
+    enable_async_logging,
+    get_dropped_log_records,
+)
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+        self.flushes = 0
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+    def flush(self):
+        self.flushes += 1
+
+
+def _record(msg, level=logging.INFO, args=()):
+    return logging.LogRecord('test', level, 'test.py', 1, msg, args, None)
+
+
+def test_queue_handler_drops_debug_records_when_full():
+    handler = DroppingQueueHandler(queue.Queue(maxsize=1))
+    handler.handle(_record('first', logging.DEBUG))
+    handler.handle(_record('second', logging.DEBUG))
+    handler.handle(_record('third', logging.DEBUG))
+
+    assert handler.queue.qsize() == 1
+    assert handler.dropped == 2
+
+
+def test_queue_handler_resolves_message_args():
+    handler = DroppingQueueHandler(queue.Queue())
+    args = {'value': 1}
+    handler.handle(_record('value=%(value)s', args=(args,)))
+    args['value'] = 2
+
+    record = handler.queue.get_nowait()
+    assert record.msg == 'value=1'
+    assert record.args is None
+
+
+def test_listener_writes_batches_and_flushes_once_per_batch():
+    target = _ListHandler()
+    log_queue = queue.Queue()
+    for i in range(5):
+        log_queue.put(_record(f'message {i}'))
+    listener = BatchingQueueListener(log_queue, target, batch_size=10)
+    listener.start()
+    listener.stop()
+
+    assert target.messages == [f'message {i}' for i in range(5)]
+    # One flush for the five queued records, one for the sentinel batch at most
+    assert target.flushes <= 2
+
+
+def test_enable_async_logging_moves_handlers_behind_queue():
+    logger = logging.getLogger('test_enable_async_logging')
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    target = _ListHandler()
+    logger.addHandler(target)
+
+    queue_handler = enable_async_logging(logger)
+    try:
+        assert logger.handlers == [queue_handler]
+        # Enabling twice keeps the existing queue handler
+        assert enable_async_logging(logger) is queue_handler
+        logger.info('hello %s', 'world')
+        queue_handler.queue.join()
+        assert target.messages == ['hello world']
+        assert get_dropped_log_records(logger) == 0
+    finally:
+        from openhands.core import logger as logger_module
+
+        logger_module.stop_async_logging()
+        logger.removeHandler(queue_handler)
@@ -863,3 +863,21 @@ def test_nested_dict_secret_replacement(temp_dir: str):
     assert 'password123' not in data_with_secrets_replaced['args']['command']
     assert 'password123' not in data_with_secrets_replaced['args']['env']['SECRET_KEY']
     assert 'password123' not in data_with_secrets_replaced['args']['env']['timestamp']
+
+
+@pytest.mark.asyncio
+async def test_add_event_async(temp_dir: str):
+    file_store = get_file_store('local', temp_dir)
+    event_stream = EventStream('async_test', file_store)
+    event_stream.cache_size = 5
+    event_stream.add_event(NullObservation('test0'), EventSource.AGENT)
+    for i in range(1, 5):
+        await event_stream.add_event_async(
+            NullObservation(f'test{i}'), EventSource.AGENT
+        )
+
+    events = collect_events(EventStream('async_test', file_store))
+    assert [event.id for event in events] == [0, 1, 2, 3, 4]
+    assert [event.content for event in events] == [f'test{i}' for i in range(5)]
+    cache_page = json.loads(file_store.read(event_stream._get_filename_for_cache(0, 5)))
+    assert [data['content'] for data in cache_page] == [f'test{i}' for i in range(5)]
@@ -1,3 +1,5 @@
+import asyncio
+from types import MappingProxyType
 from unittest.mock import AsyncMock, Mock, patch
 
 import httpx
@@ -5,11 +7,14 @@ import pytest
 from pydantic import SecretStr
 
 from openhands.integrations.github.github_service import GitHubService
+from openhands.integrations.protocols.http_client import response_cache
+from openhands.integrations.provider import ProviderHandler, ProviderToken
 from openhands.integrations.service_types import (
     AuthenticationError,
     OwnerType,
     ProviderType,
     Repository,
+    UnknownException,
     User,
 )
 from openhands.server.types import AppMode
@@ -56,6 +61,7 @@ async def test_github_service_fetch_data():
     # Mock httpx.AsyncClient for testing API calls
     mock_response = AsyncMock()
     mock_response.status_code = 200
+    mock_response.headers = {}
     mock_response.json.return_value = {'login': 'test-user'}
     mock_response.raise_for_status = Mock()
 
@@ -435,3 +441,106 @@ async def test_github_service_graphql_url_github_com():
 
         # This should be correct for GitHub.com
         assert actual_url == 'https://api.github.com/graphql'
+
+
+@pytest.fixture
+def github_api():
+    """A fake GitHub API serving repository pages with ETags, and its requests."""
+    requests: list[httpx.Request] = []
+    repos = [{'id': i, 'full_name': f'user/repo{i}'} for i in range(250)]
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        page = int(request.url.params.get('page', '1'))
+        etag = f'"page-{page}"'
+        if request.headers.get('If-None-Match') == etag:
+            return httpx.Response(304)
+        headers = {'ETag': etag}
+        if page < 3:
+            url = 'https://api.github.com/user/repos?per_page=100'
+            headers['Link'] = (
+                f'<{url}&page={page + 1}>; rel="next", <{url}&page=3>; rel="last"'
+            )
+        return httpx.Response(
+            200, json=repos[(page - 1) * 100 : page * 100], headers=headers
+        )
+
+    response_cache.clear()
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handle))
+    with patch(
+        'openhands.integrations.github.service.base.get_async_client',
+        return_value=client,
+    ):
+        yield requests
+    response_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_github_revalidates_cached_responses(github_api):
+    service = GitHubService(user_id=None, token=SecretStr('test-token'))
+    url = 'https://api.github.com/user/repos'
+
+    first, headers = await service._make_request(url, {'page': '2'})
+    second, cached_headers = await service._make_request(url, {'page': '2'})
+
+    assert second == first
+    assert cached_headers == headers
+    assert 'If-None-Match' not in github_api[0].headers
+    assert github_api[1].headers['If-None-Match'] == '"page-2"'
+
+    # Responses are cached per token
+    other = GitHubService(user_id=None, token=SecretStr('other-token'))
+    await other._make_request(url, {'page': '2'})
+    assert 'If-None-Match' not in github_api[2].headers
+
+
+@pytest.mark.asyncio
+async def test_github_fetches_remaining_pages_at_once(github_api):
+    service = GitHubService(user_id=None, token=SecretStr('test-token'))
+
+    repos = await service.get_all_repositories('pushed', AppMode.OSS)
+
+    assert [repo.id for repo in repos] == [str(i) for i in range(250)]
+    assert [request.url.params['page'] for request in github_api] == ['1', '2', '3']
+
+    # Pages beyond the limit are not fetched
+    github_api.clear()
+    repos = await service._fetch_paginated_repos(
+        'https://api.github.com/user/repos', {'per_page': '100'}, 150
+    )
+    assert len(repos) == 150
+    assert [request.url.params['page'] for request in github_api] == ['1', '2']
+
+
+@pytest.mark.asyncio
+async def test_provider_handler_fetches_from_providers_concurrently():
+    tokens = MappingProxyType(
+        {
+            ProviderType.GITHUB: ProviderToken(token=SecretStr('github-token')),
+            ProviderType.GITLAB: ProviderToken(token=SecretStr('gitlab-token')),
+        }
+    )
+    handler = ProviderHandler(provider_tokens=tokens)
+    started: list[ProviderType] = []
+    both_started = asyncio.Event()
+
+    def service_for(provider: ProviderType):
+        async def get_all_repositories(sort, app_mode):
+            started.append(provider)
+            if len(started) == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), timeout=5)
+            if provider == ProviderType.GITLAB:
+                raise UnknownException('GitLab is down')
+            return [Mock(spec=Repository)]
+
+        return Mock(get_all_repositories=get_all_repositories)
+
+    with patch.object(handler, 'get_service', side_effect=service_for):
+        repos = await handler.get_repositories(
+            'pushed', AppMode.OSS, None, None, None, None
+        )
+
+    # Both providers were asked before either answered, and a failing one is skipped
+    assert set(started) == set(tokens)
+    assert len(repos) == 1
@@ -7,7 +7,11 @@ import httpx
 import pytest
 from pydantic import SecretStr
 
-from openhands.integrations.protocols.http_client import HTTPClient
+from openhands.integrations.protocols.http_client import (
+    CachedResponse,
+    ConditionalRequestCache,
+    HTTPClient,
+)
 from openhands.integrations.service_types import (
     AuthenticationError,
     RateLimitError,
@@ -307,3 +311,24 @@ class TestHTTPClient:
             )
             result = client.handle_http_status_error(error)
             assert f'{provider} API rate limit exceeded' in str(result)
+
+
+def test_conditional_request_cache_evicts_least_recently_used():
+    cache = ConditionalRequestCache(max_entries=2, max_bytes=10)
+    keys = [
+        cache.key('Bearer token', f'https://example.com/{i}', None) for i in range(3)
+    ]
+    assert cache.key('Bearer other', 'https://example.com/0', None) != keys[0]
+
+    cache.put(keys[0], CachedResponse('"0"', b'[0]', {}))
+    cache.put(keys[1], CachedResponse('"1"', b'[1]', {}))
+    assert cache.get(keys[0]).json() == [0]
+    cache.put(keys[2], CachedResponse('"2"', b'[2]', {}))
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+
+    # Beyond the byte bound, older responses are evicted too
+    cache.put(keys[1], CachedResponse('"1"', b'[1, 2, 3]', {}))
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[2]) is None
+    assert cache.get(keys[1]).etag == '"1"'
@@ -0,0 +1,120 @@
+import shutil
+
+import pytest
+
+import openhands.linter.service as service_module
+from openhands.linter import DefaultLinter, LintService
+
+
+def _errors(results):
+    return [(result.line, result.column, result.message) for result in results]
+
+
+def test_python_errors_match_flake8(tmp_path):
+    content = "import os\ndef f(a, a):\n    return b\n__all__ = ['zz']\n"
+    results = LintService().lint('/workspace/module.py', content)
+
+    assert all(result.file == '/workspace/module.py' for result in results)
+    assert _errors(results) == [
+        (2, 1, "F831 duplicate argument 'a' in function definition"),
+        (3, 12, "F821 undefined name 'b'"),
+        (4, 1, "F822 undefined name 'zz' in __all__"),
+    ]
+    # Unused imports are not among the errors DefaultLinter selects
+    assert LintService().lint('module.py', 'import os\n') == []
+
+    if shutil.which('flake8'):
+        path = tmp_path / 'module.py'
+        path.write_text(content)
+        assert _errors(DefaultLinter().lint(str(path))) == _errors(results)
+
+
+def test_python_syntax_error(tmp_path):
+    content = 'def f(:\n    pass\n'
+    results = LintService().lint('module.py', content)
+    assert _errors(results) == [(1, 8, 'E999 SyntaxError: invalid syntax')]
+
+    if shutil.which('flake8'):
+        path = tmp_path / 'module.py'
+        path.write_text(content)
+        assert _errors(DefaultLinter().lint(str(path))) == _errors(results)
+
+
+def test_diff_leaves_out_errors_that_were_already_there():
+    old = 'x = undefined_one\n' + 'y = 1\n' * 50 + 'z = 2\n'
+    new = 'x = undefined_one\n' + 'y = 1\n' * 50 + 'z = undefined_two\n'
+    results = LintService().lint_diff('module.py', old, new)
+    assert _errors(results) == [(52, 5, "F821 undefined name 'undefined_two'")]
+
+    # Moved along with the lines around it
+    moved = 'import os\n\n' + new
+    assert _errors(LintService().lint_diff('module.py', new, moved)) == []
+
+    # The same error again on a changed line is new
+    changed = 'x = undefined_one  # changed\n' + new.split('\n', 1)[1]
+    assert _errors(LintService().lint_diff('module.py', new, changed)) == [
+        (1, 5, "F821 undefined name 'undefined_one'")
+    ]
+
+
+def test_incremental_parse_matches_fresh_parse(tmp_path):
+    lines = [
+        line
+        for i in range(200)
+        for line in (
+            f'function f{i}(a: number): number {{\n',
+            f'  const x = a + {i};\n',
+            '  return x;\n',
+            '}\n',
+        )
+    ]
+    service = LintService()
+    previous = ''.join(lines)
+    assert service.lint('app.ts', previous) == []
+
+    edits = [
+        (10, 10, ['let y = ;\n']),
+        (400, 402, []),
+        (3, 4, ['function q( {\n']),
+        (10, 11, []),
+        (700, 700, ['}\n', 'const z = 1;\n']),
+    ]
+    for start, end, replacement in edits:
+        lines[start:end] = replacement
+        content = ''.join(lines)
+        results = service.lint('app.ts', content, previous_content=previous)
+        assert results == LintService().lint('app.ts', content)
+
+        path = tmp_path / 'app.ts'
+        path.write_text(content)
+        assert _errors(results) == _errors(DefaultLinter().lint(str(path)))
+        previous = content
+
+
+def test_results_are_reused_by_content(monkeypatch):
+    service = LintService(max_cached_contents=2)
+    calls = []
+    lint_python = service_module._lint_python
+    monkeypatch.setattr(
+        service_module,
+        '_lint_python',
+        lambda content: calls.append(content) or lint_python(content),
+    )
+
+    first = service.lint('a.py', 'x = y\n')
+    assert service.lint('b.py', 'x = y\n') == [
+        result.model_copy(update={'file': 'b.py'}) for result in first
+    ]
+    assert calls == ['x = y\n']
+
+    service.lint('a.py', 'one = 1\n')
+    service.lint('a.py', 'two = 2\n')
+    service.lint('a.py', 'x = y\n')
+    assert calls == ['x = y\n', 'one = 1\n', 'two = 2\n', 'x = y\n']
+
+
+@pytest.mark.parametrize('file_path', ['notes.txt', 'Makefile'])
+def test_unsupported_files_have_no_errors(file_path):
+    service = LintService()
+    assert not service.supports(file_path)
+    assert service.lint(file_path, 'anything (') == []
@@ -0,0 +1,156 @@
+import json
+from unittest.mock import patch
+
+import pytest
+from litellm.types.utils import (
+    ChatCompletionDeltaToolCall,
+    Delta,
+    Function,
+    ModelResponseStream,
+    StreamingChoices,
+    Usage,
+)
+
+from openhands.core.config import LLMConfig
+from openhands.llm.completion_stream import (
+    CompletionStream,
+    CompletionStreamListener,
+    ToolCallStreamParser,
+)
+from openhands.llm.llm import LLM
+
+
+def _chunk(content=None, tool_calls=None, finish_reason=None, usage=None):
+    chunk = ModelResponseStream(
+        id='chatcmpl-stream',
+        model='gpt-4o',
+        choices=[
+            StreamingChoices(
+                index=0,
+                delta=Delta(content=content, tool_calls=tool_calls),
+                finish_reason=finish_reason,
+            )
+        ],
+    )
+    if usage is not None:
+        chunk.usage = usage
+    return chunk
+
+
+def _tool_delta(index, arguments, tool_call_id=None, name=None):
+    return ChatCompletionDeltaToolCall(
+        index=index,
+        id=tool_call_id,
+        type='function' if tool_call_id else None,
+        function=Function(name=name, arguments=arguments),
+    )
+
+
+def _tool_call_chunks():
+    arguments = json.dumps({'command': 'create', 'file_text': 'a "{quoted}" brace\\'})
+    return [
+        _chunk(content='Writing the file.'),
+        _chunk(tool_calls=[_tool_delta(0, '', 'call_1', 'str_replace_editor')]),
+        _chunk(tool_calls=[_tool_delta(0, arguments[:20])]),
+        _chunk(tool_calls=[_tool_delta(0, arguments[20:])]),
+        _chunk(tool_calls=[_tool_delta(1, '', 'call_2', 'execute_bash')]),
+        _chunk(tool_calls=[_tool_delta(1, '{"command": "ls"}')]),
+        _chunk(finish_reason='tool_calls'),
+        _chunk(usage=Usage(prompt_tokens=100, completion_tokens=40, total_tokens=140)),
+    ]
+
+
+def test_tool_call_completes_when_its_arguments_close():
+    parser = ToolCallStreamParser()
+    chunks = _tool_call_chunks()
+    completed_at = {}
+    for i, chunk in enumerate(chunks):
+        for tool_call in parser.feed(chunk):
+            completed_at[tool_call.id] = (i, tool_call)
+    assert parser.finish() == []
+
+    # Braces and quotes inside string values do not close the arguments early
+    index, first = completed_at['call_1']
+    assert index == 3
+    assert first.function.name == 'str_replace_editor'
+    assert json.loads(first.function.arguments)['file_text'] == 'a "{quoted}" brace\\'
+    assert completed_at['call_2'][0] == 5
+
+
+def test_tool_call_without_arguments_completes_on_next_call_or_end():
+    parser = ToolCallStreamParser()
+    assert parser.feed(_chunk(tool_calls=[_tool_delta(0, '', 'call_1', 'think')])) == []
+    completed = parser.feed(
+        _chunk(tool_calls=[_tool_delta(1, '{"x"', 'call_2', 'finish')])
+    )
+    assert [tool_call.id for tool_call in completed] == ['call_1']
+    assert [tool_call.id for tool_call in parser.finish()] == ['call_2']
+
+
+def test_completion_stream_builds_full_response():
+    contents, tool_calls = [], []
+    stream = CompletionStream(
+        CompletionStreamListener(
+            on_content=contents.append, on_tool_call=tool_calls.append
+        )
+    )
+    for chunk in _tool_call_chunks():
+        stream.add(chunk)
+    response = stream.build([{'role': 'user', 'content': 'hi'}])
+
+    assert contents == ['Writing the file.']
+    assert [tool_call.id for tool_call in tool_calls] == ['call_1', 'call_2']
+    message = response.choices[0].message
+    assert message.content == 'Writing the file.'
+    assert [tool_call.id for tool_call in message.tool_calls] == ['call_1', 'call_2']
+    assert response.usage.prompt_tokens == 100
+    assert response.usage.completion_tokens == 40
+
+
+def test_failing_listener_does_not_break_the_stream():
+    def fail(_):
+        raise RuntimeError('client went away')
+
+    stream = CompletionStream(CompletionStreamListener(on_content=fail))
+    stream.add(_chunk(content='hello'))
+    assert stream.build().choices[0].message.content == 'hello'
+
+
+@pytest.fixture
+def streaming_llm():
+    with patch('openhands.llm.llm.litellm_completion') as mock_completion:
+        mock_completion.side_effect = lambda *args, **kwargs: iter(_tool_call_chunks())
+        config = LLMConfig(model='gpt-4o', api_key='test_key', num_retries=1)
+        yield LLM(config, service_id='test-service'), mock_completion
+
+
+def test_llm_streams_to_listener_and_records_metrics_once(streaming_llm):
+    llm, mock_completion = streaming_llm
+    events = []
+    listener = CompletionStreamListener(
+        on_content=lambda delta: events.append(('content', delta)),
+        on_tool_call=lambda tool_call: events.append(('tool_call', tool_call.id)),
+    )
+
+    response = llm.completion(
+        messages=[{'role': 'user', 'content': 'hi'}], stream_listener=listener
+    )
+
+    call_kwargs = mock_completion.call_args[1]
+    assert call_kwargs['stream'] is True
+    assert call_kwargs['stream_options'] == {'include_usage': True}
+    assert 'stream_listener' not in call_kwargs
+    assert events == [
+        ('content', 'Writing the file.'),
+        ('tool_call', 'call_1'),
+        ('tool_call', 'call_2'),
+    ]
+    assert len(response.choices[0].message.tool_calls) == 2
+
+    usage = llm.metrics.get()['accumulated_token_usage']
+    assert usage['prompt_tokens'] == 100
+    assert usage['completion_tokens'] == 40
+    assert len(llm.metrics.token_usages) == 1
+    assert len(llm.metrics.response_latencies) == 1
+    assert llm.metrics.accumulated_cost > 0
+    assert len(llm.metrics.costs) == 1
@@ -82,6 +82,17 @@ def test_token_usage_add():
     )  # Should keep the response_id from the first instance
 
 
+def test_token_usage_cache_ratios():
+    usage = TokenUsage(
+        prompt_tokens=1000, cache_read_tokens=800, cache_write_tokens=150
+    )
+    assert usage.cache_read_ratio == 0.8
+    assert usage.cache_write_ratio == 0.15
+    # No division by zero for responses without usage
+    assert TokenUsage().cache_read_ratio == 0.0
+    assert TokenUsage().cache_write_ratio == 0.0
+
+
 def test_metrics_merge_accumulated_token_usage():
     """Test that accumulated token usage is properly merged between two Metrics instances."""
     # Create two Metrics instances
@@ -0,0 +1,99 @@
+import pickle
+
+import pytest
+
+from openhands.llm.metrics import Cost, MetricRecords, Metrics, TokenUsage
+
+
+def _add_calls(metrics: Metrics, start: int, count: int) -> None:
+    for i in range(start, start + count):
+        metrics.add_cost(0.5)
+        metrics.add_response_latency(1.0, f'resp-{i}')
+        metrics.add_token_usage(100, 10, 0, 0, 1000 + i, f'resp-{i}')
+
+
+def test_records_are_bounded_and_totals_cover_all_calls():
+    metrics = Metrics('model', max_records=3)
+    _add_calls(metrics, 0, 5)
+
+    assert metrics.accumulated_cost == 2.5
+    assert metrics.accumulated_token_usage.prompt_tokens == 500
+    assert metrics.accumulated_token_usage.context_window == 1004
+
+    # Only the latest records are kept, oldest first
+    assert len(metrics.token_usages) == 3
+    assert metrics.token_usages.total == 5
+    assert [usage.response_id for usage in metrics.token_usages] == [
+        'resp-2',
+        'resp-3',
+        'resp-4',
+    ]
+    assert metrics.token_usages[-1].context_window == 1004
+    assert [u['response_id'] for u in metrics.get()['token_usages']] == [
+        'resp-2',
+        'resp-3',
+        'resp-4',
+    ]
+    assert metrics.token_usages.find('response_id', 'resp-3').context_window == 1003
+    assert metrics.token_usages.find('response_id', 'resp-0') is None
+
+
+def test_snapshot_diff_skips_records_before_the_snapshot():
+    metrics = Metrics('model')
+    _add_calls(metrics, 0, 4)
+    baseline = metrics.snapshot()
+    assert len(baseline.token_usages) == 0
+    assert baseline.accumulated_cost == 2.0
+
+    _add_calls(metrics, 4, 2)
+    local = metrics.diff(baseline)
+    assert local.accumulated_cost == 1.0
+    assert local.accumulated_token_usage.prompt_tokens == 200
+    assert [usage.response_id for usage in local.token_usages] == ['resp-4', 'resp-5']
+    assert len(local.costs) == 2
+    assert len(local.response_latencies) == 2
+
+    # A full copy works as a baseline as well
+    assert metrics.diff(metrics.copy()).token_usages.total == 0
+
+
+def test_merge_keeps_the_latest_records():
+    metrics = Metrics('model', max_records=4)
+    other = Metrics('other')
+    _add_calls(metrics, 0, 3)
+    _add_calls(other, 3, 3)
+
+    metrics.merge(other)
+    assert metrics.accumulated_cost == 3.0
+    assert metrics.token_usages.total == 6
+    assert [usage.response_id for usage in metrics.token_usages] == [
+        'resp-2',
+        'resp-3',
+        'resp-4',
+        'resp-5',
+    ]
+
+
+def test_unpickle_metrics_with_record_lists():
+    metrics = Metrics('model')
+    _add_calls(metrics, 0, 2)
+    state = metrics.__dict__.copy()
+    # Metrics pickled by earlier versions held lists of pydantic records
+    state['_costs'] = list(metrics.costs)
+    state['_token_usages'] = list(metrics.token_usages)
+    state.pop('_response_latencies')
+    legacy = Metrics.__new__(Metrics)
+    legacy.__setstate__(state)
+
+    restored = pickle.loads(pickle.dumps(legacy))
+    assert isinstance(restored.costs, MetricRecords)
+    assert restored.get()['token_usages'] == metrics.get()['token_usages']
+    assert len(restored.response_latencies) == 0
+    restored.add_cost(1.0)
+    assert restored.costs[-1].cost == 1.0
+
+
+def test_metric_records_reject_non_positive_bound():
+    with pytest.raises(ValueError):
+        MetricRecords(Cost, max_records=0)
+    assert MetricRecords(TokenUsage, max_records=None).max_records is None
@@ -0,0 +1,100 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from openhands.core.config.llm_config import LLMConfig
+from openhands.core.config.openhands_config import OpenHandsConfig
+from openhands.llm.llm_registry import LLMRegistry
+from openhands.llm.response_cache import LLMResponseCache
+
+MESSAGES = [{'role': 'user', 'content': 'Generate a title'}]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return LLMResponseCache(str(tmp_path / 'cache' / 'responses.db'), max_entries=2)
+
+
+def test_key_depends_on_model_params_and_messages():
+    config = LLMConfig(model='gpt-4o')
+    key = LLMResponseCache.make_key(config, MESSAGES)
+    assert key == LLMResponseCache.make_key(LLMConfig(model='gpt-4o'), MESSAGES)
+    assert key != LLMResponseCache.make_key(LLMConfig(model='gpt-4o-mini'), MESSAGES)
+    assert key != LLMResponseCache.make_key(
+        LLMConfig(model='gpt-4o', max_output_tokens=10), MESSAGES
+    )
+    assert key != LLMResponseCache.make_key(
+        config, [{'role': 'user', 'content': 'Another title'}]
+    )
+    # The API key does not change the response
+    assert key == LLMResponseCache.make_key(
+        LLMConfig(model='gpt-4o', api_key='secret'), MESSAGES
+    )
+
+
+def test_non_zero_temperature_bypasses_cache():
+    assert LLMResponseCache.make_key(LLMConfig(temperature=0.7), MESSAGES) is None
+
+
+def test_get_and_put(cache):
+    assert cache.get('a') is None
+    cache.put('a', 'A title')
+    assert cache.get('a') == 'A title'
+    # Entries are shared through the database file
+    assert LLMResponseCache(cache.path).get('a') == 'A title'
+
+
+def test_least_recently_used_entries_are_evicted(cache):
+    with patch('openhands.llm.response_cache.time.time', side_effect=range(1, 10)):
+        cache.put('a', 'A')
+        cache.put('b', 'B')
+        assert cache.get('a') == 'A'
+        cache.put('c', 'C')
+        assert cache.get('b') is None
+        assert cache.get('a') == 'A'
+        assert cache.get('c') == 'C'
+
+
+def test_entries_expire(cache):
+    cache.ttl_seconds = 10
+    with patch('openhands.llm.response_cache.time.time', return_value=100):
+        cache.put('a', 'A')
+    with patch('openhands.llm.response_cache.time.time', return_value=105):
+        assert cache.get('a') == 'A'
+    with patch('openhands.llm.response_cache.time.time', return_value=111):
+        assert cache.get('a') is None
+
+
+def test_unusable_cache_is_a_miss(tmp_path):
+    (tmp_path / 'file').write_text('not a directory')
+    cache = LLMResponseCache(str(tmp_path / 'file' / 'responses.db'))
+    cache.put('a', 'A')
+    assert cache.get('a') is None
+
+
+def test_registry_reuses_cached_extraneous_completion(tmp_path):
+    config = OpenHandsConfig(cache_dir=str(tmp_path), llm_response_cache=True)
+    registry = LLMRegistry(config=config)
+    llm_config = LLMConfig(model='gpt-4o')
+    mock_llm = MagicMock()
+    mock_llm.config = llm_config
+    mock_llm.completion.return_value.choices[0].message.content = ' A title '
+    registry.service_to_llm['conversation_title_creator'] = mock_llm
+
+    for _ in range(2):
+        title = registry.request_extraneous_completion(
+            'conversation_title_creator', llm_config, MESSAGES
+        )
+        assert title == 'A title'
+    mock_llm.completion.assert_called_once_with(messages=MESSAGES)
+
+    # Another registry, e.g. of another conversation, shares the cache
+    other = LLMRegistry(config=config)
+    other.service_to_llm['conversation_title_creator'] = mock_llm
+    assert (
+        other.request_extraneous_completion(
+            'conversation_title_creator', llm_config, MESSAGES
+        )
+        == 'A title'
+    )
+    assert mock_llm.completion.call_count == 1
@@ -0,0 +1,104 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from openhands.core.config.mcp_config import MCPSSEServerConfig
+from openhands.events.action.mcp import MCPAction
+from openhands.mcp.session_pool import MCPSessionPool
+
+
+def _make_client(tool_name: str) -> MagicMock:
+    client = MagicMock()
+    tool = MagicMock()
+    tool.name = tool_name
+    client.tools = [tool]
+    client.tool_map = {tool_name: tool}
+    client.client = MagicMock()
+    client.client.__aenter__ = AsyncMock()
+    client.client.__aexit__ = AsyncMock()
+    response = MagicMock()
+    response.model_dump.return_value = {'content': [], 'isError': False}
+    client.call_tool = AsyncMock(return_value=response)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_session_pool_reuses_clients_across_calls():
+    server = MCPSSEServerConfig(url='http://server1:8080')
+    client = _make_client('tool_a')
+    create = AsyncMock(return_value=[client])
+
+    pool = MCPSessionPool(conversation_id='conv')
+    with patch('openhands.mcp.utils.create_mcp_clients', create):
+        for _ in range(3):
+            observation = await pool.call_tool(
+                MCPAction(name='tool_a', arguments={}), [server], []
+            )
+            assert json.loads(observation.content)['isError'] is False
+
+    create.assert_called_once()
+    client.client.__aenter__.assert_awaited_once()
+    assert client.call_tool.await_count == 3
+    assert pool.tool_latencies['tool_a'].calls == 3
+    assert pool.tool_latencies['tool_a'].errors == 0
+
+    await pool.close()
+    client.client.__aexit__.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_session_pool_reconnects_after_failure():
+    server = MCPSSEServerConfig(url='http://server1:8080')
+    broken = _make_client('tool_a')
+    broken.call_tool.side_effect = ConnectionError('session closed')
+    healthy = _make_client('tool_a')
+    create = AsyncMock(side_effect=[[broken], [healthy]])
+
+    pool = MCPSessionPool()
+    with patch('openhands.mcp.utils.create_mcp_clients', create):
+        await pool.call_tool(MCPAction(name='tool_a', arguments={}), [server], [])
+
+    assert create.call_count == 2
+    broken.client.__aexit__.assert_awaited_once()
+    healthy.call_tool.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_session_pool_closes_idle_sessions():
+    server = MCPSSEServerConfig(url='http://server1:8080')
+    first = _make_client('tool_a')
+    second = _make_client('tool_a')
+    create = AsyncMock(side_effect=[[first], [second]])
+
+    pool = MCPSessionPool(idle_ttl=0)
+    with patch('openhands.mcp.utils.create_mcp_clients', create):
+        assert await pool.get_clients([server], []) == [first]
+        assert await pool.get_clients([server], []) == [second]
+
+    first.client.__aexit__.assert_awaited_once()
+
+
+def test_session_pool_closes_sessions_on_an_idle_loop():
+    server = MCPSSEServerConfig(url='http://server1:8080')
+    first = _make_client('tool_a')
+    second = _make_client('tool_a')
+    create = AsyncMock(side_effect=[[first], [second]])
+
+    pool = MCPSessionPool()
+    first_loop = asyncio.new_event_loop()
+    second_loop = asyncio.new_event_loop()
+    try:
+        with patch('openhands.mcp.utils.create_mcp_clients', create):
+            first_loop.run_until_complete(pool.get_clients([server], []))
+            # Moving to another loop closes the sessions of the first one
+            second_loop.run_until_complete(pool.get_clients([server], []))
+        first.client.__aexit__.assert_awaited_once()
+
+        # The owning loop is not running, closing runs it
+        pool.close_sync()
+        second.client.__aexit__.assert_awaited_once()
+    finally:
+        first_loop.close()
+        second_loop.close()
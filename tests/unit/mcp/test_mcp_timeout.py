@@ -48,6 +48,7 @@ async def test_fetch_mcp_tools_with_timeout():
     # Configure the mock config
     mock_config.sse_servers = ['http://server1:8080']
     mock_config.shttp_servers = []
+    mock_config.connect_timeout = None
 
     # Mock create_mcp_clients to return an empty list (simulating all connections failing)
     with mock.patch('openhands.mcp.utils.create_mcp_clients', return_value=[]):
@@ -67,6 +68,7 @@ async def test_mixed_connection_results():
     # Configure the mock config
     mock_config.sse_servers = ['http://server1:8080', 'http://server2:8080']
     mock_config.shttp_servers = []
+    mock_config.connect_timeout = None
 
     # Create a successful client
     successful_client = mock.MagicMock(spec=MCPClient)
@@ -257,7 +257,7 @@ async def test_fetch_mcp_tools_from_config_with_stdio(mock_create_clients):
 
     # Verify create_mcp_clients was called with stdio servers
     mock_create_clients.assert_called_once_with(
-        [], [], 'test-conv', mcp_config.stdio_servers
+        [], [], 'test-conv', mcp_config.stdio_servers, None
     )
 
 
@@ -294,3 +294,164 @@ async def test_call_tool_mcp_stdio_client():
     mock_client.call_tool.assert_called_once_with(
         'stdio_test_tool', {'input': 'test_input'}
     )
+
+
+@pytest.mark.asyncio
+async def test_create_mcp_clients_connects_concurrently_with_per_server_timeout():
+    """Test that a slow server times out without delaying the other servers."""
+    import asyncio
+
+    async def connect(self, server, conversation_id=None):
+        if 'slow' in server.url:
+            await asyncio.sleep(10)
+
+    server_configs = [
+        MCPSSEServerConfig(url='http://slow:8080'),
+        MCPSSEServerConfig(url='http://fast1:8080'),
+        MCPSSEServerConfig(url='http://fast2:8080'),
+    ]
+
+    with (
+        patch.object(openhands.mcp.utils.MCPClient, 'connect_http', connect),
+        patch.object(openhands.mcp.utils, 'MCP_SERVER_CONNECT_TIMEOUT', 0.2),
+    ):
+        start = asyncio.get_event_loop().time()
+        clients = await openhands.mcp.utils.create_mcp_clients(server_configs, [])
+        elapsed = asyncio.get_event_loop().time() - start
+
+    assert len(clients) == 2
+    assert elapsed < 2
+
+
+@pytest.mark.asyncio
+async def test_fetch_mcp_tools_from_config_cached_refreshes_in_background():
+    """Test that cached MCP tools are returned immediately and refreshed later."""
+    import asyncio
+
+    from openhands.core.config.mcp_config import MCPConfig
+
+    mcp_config = MCPConfig(sse_servers=[MCPSSEServerConfig(url='http://cache:8080')])
+    tool_names = iter(['first', 'second'])
+
+    async def connect(server, conversation_id=None, timeout=None):
+        client = MagicMock()
+        tool = MagicMock()
+        tool.to_param.return_value = {'function': {'name': next(tool_names)}}
+        client.tools = [tool]
+        return client
+
+    with (
+        patch.object(openhands.mcp.utils, '_mcp_tools_cache', {}),
+        patch.object(openhands.mcp.utils, '_mcp_tools_refresh_tasks', {}),
+        patch.object(openhands.mcp.utils, '_connect_mcp_server', connect),
+    ):
+        # A cache miss fetches synchronously
+        assert await openhands.mcp.utils.fetch_mcp_tools_from_config_cached(
+            mcp_config
+        ) == [{'function': {'name': 'first'}}]
+        # A cache hit returns the cached tools and refreshes in the background
+        assert await openhands.mcp.utils.fetch_mcp_tools_from_config_cached(
+            mcp_config
+        ) == [{'function': {'name': 'first'}}]
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert await openhands.mcp.utils.fetch_mcp_tools_from_config_cached(
+            mcp_config
+        ) == [{'function': {'name': 'second'}}]
+
+
+@pytest.mark.asyncio
+async def test_fetch_mcp_tools_from_config_cached_per_server():
+    """Test that tools are cached per server and survive a failed refresh."""
+    import asyncio
+
+    from openhands.core.config.mcp_config import MCPConfig
+
+    down: set[str] = set()
+
+    async def connect(server, conversation_id=None, timeout=None):
+        if server.url in down:
+            return None
+        client = MagicMock()
+        tool = MagicMock()
+        tool.to_param.return_value = {'function': {'name': server.url}}
+        client.tools = [tool]
+        return client
+
+    user_server = MCPSSEServerConfig(url='http://user:8080', api_key='secret')
+    proxy = MCPSSEServerConfig(url='http://runtime-1/mcp/sse', api_key='key-1')
+
+    with (
+        patch.object(openhands.mcp.utils, '_mcp_tools_cache', {}),
+        patch.object(openhands.mcp.utils, '_mcp_tools_refresh_tasks', {}),
+        patch.object(openhands.mcp.utils, '_connect_mcp_server', connect),
+    ):
+        tools = await openhands.mcp.utils.fetch_mcp_tools_from_config_cached(
+            MCPConfig(sse_servers=[user_server, proxy]),
+            cache_keys={proxy.url: 'proxy'},
+        )
+        assert [tool['function']['name'] for tool in tools] == [
+            'http://user:8080',
+            'http://runtime-1/mcp/sse',
+        ]
+
+        # The next conversation has a new proxy URL and key, and a server that
+        # can't be reached keeps its cached tools
+        down.update({'http://user:8080', 'http://runtime-2/mcp/sse'})
+        next_proxy = MCPSSEServerConfig(url='http://runtime-2/mcp/sse', api_key='k2')
+        user_server = MCPSSEServerConfig(url='http://user:8080', api_key='rotated')
+        for _ in range(2):
+            tools = await openhands.mcp.utils.fetch_mcp_tools_from_config_cached(
+                MCPConfig(sse_servers=[user_server, next_proxy]),
+                cache_keys={next_proxy.url: 'proxy'},
+            )
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            assert [tool['function']['name'] for tool in tools] == [
+                'http://user:8080',
+                'http://runtime-1/mcp/sse',
+            ]
+
+
+@pytest.mark.asyncio
+async def test_connect_timeout_is_configurable():
+    """Test that the connect timeout comes from the config or the SHTTP server."""
+    from openhands.core.config.mcp_config import MCPConfig, MCPSHTTPServerConfig
+
+    timeouts = {}
+
+    async def connect(server, conversation_id=None, timeout=None):
+        timeouts[server.url] = timeout
+        return None
+
+    mcp_config = MCPConfig(
+        sse_servers=[MCPSSEServerConfig(url='http://sse:8080')],
+        connect_timeout=300,
+    )
+    with (
+        patch.object(openhands.mcp.utils, '_mcp_tools_cache', {}),
+        patch.object(openhands.mcp.utils, '_mcp_tools_refresh_tasks', {}),
+        patch.object(openhands.mcp.utils, '_connect_mcp_server', connect),
+    ):
+        await openhands.mcp.utils.fetch_mcp_tools_from_config_cached(mcp_config)
+    assert timeouts == {'http://sse:8080': 300.0}
+
+    async def connect_http(self, server, conversation_id=None):
+        timeouts['connect_http'] = self.server_timeout
+
+    waits = []
+
+    async def wait_for(coro, timeout):
+        waits.append(timeout)
+        return await coro
+
+    with (
+        patch.object(openhands.mcp.utils.MCPClient, 'connect_http', connect_http),
+        patch.object(openhands.mcp.utils.asyncio, 'wait_for', wait_for),
+    ):
+        await openhands.mcp.utils.create_mcp_clients(
+            [],
+            [MCPSHTTPServerConfig(url='http://shttp:8080', timeout=180)],
+            connect_timeout=30,
+        )
+    assert waits == [180.0]
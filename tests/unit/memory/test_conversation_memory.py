@@ -667,12 +667,28 @@ def test_apply_prompt_caching(conversation_memory):
 
     # System message is hard-coded to be cached always
     assert messages[0].content[0].cache_prompt is True
-    assert messages[1].content[0].cache_prompt is False
+    # The previous request ended at the first user message
+    assert messages[1].content[0].cache_prompt is True
     assert messages[2].content[0].cache_prompt is False
-    # Only the last user message should have cache_prompt=True
     assert messages[3].content[0].cache_prompt is True
 
 
+def test_apply_prompt_caching_with_volatile_content(conversation_memory):
+    messages = [
+        Message(role='system', content=[TextContent(text='System message')]),
+        Message(role='user', content=[TextContent(text='User message')]),
+    ]
+    reminder = TextContent(text='Current Mode: development')
+
+    conversation_memory.apply_prompt_caching(messages, [reminder])
+
+    # The reminder follows the breakpoint instead of being cached with it
+    assert len(messages) == 2
+    assert messages[1].content[-1] is reminder
+    assert messages[1].content[0].cache_prompt is True
+    assert reminder.cache_prompt is False
+
+
 def test_process_events_with_environment_microagent_observation(conversation_memory):
     """Test processing a RecallObservation with ENVIRONMENT info type."""
     obs = RecallObservation(
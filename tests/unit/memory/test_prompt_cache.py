@@ -0,0 +1,75 @@
+from openhands.core.message import Message, TextContent
+from openhands.memory.prompt_cache import PromptCachePlanner
+
+
+def _message(role: str, text: str) -> Message:
+    return Message(role=role, content=[TextContent(text=text)])
+
+
+def _conversation(steps: int) -> list[Message]:
+    messages = [
+        _message('system', 'system prompt'),
+        _message('user', 'task'),
+        _message('user', 'workspace context'),
+    ]
+    for i in range(steps):
+        messages.append(_message('assistant', f'call {i}'))
+        messages.append(_message('tool', f'result {i}'))
+    return messages
+
+
+def _cached_prefix(messages: list[Message], index: int) -> list[tuple[str, str]]:
+    """The content blocks the provider caches up to a breakpoint on messages[index]."""
+    blocks = [(m.role, c.text) for m in messages[:index] for c in m.content]
+    message = messages[index]
+    # Only content up to the marked block belongs to the prefix
+    marked = max(i for i, c in enumerate(message.content) if c.cache_prompt)
+    return blocks + [(message.role, c.text) for c in message.content[: marked + 1]]
+
+
+def test_plan_marks_last_previous_system_and_initial_turn():
+    messages = _conversation(steps=5)
+    # last tool result, the previous step's tool result, system, initial turn
+    assert PromptCachePlanner().plan(messages) == [12, 10, 0, 2]
+    assert PromptCachePlanner(max_breakpoints=2).plan(messages) == [12, 10]
+
+
+def test_plan_deduplicates_overlapping_breakpoints():
+    messages = [_message('system', 'system prompt'), _message('user', 'task')]
+    assert PromptCachePlanner().plan(messages) == [1, 0]
+    assert PromptCachePlanner().plan([]) == []
+
+
+def test_previous_request_prefix_is_read_back_despite_volatile_content():
+    planner = PromptCachePlanner()
+    reminder = [TextContent(text='settings: development')]
+
+    step_1 = _conversation(steps=2)
+    written_at = planner.plan(step_1)[0]
+    planner.apply(step_1, reminder)
+
+    step_2 = _conversation(steps=3)
+    read_at = planner.plan(step_2)[1]
+    planner.apply(step_2, reminder)
+
+    assert read_at == written_at
+    assert _cached_prefix(step_2, read_at) == _cached_prefix(step_1, written_at)
+
+
+def test_volatile_content_follows_the_last_breakpoint():
+    planner = PromptCachePlanner()
+    reminder = TextContent(text='settings: development')
+
+    messages = [_message('system', 'system prompt'), _message('user', 'task')]
+    planner.apply(messages, [reminder])
+    assert messages[1].content[0].cache_prompt
+    assert messages[1].content[-1] is reminder
+    assert not reminder.cache_prompt
+
+    # Tool results are cached as a whole, so the reminder gets its own message
+    messages = _conversation(steps=1)
+    planner.apply(messages, [reminder])
+    assert messages[-2].role == 'tool'
+    assert messages[-2].content[-1].cache_prompt
+    assert messages[-1].role == 'user'
+    assert messages[-1].content == [reminder]
@@ -0,0 +1,102 @@
+import multiprocessing
+import pickle
+
+import numpy as np
+import pytest
+
+from openhands.runtime.browser.shared_image_ring import (
+    SharedImageRef,
+    SharedImageRing,
+)
+from openhands.runtime.browser.utils import encode_browser_images
+
+
+@pytest.fixture
+def ring():
+    ring = SharedImageRing(slots=2, slot_size=64 * 64 * 4)
+    yield ring
+    ring.close()
+
+
+def _write_in_child(ring: SharedImageRing, conn) -> None:
+    image = np.full((32, 48, 3), 7, dtype=np.uint8)
+    conn.send(ring.put(image))
+    conn.close()
+    ring.close()
+
+
+def test_put_and_get_round_trip(ring):
+    image = np.random.randint(0, 255, (64, 32, 4), dtype=np.uint8)
+    ref = ring.put(image)
+    assert isinstance(ref, SharedImageRef)
+    assert ref.slot == 0
+    result = ring.get(ref)
+    assert np.array_equal(result, image)
+    # The result is a copy, reusing the slot does not change it
+    ring.put(np.zeros_like(image))
+    ring.put(np.zeros_like(image))
+    assert np.array_equal(result, image)
+
+
+def test_slots_rotate(ring):
+    first = ring.put(np.ones((8, 8, 3), dtype=np.uint8))
+    second = ring.put(np.full((8, 8, 3), 2, dtype=np.uint8))
+    assert (first.slot, second.slot) == (0, 1)
+    # A newer image does not overwrite the previous slot
+    assert ring.get(first).max() == 1
+    assert ring.put(np.zeros((8, 8, 3), dtype=np.uint8)).slot == 0
+
+
+def test_oversized_image_is_passed_by_value(ring):
+    image = np.zeros((128, 128, 4), dtype=np.uint8)
+    ref = ring.put(image)
+    assert ref is image
+    assert ring.get(ref) is image
+
+
+def test_pickled_ring_attaches_to_the_same_memory(ring):
+    attached = pickle.loads(pickle.dumps(ring))
+    try:
+        ref = attached.put(np.full((4, 4, 3), 9, dtype=np.uint8))
+        assert ring.get(ref).min() == 9
+    finally:
+        attached.close()
+    # Only the creating ring unlinks the memory
+    assert not ring.closed
+    assert ring.get(ring.put(np.ones((2, 2), dtype=np.uint8))).sum() == 4
+
+
+def test_images_cross_process_boundary(ring):
+    ctx = multiprocessing.get_context('spawn')
+    parent_conn, child_conn = ctx.Pipe()
+    process = ctx.Process(target=_write_in_child, args=(ring, child_conn))
+    process.start()
+    assert parent_conn.poll(timeout=30)
+    ref = parent_conn.recv()
+    process.join(10)
+    image = ring.get(ref)
+    assert image.shape == (32, 48, 3)
+    assert (image == 7).all()
+
+
+def test_encode_browser_images_encodes_raw_screenshot_once():
+    obs = {
+        'screenshot': np.zeros((10, 20, 3), dtype=np.uint8),
+        'extra_element_properties': {},
+    }
+    png, screenshot, set_of_marks = encode_browser_images(obs)
+    assert png is not None and png.startswith(b'\x89PNG')
+    assert screenshot is not None
+    assert screenshot.startswith('data:image/png;base64,')
+    assert set_of_marks is not None
+    assert set_of_marks.startswith('data:image/png;base64,')
+
+
+def test_encode_browser_images_passes_encoded_screenshot_through():
+    obs = {'screenshot': 'data:image/png;base64,aGVsbG8=', 'set_of_marks': 'som'}
+    assert encode_browser_images(obs) == (
+        b'hello',
+        'data:image/png;base64,aGVsbG8=',
+        'som',
+    )
+    assert encode_browser_images({}) == (None, None, None)
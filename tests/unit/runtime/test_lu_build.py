@@ -0,0 +1,162 @@
+import importlib.machinery
+import importlib.util
+import shutil
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+LU_PATH = Path(__file__).parents[3] / 'openhands' / 'bin' / 'lu'
+
+# Compiles by hashing the sources into build/, and logs how it was called
+FAKE_LUMIO = """\
+#!{python}
+import hashlib, json, os, pathlib, sys
+args = sys.argv[1:]
+with open({log!r}, 'a') as f:
+    f.write(' '.join(args) + '\\n')
+if '--skip-fetch-latest-git-deps' in args and os.path.exists({no_skip!r}):
+    print("error: unexpected argument '--skip-fetch-latest-git-deps' found")
+    sys.exit(2)
+sources = ''.join(p.read_text() for p in sorted(pathlib.Path('.').rglob('*.move')))
+if 'ERROR' in sources:
+    print('error[E01001]: unexpected token')
+    sys.exit(1)
+if args[1] == 'compile':
+    out = pathlib.Path('build/pkg/bytecode_modules')
+    out.mkdir(parents=True, exist_ok=True)
+    (out / 'm.mv').write_text(hashlib.sha256(sources.encode()).hexdigest())
+print(json.dumps({{'Result': [args[1]]}}))
+"""
+
+
+@pytest.fixture
+def lu(tmp_path, monkeypatch):
+    loader = importlib.machinery.SourceFileLoader('lu', str(LU_PATH))
+    spec = importlib.util.spec_from_loader('lu', loader)
+    module = importlib.util.module_from_spec(spec)
+    loader.exec_module(module)
+
+    fake = tmp_path / 'lumio'
+    fake.write_text(
+        FAKE_LUMIO.format(
+            python=sys.executable,
+            log=str(tmp_path / 'calls.log'),
+            no_skip=str(tmp_path / 'no-skip'),
+        )
+    )
+    fake.chmod(0o755)
+    monkeypatch.setattr(module.LumioCLI, 'LUMIO_BIN', str(fake))
+    monkeypatch.setattr(module.LumioCLI, 'WORKSPACE', tmp_path)
+    # The commits the branches of git dependencies are at
+    module.remote = {'mainnet': 'a' * 40}
+    monkeypatch.setattr(module, '_ls_remote', lambda url, rev: module.remote.get(rev))
+    return module
+
+
+def _cli(lu, tmp_path):
+    cli = lu.LumioCLI()
+    cli.build_cache = lu.BuildCache(tmp_path / 'cache')
+    return cli
+
+
+def _calls(tmp_path) -> list[str]:
+    return (tmp_path / 'calls.log').read_text().splitlines()
+
+
+def _project(path: Path, source: str = 'module app::m {}') -> Path:
+    contract = path / 'contract'
+    (contract / 'sources').mkdir(parents=True)
+    (contract / 'Move.toml').write_text(
+        textwrap.dedent("""\
+            [package]
+            name = "pkg"
+
+            [dependencies.LumioFramework]
+            git = "https://github.com/pontem-network/lumio-framework"
+            rev = "mainnet"
+            subdir = "lumio-framework"
+            """)
+    )
+    (contract / 'sources' / 'm.move').write_text(source)
+    return contract
+
+
+def test_unchanged_package_is_not_compiled_again(lu, tmp_path):
+    cli = _cli(lu, tmp_path)
+    contract = _project(tmp_path / 'app')
+
+    first = cli._cached_move(contract, 'compile', [])
+    assert first['success'] and not first['cached']
+    second = cli._cached_move(contract, 'compile', [])
+    assert second['success'] and second['cached']
+    assert second['output'] == first['output']
+    assert len(_calls(tmp_path)) == 1
+
+    # A copy of the project elsewhere gets the compiled build directory
+    copy = tmp_path / 'copy'
+    shutil.copytree(tmp_path / 'app', copy)
+    shutil.rmtree(copy / 'contract' / 'build')
+    assert cli._cached_move(copy / 'contract', 'compile', [])['cached']
+    assert (copy / 'contract' / 'build' / 'pkg' / 'bytecode_modules' / 'm.mv').exists()
+
+    # Changing a source compiles again, and failures are not cached
+    (contract / 'sources' / 'm.move').write_text('module app::m { ERROR }')
+    for _ in range(2):
+        failed = cli._cached_move(contract, 'compile', [])
+        assert not failed['success'] and not failed['cached']
+    assert len(_calls(tmp_path)) == 3
+
+    assert failed['stats'] == {'hits': 2, 'misses': 3, 'hit_rate': 0.4}
+
+
+def test_tests_and_arguments_are_cached_separately(lu, tmp_path):
+    cli = _cli(lu, tmp_path)
+    contract = _project(tmp_path / 'app')
+
+    assert not cli._cached_move(contract, 'compile', [])['cached']
+    assert not cli._cached_move(contract, 'test', [])['cached']
+    assert cli._cached_move(contract, 'test', [])['cached']
+    assert not cli._cached_move(contract, 'test', ['--filter', 'x'])['cached']
+
+    # Dependencies are fetched by the first run only
+    assert _calls(tmp_path) == [
+        'move compile --package-dir .',
+        'move test --package-dir . --skip-fetch-latest-git-deps',
+        'move test --package-dir . --filter x --skip-fetch-latest-git-deps',
+    ]
+
+
+def test_dependencies_are_fetched_if_skipping_fails(lu, tmp_path):
+    cli = _cli(lu, tmp_path)
+    contract = _project(tmp_path / 'app')
+    cli._cached_move(contract, 'compile', [])
+
+    (tmp_path / 'no-skip').touch()
+    (contract / 'sources' / 'm.move').write_text('module app::m { fun f() {} }')
+    assert cli._cached_move(contract, 'compile', [])['success']
+    assert _calls(tmp_path)[1:] == [
+        'move compile --package-dir . --skip-fetch-latest-git-deps',
+        'move compile --package-dir .',
+    ]
+
+
+def test_dependencies_are_fetched_again_when_their_branch_moves(
+    lu, tmp_path, monkeypatch
+):
+    cli = _cli(lu, tmp_path)
+    contract = _project(tmp_path / 'app')
+    assert not cli._cached_move(contract, 'compile', [])['cached']
+
+    # Within GIT_REV_TTL, the remote isn't asked again
+    lu.remote['mainnet'] = 'b' * 40
+    assert cli._cached_move(contract, 'compile', [])['cached']
+
+    monkeypatch.setattr(lu, 'GIT_REV_TTL', 0)
+    assert not cli._cached_move(contract, 'compile', [])['cached']
+    assert _calls(tmp_path) == ['move compile --package-dir .'] * 2
+
+    # Offline, the commit fetched last is used
+    lu.remote.clear()
+    assert cli._cached_move(contract, 'compile', [])['cached']
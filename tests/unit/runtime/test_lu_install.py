@@ -0,0 +1,98 @@
+import importlib.machinery
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+
+from openhands.runtime.utils.runtime_build import (
+    get_node_deps_key,
+    get_node_modules_layers,
+)
+
+ROOT = Path(__file__).parents[3]
+LU_PATH = ROOT / 'openhands' / 'bin' / 'lu'
+
+DEPS = {'dependencies': {'react': '^18.3.1'}, 'devDependencies': {'vite': '6.0.8'}}
+
+
+@pytest.fixture
+def lu(tmp_path, monkeypatch):
+    loader = importlib.machinery.SourceFileLoader('lu', str(LU_PATH))
+    spec = importlib.util.spec_from_loader('lu', loader)
+    module = importlib.util.module_from_spec(spec)
+    loader.exec_module(module)
+
+    commands = []
+    monkeypatch.setattr(
+        module, 'run_cmd', lambda cmd, cwd=None: commands.append(cmd) or (0, '')
+    )
+    module.commands = commands
+    monkeypatch.setattr(module, 'PNPM_STORE_DIR', tmp_path / 'store')
+    monkeypatch.setattr(module, 'PREBUILT_NODE_MODULES_DIR', tmp_path / 'prebuilt')
+    return module
+
+
+def _frontend(path: Path, manifest: dict) -> Path:
+    path.mkdir(parents=True)
+    (path / 'package.json').write_text(json.dumps(manifest))
+    return path
+
+
+def _prebuild(lu, tmp_path, manifest: dict) -> Path:
+    """A template frontend, installed the way the runtime image does."""
+    template = _frontend(tmp_path / 'templates' / 'app' / 'frontend', manifest)
+    [layer] = get_node_modules_layers(tmp_path / 'templates')
+    prebuilt = tmp_path / 'prebuilt' / layer['key']
+    (prebuilt / 'node_modules' / '.pnpm').mkdir(parents=True)
+    (prebuilt / 'node_modules' / 'react').mkdir()
+    (prebuilt / 'node_modules' / 'react' / 'index.js').write_text('react')
+    (prebuilt / 'pnpm-lock.yaml').write_text('lockfileVersion: 9.0\n')
+    assert lu._deps_key(template) == layer['key']
+    return prebuilt
+
+
+def test_deps_keys_match_runtime_build(lu, tmp_path):
+    for package_json in ROOT.glob('templates/*/frontend/package.json'):
+        assert lu._deps_key(package_json.parent) == get_node_deps_key(package_json)
+
+    # Only the dependencies count, so templates sharing them share a layer
+    _frontend(tmp_path / 'templates' / 'a' / 'frontend', {'name': 'a', **DEPS})
+    _frontend(tmp_path / 'templates' / 'b' / 'frontend', {'name': 'b', **DEPS})
+    _frontend(tmp_path / 'templates' / 'c' / 'frontend', {'dependencies': {}})
+    layers = get_node_modules_layers(tmp_path / 'templates')
+    assert [layer['frontend'] for layer in layers] == ['a/frontend', 'c/frontend']
+
+
+def test_prebuilt_node_modules_are_linked(lu, tmp_path):
+    prebuilt = _prebuild(lu, tmp_path, {'name': 'template', **DEPS})
+    frontend = _frontend(tmp_path / 'app' / 'frontend', {'name': 'my-app', **DEPS})
+
+    assert lu.LumioCLI().install(str(tmp_path / 'app')) == 0
+    assert lu.commands == []
+    linked = frontend / 'node_modules' / 'react' / 'index.js'
+    original = prebuilt / 'node_modules' / 'react' / 'index.js'
+    assert linked.stat().st_ino == original.stat().st_ino
+    assert (frontend / 'pnpm-lock.yaml').read_text() == 'lockfileVersion: 9.0\n'
+
+
+def test_other_dependencies_are_installed_with_pnpm(lu, tmp_path):
+    _prebuild(lu, tmp_path, DEPS)
+    changed = {**DEPS, 'dependencies': {'react': '^18.3.1', 'zod': '^3.25.76'}}
+    _frontend(tmp_path / 'changed', changed)
+    locked = _frontend(tmp_path / 'locked', DEPS)
+    (locked / 'pnpm-lock.yaml').write_text('lockfileVersion: 6.0\n')
+
+    cli = lu.LumioCLI()
+    assert cli.install(str(tmp_path / 'changed')) == 0
+    assert cli.install(str(tmp_path / 'locked')) == 0
+    assert not (locked / 'node_modules').exists()
+    # The shared store is missing, so a local one is used
+    local = 'pnpm install --store-dir /tmp/pnpm-store --shamefully-hoist'
+    assert lu.commands == [f'{local} --prefer-offline --silent'] * 2
+
+    (tmp_path / 'store').mkdir()
+    lu.commands.clear()
+    assert cli.install(str(tmp_path / 'changed')) == 0
+    shared = f'pnpm install --store-dir {tmp_path / "store"} --shamefully-hoist'
+    assert lu.commands == [f'{shared} --prefer-offline --silent']
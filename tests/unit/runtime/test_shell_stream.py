@@ -0,0 +1,115 @@
+import json
+import threading
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from openhands.events.action import CmdRunAction
+from openhands.events.observation import CmdOutputObservation
+from openhands.runtime.impl.action_execution.action_execution_client import (
+    ActionExecutionClient,
+)
+from openhands.runtime.utils.request import RequestHTTPError
+from openhands.utils import http_session
+from openhands.utils.http_session import HttpSession
+
+OBSERVATION = {
+    'observation': 'run',
+    'content': 'hello',
+    'extras': {'command': 'echo hello', 'metadata': {'exit_code': 0}},
+}
+
+
+class _Client(ActionExecutionClient):
+    @property
+    def action_execution_server_url(self) -> str:
+        return 'http://runtime'
+
+    async def connect(self):
+        pass
+
+
+class _Server:
+    """The action execution server, answering requests with `handle`."""
+
+    def __init__(self):
+        self.paths: list[str] = []
+        self.handle = None
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.paths.append(request.url.path)
+        return self.handle(request)
+
+
+@pytest.fixture
+def server(monkeypatch):
+    server = _Server()
+    client = httpx.Client(transport=httpx.MockTransport(server))
+    monkeypatch.setattr(http_session, '_get_client', lambda: client)
+    return server
+
+
+@pytest.fixture
+def runtime():
+    runtime = _Client.__new__(_Client)
+    runtime.sid = 'test'
+    runtime.config = MagicMock()
+    runtime.session = HttpSession()
+    runtime.action_semaphore = threading.Semaphore(1)
+    runtime._shell_stream_supported = True
+    runtime._shell_stream_callback = None
+    return runtime
+
+
+def _run(runtime, command='echo hello', hidden=False):
+    action = CmdRunAction(command=command, hidden=hidden)
+    action.set_hard_timeout(10)
+    return runtime.send_action_for_execution(action)
+
+
+def test_output_is_streamed(runtime, server):
+    def handle(request):
+        if request.url.path == '/execute_action':
+            return httpx.Response(200, json=OBSERVATION)
+        lines = [{'output': 'hel'}, {'output': 'lo'}, {'observation': OBSERVATION}]
+        return httpx.Response(200, text='\n'.join(json.dumps(x) for x in lines))
+
+    server.handle = handle
+    chunks = []
+    runtime.subscribe_to_shell_stream(chunks.append)
+
+    obs = _run(runtime)
+    assert isinstance(obs, CmdOutputObservation)
+    assert chunks == ['hel', 'lo']
+
+    # Hidden commands are not shown to the user
+    _run(runtime, hidden=True)
+    assert chunks == ['hel', 'lo']
+    assert server.paths == ['/execute_action_stream', '/execute_action']
+
+
+def test_stream_errors_are_mapped(runtime, server):
+    runtime.subscribe_to_shell_stream(lambda output: None)
+
+    server.handle = lambda request: httpx.Response(500, json={'detail': 'boom'})
+    with pytest.raises(RequestHTTPError) as exc_info:
+        _run(runtime)
+    assert exc_info.value.detail == 'boom'
+    assert runtime._shell_stream_supported
+
+    # Older action execution servers can't stream
+    server.paths.clear()
+    server.handle = lambda request: (
+        httpx.Response(404)
+        if request.url.path == '/execute_action_stream'
+        else httpx.Response(200, json=OBSERVATION)
+    )
+    assert isinstance(_run(runtime), CmdOutputObservation)
+    assert isinstance(_run(runtime), CmdOutputObservation)
+    assert not runtime._shell_stream_supported
+    assert server.paths == [
+        '/execute_action_stream',
+        '/execute_action',
+        '/execute_action',
+    ]
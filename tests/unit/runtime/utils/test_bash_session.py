@@ -386,3 +386,42 @@ def test_python_interactive_input():
     assert session.prev_status == BashCommandStatus.COMPLETED
 
     session.close()
+
+
+def test_short_command_completes_without_polling_delay():
+    session = BashSession(work_dir=os.getcwd())
+    session.initialize()
+    assert session._output_stream_path is not None
+
+    start = time.time()
+    obs = session.execute(CmdRunAction('echo fast'))
+    elapsed = time.time() - start
+    assert 'fast' in obs.content
+    assert obs.metadata.exit_code == 0
+    # Completion is detected from the output stream, not the next pane poll
+    assert elapsed < BashSession.POLL_INTERVAL
+
+    session.close()
+    assert session._output_stream_path is None
+
+
+def test_output_callback_streams_output_before_completion():
+    session = BashSession(work_dir=os.getcwd())
+    session.initialize()
+
+    chunks: list[tuple[float, str]] = []
+    start = time.time()
+    obs = session.execute(
+        CmdRunAction('echo first; sleep 2; echo second'),
+        output_callback=lambda chunk: chunks.append((time.time() - start, chunk)),
+    )
+    assert obs.metadata.exit_code == 0
+    streamed = ''.join(chunk for _, chunk in chunks)
+    assert 'first' in streamed and 'second' in streamed
+    # The first line arrived well before the command finished
+    first_at = next(t for t, chunk in chunks if 'first' in chunk.split('echo')[-1])
+    assert first_at < 1.5
+    # The prompt is parsed into metadata, not streamed
+    assert '###PS1JSON###' not in streamed
+
+    session.close()
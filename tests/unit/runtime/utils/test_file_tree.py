@@ -0,0 +1,87 @@
+import pytest
+
+from openhands.runtime.utils.file_tree import FileTreeBuilder
+
+
+def _write(path, contents: str = '') -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(contents)
+
+
+def _names(entries: list[dict]) -> list[str]:
+    return [entry['name'] for entry in entries]
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    _write(tmp_path / '.gitignore', '*.log\nbuild/\n')
+    _write(tmp_path / 'README.md')
+    _write(tmp_path / 'app.log')
+    _write(tmp_path / 'build' / 'out.js')
+    _write(tmp_path / 'node_modules' / 'pkg' / 'index.js')
+    _write(tmp_path / 'src' / 'main.py')
+    _write(tmp_path / 'src' / 'pkg' / '.gitignore', 'generated.py\n')
+    _write(tmp_path / 'src' / 'pkg' / 'generated.py')
+    _write(tmp_path / 'src' / 'pkg' / 'module.py')
+    _write(tmp_path / 'src' / 'pkg' / 'debug.log')
+    _write(tmp_path / 'Docs' / 'deep' / 'deeper' / 'file.md')
+    return tmp_path
+
+
+def test_tree_lists_levels_and_applies_gitignores(workspace):
+    tree = FileTreeBuilder().get_tree(str(workspace), depth=3).tree
+
+    assert tree['path'] == str(workspace)
+    assert not tree['truncated']
+    # Directories first, case-insensitively sorted, ignored entries left out
+    assert _names(tree['entries']) == ['Docs/', 'src/', '.gitignore', 'README.md']
+    src = tree['entries'][1]['children']
+    assert _names(src) == ['pkg/', 'main.py']
+    # Nested .gitignore files apply below their directory, on top of the root one
+    assert _names(src[0]['children']) == ['.gitignore', 'module.py']
+    # Directories below the depth limit are listed without children
+    deep = tree['entries'][0]['children'][0]['children'][0]
+    assert deep == {'name': 'deeper/'}
+
+
+def test_tree_limit_cuts_deepest_levels(workspace):
+    tree = FileTreeBuilder().get_tree(str(workspace), depth=3, limit=6).tree
+
+    assert tree['truncated']
+    assert _names(tree['entries']) == ['Docs/', 'src/', '.gitignore', 'README.md']
+    assert _names(tree['entries'][0]['children']) == ['deep/']
+    assert _names(tree['entries'][1]['children']) == ['pkg/']
+    # Directories that were not listed don't look empty
+    assert 'children' not in tree['entries'][1]['children'][0]
+
+
+def test_tree_is_reused_until_it_changes(workspace):
+    builder = FileTreeBuilder()
+    first = builder.get_tree(str(workspace))
+    assert builder.get_tree(str(workspace)) is first
+
+    # Changing a file's contents doesn't change the tree
+    _write(workspace / 'src' / 'main.py', 'print(1)')
+    assert builder.get_tree(str(workspace)) is first
+
+    _write(workspace / 'src' / 'new.py')
+    second = builder.get_tree(str(workspace))
+    assert second.etag != first.etag
+    assert 'new.py' in _names(second.tree['entries'][1]['children'])
+
+    # Editing a .gitignore applies without restarting
+    _write(workspace / '.gitignore', '*.log\nbuild/\nsrc/\n')
+    third = builder.get_tree(str(workspace))
+    assert _names(third.tree['entries']) == ['Docs/', '.gitignore', 'README.md']
+
+
+def test_tree_of_missing_directory(tmp_path):
+    builder = FileTreeBuilder()
+    missing = tmp_path / 'missing'
+    assert builder.get_tree(str(missing)).tree['entries'] == []
+
+    _write(missing / 'file.txt')
+    assert _names(builder.get_tree(str(missing)).tree['entries']) == ['file.txt']
+
+    with pytest.raises(ValueError):
+        builder.get_tree(str(tmp_path), depth=0)
@@ -0,0 +1,24 @@
+from openhands.runtime.utils.output_buffer import (
+    TRUNCATED_OUTPUT_NOTICE,
+    OutputChunkBuffer,
+)
+
+
+def test_append_reports_transition_from_empty():
+    buffer = OutputChunkBuffer()
+    assert buffer.append('a') is True
+    assert buffer.append('b') is False
+    assert buffer.append('') is False
+    assert buffer.drain() == 'ab'
+    assert len(buffer) == 0
+    assert buffer.append('c') is True
+
+
+def test_pending_output_is_bounded():
+    buffer = OutputChunkBuffer(max_pending_chars=10)
+    for i in range(100):
+        buffer.append(f'{i:03d}\n')
+    assert len(buffer) == 10
+    assert buffer.drain() == TRUNCATED_OUTPUT_NOTICE + '7\n098\n099\n'
+    buffer.append('x')
+    assert buffer.drain() == 'x'
@@ -0,0 +1,159 @@
+import os
+import subprocess
+import time
+
+import pytest
+
+from openhands.runtime.utils import git_changes
+from openhands.runtime.utils.git_changes_tracker import GitChangesTracker
+from openhands.runtime.utils.workspace_watcher import WorkspaceWatcher
+
+
+def _write(path, contents: str = '') -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(contents)
+
+
+def _git(cwd, *args: str) -> None:
+    subprocess.run(['git', *args], cwd=cwd, check=True, capture_output=True)
+
+
+def _wait(watcher: WorkspaceWatcher, version: int):
+    changes = watcher.wait_for_changes(version, timeout=5)
+    assert changes.version > version
+    return changes
+
+
+def _wait_for_paths(watcher: WorkspaceWatcher, version: int, *paths: str):
+    """Wait until all of `paths` are reported as changed after `version`."""
+    deadline = time.monotonic() + 5
+    while True:
+        changes = watcher.changes_since(version)
+        if set(paths) <= set(changes.paths):
+            return changes
+        remaining = deadline - time.monotonic()
+        assert remaining > 0, f'{paths} not in {changes.paths}'
+        watcher.wait_for_changes(changes.version, timeout=remaining)
+
+
+@pytest.fixture
+def watcher(tmp_path):
+    _write(tmp_path / 'src' / 'main.py')
+    watcher = WorkspaceWatcher(str(tmp_path), coalesce_delay=0.01)
+    try:
+        watcher.start()
+    except OSError as e:
+        pytest.skip(f'inotify is not available: {e}')
+    yield watcher
+    watcher.stop()
+
+
+def test_watcher_reports_changed_paths(watcher, tmp_path):
+    version = watcher.version
+    assert watcher.changes_since(None).reset
+    assert watcher.changes_since(version).paths == []
+
+    _write(tmp_path / 'src' / 'main.py', 'print(1)')
+    changes = _wait(watcher, version)
+    assert changes.paths == ['src/main.py']
+    assert not changes.reset
+
+    # Files in new directories are found, even if written before the watch
+    _write(tmp_path / 'new' / 'deep' / 'file.txt')
+    changes = _wait(watcher, changes.version)
+    assert changes.paths == ['new', 'new/deep', 'new/deep/file.txt']
+
+    # The new directories are watched too
+    _write(tmp_path / 'new' / 'deep' / 'other.txt')
+    _wait(watcher, changes.version)
+    changes = watcher.changes_since(version)
+    assert 'new/deep/other.txt' in changes.paths
+    assert 'src/main.py' in changes.paths
+
+
+def test_watcher_skips_excluded_and_moved_directories(watcher, tmp_path):
+    version = watcher.version
+    _write(tmp_path / 'node_modules' / 'pkg' / 'index.js')
+    _write(tmp_path / 'build' / 'out.js')
+    os.rename(tmp_path / 'src', tmp_path / 'lib')
+    changes = _wait(watcher, version)
+    # Wait for the events of any other batch
+    changes = watcher.wait_for_changes(changes.version, timeout=0.2)
+    assert watcher.changes_since(version).paths == ['lib', 'lib/main.py', 'src']
+
+    # The moved directory is watched under its new name only
+    _write(tmp_path / 'lib' / 'main.py', 'print(1)')
+    changes = _wait(watcher, changes.version)
+    assert changes.paths == ['lib/main.py']
+
+
+def test_git_changes_tracker_matches_full_listing(watcher, tmp_path):
+    version = watcher.version
+    origin = tmp_path.parent / f'{tmp_path.name}-origin.git'
+    _git(tmp_path.parent, 'init', '-q', '--bare', '-b', 'main', str(origin))
+    _git(tmp_path, 'init', '-q', '-b', 'main')
+    _git(tmp_path, 'config', 'user.email', 'test@example.com')
+    _git(tmp_path, 'config', 'user.name', 'Test')
+    _git(tmp_path, 'remote', 'add', 'origin', str(origin))
+    _write(tmp_path / 'README.md', 'hello')
+    _write(tmp_path / 'build' / 'out.txt', 'built')
+    _git(tmp_path, 'add', '.')
+    _git(tmp_path, 'commit', '-q', '-m', 'initial')
+    _git(tmp_path, 'push', '-q', 'origin', 'main')
+    _wait_for_paths(watcher, version, 'README.md', '.git')
+
+    tracker = GitChangesTracker(str(tmp_path), watcher)
+
+    def check(expected):
+        assert tracker.get_changes() == expected
+        assert expected == sorted(
+            git_changes.get_git_changes(str(tmp_path)), key=lambda c: c['path']
+        )
+
+    check([])
+
+    version = watcher.version
+    _write(tmp_path / 'README.md', 'changed')
+    _write(tmp_path / 'src' / 'new.py')
+    _wait_for_paths(watcher, version, 'README.md', 'src/new.py')
+    check(
+        [
+            {'status': 'M', 'path': 'README.md'},
+            {'status': 'A', 'path': 'src/new.py'},
+        ]
+    )
+
+    # Committing doesn't change the changes, but pushing changes the base
+    version = watcher.version
+    _git(tmp_path, 'add', '.')
+    _git(tmp_path, 'commit', '-q', '-m', 'second')
+    _wait_for_paths(watcher, version, '.git')
+    check(
+        [
+            {'status': 'M', 'path': 'README.md'},
+            {'status': 'A', 'path': 'src/new.py'},
+        ]
+    )
+    version = watcher.version
+    _git(tmp_path, 'push', '-q', 'origin', 'main')
+    _wait_for_paths(watcher, version, '.git')
+    check([])
+
+    version = watcher.version
+    os.remove(tmp_path / 'src' / 'new.py')
+    _wait_for_paths(watcher, version, 'src/new.py')
+    check([{'status': 'D', 'path': 'src/new.py'}])
+
+    # Tracked files in directories the watcher skips are still listed
+    _write(tmp_path / 'build' / 'out.txt', 'rebuilt')
+    check(
+        [
+            {'status': 'M', 'path': 'build/out.txt'},
+            {'status': 'D', 'path': 'src/new.py'},
+        ]
+    )
+
+
+def test_git_changes_tracker_rejects_directories_outside_the_root(watcher, tmp_path):
+    with pytest.raises(ValueError):
+        GitChangesTracker(str(tmp_path.parent), watcher)
@@ -0,0 +1,105 @@
+import json
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import openhands.server.routes.templates as templates_routes
+from openhands.server.services import template_manager as template_manager_module
+from openhands.server.services.template_manager import TemplateManager
+
+
+def _template(root, name, **meta):
+    path = root / name
+    (path / 'frontend' / 'node_modules').mkdir(parents=True)
+    (path / 'meta.json').write_text(
+        json.dumps({'id': name, 'name': name.title(), 'description': '', **meta})
+    )
+    (path / 'frontend' / 'App.tsx').write_text('export {}')
+    (path / 'image.png').write_bytes(b'\x89PNG image of ' + name.encode())
+    return path
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.02)
+
+
+@pytest.fixture
+def manager(tmp_path):
+    _template(tmp_path, 'counter', default=True)
+    _template(tmp_path, 'token')
+    manager = TemplateManager(str(tmp_path))
+    yield manager
+    manager.stop()
+
+
+def test_templates_are_hashed_by_content(manager, tmp_path):
+    counter = manager.get_template('counter')
+    token = manager.get_template('token')
+    assert counter.content_hash != token.content_hash
+    assert manager.get_template_by_hash(token.content_hash) == token
+    assert counter.image_url.startswith('/api/templates/counter/image?v=')
+
+    # Installed dependencies are not part of a template
+    copy = _template(tmp_path / 'copy', 'counter', default=True)
+    (copy / 'frontend' / 'node_modules' / 'react.js').write_text('react')
+    assert template_manager_module.hash_template(copy) == counter.content_hash
+
+
+def test_changes_are_picked_up(manager, tmp_path):
+    counter = manager.get_template('counter')
+    token = manager.get_template('token')
+
+    (tmp_path / 'counter' / 'frontend' / 'App.tsx').write_text('export const x = 1')
+    _wait_for(lambda: manager.get_template('counter') != counter)
+    assert manager.get_template('counter').content_hash != counter.content_hash
+    assert manager.get_template('token') is token
+
+    # Reloading replaces the templates, so iterating the old ones is safe
+    templates = manager._current()
+    _template(tmp_path, 'nft')
+    _wait_for(lambda: manager.get_template('nft') is not None)
+    assert [t.id for t in manager.get_templates()] == ['counter', 'nft', 'token']
+    assert list(templates) == ['counter', 'token']
+
+
+def test_changes_are_polled_without_a_watcher(tmp_path, monkeypatch):
+    _template(tmp_path, 'counter')
+    monkeypatch.setattr(template_manager_module, 'POLL_INTERVAL', 0)
+    manager = TemplateManager(str(tmp_path))
+    monkeypatch.setattr(manager, '_start_watching', lambda: None)
+    counter = manager.get_template('counter')
+
+    (tmp_path / 'counter' / 'image.png').write_bytes(b'\x89PNG another image')
+    changed = manager.get_template('counter')
+    assert changed.content_hash != counter.content_hash
+    assert changed.image_url != counter.image_url
+
+
+def test_image_is_cached_by_content(manager, monkeypatch):
+    monkeypatch.setattr(templates_routes, 'get_template_manager', lambda: manager)
+    app = FastAPI()
+    app.include_router(templates_routes.router)
+    client = TestClient(app)
+
+    image_url = manager.get_template('counter').image_url
+    response = client.get(image_url)
+    assert response.status_code == 200
+    assert response.content == b'\x89PNG image of counter'
+    assert response.headers['cache-control'] == 'public, max-age=31536000, immutable'
+
+    # Without the version, the image is revalidated
+    response = client.get('/api/templates/counter/image')
+    assert response.headers['cache-control'] == 'no-cache'
+    etag = response.headers['etag']
+    response = client.get(
+        '/api/templates/counter/image', headers={'If-None-Match': etag}
+    )
+    assert response.status_code == 304
+    assert response.headers['etag'] == etag
+
+    assert client.get('/api/templates/missing/image').status_code == 404
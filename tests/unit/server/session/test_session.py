@@ -1,9 +1,11 @@
+import asyncio
 from unittest.mock import ANY, AsyncMock, patch
 
 import pytest
 from litellm.exceptions import (
     RateLimitError,
 )
+from litellm.types.utils import ChatCompletionMessageToolCall, Function
 
 from openhands.core.config.llm_config import LLMConfig
 from openhands.core.config.openhands_config import OpenHandsConfig
@@ -98,3 +100,67 @@ async def test_notify_on_llm_retry(
         'info', RuntimeStatus.LLM_RETRY, ANY
     )
     await session.close()
+
+
+@pytest.mark.asyncio
+async def test_shell_output_is_coalesced_and_not_persisted(
+    mock_sio, llm_registry, conversation_stats
+):
+    session = Session(
+        sid='..sid..',
+        file_store=InMemoryFileStore({}),
+        config=OpenHandsConfig(),
+        llm_registry=llm_registry,
+        conversation_stats=conversation_stats,
+        sio=mock_sio,
+        user_id='..uid..',
+    )
+
+    with patch('openhands.server.session.session.SHELL_OUTPUT_INTERVAL', 0.01):
+        session._on_shell_output('line 1\n')
+        session._on_shell_output('line 2\n')
+        await asyncio.sleep(0.1)
+
+    mock_sio.emit.assert_called_once_with(
+        'oh_shell_output', {'content': 'line 1\nline 2\n'}, to=ANY
+    )
+    assert session.agent_session.event_stream.get_latest_event_id() == -1
+    await session.close()
+
+
+@pytest.mark.asyncio
+async def test_llm_stream_is_sent_as_ephemeral_events(
+    mock_sio, llm_registry, conversation_stats
+):
+    session = Session(
+        sid='..sid..',
+        file_store=InMemoryFileStore({}),
+        config=OpenHandsConfig(),
+        llm_registry=llm_registry,
+        conversation_stats=conversation_stats,
+        sio=mock_sio,
+        user_id='..uid..',
+    )
+
+    with patch('openhands.server.session.session.SHELL_OUTPUT_INTERVAL', 0.01):
+        session._on_llm_output('Writing ')
+        session._on_llm_output('the file.')
+        session._on_llm_tool_call(
+            ChatCompletionMessageToolCall(
+                id='call_1',
+                function=Function(name='execute_bash', arguments='{"command": "ls"}'),
+            )
+        )
+        await asyncio.sleep(0.1)
+
+    mock_sio.emit.assert_any_call(
+        'oh_llm_tool_call',
+        {'id': 'call_1', 'name': 'execute_bash', 'arguments': '{"command": "ls"}'},
+        to=ANY,
+    )
+    mock_sio.emit.assert_any_call(
+        'oh_llm_output', {'content': 'Writing the file.'}, to=ANY
+    )
+    assert mock_sio.emit.call_count == 2
+    assert session.agent_session.event_stream.get_latest_event_id() == -1
+    await session.close()
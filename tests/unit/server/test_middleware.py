@@ -1,12 +1,19 @@
 import os
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 from fastapi.testclient import TestClient
 from starlette.middleware.cors import CORSMiddleware
 
-from openhands.server.middleware import LocalhostCORSMiddleware
+from openhands.server.middleware import (
+    CacheControlMiddleware,
+    InMemoryRateLimiter,
+    LocalhostCORSMiddleware,
+    RateLimitMiddleware,
+    TokenRateLimitMiddleware,
+)
 
 
 @pytest.fixture
@@ -127,3 +134,130 @@ def test_localhost_cors_middleware_cors_parameters():
         assert kwargs['allow_credentials'] is True
         assert kwargs['allow_methods'] == ['*']
         assert kwargs['allow_headers'] == ['*']
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    clock = _Clock()
+    with patch('openhands.server.middleware.time.monotonic', clock):
+        yield clock
+
+
+def _connection(host: str):
+    return type('Connection', (), {'client': type('Client', (), {'host': host})})()
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_allows_burst_then_delays_then_rejects(clock):
+    limiter = InMemoryRateLimiter(requests=2, seconds=1, sleep_seconds=0)
+    client = _connection('1.2.3.4')
+    assert [await limiter(client) for _ in range(6)] == [
+        True,
+        True,
+        False,
+        False,
+        False,
+        False,
+    ]
+
+    # Other clients have their own bucket
+    assert await limiter(_connection('5.6.7.8'))
+
+    # Tokens refill over time
+    clock.now += 10
+    assert await limiter(client)
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_delays_before_rejecting(clock):
+    limiter = InMemoryRateLimiter(requests=2, seconds=1, sleep_seconds=1)
+    client = _connection('1.2.3.4')
+    with patch(
+        'openhands.server.middleware.asyncio.sleep', new_callable=AsyncMock
+    ) as mock_sleep:
+        results = [await limiter(client) for _ in range(5)]
+    assert results == [True, True, True, True, False]
+    assert mock_sleep.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_bounds_and_evicts_clients(clock):
+    limiter = InMemoryRateLimiter(requests=2, seconds=1, max_clients=3)
+    for i in range(5):
+        await limiter(_connection(f'10.0.0.{i}'))
+    # Least recently used clients are dropped first
+    assert list(limiter.buckets) == ['10.0.0.2', '10.0.0.3', '10.0.0.4']
+
+    await limiter(_connection('10.0.0.2'))
+    clock.now += InMemoryRateLimiter.EVICTION_INTERVAL
+    await limiter(_connection('10.0.0.9'))
+    # Idle buckets have refilled, so they are evicted
+    assert list(limiter.buckets) == ['10.0.0.9']
+
+
+def test_rate_limit_middleware_returns_429(app, clock):
+    app.add_middleware(
+        RateLimitMiddleware,
+        rate_limiter=InMemoryRateLimiter(requests=1, seconds=1, sleep_seconds=0),
+    )
+    client = TestClient(app)
+    assert client.get('/test').status_code == 200
+    response = client.get('/test')
+    assert response.status_code == 429
+    assert response.headers['retry-after'] == '1'
+    assert response.json() == {'message': 'Too many requests'}
+
+
+def test_token_rate_limit_middleware_only_limits_token_endpoints(app, clock):
+    @app.get('/api/token/verify')
+    def verify():
+        return {}
+
+    app.add_middleware(TokenRateLimitMiddleware)
+    client = TestClient(app)
+    statuses = [client.get('/api/token/verify').status_code for _ in range(21)]
+    assert statuses[:20] == [200] * 20
+    assert statuses[20] == 429
+    assert client.get('/test').status_code == 200
+
+
+def test_cache_control_middleware_sets_headers(app):
+    @app.get('/assets/app.js')
+    def asset():
+        return {}
+
+    app.add_middleware(CacheControlMiddleware)
+    client = TestClient(app)
+
+    response = client.get('/test')
+    assert (
+        response.headers['cache-control']
+        == 'no-cache, no-store, must-revalidate, max-age=0'
+    )
+    assert response.headers['pragma'] == 'no-cache'
+    assert response.headers['expires'] == '0'
+
+    response = client.get('/assets/app.js')
+    assert response.headers['cache-control'] == 'public, max-age=2592000, immutable'
+    assert 'pragma' not in response.headers
+
+
+def test_cache_control_middleware_keeps_route_headers(app):
+    @app.get('/cached')
+    def cached():
+        return JSONResponse({}, headers={'Cache-Control': 'public, max-age=300'})
+
+    app.add_middleware(CacheControlMiddleware)
+    client = TestClient(app)
+
+    response = client.get('/cached')
+    assert response.headers['cache-control'] == 'public, max-age=300'
+    assert 'pragma' not in response.headers
@@ -200,3 +200,32 @@ async def test_get_all_metadata():
     assert results[0].title == 'First conversation'
     assert results[1].conversation_id == 'conv2'
     assert results[1].title == 'Second conversation'
+
+
+@pytest.mark.asyncio
+async def test_search_reads_metadata_in_one_batch():
+    class _CountingFileStore(InMemoryFileStore):
+        def __init__(self) -> None:
+            super().__init__()
+            self.batches = 0
+
+        def read_many(self, paths, return_exceptions=False):
+            self.batches += 1
+            return super().read_many(paths, return_exceptions)
+
+    file_store = _CountingFileStore()
+    store = FileConversationStore(file_store)
+    for i in range(5):
+        await store.save_metadata(
+            ConversationMetadata(
+                conversation_id=f'conversation-{i}',
+                selected_repository='some-repo',
+                title=f'Conversation {i}',
+            )
+        )
+    # Unreadable metadata is skipped
+    file_store.write(get_conversation_metadata_filename('broken'), '{')
+
+    results = await store.search(limit=3)
+    assert len(results.results) == 3
+    assert file_store.batches == 1
@@ -0,0 +1,59 @@
+from unittest.mock import patch
+
+import pytest
+
+from openhands.storage.adapters import (
+    AsyncFileStoreAdapter,
+    SyncFileStoreAdapter,
+    get_async_file_store,
+)
+from openhands.storage.local import LocalFileStore
+from openhands.storage.memory import InMemoryFileStore
+
+
+@pytest.mark.asyncio
+async def test_async_adapter_round_trip(tmp_path):
+    store = get_async_file_store(LocalFileStore(str(tmp_path)))
+    await store.write_many({'a/1.txt': 'one', 'a/2.txt': b'two'})
+    await store.write('b.txt', 'three')
+
+    assert await store.read('a/1.txt') == 'one'
+    assert await store.read_bytes('a/2.txt') == b'two'
+    assert await store.read_many(['b.txt', 'a/1.txt']) == ['three', 'one']
+    assert sorted(await store.list('')) == ['a/', 'b.txt']
+
+    await store.delete('a')
+    with pytest.raises(FileNotFoundError):
+        await store.read_many(['b.txt', 'a/1.txt'])
+    results = await store.read_many(['b.txt', 'a/1.txt'], return_exceptions=True)
+    assert results[0] == 'three'
+    assert isinstance(results[1], FileNotFoundError)
+
+
+@pytest.mark.asyncio
+async def test_async_adapter_calls_non_blocking_stores_directly():
+    store = AsyncFileStoreAdapter(InMemoryFileStore())
+    with patch(
+        'openhands.storage.adapters.call_sync_from_async',
+        side_effect=AssertionError('unexpected thread pool hop'),
+    ):
+        await store.write('a.txt', 'one')
+        assert await store.read_many(['a.txt']) == ['one']
+
+
+def test_sync_adapter_round_trip():
+    memory = InMemoryFileStore()
+    store = SyncFileStoreAdapter(get_async_file_store(memory))
+    store.write('a.txt', 'one')
+    store.write_many({'b/c.txt': 'two'})
+
+    assert memory.files == {'a.txt': 'one', 'b/c.txt': 'two'}
+    assert store.read('a.txt') == 'one'
+    assert store.read_many(['b/c.txt', 'a.txt']) == ['two', 'one']
+    assert store.list('b/') == ['b/c.txt']
+    store.delete('b/')
+    with pytest.raises(FileNotFoundError):
+        store.read('b/c.txt')
+
+    # Adapting back gives the async store being adapted
+    assert get_async_file_store(store) is store.file_store
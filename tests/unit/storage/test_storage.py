@@ -39,6 +39,18 @@ class _StorageTest(ABC):
         with self.assertRaises(FileNotFoundError):
             store.read(filename)
 
+    def test_binary_fileops(self):
+        filename = 'state.bin'
+        contents = bytes(range(256))
+        store = self.get_store()
+        store.write(filename, contents)
+        self.assertEqual(store.read_bytes(filename), contents)
+        store.write(filename, 'Hello, world!')
+        self.assertEqual(store.read_bytes(filename), b'Hello, world!')
+        store.delete(filename)
+        with self.assertRaises(FileNotFoundError):
+            store.read_bytes(filename)
+
     def test_complex_path_fileops(self):
         filenames = ['foo.bar.baz', './foo/bar/baz', 'foo/bar/baz', '/foo/bar/baz']
         store = self.get_store()
@@ -136,9 +148,49 @@ class TestGoogleCloudFileStore(TestCase, _StorageTest):
 
 class TestS3FileStore(TestCase, _StorageTest):
     def setUp(self):
-        with patch('boto3.client', lambda service, **kwargs: _MockS3Client()):
+        # A small page size, so listings follow continuation tokens
+        self.client = _MockS3Client(page_size=3)
+        with patch('boto3.client', lambda service, **kwargs: self.client):
             self.store = S3FileStore('dear-liza')
 
+    def test_list_follows_continuation_tokens(self):
+        store = self.get_store()
+        for i in range(10):
+            store.write(f'sessions/abc/events/{i}.json', '{}')
+            store.write(f'sessions/conv-{i}/metadata.json', '{}')
+        self.client.list_calls = 0
+
+        self.assertEqual(
+            sorted(store.list('sessions/abc/events')),
+            sorted(f'sessions/abc/events/{i}.json' for i in range(10)),
+        )
+        self.assertEqual(self.client.list_calls, 4)
+        # Directories come back as common prefixes, not as all the keys under them
+        self.assertEqual(
+            sorted(store.list('sessions')),
+            ['sessions/abc/'] + sorted(f'sessions/conv-{i}/' for i in range(10)),
+        )
+
+    def test_delete_removes_keys_in_batches(self):
+        store = self.get_store()
+        store.write('foo', 'Hello, world!')
+        for i in range(10):
+            store.write(f'foo/bar/{i}.json', '{}')
+        self.client.delete_calls = 0
+
+        store.delete('foo')
+        self.assertEqual(store.list(''), [])
+        # one batch per listed page of keys, plus the file itself
+        self.assertEqual(self.client.delete_calls, 4 + 1)
+
+    def test_read_and_write_many(self):
+        store = self.get_store()
+        files = {f'events/{i}.json': f'{{"id": {i}}}' for i in range(50)}
+        store.write_many(files)
+        self.assertEqual(store.read_many(list(files)), list(files.values()))
+        with self.assertRaises(FileNotFoundError):
+            store.read_many(['events/0.json', 'events/missing.json'])
+
 
 # I would have liked to use cloud-storage-mocker here but the python versions were incompatible :(
 # If we write tests for the S3 storage class I would definitely recommend we use moto.
@@ -173,7 +225,13 @@ class _MockGoogleCloudBlob:
             if self.content is None:
                 raise FileNotFoundError()
             return StringIO(self.content)
-        if op == 'w':
+        if op == 'rb':
+            if self.content is None:
+                raise FileNotFoundError()
+            if isinstance(self.content, str):
+                return BytesIO(self.content.encode('utf-8'))
+            return BytesIO(self.content)
+        if op in ('w', 'wb'):
             return _MockGoogleCloudBlobWriter(self)
 
     def delete(self):
@@ -203,8 +261,11 @@ class _MockGoogleCloudBlobWriter:
 
 
 class _MockS3Client:
-    def __init__(self):
+    def __init__(self, page_size: int = 1000):
         self.objects_by_bucket: dict[str, dict[str, _MockS3Object]] = {}
+        self.page_size = page_size
+        self.list_calls = 0
+        self.delete_calls = 0
 
     def put_object(self, Bucket: str, Key: str, Body: str | bytes) -> None:
         if Bucket not in self.objects_by_bucket:
@@ -237,7 +298,13 @@ class _MockS3Client:
             return {'Body': BytesIO(content)}
         return {'Body': StringIO(content)}
 
-    def list_objects_v2(self, Bucket: str, Prefix: str = '') -> dict:
+    def list_objects_v2(
+        self,
+        Bucket: str,
+        Prefix: str = '',
+        Delimiter: str | None = None,
+        ContinuationToken: str | None = None,
+    ) -> dict:
         if Bucket not in self.objects_by_bucket:
             raise botocore.exceptions.ClientError(
                 {
@@ -248,13 +315,49 @@ class _MockS3Client:
                 },
                 'ListObjectsV2',
             )
-        objects = self.objects_by_bucket[Bucket]
-        contents = [
-            {'Key': key}
-            for key in objects.keys()
-            if not Prefix or key.startswith(Prefix)
+        self.list_calls += 1
+        # Like S3, keys and common prefixes are listed in order, a page at a time
+        entries: dict[str, str] = {}
+        for key in self.objects_by_bucket[Bucket]:
+            if not key.startswith(Prefix):
+                continue
+            index = key.find(Delimiter, len(Prefix)) if Delimiter else -1
+            if index == -1:
+                entries[key] = 'Contents'
+            else:
+                entries[key[: index + 1]] = 'CommonPrefixes'
+        names = sorted(name for name in entries if name > (ContinuationToken or ''))
+        page = names[: self.page_size]
+        response: dict = {}
+        contents = [{'Key': name} for name in page if entries[name] == 'Contents']
+        prefixes = [
+            {'Prefix': name} for name in page if entries[name] == 'CommonPrefixes'
         ]
-        return {'Contents': contents} if contents else {}
+        if contents:
+            response['Contents'] = contents
+        if prefixes:
+            response['CommonPrefixes'] = prefixes
+        if len(names) > len(page):
+            response['IsTruncated'] = True
+            response['NextContinuationToken'] = page[-1]
+        return response
+
+    def delete_objects(self, Bucket: str, Delete: dict) -> dict:
+        if Bucket not in self.objects_by_bucket:
+            raise botocore.exceptions.ClientError(
+                {
+                    'Error': {
+                        'Code': 'NoSuchBucket',
+                        'Message': f"The bucket '{Bucket}' does not exist",
+                    }
+                },
+                'DeleteObjects',
+            )
+        assert len(Delete['Objects']) <= 1000
+        self.delete_calls += 1
+        for obj in Delete['Objects']:
+            self.objects_by_bucket[Bucket].pop(obj['Key'], None)
+        return {}
 
     def delete_object(self, Bucket: str, Key: str) -> None:
         if Bucket not in self.objects_by_bucket:
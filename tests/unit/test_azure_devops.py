@@ -63,7 +63,7 @@ async def test_azure_devops_get_repositories():
                 mock_repos_response,
             ]
         )
-        mock_client.return_value.__aenter__.return_value = mock_client_instance
+        mock_client.return_value = mock_client_instance
 
         # Create the service and call get_repositories
         service = AzureDevOpsService(
@@ -104,7 +104,7 @@ async def test_azure_devops_get_repository_details():
         # Set up the mock client to return our mock response
         mock_client_instance = MagicMock()
         mock_client_instance.get = AsyncMock(return_value=mock_response)
-        mock_client.return_value.__aenter__.return_value = mock_client_instance
+        mock_client.return_value = mock_client_instance
 
         # Create the service and call get_repository_details_from_repo_name
         service = AzureDevOpsService(
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import pytest
 
 from openhands.utils.chunk_localizer import (
@@ -134,3 +136,52 @@ def test_get_top_k_chunk_matches_with_overlapping_chunks():
     assert matches[1].text == 'chunk3\nchunk4'
     assert matches[1].line_range == (3, 4)
     assert matches[0].normalized_lcs == matches[1].normalized_lcs
+
+
+def _generated_file(classes: int) -> str:
+    return '\n'.join(
+        f'class Model{i}:\n    value = {i * 7 % 13}\n\n    def get(self):\n        return self.value\n'
+        for i in range(classes)
+    )
+
+
+def test_get_top_k_chunk_matches_in_large_file_scores_like_exhaustive_search():
+    text = _generated_file(200)
+    query = 'class Model120:\n    value = 8\n\n    def get(self) -> int:\n        return self.value'
+    matches = get_top_k_chunk_matches(text, query, k=3, max_chunk_size=6)
+
+    exhaustive = sorted(
+        (normalized_lcs(chunk.text, query) for chunk in create_chunks(text, 6)),
+        reverse=True,
+    )
+    assert [match.normalized_lcs for match in matches] == exhaustive[:3]
+    assert 'class Model120:' in matches[0].text
+    assert matches[0].line_range == (721, 726)
+
+
+def test_get_top_k_chunk_matches_without_common_lines():
+    text = _generated_file(100)
+    # No line of the query is in the file, so every chunk is scored
+    query = 'class Model42: value = 8'
+    matches = get_top_k_chunk_matches(text, query, k=2, max_chunk_size=6)
+    exhaustive = sorted(
+        (normalized_lcs(chunk.text, query) for chunk in create_chunks(text, 6)),
+        reverse=True,
+    )
+    assert [match.normalized_lcs for match in matches] == exhaustive[:2]
+
+
+def test_get_top_k_chunk_matches_reuses_file_index():
+    text = _generated_file(100)
+    first = get_top_k_chunk_matches(text, 'class Model7:', k=1, max_chunk_size=6)
+    with patch(
+        'openhands.utils.chunk_localizer._index_file',
+        side_effect=AssertionError('indexed again'),
+    ):
+        again = get_top_k_chunk_matches(text, 'class Model7:', k=1, max_chunk_size=6)
+    assert again == first
+    # Returned chunks are copies, so changing them doesn't change the index
+    first[0].text = 'changed'
+    assert (
+        get_top_k_chunk_matches(text, 'class Model7:', k=1, max_chunk_size=6) == again
+    )
@@ -0,0 +1,18 @@
+import httpx
+import pytest
+
+from openhands.utils.http_session import get_async_client
+
+
+@pytest.mark.asyncio
+async def test_shared_async_client_stores_no_cookies():
+    client = get_async_client()
+    assert get_async_client() is client
+
+    # As httpx does with every response, so they would go to other callers
+    request = httpx.Request('GET', 'https://api.github.com/user')
+    response = httpx.Response(
+        200, headers={'Set-Cookie': 'session=user-1; Path=/'}, request=request
+    )
+    client.cookies.extract_cookies(response)
+    assert not client.cookies